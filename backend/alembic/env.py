@@ -14,7 +14,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from app.config import settings
 from app.database import Base
-from app.models import strategy  # Import all models here
+from app.models import strategy, strategy_leg, stress_result  # Import all models here
 
 # this is the Alembic Config object
 config = context.config
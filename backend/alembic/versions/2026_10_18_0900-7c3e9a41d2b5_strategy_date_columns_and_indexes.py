@@ -0,0 +1,141 @@
+"""strategy date columns and filter indexes
+
+Converts strategies.entry_date / expiry_date from VARCHAR(50) to DATE and
+adds the indexes behind the listing filters:
+- ix_strategies_type_expiry (strategy_type, expiry_date)
+- ix_strategies_expiry_date (expiry_date)
+- ix_strategies_name_pattern (name varchar_pattern_ops), PostgreSQL only
+
+Tables created by init_db() from the current models already have this
+shape; every step checks the live schema first, so the revision can be
+applied to those databases as well. On an empty database (no strategies
+table yet) the upgrade does nothing; init_db() creates the tables at
+startup.
+
+Existing values must be valid dates; the upgrade stops before changing
+anything if any row holds something else.
+
+Revision ID: 7c3e9a41d2b5
+Revises:
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+import re
+from datetime import date
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c3e9a41d2b5'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DATE_COLUMNS = ("entry_date", "expiry_date")
+
+# Values accepted as dates (PostgreSQL regex syntax as well as Python's)
+DATE_PATTERN = r"^\s*\d{4}-\d{1,2}-\d{1,2}\s*$"
+
+INDEXES = {
+    "ix_strategies_type_expiry": ["strategy_type", "expiry_date"],
+    "ix_strategies_expiry_date": ["expiry_date"],
+}
+
+
+def _columns(type_) -> list:
+    return [sa.Column(name, type_, nullable=False) for name in DATE_COLUMNS]
+
+
+def _invalid(bad: list) -> RuntimeError:
+    return RuntimeError(f"strategies has date values that are not YYYY-MM-DD dates: {bad[:5]}")
+
+
+def _check_dates(bind) -> None:
+    """Stop before the ::date cast if a date column holds a value that is not YYYY-MM-DD."""
+    for name in DATE_COLUMNS:
+        bad = bind.execute(
+            sa.text(f"SELECT id, {name} FROM strategies WHERE {name} !~ :pattern LIMIT 5"),
+            {"pattern": DATE_PATTERN},
+        ).all()
+        if bad:
+            raise _invalid(bad)
+
+
+def _normalize_sqlite_dates(bind) -> None:
+    """Rewrite SQLite date text as zero-padded ISO dates, which the Date type reads."""
+    updates, bad = [], []
+    for row in bind.execute(sa.text("SELECT id, entry_date, expiry_date FROM strategies")):
+        values = {}
+        for name, value in zip(DATE_COLUMNS, row[1:]):
+            try:
+                values[name] = date(*map(int, re.match(DATE_PATTERN, value).group(0).split("-"))).isoformat()
+            except (AttributeError, TypeError, ValueError):
+                bad.append((row[0], value))
+        updates.append({"id": row[0], **values})
+    if bad:
+        raise _invalid(bad)
+    if updates:
+        bind.execute(
+            sa.text("UPDATE strategies SET entry_date = :entry_date, expiry_date = :expiry_date WHERE id = :id"),
+            updates,
+        )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "strategies" not in inspector.get_table_names():
+        return
+    types = {c["name"]: c["type"] for c in inspector.get_columns("strategies")}
+
+    if not all(isinstance(types[name], sa.Date) for name in DATE_COLUMNS):
+        if bind.dialect.name == "sqlite":
+            # SQLite keeps dates as ISO text: normalize the text, then rebuild
+            # the table with DATE declared (a batch CAST AS DATE would turn
+            # '2026-01-29' into the number 2026)
+            _normalize_sqlite_dates(bind)
+            with op.batch_alter_table("strategies", recreate="always", reflect_args=_columns(sa.Date())):
+                pass
+        else:
+            _check_dates(bind)
+            for name in DATE_COLUMNS:
+                op.alter_column(
+                    "strategies", name,
+                    type_=sa.Date(),
+                    existing_type=sa.String(50),
+                    existing_nullable=False,
+                    postgresql_using=f"{name}::date",
+                )
+
+    existing = {index["name"] for index in sa.inspect(bind).get_indexes("strategies")}
+    for name, columns in INDEXES.items():
+        if name not in existing:
+            op.create_index(name, "strategies", columns)
+    if bind.dialect.name == "postgresql" and "ix_strategies_name_pattern" not in existing:
+        op.create_index(
+            "ix_strategies_name_pattern", "strategies", ["name"],
+            postgresql_ops={"name": "varchar_pattern_ops"},
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    existing = {index["name"] for index in sa.inspect(bind).get_indexes("strategies")}
+    for name in ["ix_strategies_name_pattern", *INDEXES]:
+        if name in existing:
+            op.drop_index(name, table_name="strategies")
+
+    if bind.dialect.name == "sqlite":
+        with op.batch_alter_table("strategies", recreate="always", reflect_args=_columns(sa.String(50))):
+            pass
+    else:
+        for name in DATE_COLUMNS:
+            op.alter_column(
+                "strategies", name,
+                type_=sa.String(50),
+                existing_type=sa.Date(),
+                existing_nullable=False,
+                postgresql_using=f"to_char({name}, 'YYYY-MM-DD')",
+            )
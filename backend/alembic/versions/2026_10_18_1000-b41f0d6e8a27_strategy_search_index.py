@@ -0,0 +1,78 @@
+"""strategy full-text search index
+
+Adds the full-text index behind GET /api/strategies/search:
+- PostgreSQL: ix_strategies_search, a GIN index on the weighted english
+  tsvector of name and notes
+- SQLite: the FTS5 table strategies_fts with the triggers that keep it
+  in step with strategies, filled from the existing rows
+
+Tables created by init_db() from the current models already have the
+index; every step checks the live schema first, so the revision can be
+applied to those databases as well. An empty database is left to
+init_db().
+
+Revision ID: b41f0d6e8a27
+Revises: 7c3e9a41d2b5
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b41f0d6e8a27'
+down_revision: Union[str, None] = '7c3e9a41d2b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same expression as app.models.strategy.SEARCH_DOCUMENT (queries must match it)
+SEARCH_DOCUMENT = (
+    "setweight(to_tsvector('english'::regconfig, coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(notes, '')), 'B')"
+)
+
+SQLITE_TRIGGERS = ("strategies_fts_insert", "strategies_fts_delete", "strategies_fts_update")
+
+SQLITE_SEARCH_DDL = (
+    "CREATE VIRTUAL TABLE strategies_fts USING fts5("
+    "name, notes, content='strategies', content_rowid='id', tokenize='porter unicode61')",
+    "CREATE TRIGGER strategies_fts_insert AFTER INSERT ON strategies BEGIN "
+    "INSERT INTO strategies_fts(rowid, name, notes) VALUES (new.id, new.name, new.notes); END",
+    "CREATE TRIGGER strategies_fts_delete AFTER DELETE ON strategies BEGIN "
+    "INSERT INTO strategies_fts(strategies_fts, rowid, name, notes) "
+    "VALUES ('delete', old.id, old.name, old.notes); END",
+    "CREATE TRIGGER strategies_fts_update AFTER UPDATE OF name, notes ON strategies BEGIN "
+    "INSERT INTO strategies_fts(strategies_fts, rowid, name, notes) "
+    "VALUES ('delete', old.id, old.name, old.notes); "
+    "INSERT INTO strategies_fts(rowid, name, notes) VALUES (new.id, new.name, new.notes); END",
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "strategies" not in inspector.get_table_names():
+        return
+
+    if bind.dialect.name == "sqlite":
+        if "strategies_fts" not in inspector.get_table_names():
+            for statement in SQLITE_SEARCH_DDL:
+                op.execute(statement)
+            # Index the rows that predate the triggers
+            op.execute("INSERT INTO strategies_fts(strategies_fts) VALUES ('rebuild')")
+    elif bind.dialect.name == "postgresql":
+        existing = {index["name"] for index in inspector.get_indexes("strategies")}
+        if "ix_strategies_search" not in existing:
+            op.execute(f"CREATE INDEX ix_strategies_search ON strategies USING gin (({SEARCH_DOCUMENT}))")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite":
+        for name in SQLITE_TRIGGERS:
+            op.execute(f"DROP TRIGGER IF EXISTS {name}")
+        op.execute("DROP TABLE IF EXISTS strategies_fts")
+    elif bind.dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_strategies_search")
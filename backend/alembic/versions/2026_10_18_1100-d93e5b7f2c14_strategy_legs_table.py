@@ -0,0 +1,213 @@
+"""strategy legs table
+
+Adds strategy_legs, one indexed row per leg of a saved strategy, behind
+GET /api/strategies/legs:
+- primary key (strategy_id, leg_index), strategy_id referencing
+  strategies.id with ON DELETE CASCADE
+- ix_strategy_legs_type_action_strike (leg_type, action, strike)
+- ix_strategy_legs_expiry (expiry)
+
+Existing strategies are then given their leg rows. The leg mapping is a
+frozen copy of app.services.legs / strategy_legs as of this revision, over
+sa.table() stubs, so the backfill does not change when the application
+does. It only fills strategies that have no rows yet and can be re-run.
+
+Tables created by init_db() from the current models already have this
+shape; the table is only created when missing.
+
+Revision ID: d93e5b7f2c14
+Revises: b41f0d6e8a27
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+import math
+from typing import Any, Dict, List, Optional, Sequence, Union
+from alembic import op
+import numpy as np
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd93e5b7f2c14'
+down_revision: Union[str, None] = 'b41f0d6e8a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+strategies = sa.table(
+    "strategies",
+    sa.column("id", sa.Integer),
+    sa.column("strategy_type", sa.String),
+    sa.column("parameters", sa.JSON),
+    sa.column("custom_legs", sa.JSON),
+    sa.column("expiry_date", sa.Date),
+)
+
+strategy_legs = sa.table(
+    "strategy_legs",
+    sa.column("strategy_id", sa.Integer),
+    sa.column("leg_index", sa.Integer),
+    sa.column("leg_type", sa.String),
+    sa.column("action", sa.String),
+    sa.column("quantity", sa.Float),
+    sa.column("strike", sa.Float),
+    sa.column("entry_price", sa.Float),
+    sa.column("expiry", sa.Date),
+)
+
+
+def _template_legs(strategy_type: str, p: Dict[str, Any]) -> List[tuple]:
+    """(leg_type, signed quantity, strike, entry_price) of a template; None where it defaults to the spot."""
+    def num(name: str, default: Optional[float]) -> Optional[float]:
+        value = p.get(name)
+        return default if value in (None, "") else float(value)
+
+    if strategy_type == "covered-call":
+        return [
+            ("FUT", num("futuresLotSize", 50), None, num("futuresPrice", None)),
+            ("CE", -num("callLotSize", 50), num("callStrike", None), num("premium", 200)),
+        ]
+    if strategy_type == "bull-call-spread":
+        lot = num("lotSize", 50)
+        return [
+            ("CE", lot, num("longCallStrike", None), num("longCallPremium", 300)),
+            ("CE", -lot, num("shortCallStrike", None), num("shortCallPremium", 150)),
+        ]
+    if strategy_type == "iron-condor":
+        lot = num("lotSize", 50)
+        return [
+            ("PE", lot, num("putBuyStrike", None), 0.0),
+            ("PE", -lot, num("putSellStrike", None), 0.0),
+            ("CE", -lot, num("callSellStrike", None), 0.0),
+            ("CE", lot, num("callBuyStrike", None), 0.0),
+        ]
+    if strategy_type == "long-straddle":
+        lot = num("lotSize", 50)
+        strike = num("strike", None)
+        return [
+            ("CE", lot, strike, num("callPremium", 300)),
+            ("PE", lot, strike, num("putPremium", 300)),
+        ]
+    if strategy_type == "protective-put":
+        lot = num("lotSize", 50)
+        return [
+            ("FUT", lot, None, num("stockPrice", None)),
+            ("PE", lot, num("putStrike", None), num("putPremium", 200)),
+        ]
+    if strategy_type == "butterfly-spread":
+        lot = num("lotSize", 50)
+        return [
+            ("CE", lot, num("lowerStrike", None), num("lowerPremium", 300)),
+            ("CE", -2 * lot, num("middleStrike", None), num("middlePremium", 200)),
+            ("CE", lot, num("upperStrike", None), num("upperPremium", 100)),
+        ]
+    raise ValueError(f"Unknown strategy type: {strategy_type}")
+
+
+def _custom_legs(custom_legs: List[Dict[str, Any]]) -> List[tuple]:
+    rows = []
+    for leg in custom_legs:
+        leg_type = leg.get("type")
+        if leg_type not in ("FUT", "CE", "PE"):
+            raise ValueError(f"Unknown leg type: {leg_type}")
+        quantity = (1.0 if leg.get("action") == "BUY" else -1.0) * float(leg.get("lotSize") or 0)
+        if leg_type == "FUT":
+            rows.append(("FUT", quantity, None, float(leg["entryPrice"]) if leg.get("entryPrice") else None))
+        else:
+            rows.append((
+                leg_type, quantity,
+                float(leg["strike"]) if leg.get("strike") else None,
+                float(leg.get("premium") or 0),
+            ))
+    return rows
+
+
+def _date(value):
+    return np.datetime64(str(value).strip().replace("Z", ""), "s").astype("datetime64[D]").item()
+
+
+def _number(value: Optional[float]) -> Optional[float]:
+    return None if value is None or math.isnan(value) else value
+
+
+def _leg_records(source) -> List[Dict[str, Any]]:
+    """strategy_legs rows of one (id, strategy_type, parameters, custom_legs, expiry_date) row."""
+    strategy_id, strategy_type, parameters, custom_legs, expiry_date = source
+    try:
+        expiry_date = _date(expiry_date)
+        if strategy_type == "custom-strategy":
+            rows = _custom_legs(custom_legs or [])
+            expiries = [_date(leg["expiry"]) if leg.get("expiry") else expiry_date for leg in custom_legs or []]
+        else:
+            rows = _template_legs(strategy_type, parameters or {})
+            expiries = [expiry_date] * len(rows)
+    except (ValueError, TypeError, AttributeError):
+        return []
+
+    return [
+        {
+            "strategy_id": strategy_id,
+            "leg_index": index,
+            "leg_type": leg_type,
+            "action": "BUY" if quantity > 0 else "SELL",
+            "quantity": abs(quantity),
+            "strike": None if leg_type == "FUT" else _number(strike),
+            "entry_price": _number(entry_price),
+            "expiry": expiry,
+        }
+        for index, ((leg_type, quantity, strike, entry_price), expiry) in enumerate(zip(rows, expiries))
+        if quantity
+    ]
+
+
+def backfill_legs(bind) -> None:
+    """Write the legs of strategies that have none, BATCH_SIZE strategies at a time."""
+    missing = (
+        sa.select(
+            strategies.c.id, strategies.c.strategy_type, strategies.c.parameters,
+            strategies.c.custom_legs, strategies.c.expiry_date,
+        )
+        .where(~sa.exists().where(strategy_legs.c.strategy_id == strategies.c.id))
+        .order_by(strategies.c.id)
+        .limit(BATCH_SIZE)
+    )
+    last_id = None
+    while True:
+        query = missing if last_id is None else missing.where(strategies.c.id > last_id)
+        sources = bind.execute(query).all()
+        if not sources:
+            return
+        records = [record for source in sources for record in _leg_records(source)]
+        if records:
+            bind.execute(strategy_legs.insert(), records)
+        last_id = sources[-1][0]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    tables = sa.inspect(bind).get_table_names()
+    if "strategies" not in tables:
+        # Empty database: init_db() creates both tables at startup
+        return
+    if "strategy_legs" not in tables:
+        op.create_table(
+            "strategy_legs",
+            sa.Column("strategy_id", sa.Integer(), sa.ForeignKey("strategies.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("leg_index", sa.Integer(), nullable=False),
+            sa.Column("leg_type", sa.String(3), nullable=False),
+            sa.Column("action", sa.String(4), nullable=False),
+            sa.Column("quantity", sa.Float(), nullable=False),
+            sa.Column("strike", sa.Float(), nullable=True),
+            sa.Column("entry_price", sa.Float(), nullable=True),
+            sa.Column("expiry", sa.Date(), nullable=True),
+            sa.PrimaryKeyConstraint("strategy_id", "leg_index"),
+        )
+        op.create_index("ix_strategy_legs_type_action_strike", "strategy_legs", ["leg_type", "action", "strike"])
+        op.create_index("ix_strategy_legs_expiry", "strategy_legs", ["expiry"])
+
+    backfill_legs(bind)
+
+
+def downgrade() -> None:
+    op.drop_table("strategy_legs")
@@ -27,6 +27,20 @@ class Settings(BaseSettings):
     # Security
     secret_key: str = Field(..., env="SECRET_KEY")
     
+    # Market data (local option-chain snapshots)
+    option_chain_dir: str = Field(default="data/option_chains", env="OPTION_CHAIN_DIR")
+    option_chain_store_dir: str = Field(default="data/option_chain_store", env="OPTION_CHAIN_STORE_DIR")
+    price_history_dir: str = Field(default="data/price_history", env="PRICE_HISTORY_DIR")
+    
+    # Pricing defaults
+    default_volatility: float = Field(default=0.15, env="DEFAULT_VOLATILITY")
+    risk_free_rate: float = Field(default=0.0, env="RISK_FREE_RATE")
+    
+    # Numeric kernels: auto (numba when installed), numpy or numba
+    kernel_backend: str = Field(default="auto", env="KERNEL_BACKEND")
+    numeric_precision: str = Field(default="float64", env="NUMERIC_PRECISION")
+    price_grid_cache_size: int = Field(default=256, env="PRICE_GRID_CACHE_SIZE")
+    
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
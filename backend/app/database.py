@@ -1,13 +1,53 @@
 """
 Database configuration and session management.
 Uses SQLAlchemy with PostgreSQL (Neon).
+
+Two engines share one DATABASE_URL:
+- engine / SessionLocal: synchronous (psycopg2), for jobs, scripts and
+  the analytics routers (plain handlers, run in the threadpool)
+- async_engine / AsyncSessionLocal: asyncio (asyncpg, or aiosqlite for a
+  local SQLite file), for request handlers that must not block the
+  event loop
+
+SQLite connections of both engines enforce foreign keys (off by default
+in SQLite), so deleting a strategy cascades to its legs and stress
+results as it does on PostgreSQL.
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import AsyncGenerator, Generator
 from .config import settings
 
+# Async driver for each database backend
+_ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def async_database_url(database_url: str) -> URL:
+    """
+    Async-driver form of a database URL.
+    
+    libpq options asyncpg does not understand are translated
+    (sslmode -> ssl) or dropped (channel_binding).
+    """
+    url = make_url(database_url)
+    backend = url.drivername.split("+")[0]
+    if backend not in _ASYNC_DRIVERS:
+        raise ValueError(f"No async driver for database backend: {backend}")
+    
+    query = dict(url.query)
+    if backend != "sqlite":
+        if "sslmode" in query:
+            query["ssl"] = query.pop("sslmode")
+        query.pop("channel_binding", None)
+    return url.set(drivername=_ASYNC_DRIVERS[backend], query=query)
+
 # Create SQLAlchemy engine
 engine = create_engine(
     settings.database_url,
@@ -24,6 +64,35 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+# Async engine, pooled like the sync one (aiosqlite opens a connection per use)
+_async_url = async_database_url(settings.database_url)
+_async_pool = {} if _async_url.get_backend_name() == "sqlite" else {"pool_size": 10, "max_overflow": 20}
+async_engine = create_async_engine(
+    _async_url,
+    pool_pre_ping=True,
+    echo=settings.debug,
+    **_async_pool
+)
+
+# Objects stay usable after commit (no implicit refresh in async code)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    """Turn on foreign key enforcement (and ON DELETE CASCADE) for a new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+if engine.dialect.name == "sqlite":
+    event.listen(engine, "connect", _enable_sqlite_foreign_keys)
+    event.listen(async_engine.sync_engine, "connect", _enable_sqlite_foreign_keys)
+
 # Base class for SQLAlchemy models
 Base = declarative_base()
 
@@ -48,10 +117,25 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for an async database session.
+    
+    Usage in FastAPI:
+    ```python
+    @app.get("/items")
+    async def get_items(db: AsyncSession = Depends(get_async_db)):
+        result = await db.execute(select(Item))
+    ```
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def init_db():
     """
     Initialize database - create all tables.
     Called on application startup.
     """
-    from .models import strategy  # Import models to register them
+    from .models import strategy, strategy_leg, stress_result  # Import models to register them
     Base.metadata.create_all(bind=engine)
@@ -0,0 +1 @@
+# Background Jobs Package
@@ -0,0 +1,182 @@
+"""
+Daily book stress test.
+
+Pages through every saved strategy in chunks, fans the chunks
+out to a process pool that prices the standard stress scenarios, and
+writes each strategy's worst-case P&L to `strategy_stress_results`.
+
+The job is resumable: results are committed chunk by chunk and a rerun
+with the same run id skips strategies that already have a result.
+
+Usage:
+    python -m app.jobs.stress_test --underlying-price 18000 --volatility 0.14
+    python -m app.jobs.stress_test --underlying-price 18000 --run-id 2026-01-15
+"""
+import argparse
+import logging
+import os
+import time
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import exists, func, insert, select
+
+from ..config import settings
+from ..database import SessionLocal, init_db
+from ..models.strategy import Strategy
+from ..models.stress_result import StrategyStressResult
+from ..services.market_data import to_datetime64
+from ..services.scenarios import ScenarioService
+
+logger = logging.getLogger(__name__)
+
+_STRATEGY_COLUMNS = (
+    Strategy.id,
+    Strategy.strategy_type,
+    Strategy.expiry_date,
+    Strategy.parameters,
+    Strategy.custom_legs,
+)
+
+
+def _stress_chunk(
+    rows: List[Dict[str, Any]],
+    underlying_price: float,
+    volatility: float,
+    valuation_date: str,
+    rate: float
+) -> List[Dict[str, Any]]:
+    """Worker entry point: stress one chunk of strategies."""
+    return ScenarioService.stress_strategies(
+        rows, underlying_price, volatility, to_datetime64(valuation_date), rate
+    )
+
+
+def run_stress_test(
+    underlying_price: float,
+    volatility: Optional[float] = None,
+    run_id: Optional[str] = None,
+    valuation_date: Optional[str] = None,
+    chunk_size: int = 1000,
+    workers: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Stress-test every saved strategy against the standard scenario set.
+
+    Args:
+        underlying_price: Current underlying price
+        volatility: Current volatility (default: settings.default_volatility)
+        run_id: Identifier of the run (default: valuation date)
+        valuation_date: Valuation date YYYY-MM-DD (default: today)
+        chunk_size: Strategies per database batch and per worker task
+        workers: Worker processes (default: CPU count)
+
+    Returns:
+        Throughput metrics of the run
+    """
+    valuation_date = valuation_date or date.today().isoformat()
+    run_id = run_id or valuation_date
+    volatility = settings.default_volatility if volatility is None else volatility
+    rate = settings.risk_free_rate
+    workers = workers or os.cpu_count() or 1
+
+    already_done = exists().where(
+        (StrategyStressResult.run_id == run_id)
+        & (StrategyStressResult.strategy_id == Strategy.id)
+    )
+
+    started = time.perf_counter()
+    processed = failed = 0
+
+    with SessionLocal() as db, ProcessPoolExecutor(workers) as pool:
+        total = db.execute(
+            select(func.count()).select_from(Strategy).where(~already_done)
+        ).scalar_one()
+        logger.info(f"Stress run {run_id}: {total} strategies to process")
+
+        max_in_flight = 2 * workers
+        in_flight = set()
+
+        def drain(return_when: str) -> None:
+            nonlocal processed, failed
+            done, _ = wait(in_flight, return_when=return_when)
+            for future in done:
+                in_flight.discard(future)
+                rows = [{"run_id": run_id, **r} for r in future.result()]
+                db.execute(insert(StrategyStressResult), rows)
+                db.commit()
+
+                processed += len(rows)
+                failed += sum(1 for r in rows if r["error"])
+                elapsed = time.perf_counter() - started
+                rate_per_sec = processed / elapsed if elapsed > 0 else 0.0
+                eta = (total - processed) / rate_per_sec if rate_per_sec > 0 else 0.0
+                logger.info(
+                    f"Stress run {run_id}: {processed}/{total} strategies "
+                    f"({rate_per_sec:.0f}/s, ETA {eta:.0f}s, {failed} failed)"
+                )
+
+        # Keyset pages: each read is a short query, so no cursor stays open
+        # while results are committed and only one page is held in memory
+        last_id = 0
+        while True:
+            page = db.execute(
+                select(*_STRATEGY_COLUMNS)
+                .where(Strategy.id > last_id, ~already_done)
+                .order_by(Strategy.id)
+                .limit(chunk_size)
+            ).all()
+            if not page:
+                break
+            last_id = page[-1].id
+
+            rows = [row._asdict() for row in page]
+            in_flight.add(pool.submit(
+                _stress_chunk, rows, underlying_price, volatility, valuation_date, rate
+            ))
+            if len(in_flight) >= max_in_flight:
+                drain(FIRST_COMPLETED)
+
+        if in_flight:
+            drain(ALL_COMPLETED)
+
+    elapsed = time.perf_counter() - started
+    metrics = {
+        "run_id": run_id,
+        "processed": processed,
+        "failed": failed,
+        "elapsed_seconds": round(elapsed, 2),
+        "strategies_per_second": round(processed / elapsed, 1) if elapsed > 0 else None,
+    }
+    logger.info(f"Stress run {run_id} finished: {metrics}")
+    return metrics
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Stress-test every saved strategy")
+    parser.add_argument("--underlying-price", type=float, required=True, help="Current underlying price")
+    parser.add_argument("--volatility", type=float, default=None, help="Current volatility, e.g. 0.14")
+    parser.add_argument("--run-id", default=None, help="Run identifier (default: valuation date)")
+    parser.add_argument("--valuation-date", default=None, help="Valuation date YYYY-MM-DD (default: today)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Strategies per batch")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    init_db()
+    run_stress_test(
+        underlying_price=args.underlying_price,
+        volatility=args.volatility,
+        run_id=args.run_id,
+        valuation_date=args.valuation_date,
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+    )
+
+
+if __name__ == "__main__":
+    main()
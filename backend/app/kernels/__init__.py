@@ -0,0 +1,111 @@
+"""
+Kernel backends - Interchangeable implementations of the hot numeric loops.
+
+Every backend module exposes the same functions:
+- black_scholes_price(spot, strike, t, vol, rate, is_call, dtype)
+- leg_pnl(kind, quantity, strike, entry_price, spot, t, vol, rate, dtype)
+
+`numpy` is the reference implementation and is always available.
+`numba` compiles the same math to machine code and is used when the
+numba package is installed. KERNEL_BACKEND selects one of:
+auto (numba when installed, else numpy), numpy, numba.
+
+Kernels run in float64 or float32. float32 halves the memory and
+bandwidth of large grids; NUMERIC_PRECISION sets the server default and
+memory-heavy endpoints accept a per-request `precision`. Against the
+float64 reference, float32 results stay within:
+- prices: FLOAT32_PRICE_TOLERANCE x (spot + strike)
+- P&L: FLOAT32_PRICE_TOLERANCE x sum over legs of |quantity| x (spot + strike)
+(asserted by tests/test_precision.py; benchmarks/precision_check.py
+reports the worst error on larger grids).
+"""
+import importlib
+import logging
+import time
+from types import ModuleType
+from typing import Dict, Optional
+
+import numpy as np
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+KERNEL_BACKENDS = ("auto", "numpy", "numba")
+
+PRECISIONS = {"float64": np.dtype(np.float64), "float32": np.dtype(np.float32)}
+
+# Documented float32 error bound, relative to the notional (see module docstring)
+FLOAT32_PRICE_TOLERANCE = 1e-6
+
+_backend: Optional[ModuleType] = None
+
+
+def load_backend(name: str) -> ModuleType:
+    """
+    Import a kernel backend by name.
+
+    Raises:
+        ValueError: If the name is unknown or the backend is not installed
+    """
+    if name not in KERNEL_BACKENDS or name == "auto":
+        raise ValueError(f"Unknown kernel backend: {name}")
+    try:
+        return importlib.import_module(f".{name}_kernels", __name__)
+    except ImportError:
+        raise ValueError(f"The {name} kernel backend requires the {name} package")
+
+
+def get_kernels() -> ModuleType:
+    """Active kernel backend, chosen from settings.kernel_backend on first use."""
+    global _backend
+    if _backend is None:
+        name = settings.kernel_backend.lower()
+        if name == "auto":
+            try:
+                _backend = load_backend("numba")
+            except ValueError:
+                _backend = load_backend("numpy")
+        else:
+            try:
+                _backend = load_backend(name)
+            except ValueError as e:
+                logger.warning(f"{e}; falling back to the numpy kernels")
+                _backend = load_backend("numpy")
+    return _backend
+
+
+def resolve_precision(precision: Optional[str] = None) -> np.dtype:
+    """
+    NumPy dtype of a precision name (default: settings.numeric_precision).
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    name = (precision or settings.numeric_precision).lower()
+    if name not in PRECISIONS:
+        raise ValueError(f"Unknown precision: {name} (use float64 or float32)")
+    return PRECISIONS[name]
+
+
+def warm_up() -> Dict[str, object]:
+    """
+    Run every kernel of the active backend once on tiny inputs.
+
+    JIT backends compile (or load from their on-disk cache) here, so the
+    first request does not pay the compile time.
+
+    Returns:
+        Backend name and warm-up time
+    """
+    started = time.perf_counter()
+    kernels = get_kernels()
+    kind = np.array([1, 2], dtype=np.int8)
+    for dtype in PRECISIONS.values():
+        one = np.ones(2, dtype=dtype)
+        kernels.black_scholes_price(one, one, one, one, 0.0, kind == 1, dtype)
+        kernels.leg_pnl(kind, one, one, one, one, one, one, 0.0, dtype)
+    return {
+        "backend": kernels.NAME,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+    }
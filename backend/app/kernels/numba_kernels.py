@@ -0,0 +1,111 @@
+"""
+Numba kernels - JIT-compiled implementation of the kernel backend.
+
+Same math as numpy_kernels, written as scalar loops and compiled with
+Numba. black_scholes_price is a ufunc and leg_pnl a generalized ufunc
+over the leg axis, so both broadcast exactly like the NumPy reference
+without materializing (..., legs) temporaries. Compiled code is cached
+on disk, so only the first start after a change pays the compile time.
+
+Loops are listed float32 first: NumPy picks the first loop the inputs
+cast to safely, so float32 inputs would otherwise run the float64 loop.
+
+Importing this module raises ImportError when numba is not installed.
+"""
+import math
+
+import numba
+import numpy as np
+
+from ..services.pricing import (
+    MIN_TIME_TO_EXPIRY,
+    _B1, _B2, _B3, _B4, _B5, _INV_SQRT_2PI, _P,
+)
+
+NAME = "numba"
+
+_FUT = 0
+_CE = 1
+
+
+@numba.njit(cache=True)
+def _norm_cdf(x):
+    ax = abs(x)
+    k = 1.0 / (1.0 + _P * ax)
+    poly = k * (_B1 + k * (_B2 + k * (_B3 + k * (_B4 + k * _B5))))
+    upper = _INV_SQRT_2PI * math.exp(-0.5 * ax * ax) * poly
+    return 1.0 - upper if x >= 0 else upper
+
+
+@numba.njit(cache=True)
+def _bs_price(spot, strike, t, vol, rate, is_call):
+    t = max(t, MIN_TIME_TO_EXPIRY)
+    vol = max(vol, 1e-6)
+    sigma_sqrt_t = vol * math.sqrt(t)
+    d1 = (math.log(spot / strike) + (rate + 0.5 * vol * vol) * t) / sigma_sqrt_t
+    d2 = d1 - sigma_sqrt_t
+    discounted_strike = strike * math.exp(-rate * t)
+    if is_call:
+        return spot * _norm_cdf(d1) - discounted_strike * _norm_cdf(d2)
+    return discounted_strike * _norm_cdf(-d2) - spot * _norm_cdf(-d1)
+
+
+@numba.vectorize(
+    [
+        "float32(float32, float32, float32, float32, float32, boolean)",
+        "float64(float64, float64, float64, float64, float64, boolean)",
+    ],
+    cache=True,
+)
+def _bs_ufunc(spot, strike, t, vol, rate, is_call):
+    return _bs_price(spot, strike, t, vol, rate, is_call)
+
+
+@numba.guvectorize(
+    [
+        "void(int8[:], float32[:], float32[:], float32[:], float32[:], float32[:], float32[:], float32, float32[:])",
+        "void(int8[:], float64[:], float64[:], float64[:], float64[:], float64[:], float64[:], float64, float64[:])",
+    ],
+    "(n),(n),(n),(n),(n),(n),(n),()->()",
+    cache=True,
+)
+def _leg_pnl_gufunc(kind, quantity, strike, entry_price, spot, t, vol, rate, out):
+    total = 0.0
+    for j in range(kind.shape[0]):
+        s = spot[j]
+        if kind[j] == _FUT:
+            value = s
+        elif t[j] > 0:
+            value = _bs_price(s, strike[j], t[j], vol[j], rate, kind[j] == _CE)
+        elif kind[j] == _CE:
+            value = max(s - strike[j], 0.0)
+        else:
+            value = max(strike[j] - s, 0.0)
+        total += quantity[j] * (value - entry_price[j])
+    out[0] = total
+
+
+def black_scholes_price(spot, strike, time_to_expiry, volatility, rate=0.0, is_call=True,
+                        dtype=np.float64):
+    """Black-Scholes price of a European option (see services.pricing)."""
+    return _bs_ufunc(
+        np.asarray(spot, dtype=dtype),
+        np.asarray(strike, dtype=dtype),
+        np.asarray(time_to_expiry, dtype=dtype),
+        np.asarray(volatility, dtype=dtype),
+        np.asarray(rate, dtype=dtype),
+        np.asarray(is_call, dtype=bool),
+    )
+
+
+def leg_pnl(kind, quantity, strike, entry_price, spot, time_to_expiry, volatility, rate=0.0,
+            dtype=np.float64):
+    """Position P&L summed over the leg axis, excluding net cash."""
+    arrays = [np.asarray(kind, dtype=np.int8)] + [
+        np.asarray(a, dtype=dtype)
+        for a in (quantity, strike, entry_price, spot, time_to_expiry, volatility)
+    ]
+    # Stride-0 views give every input the full leg axis without copying
+    shape = np.broadcast_shapes(*(a.shape for a in arrays))
+    arrays = [np.broadcast_to(a, shape) for a in arrays]
+    return _leg_pnl_gufunc(*arrays, np.asarray(rate, dtype=dtype))
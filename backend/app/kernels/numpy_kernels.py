@@ -0,0 +1,44 @@
+"""
+NumPy kernels - Reference implementation of the kernel backend.
+
+Inputs broadcast like ordinary NumPy expressions; the last axis of the
+leg arrays is the leg axis.
+"""
+import numpy as np
+
+from ..services.pricing import black_scholes_price
+
+NAME = "numpy"
+
+# Leg kinds (see services.legs)
+_FUT = 0
+_CE = 1
+
+__all__ = ["NAME", "black_scholes_price", "leg_pnl"]
+
+
+def leg_pnl(kind, quantity, strike, entry_price, spot, time_to_expiry, volatility, rate=0.0,
+            dtype=np.float64):
+    """
+    Position P&L summed over the leg axis, excluding net cash.
+
+    Options are priced with Black-Scholes while time remains and at
+    intrinsic value once expired; futures are worth the spot price.
+    Everything is computed in `dtype`.
+    """
+    quantity = np.asarray(quantity, dtype=dtype)
+    strike = np.asarray(strike, dtype=dtype)
+    entry_price = np.asarray(entry_price, dtype=dtype)
+    spot = np.asarray(spot, dtype=dtype)
+    t = np.asarray(time_to_expiry, dtype=dtype)
+    is_call = kind == _CE
+
+    intrinsic = np.where(is_call, spot - strike, strike - spot)
+    intrinsic = np.maximum(intrinsic, 0.0)
+    option = np.where(
+        t > 0,
+        black_scholes_price(spot, strike, t, volatility, rate, is_call, dtype),
+        intrinsic,
+    )
+    values = np.where(kind == _FUT, spot, option)
+    return (quantity * (values - entry_price)).sum(axis=-1)
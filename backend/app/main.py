@@ -9,8 +9,9 @@ from contextlib import asynccontextmanager
 import logging
 
 from .config import settings
-from .database import init_db
-from .routers import payoff, strategies
+from .database import async_engine, init_db
+from .kernels import warm_up
+from .routers import payoff, strategies, optimizer, option_chain, backtest, risk, simulation
 
 # Configure logging
 logging.basicConfig(
@@ -42,10 +43,15 @@ async def lifespan(app: FastAPI):
         logger.error(f"❌ Database initialization failed: {e}")
         raise
     
+    # Compile / load the numeric kernels before the first request
+    kernels = warm_up()
+    logger.info(f"✅ Kernels ready: {kernels['backend']} ({kernels['elapsed_ms']} ms)")
+    
     yield
     
     # Shutdown
     logger.info("🛑 Shutting down Options Strategy Builder API")
+    await async_engine.dispose()
 
 
 # Create FastAPI application
@@ -70,6 +76,11 @@ app.add_middleware(
 # Include routers
 app.include_router(payoff.router, prefix="/api")
 app.include_router(strategies.router, prefix="/api")
+app.include_router(optimizer.router, prefix="/api")
+app.include_router(option_chain.router, prefix="/api")
+app.include_router(backtest.router, prefix="/api")
+app.include_router(risk.router, prefix="/api")
+app.include_router(simulation.router, prefix="/api")
 
 
 @app.get(
@@ -90,10 +101,24 @@ async def root():
             "health": "/api/health",
             "calculate_payoff": "POST /api/payoff/calculate",
             "create_strategy": "POST /api/strategies",
+            "import_strategies": "POST /api/strategies/bulk",
             "get_strategies": "GET /api/strategies",
+            "search_strategies": "GET /api/strategies/search",
+            "get_strategy_legs": "GET /api/strategies/legs",
+            "export_strategies": "GET /api/strategies/export",
             "get_strategy": "GET /api/strategies/{id}",
             "update_strategy": "PUT /api/strategies/{id}",
             "delete_strategy": "DELETE /api/strategies/{id}",
+            "batch_update_strategies": "POST /api/strategies/batch-update",
+            "batch_delete_strategies": "POST /api/strategies/batch-delete",
+            "optimize_strikes": "POST /api/optimizer/strikes",
+            "chain_quote": "GET /api/option-chain/quote",
+            "chain_quotes": "POST /api/option-chain/quotes",
+            "run_backtest": "POST /api/backtest/run",
+            "scenario_grid": "POST /api/risk/scenarios",
+            "historical_var": "POST /api/risk/historical-var",
+            "simulate": "POST /api/simulation/run",
+            "simulate_exits": "POST /api/simulation/exits",
         }
     }
 
@@ -2,10 +2,35 @@
 SQLAlchemy model for Strategy entity.
 Represents saved trading strategies in the database.
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, Index, JSON, DDL, event, text
 from sqlalchemy.sql import func
 from ..database import Base
 
+# Full-text document of a strategy on PostgreSQL: name (weight A) and notes
+# (weight B). Search queries must use this exact expression so the planner
+# matches it to ix_strategies_search.
+SEARCH_DOCUMENT = (
+    "setweight(to_tsvector('english'::regconfig, coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(notes, '')), 'B')"
+)
+
+# Full-text index on SQLite: an FTS5 table over name and notes, kept in
+# step with strategies by triggers (external content, so text is not stored twice)
+SEARCH_TABLE = "strategies_fts"
+SQLITE_SEARCH_DDL = (
+    f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5("
+    "name, notes, content='strategies', content_rowid='id', tokenize='porter unicode61')",
+    f"CREATE TRIGGER strategies_fts_insert AFTER INSERT ON strategies BEGIN "
+    f"INSERT INTO {SEARCH_TABLE}(rowid, name, notes) VALUES (new.id, new.name, new.notes); END",
+    f"CREATE TRIGGER strategies_fts_delete AFTER DELETE ON strategies BEGIN "
+    f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, name, notes) "
+    "VALUES ('delete', old.id, old.name, old.notes); END",
+    f"CREATE TRIGGER strategies_fts_update AFTER UPDATE OF name, notes ON strategies BEGIN "
+    f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, name, notes) "
+    "VALUES ('delete', old.id, old.name, old.notes); "
+    f"INSERT INTO {SEARCH_TABLE}(rowid, name, notes) VALUES (new.id, new.name, new.notes); END",
+)
+
 
 class Strategy(Base):
     """
@@ -13,6 +38,21 @@ class Strategy(Base):
     Stores user-configured trading strategies.
     """
     __tablename__ = "strategies"
+    __table_args__ = (
+        # Listing filters: type + expiry range, expiry range alone
+        Index("ix_strategies_type_expiry", "strategy_type", "expiry_date"),
+        Index("ix_strategies_expiry_date", "expiry_date"),
+        # Name-prefix LIKE 'abc%' can only use a pattern_ops index on PostgreSQL
+        Index(
+            "ix_strategies_name_pattern", "name",
+            postgresql_ops={"name": "varchar_pattern_ops"}
+        ).ddl_if(dialect="postgresql"),
+        # Full-text search over name and notes (SQLite uses SEARCH_TABLE instead)
+        Index(
+            "ix_strategies_search", text(f"({SEARCH_DOCUMENT})"),
+            postgresql_using="gin"
+        ).ddl_if(dialect="postgresql"),
+    )
     
     # Primary key
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
@@ -22,8 +62,8 @@ class Strategy(Base):
     strategy_type = Column(String(100), nullable=False, index=True)
     
     # Dates
-    entry_date = Column(String(50), nullable=False)
-    expiry_date = Column(String(50), nullable=False)
+    entry_date = Column(Date, nullable=False)
+    expiry_date = Column(Date, nullable=False)
     
     # Strategy parameters (stored as JSON)
     parameters = Column(JSON, nullable=False, default={})
@@ -56,11 +96,20 @@ class Strategy(Base):
             "id": self.id,
             "name": self.name,
             "strategy_type": self.strategy_type,
-            "entry_date": self.entry_date,
-            "expiry_date": self.expiry_date,
+            "entry_date": self.entry_date.isoformat() if self.entry_date else None,
+            "expiry_date": self.expiry_date.isoformat() if self.expiry_date else None,
             "parameters": self.parameters,
             "custom_legs": self.custom_legs,
             "notes": self.notes,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
+
+
+# Create the SQLite search table and its triggers along with strategies
+for _statement in SQLITE_SEARCH_DDL:
+    event.listen(Strategy.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(
+    Strategy.__table__, "after_drop",
+    DDL(f"DROP TABLE IF EXISTS {SEARCH_TABLE}").execute_if(dialect="sqlite")
+)
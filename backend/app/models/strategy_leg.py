@@ -0,0 +1,61 @@
+"""
+SQLAlchemy model for StrategyLeg entity.
+One row per leg of a saved strategy, derived from its template parameters
+or custom legs so legs can be queried with indexes.
+"""
+from sqlalchemy import Column, Integer, String, Date, Float, ForeignKey, Index
+from ..database import Base
+
+
+class StrategyLeg(Base):
+    """
+    Strategy leg database model.
+    Rewritten by the strategy services whenever a strategy's legs can change.
+    """
+    __tablename__ = "strategy_legs"
+    __table_args__ = (
+        # Leg queries: type + action + strike range, expiry range
+        Index("ix_strategy_legs_type_action_strike", "leg_type", "action", "strike"),
+        Index("ix_strategy_legs_expiry", "expiry"),
+    )
+
+    # Primary key: position of the leg within its strategy
+    strategy_id = Column(
+        Integer,
+        ForeignKey("strategies.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    leg_index = Column(Integer, primary_key=True)
+
+    # Position
+    leg_type = Column(String(3), nullable=False)   # CE / PE / FUT
+    action = Column(String(4), nullable=False)     # BUY / SELL
+    quantity = Column(Float, nullable=False)       # Units (lots x lot size)
+
+    # Option strike (null for futures, or when a template leaves it to the spot price)
+    strike = Column(Float, nullable=True)
+
+    # Premium paid/received, or futures entry price
+    entry_price = Column(Float, nullable=True)
+
+    # Leg expiry (a custom leg's own expiry, else the strategy's)
+    expiry = Column(Date, nullable=True)
+
+    def __repr__(self):
+        return (
+            f"<StrategyLeg(strategy_id={self.strategy_id}, leg_index={self.leg_index}, "
+            f"{self.action} {self.leg_type} {self.strike})>"
+        )
+
+    def to_dict(self):
+        """Convert model to dictionary for JSON response."""
+        return {
+            "strategy_id": self.strategy_id,
+            "leg_index": self.leg_index,
+            "leg_type": self.leg_type,
+            "action": self.action,
+            "quantity": self.quantity,
+            "strike": self.strike,
+            "entry_price": self.entry_price,
+            "expiry": self.expiry.isoformat() if self.expiry else None,
+        }
@@ -0,0 +1,67 @@
+"""
+SQLAlchemy model for StrategyStressResult entity.
+Stores the outcome of the daily stress test for each saved strategy.
+"""
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, ForeignKey, UniqueConstraint
+from sqlalchemy.sql import func
+from ..database import Base
+
+
+class StrategyStressResult(Base):
+    """
+    Stress test result database model.
+    One row per (stress run, strategy).
+    """
+    __tablename__ = "strategy_stress_results"
+    __table_args__ = (
+        UniqueConstraint("run_id", "strategy_id", name="uq_stress_run_strategy"),
+    )
+    
+    # Primary key
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    
+    # Run identification (e.g. the run date)
+    run_id = Column(String(100), nullable=False, index=True)
+    strategy_id = Column(
+        Integer,
+        ForeignKey("strategies.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+    
+    # Results
+    base_pnl = Column(Float, nullable=True)
+    worst_pnl = Column(Float, nullable=True)
+    worst_spot_shock = Column(Float, nullable=True)
+    worst_vol_shock = Column(Float, nullable=True)
+    worst_days_elapsed = Column(Float, nullable=True)
+    best_pnl = Column(Float, nullable=True)
+    
+    # Set when the strategy could not be priced
+    error = Column(Text, nullable=True)
+    
+    # Timestamps
+    created_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+    
+    def __repr__(self):
+        return f"<StrategyStressResult(run_id='{self.run_id}', strategy_id={self.strategy_id}, worst_pnl={self.worst_pnl})>"
+    
+    def to_dict(self):
+        """Convert model to dictionary for JSON response."""
+        return {
+            "id": self.id,
+            "run_id": self.run_id,
+            "strategy_id": self.strategy_id,
+            "base_pnl": self.base_pnl,
+            "worst_pnl": self.worst_pnl,
+            "worst_spot_shock": self.worst_spot_shock,
+            "worst_vol_shock": self.worst_vol_shock,
+            "worst_days_elapsed": self.worst_days_elapsed,
+            "best_pnl": self.best_pnl,
+            "error": self.error,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
@@ -0,0 +1,86 @@
+"""
+Backtest endpoints (Controller layer).
+Replays saved or inline strategies over local price history.
+"""
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from ..database import get_db
+from ..schemas.backtest import BacktestRequest
+from ..schemas.strategy import StandardResponse
+from ..services.backtester import BacktestService
+from ..services.strategy_service import StrategyService
+
+router = APIRouter(
+    prefix="/backtest",
+    tags=["Backtesting"]
+)
+
+
+@router.post(
+    "/run",
+    response_model=StandardResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Backtest strategies",
+    description="Replay strategies over a price-history file and report equity curves and stats"
+)
+def run_backtest(
+    request: BacktestRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Backtest saved and/or inline strategies.
+
+    **Request Body:**
+    - history_file: Price history CSV inside PRICE_HISTORY_DIR (date, close)
+    - strategy_ids: Saved strategies to replay
+    - strategies: Inline strategy definitions (e.g. parameter variants)
+    - volatility: Pricing volatility (default: trailing realized volatility)
+    - stop_loss / profit_target / max_days_held: Exit rules
+
+    **Returns:**
+    Standard response with per-strategy stats, the combined equity curve
+    and a summary across all strategies
+    """
+    strategies, missing = StrategyService.get_strategy_definitions(db, request.strategy_ids)
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Strategies not found: {missing}"
+        )
+
+    strategies += [s.model_dump() for s in request.strategies]
+
+    try:
+        result = BacktestService.run(
+            strategies=strategies,
+            history_file=request.history_file,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            volatility=request.volatility,
+            stop_loss=request.stop_loss,
+            profit_target=request.profit_target,
+            max_days_held=request.max_days_held,
+            include_equity_curves=request.include_equity_curves,
+            precision=request.precision
+        )
+
+        return StandardResponse(
+            success=True,
+            message=f"Backtested {result['summary']['completed']} strategies over {result['bars']} bars",
+            data=result
+        )
+    except FileNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Backtest failed: {str(e)}"
+        )
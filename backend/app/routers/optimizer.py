@@ -0,0 +1,73 @@
+"""
+Strike optimizer endpoints (Controller layer).
+Searches option-chain strikes for strategy templates.
+"""
+from fastapi import APIRouter, HTTPException, status
+from ..schemas.optimizer import StrikeOptimizerRequest
+from ..schemas.strategy import StandardResponse
+from ..services.strike_optimizer import StrikeOptimizerService
+
+router = APIRouter(
+    prefix="/optimizer",
+    tags=["Strike Optimizer"]
+)
+
+
+@router.post(
+    "/strikes",
+    response_model=StandardResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Find best strikes for a template",
+    description="Enumerate option-chain strike combinations for a strategy template and return the top-k"
+)
+def optimize_strikes(request: StrikeOptimizerRequest):
+    """
+    Search strike combinations for a strategy template.
+
+    **Request Body:**
+    - strategy_type: iron-condor, bull-call-spread, butterfly-spread or covered-call
+    - chain_file: Option-chain CSV inside OPTION_CHAIN_DIR
+    - objective: reward_risk, pop or expected_value
+    - top_k: Number of candidates (default: 10)
+
+    **Returns:**
+    Standard response with ranked candidates. Each candidate's `parameters`
+    can be sent unchanged to `POST /api/payoff/calculate`.
+    """
+    try:
+        result = StrikeOptimizerService.optimize(
+            strategy_type=request.strategy_type,
+            chain_file=request.chain_file,
+            objective=request.objective,
+            top_k=request.top_k,
+            underlying=request.underlying,
+            expiry=request.expiry,
+            underlying_price=request.underlying_price,
+            lot_size=request.lot_size,
+            price_basis=request.price_basis,
+            max_width=request.max_width,
+            min_pop=request.min_pop,
+            volatility=request.volatility,
+            valuation_date=request.valuation_date
+        )
+
+        return StandardResponse(
+            success=True,
+            message=f"Found {len(result['candidates'])} candidates",
+            data=result
+        )
+    except FileNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Strike optimization failed: {str(e)}"
+        )
@@ -0,0 +1,143 @@
+"""
+Option chain endpoints (Controller layer).
+Ingests local chain snapshots and serves contract quotes from the store.
+"""
+from fastapi import APIRouter, HTTPException, status
+from typing import Optional
+from ..schemas.option_chain import ChainIngestRequest, BulkQuoteRequest
+from ..schemas.strategy import StandardResponse
+from ..services.option_chain import OptionChainStore, get_chain_store
+
+router = APIRouter(
+    prefix="/option-chain",
+    tags=["Option Chain"]
+)
+
+
+def _chain_error(e: Exception) -> HTTPException:
+    """Map service errors to HTTP errors."""
+    if isinstance(e, FileNotFoundError):
+        return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    if isinstance(e, ValueError):
+        return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return HTTPException(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        detail=f"Option chain request failed: {str(e)}"
+    )
+
+
+@router.post(
+    "/ingest",
+    response_model=StandardResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Ingest an option-chain file",
+    description="Parse a CSV/Parquet snapshot into the indexed columnar store"
+)
+def ingest_chain(request: ChainIngestRequest):
+    """
+    Ingest (or re-ingest) an option-chain snapshot.
+
+    Files are also ingested automatically the first time they are used,
+    and again whenever the source file changes.
+    """
+    try:
+        store = OptionChainStore.ingest(request.chain_file)
+
+        return StandardResponse(
+            success=True,
+            message=f"Ingested {len(store)} contracts",
+            data={
+                "chain_file": request.chain_file,
+                "rows": len(store),
+                "underlyings": {u: store.expiries(u) for u in store.underlyings},
+            }
+        )
+    except Exception as e:
+        raise _chain_error(e)
+
+
+@router.get(
+    "/quote",
+    response_model=StandardResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Quote a single contract",
+    description="Look up one contract by (underlying, expiry, strike, type)"
+)
+def get_quote(
+    chain_file: str,
+    expiry: str,
+    strike: float,
+    option_type: str,
+    underlying: Optional[str] = None
+):
+    """
+    Get the quote of a single contract.
+
+    **Query Parameters:**
+    - chain_file: Chain file name inside OPTION_CHAIN_DIR
+    - underlying: Underlying symbol (optional if the file has one)
+    - expiry: Expiry date (YYYY-MM-DD)
+    - strike: Strike price
+    - option_type: CE or PE
+    """
+    try:
+        store = get_chain_store(chain_file)
+        quote = store.lookup(underlying or store.underlyings[0], expiry, strike, option_type)
+    except Exception as e:
+        raise _chain_error(e)
+
+    if quote is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Contract {expiry} {strike} {option_type} not found in {chain_file}"
+        )
+
+    return StandardResponse(
+        success=True,
+        message="Quote retrieved successfully",
+        data=quote
+    )
+
+
+@router.post(
+    "/quotes",
+    response_model=StandardResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Quote a set of contracts",
+    description="Bulk vectorized quote fetch for a whole leg set"
+)
+def get_quotes(request: BulkQuoteRequest):
+    """
+    Get quotes for many contracts in one call.
+
+    **Returns:**
+    One entry per requested contract, in request order; `found` is false
+    for contracts that are not listed in the chain.
+    """
+    try:
+        store = get_chain_store(request.chain_file)
+        default_underlying = store.underlyings[0]
+        contracts = request.contracts
+        quotes = store.fetch(
+            [c.underlying or default_underlying for c in contracts],
+            [c.expiry for c in contracts],
+            [c.strike for c in contracts],
+            [c.option_type for c in contracts],
+        )
+    except Exception as e:
+        raise _chain_error(e)
+
+    data = []
+    for i, contract in enumerate(contracts):
+        entry = contract.model_dump()
+        entry["found"] = bool(quotes["found"][i])
+        for name in ("bid", "ask", "ltp", "iv", "underlying_price", "price"):
+            value = quotes[name][i]
+            entry[name] = None if value != value else round(float(value), 4)
+        data.append(entry)
+
+    return StandardResponse(
+        success=True,
+        message=f"Quoted {int(quotes['found'].sum())} of {len(contracts)} contracts",
+        data=data
+    )
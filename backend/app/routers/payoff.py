@@ -3,9 +3,13 @@ Payoff calculation endpoints (Controller layer).
 Handles HTTP requests/responses and delegates to service layer.
 """
 from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
+from itertools import chain
 from typing import List
-from ..schemas.strategy import PayoffRequest, PayoffDataPoint, StandardResponse
+from ..schemas.strategy import PayoffRequest, PayoffStreamRequest, PayoffDataPoint, StandardResponse
 from ..services.payoff_calculator import PayoffCalculatorService
+from ..services.option_chain import price_from_chain
+from ..services.streaming import STREAM_FORMATS, encode_blocks
 
 router = APIRouter(
     prefix="/payoff",
@@ -31,7 +35,13 @@ async def calculate_payoff(request: PayoffRequest):
     - parameters: Strategy-specific parameters (dict)
     - underlying_price: Current underlying price (default: 18000)
     - price_range_percent: Price range % (10-100, default: 30)
-    - custom_legs: For custom strategies (array of leg objects)
+    - custom_legs: For custom strategies (array of leg objects); a leg
+      may set its own expiry for calendar and diagonal spreads
+    - volatility: Prices legs still alive at the nearest expiry
+    - num_points: Points on the curve (2-10000, default: 50)
+    - grid_spacing: linear (default), log or strike-dense
+    - chain_file: Optional option-chain file; premiums left out of
+      parameters/legs are priced from it at expiry_date
     
     **Returns:**
     Array of {price, pnl} objects for charting
@@ -55,17 +65,113 @@ async def calculate_payoff(request: PayoffRequest):
     ```
     """
     try:
+        parameters = request.parameters
+        custom_legs = request.custom_legs
+        
+        # Fill missing premiums from real chain data
+        if request.chain_file:
+            parameters, custom_legs = price_from_chain(
+                request.strategy_type,
+                parameters,
+                custom_legs,
+                request.chain_file,
+                request.expiry_date,
+                request.underlying
+            )
+        
         # Delegate to service layer for calculation
         payoff_data = PayoffCalculatorService.calculate_payoff(
             strategy_type=request.strategy_type,
-            parameters=request.parameters,
+            parameters=parameters,
             underlying_price=request.underlying_price,
             price_range_percent=request.price_range_percent,
-            custom_legs=request.custom_legs
+            custom_legs=custom_legs,
+            num_points=request.num_points,
+            grid_spacing=request.grid_spacing,
+            expiry_date=request.expiry_date,
+            volatility=request.volatility
         )
         
         return payoff_data
     
+    except FileNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal server error: {str(e)}"
+        )
+
+
+@router.post(
+    "/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Stream payoff curve",
+    description="Stream a high-resolution payoff curve as NDJSON or CSV in constant memory"
+)
+async def stream_payoff(request: PayoffStreamRequest):
+    """
+    Stream the expiry payoff curve block by block.
+    
+    The curve is evaluated in fixed-size array blocks and each block is
+    serialized as soon as it is ready, so memory stays flat for curves of
+    millions of points.
+    
+    **Request Body:**
+    Same as /calculate, plus:
+    - num_points: Points on the curve (2-10,000,000, default: 10,000)
+    - format: ndjson (default, one {"price", "pnl"} object per line) or csv
+    - precision: float64 or float32
+    
+    **Returns:**
+    Streamed NDJSON or CSV rows, in ascending price order
+    """
+    try:
+        if request.format not in STREAM_FORMATS:
+            raise ValueError(f"Unknown format: {request.format} (use {', '.join(STREAM_FORMATS)})")
+        
+        parameters = request.parameters
+        custom_legs = request.custom_legs
+        
+        # Fill missing premiums from real chain data
+        if request.chain_file:
+            parameters, custom_legs = price_from_chain(
+                request.strategy_type,
+                parameters,
+                custom_legs,
+                request.chain_file,
+                request.expiry_date,
+                request.underlying
+            )
+        
+        chunks = PayoffCalculatorService.iter_payoff_chunks(
+            strategy_type=request.strategy_type,
+            parameters=parameters,
+            underlying_price=request.underlying_price,
+            price_range_percent=request.price_range_percent,
+            expiry_date=request.expiry_date,
+            custom_legs=custom_legs,
+            num_points=request.num_points,
+            grid_spacing=request.grid_spacing,
+            precision=request.precision,
+            volatility=request.volatility
+        )
+        # Evaluate the first block now so invalid input fails before streaming starts
+        first = next(chunks)
+    
+    except FileNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -76,3 +182,9 @@ async def calculate_payoff(request: PayoffRequest):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Internal server error: {str(e)}"
         )
+    
+    blocks = ({"price": prices, "pnl": pnl} for prices, pnl in chain([first], chunks))
+    return StreamingResponse(
+        encode_blocks(blocks, request.format),
+        media_type=STREAM_FORMATS[request.format]
+    )
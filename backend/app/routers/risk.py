@@ -0,0 +1,157 @@
+"""
+Risk analytics endpoints (Controller layer).
+Scenario analysis and historical VaR for strategies and portfolios.
+"""
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from ..database import get_db
+from ..schemas.risk import HistoricalVaRRequest, ScenarioRequest
+from ..schemas.strategy import StandardResponse
+from ..services.historical_var import HistoricalVaRService
+from ..services.scenarios import ScenarioService
+from ..services.strategy_service import StrategyService
+
+router = APIRouter(
+    prefix="/risk",
+    tags=["Risk Analytics"]
+)
+
+
+@router.post(
+    "/scenarios",
+    response_model=StandardResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Scenario shock grid",
+    description="P&L cube of a strategy or portfolio under spot, volatility and time shocks"
+)
+def run_scenarios(
+    request: ScenarioRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Compute P&L under simultaneous spot, volatility and time shocks.
+
+    **Request Body:**
+    - strategy_ids / strategies: Saved and/or inline strategies (summed as a portfolio)
+    - underlying_price: Current underlying price
+    - volatility: Current volatility (default: DEFAULT_VOLATILITY)
+    - spot_shocks: Spot moves in % (default: -10..10)
+    - vol_shocks: Volatility moves in points (default: -5, 0, 5, 10)
+    - days_elapsed: Days passed (default: 0, 1, 5)
+
+    **Returns:**
+    Standard response with `pnl[spot][vol][days]` and the worst/best scenario
+    """
+    strategies, missing = StrategyService.get_strategy_definitions(db, request.strategy_ids)
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Strategies not found: {missing}"
+        )
+
+    strategies += [s.model_dump() for s in request.strategies]
+
+    try:
+        result = ScenarioService.run(
+            strategies=strategies,
+            underlying_price=request.underlying_price,
+            volatility=request.volatility,
+            valuation_date=request.valuation_date,
+            spot_shocks=request.spot_shocks,
+            vol_shocks=request.vol_shocks,
+            days_elapsed=request.days_elapsed,
+            include_breakdown=request.include_breakdown,
+            precision=request.precision
+        )
+
+        return StandardResponse(
+            success=True,
+            message=f"Evaluated {result['scenarios']} scenarios for {len(strategies)} strategies",
+            data=result
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Scenario analysis failed: {str(e)}"
+        )
+
+
+@router.post(
+    "/historical-var",
+    response_model=StandardResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Historical VaR",
+    description="Value at risk of the saved book from historical N-day returns"
+)
+def run_historical_var(
+    request: HistoricalVaRRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Apply every historical N-day return to the current book and reprice it.
+
+    **Request Body:**
+    - history_file: Price history CSV in PRICE_HISTORY_DIR
+    - strategy_ids / strategy_types: Filter the saved book (default: every saved strategy)
+    - strategies: Inline strategies added to the book
+    - underlying_price: Current underlying price (default: last close)
+    - horizon_days: Return horizon in bars (default: 1)
+    - confidence: VaR confidence level (default: 0.99)
+
+    **Returns:**
+    Standard response with VaR, expected shortfall and the worst scenarios
+    """
+    strategies = StrategyService.get_book_definitions(
+        db, request.strategy_ids, request.strategy_types
+    )
+    found = {s["id"] for s in strategies}
+    missing = [i for i in request.strategy_ids if i not in found]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Strategies not found: {missing}"
+        )
+
+    strategies += [s.model_dump() for s in request.strategies]
+
+    try:
+        result = HistoricalVaRService.run(
+            strategies=strategies,
+            history_file=request.history_file,
+            underlying_price=request.underlying_price,
+            horizon_days=request.horizon_days,
+            confidence=request.confidence,
+            volatility=request.volatility,
+            valuation_date=request.valuation_date,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            worst_scenarios=request.worst_scenarios,
+            include_breakdown=request.include_breakdown,
+            precision=request.precision
+        )
+
+        return StandardResponse(
+            success=True,
+            message=f"Repriced {result['priced_strategies']} strategies under {result['scenarios']} historical scenarios",
+            data=result
+        )
+    except FileNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Historical VaR failed: {str(e)}"
+        )
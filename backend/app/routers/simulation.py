@@ -0,0 +1,160 @@
+"""
+Simulation endpoints (Controller layer).
+Monte Carlo P&L distributions under GBM, Heston and Merton models,
+at a horizon or along daily paths with exit rules.
+"""
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from ..database import get_db
+from ..schemas.simulation import SimulationExitRequest, SimulationRequest
+from ..schemas.strategy import StandardResponse
+from ..services.simulation import SimulationService
+from ..services.strategy_service import StrategyService
+
+router = APIRouter(
+    prefix="/simulation",
+    tags=["Simulation"]
+)
+
+
+@router.post(
+    "/run",
+    response_model=StandardResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Monte Carlo simulation",
+    description="Simulated P&L distribution of a strategy or portfolio at a horizon"
+)
+def run_simulation(
+    request: SimulationRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Simulate terminal prices and evaluate the strategy P&L on every path.
+
+    **Request Body:**
+    - strategy_ids / strategies: Saved and/or inline strategies (summed as a portfolio)
+    - underlying_price: Current underlying price
+    - model: gbm, heston or merton (with `heston` / `merton` parameters)
+    - num_paths: Number of paths (default: 100000)
+    - horizon_date: Date P&L is measured at (default: earliest expiry)
+    - seed: Random seed for reproducible runs
+    - sampling / antithetic / control_variate: Variance reduction
+
+    **Returns:**
+    Standard response with expected P&L and POP (with standard errors),
+    VaR/ES and percentiles
+    """
+    strategies, missing = StrategyService.get_strategy_definitions(db, request.strategy_ids)
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Strategies not found: {missing}"
+        )
+
+    strategies += [s.model_dump() for s in request.strategies]
+
+    try:
+        result = SimulationService.run(
+            strategies=strategies,
+            underlying_price=request.underlying_price,
+            model=request.model,
+            num_paths=request.num_paths,
+            volatility=request.volatility,
+            valuation_date=request.valuation_date,
+            horizon_date=request.horizon_date,
+            params=request.model_params(),
+            seed=request.seed,
+            sampling=request.sampling,
+            antithetic=request.antithetic,
+            control_variate=request.control_variate,
+            include_breakdown=request.include_breakdown,
+            precision=request.precision
+        )
+
+        return StandardResponse(
+            success=True,
+            message=f"Simulated {result['paths']} paths for {len(strategies)} strategies",
+            data=result
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Simulation failed: {str(e)}"
+        )
+
+
+@router.post(
+    "/exits",
+    response_model=StandardResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Exit rule simulation",
+    description="Realized P&L of strategies managed with stop-loss, profit-target, time and strike-breach exits"
+)
+def run_exit_simulation(
+    request: SimulationExitRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Simulate daily paths and close each strategy when an exit rule fires.
+
+    **Request Body:**
+    - Same portfolio, model and sampling fields as /run (no control_variate)
+    - stop_loss: Close once the loss reaches this amount
+    - profit_target: Close once the profit reaches this amount
+    - max_days_held: Close after this many days
+    - exit_on_strike_breach: Close once a short strike is breached
+
+    **Returns:**
+    Standard response with realized P&L statistics, hold-to-horizon
+    comparison, exit reasons and exit-day distribution
+    """
+    strategies, missing = StrategyService.get_strategy_definitions(db, request.strategy_ids)
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Strategies not found: {missing}"
+        )
+
+    strategies += [s.model_dump() for s in request.strategies]
+
+    try:
+        result = SimulationService.run_exits(
+            strategies=strategies,
+            underlying_price=request.underlying_price,
+            model=request.model,
+            num_paths=request.num_paths,
+            volatility=request.volatility,
+            valuation_date=request.valuation_date,
+            horizon_date=request.horizon_date,
+            params=request.model_params(),
+            seed=request.seed,
+            sampling=request.sampling,
+            antithetic=request.antithetic,
+            stop_loss=request.stop_loss,
+            profit_target=request.profit_target,
+            max_days_held=request.max_days_held,
+            exit_on_strike_breach=request.exit_on_strike_breach,
+            include_breakdown=request.include_breakdown,
+            precision=request.precision
+        )
+
+        return StandardResponse(
+            success=True,
+            message=f"Simulated {result['paths']} paths over {result['steps']} days for {len(strategies)} strategies",
+            data=result
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Exit simulation failed: {str(e)}"
+        )
@@ -1,18 +1,33 @@
 """
 Strategy management endpoints (Controller layer).
-CRUD operations for saved strategies.
+CRUD operations for saved strategies, on async sessions.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
-from ..database import get_db
+from datetime import date
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from ..database import AsyncSessionLocal, get_async_db
 from ..schemas.strategy import (
     StrategyCreate,
     StrategyUpdate,
+    StrategyBatchUpdate,
+    StrategySelection,
+    StrategyLegQuery,
     StrategyResponse,
-    StandardResponse
+    StandardResponse,
+    PaginatedResponse
 )
-from ..services.strategy_service import StrategyService
+from ..services.payoff_calculator import PayoffCalculatorService
+from ..services.strategy_import import IMPORT_BATCH_SIZE, StrategyImportService
+from ..services.strategy_service import STRATEGY_ORDERS, AsyncStrategyService, resolve_fields
+from ..services.streaming import STREAM_FORMATS, encode_records
+
+# Columns the export metrics are computed from
+METRICS_FIELDS = ("strategy_type", "expiry_date", "parameters", "custom_legs")
 
 router = APIRouter(
     prefix="/strategies",
@@ -29,7 +44,7 @@ router = APIRouter(
 )
 async def create_strategy(
     strategy: StrategyCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create a new strategy.
@@ -47,7 +62,7 @@ async def create_strategy(
     Standard response with created strategy data
     """
     try:
-        db_strategy = StrategyService.create_strategy(db, strategy)
+        db_strategy = await AsyncStrategyService.create_strategy(db, strategy)
         
         return StandardResponse(
             success=True,
@@ -61,35 +76,213 @@ async def create_strategy(
         )
 
 
+@router.post(
+    "/bulk",
+    response_model=StandardResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Import strategies in bulk",
+    description="Insert many strategies from an NDJSON or CSV body in large batches"
+)
+async def import_strategies(
+    request: Request,
+    format: Optional[str] = None,
+    batch_size: int = Query(default=IMPORT_BATCH_SIZE, ge=1, le=10000),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Import strategies from a file body.
+    
+    The body is parsed as it arrives and each row is validated like a
+    single create. Valid rows are inserted in batches (COPY on
+    PostgreSQL); invalid rows are skipped and reported by line number.
+    
+    **Query Parameters:**
+    - format: ndjson or csv (default: csv for a text/csv body, else ndjson)
+    - batch_size: Rows inserted per statement/commit (1-10000, default: 1000)
+    
+    **Request Body:**
+    - ndjson: One strategy object per line (same fields as create)
+    - csv: Header row of create field names; parameters and custom_legs
+      cells hold JSON text
+    
+    **Returns:**
+    Standard response with received/inserted/failed counts and per-row errors
+    """
+    if format is None:
+        content_type = request.headers.get("content-type", "")
+        format = "csv" if content_type.startswith("text/csv") else "ndjson"
+    
+    try:
+        report = await StrategyImportService.import_stream(db, request.stream(), format, batch_size)
+        
+        return StandardResponse(
+            success=True,
+            message=f"Imported {report['inserted']} strategies ({report['failed']} rows failed)",
+            data=report
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to import strategies: {str(e)}"
+        )
+
+
+@router.post(
+    "/batch-update",
+    response_model=StandardResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Update strategies in bulk",
+    description="Apply one change to a selection of strategies, or per-ID patches, in one transaction"
+)
+async def batch_update_strategies(
+    request: StrategyBatchUpdate,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Update many strategies with set-based statements.
+    
+    **Request Body:**
+    Either
+    - selection: ids, strategy_types and/or expiry_before (all must match)
+    - changes: Fields to set on every selected strategy (as in update)
+    
+    or
+    - updates: Array of partial updates, each with its strategy `id`
+      (up to 10,000)
+    
+    **Returns:**
+    Standard response with count, the updated IDs and unmatched_ids
+    (requested IDs that were not updated)
+    """
+    try:
+        result = await AsyncStrategyService.update_strategies(
+            db, request.selection, request.changes, request.updates
+        )
+        
+        return StandardResponse(
+            success=True,
+            message=f"Updated {result['count']} strategies",
+            data=result
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to update strategies: {str(e)}"
+        )
+
+
+@router.post(
+    "/batch-delete",
+    response_model=StandardResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Delete strategies in bulk",
+    description="Delete a selection of strategies (e.g. all expired ones) in one statement"
+)
+async def batch_delete_strategies(
+    selection: StrategySelection,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Delete many strategies with one DELETE.
+    
+    **Request Body:**
+    - ids: Strategy IDs (optional)
+    - strategy_types: Strategy types (optional)
+    - expiry_before: Expiry earlier than this date, YYYY-MM-DD (optional)
+    
+    At least one criterion is required; all given criteria must match.
+    
+    **Returns:**
+    Standard response with count, the deleted IDs and unmatched_ids
+    (requested IDs that were not deleted)
+    """
+    try:
+        result = await AsyncStrategyService.delete_strategies(db, selection)
+        
+        return StandardResponse(
+            success=True,
+            message=f"Deleted {result['count']} strategies",
+            data=result
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to delete strategies: {str(e)}"
+        )
+
+
 @router.get(
     "",
-    response_model=StandardResponse,
+    response_model=PaginatedResponse,
     status_code=status.HTTP_200_OK,
     summary="Get all strategies",
-    description="Retrieve all saved strategies with pagination"
+    description="Retrieve saved strategies page by page (cursor pagination)"
 )
 async def get_strategies(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db)
+    limit: int = Query(default=100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    order: str = "asc",
+    fields: Optional[str] = None,
+    strategy_type: Optional[List[str]] = Query(default=None),
+    expiry_from: Optional[date] = None,
+    expiry_to: Optional[date] = None,
+    name_prefix: Optional[str] = None,
+    skip: Optional[int] = Query(default=None, ge=0, deprecated=True),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Get all strategies.
+    Get all strategies, one page at a time.
     
     **Query Parameters:**
-    - skip: Number of records to skip (default: 0)
-    - limit: Maximum records to return (default: 100)
+    - limit: Maximum records to return (1-1000, default: 100)
+    - cursor: `next_cursor` of the previous page (omit for the first page)
+    - order: asc (oldest first, default) or desc (newest first)
+    - fields: Comma-separated columns, or `all` (default: id, name,
+      strategy_type, expiry_date)
+    - strategy_type: Only these types (repeat for several)
+    - expiry_from / expiry_to: Only expiries in this range, inclusive (YYYY-MM-DD)
+    - name_prefix: Only names starting with this text
+    
+    Filters are applied to every page; pass the same filters with the cursor.
+    - skip: Deprecated offset paging; slower on deep pages
     
     **Returns:**
-    Standard response with array of strategies
+    Paginated response with array of strategies and `next_cursor`
+    (null on the last page)
     """
     try:
-        strategies = StrategyService.get_strategies(db, skip=skip, limit=limit)
+        selection = None
+        if strategy_type or expiry_from or expiry_to or name_prefix:
+            selection = StrategySelection(
+                strategy_types=strategy_type,
+                expiry_from=expiry_from,
+                expiry_to=expiry_to,
+                name_prefix=name_prefix
+            )
         
-        return StandardResponse(
+        strategies, next_cursor = await AsyncStrategyService.get_strategies_page(
+            db, limit=limit, cursor=cursor, order=order, fields=resolve_fields(fields), skip=skip,
+            selection=selection
+        )
+        
+        return PaginatedResponse(
             success=True,
             message=f"Retrieved {len(strategies)} strategies",
-            data=[s.to_dict() for s in strategies]
+            data=strategies,
+            next_cursor=next_cursor
+        )
+    except ValidationError as e:
+        # Invalid filter combination: report it like other query validation errors
+        raise RequestValidationError(e.errors())
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
     except Exception as e:
         raise HTTPException(
@@ -98,6 +291,201 @@ async def get_strategies(
         )
 
 
+@router.get(
+    "/search",
+    response_model=PaginatedResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Search strategies",
+    description="Full-text search over strategy names and notes, best matches first"
+)
+async def search_strategies(
+    q: str = Query(min_length=1, max_length=200),
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Search strategies by name and notes.
+    
+    Matches come from the full-text index (GIN on PostgreSQL, FTS5 on
+    SQLite) and are ranked with name matches above notes matches.
+    
+    **Query Parameters:**
+    - q: Search words; all must match, the last one also as a prefix
+    - limit: Maximum matches to return (1-100, default: 20)
+    - cursor: `next_cursor` of the previous page (omit for the first page)
+    - fields: Comma-separated columns, or `all` (default: id, name,
+      strategy_type, expiry_date)
+    
+    **Returns:**
+    Paginated response with matching strategies (each with a relevance
+    `score`, higher is better) and `next_cursor` (null on the last page)
+    """
+    try:
+        strategies, next_cursor = await AsyncStrategyService.search_strategies(
+            db, q, limit=limit, cursor=cursor, fields=resolve_fields(fields)
+        )
+        
+        return PaginatedResponse(
+            success=True,
+            message=f"Found {len(strategies)} strategies",
+            data=strategies,
+            next_cursor=next_cursor
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to search strategies: {str(e)}"
+        )
+
+
+@router.get(
+    "/legs",
+    response_model=PaginatedResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Query strategy legs",
+    description="Find saved legs by type, action, strike range and expiry (index-backed)"
+)
+async def get_strategy_legs(
+    leg_type: Optional[str] = None,
+    action: Optional[str] = None,
+    strike_min: Optional[float] = None,
+    strike_max: Optional[float] = None,
+    expiry_from: Optional[date] = None,
+    expiry_to: Optional[date] = None,
+    strategy_type: Optional[List[str]] = Query(default=None),
+    limit: int = Query(default=100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Query the legs of saved strategies, e.g. every short 18500 CE:
+    `?leg_type=CE&action=SELL&strike_min=18500&strike_max=18500`
+    
+    **Query Parameters:**
+    - leg_type: CE, PE or FUT
+    - action: BUY (long) or SELL (short)
+    - strike_min / strike_max: Strike range, inclusive
+    - expiry_from / expiry_to: Leg expiry range, inclusive (YYYY-MM-DD)
+    - strategy_type: Only legs of these strategy types (repeat for several)
+    - limit: Maximum legs to return (1-1000, default: 100)
+    - cursor: `next_cursor` of the previous page (omit for the first page)
+    
+    Template strikes left to default to the spot price are null and do
+    not match a strike range.
+    
+    **Returns:**
+    Paginated response with matching legs (strategy_id, name,
+    strategy_type, leg_index, leg_type, action, quantity, strike,
+    entry_price, expiry) and `next_cursor` (null on the last page)
+    """
+    try:
+        query = StrategyLegQuery(
+            leg_type=leg_type,
+            action=action,
+            strike_min=strike_min,
+            strike_max=strike_max,
+            expiry_from=expiry_from,
+            expiry_to=expiry_to,
+            strategy_types=strategy_type
+        )
+        
+        legs, next_cursor = await AsyncStrategyService.get_legs_page(db, query, limit=limit, cursor=cursor)
+        
+        return PaginatedResponse(
+            success=True,
+            message=f"Retrieved {len(legs)} legs",
+            data=legs,
+            next_cursor=next_cursor
+        )
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve strategy legs: {str(e)}"
+        )
+
+
+@router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    summary="Export all strategies",
+    description="Stream every saved strategy as NDJSON or CSV in constant memory"
+)
+async def export_strategies(
+    format: str = "ndjson",
+    fields: Optional[str] = None,
+    order: str = "asc",
+    metrics: bool = False,
+    underlying_price: float = Query(default=18000, gt=0),
+    price_range_percent: float = Query(default=30, ge=10, le=100)
+):
+    """
+    Export the whole book, streamed row by row.
+    
+    Rows are read from a server-side cursor in batches and each batch is
+    serialized as soon as it arrives, so memory stays flat and there is
+    no row cap.
+    
+    **Query Parameters:**
+    - format: ndjson (default, one strategy per line) or csv
+    - fields: Comma-separated columns (default: all)
+    - order: asc (oldest first, default) or desc (newest first)
+    - metrics: Add max_profit, max_loss and breakevens of each strategy
+      (and error when it cannot be priced)
+    - underlying_price: Reference price of the metrics (default: 18000)
+    - price_range_percent: Price range the metrics are read over (default: 30)
+    
+    **Returns:**
+    Streamed NDJSON or CSV rows
+    """
+    try:
+        if format not in STREAM_FORMATS:
+            raise ValueError(f"Unknown format: {format} (use {', '.join(STREAM_FORMATS)})")
+        if order not in STRATEGY_ORDERS:
+            raise ValueError(f"Unknown order: {order} (use {', '.join(STRATEGY_ORDERS)})")
+        
+        selected = resolve_fields(fields or "all")
+        columns = selected + [c for c in METRICS_FIELDS if metrics and c not in selected]
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    async def rows():
+        # Own session: a dependency's session closes before a streamed body is sent
+        async with AsyncSessionLocal() as db:
+            header = True
+            async for batch in AsyncStrategyService.iter_strategy_batches(db, columns, order):
+                if metrics:
+                    # Priced in the threadpool: NumPy work would stall the event loop
+                    summaries = await run_in_threadpool(
+                        PayoffCalculatorService.summarize_strategies,
+                        batch, underlying_price, price_range_percent
+                    )
+                    batch = [
+                        {**{name: row[name] for name in selected}, **summary}
+                        for row, summary in zip(batch, summaries)
+                    ]
+                yield encode_records(batch, format, header=header)
+                header = False
+    
+    return StreamingResponse(rows(), media_type=STREAM_FORMATS[format])
+
+
 @router.get(
     "/{strategy_id}",
     response_model=StandardResponse,
@@ -107,7 +495,7 @@ async def get_strategies(
 )
 async def get_strategy(
     strategy_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get a strategy by ID.
@@ -118,7 +506,7 @@ async def get_strategy(
     **Returns:**
     Standard response with strategy data
     """
-    strategy = StrategyService.get_strategy_by_id(db, strategy_id)
+    strategy = await AsyncStrategyService.get_strategy_by_id(db, strategy_id)
     
     if not strategy:
         raise HTTPException(
@@ -143,7 +531,7 @@ async def get_strategy(
 async def update_strategy(
     strategy_id: int,
     strategy: StrategyUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update a strategy.
@@ -157,7 +545,7 @@ async def update_strategy(
     **Returns:**
     Standard response with updated strategy data
     """
-    updated_strategy = StrategyService.update_strategy(db, strategy_id, strategy)
+    updated_strategy = await AsyncStrategyService.update_strategy(db, strategy_id, strategy)
     
     if not updated_strategy:
         raise HTTPException(
@@ -181,7 +569,7 @@ async def update_strategy(
 )
 async def delete_strategy(
     strategy_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Delete a strategy.
@@ -192,7 +580,7 @@ async def delete_strategy(
     **Returns:**
     Standard response confirming deletion
     """
-    success = StrategyService.delete_strategy(db, strategy_id)
+    success = await AsyncStrategyService.delete_strategy(db, strategy_id)
     
     if not success:
         raise HTTPException(
@@ -0,0 +1,30 @@
+"""
+Pydantic schemas for historical backtests.
+"""
+from pydantic import BaseModel, Field, model_validator
+from typing import Optional, List
+from .strategy import StrategyDefinition
+
+
+class BacktestRequest(BaseModel):
+    """Request schema for replaying strategies over a price history."""
+    history_file: str = Field(..., description="Price history file name inside PRICE_HISTORY_DIR")
+    strategy_ids: List[int] = Field(default=[], description="IDs of saved strategies to replay")
+    strategies: List[StrategyDefinition] = Field(default=[], description="Inline strategies/variants to replay")
+    start_date: Optional[str] = Field(default=None, description="First bar date (default: start of file)")
+    end_date: Optional[str] = Field(default=None, description="Last bar date (default: end of file)")
+    volatility: Optional[float] = Field(default=None, gt=0, description="Pricing volatility (default: realized)")
+    stop_loss: Optional[float] = Field(default=None, gt=0, description="Exit when the loss reaches this amount")
+    profit_target: Optional[float] = Field(default=None, gt=0, description="Exit when the profit reaches this amount")
+    max_days_held: Optional[int] = Field(default=None, ge=0, description="Exit after this many calendar days")
+    include_equity_curves: bool = Field(default=False, description="Return each strategy's equity curve")
+    precision: Optional[str] = Field(default=None, description="float64 or float32 (default: NUMERIC_PRECISION)")
+    
+    @model_validator(mode="after")
+    def validate_strategy_count(self):
+        count = len(self.strategy_ids) + len(self.strategies)
+        if count == 0:
+            raise ValueError("Provide strategy_ids and/or strategies")
+        if count > 5000:
+            raise ValueError("At most 5000 strategies per backtest")
+        return self
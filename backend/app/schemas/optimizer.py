@@ -0,0 +1,29 @@
+"""
+Pydantic schemas for the strike optimizer.
+"""
+from pydantic import BaseModel, Field
+from typing import Optional, Literal
+
+
+class StrikeOptimizerRequest(BaseModel):
+    """Request schema for strike-selection search."""
+    strategy_type: Literal["iron-condor", "bull-call-spread", "butterfly-spread", "covered-call"] = Field(
+        ..., description="Strategy template whose strikes are searched"
+    )
+    chain_file: str = Field(..., description="Option-chain file name inside OPTION_CHAIN_DIR")
+    underlying: Optional[str] = Field(default=None, description="Underlying symbol (optional if the file has one)")
+    expiry: Optional[str] = Field(default=None, description="Expiry date in YYYY-MM-DD format (default: nearest)")
+    objective: Literal["reward_risk", "pop", "expected_value"] = Field(
+        default="reward_risk",
+        description="Ranking score: max profit / max loss, probability of profit or expected P&L"
+    )
+    top_k: int = Field(default=10, ge=1, le=100, description="Number of candidates to return")
+    underlying_price: Optional[float] = Field(default=None, gt=0, description="Spot price (default: from chain)")
+    lot_size: float = Field(default=50, gt=0, description="Lot size applied to every leg")
+    price_basis: Literal["mid", "bid_ask"] = Field(
+        default="mid", description="Price legs at mid or conservatively at bid/ask"
+    )
+    max_width: Optional[float] = Field(default=None, gt=0, description="Maximum spread width")
+    min_pop: Optional[float] = Field(default=None, ge=0, le=1, description="Minimum probability of profit")
+    volatility: Optional[float] = Field(default=None, gt=0, description="Volatility override (default: ATM IV)")
+    valuation_date: Optional[str] = Field(default=None, description="Valuation date YYYY-MM-DD (default: today)")
@@ -0,0 +1,24 @@
+"""
+Pydantic schemas for option-chain store endpoints.
+"""
+from pydantic import BaseModel, Field
+from typing import Optional, List, Literal
+
+
+class ChainIngestRequest(BaseModel):
+    """Request schema for (re)ingesting an option-chain file."""
+    chain_file: str = Field(..., description="CSV or Parquet file name inside OPTION_CHAIN_DIR")
+
+
+class ContractQuery(BaseModel):
+    """Identifies a single listed contract."""
+    underlying: Optional[str] = Field(default=None, description="Underlying symbol (optional if the file has one)")
+    expiry: str = Field(..., description="Expiry date in YYYY-MM-DD format")
+    strike: float = Field(..., gt=0, description="Strike price")
+    option_type: Literal["CE", "PE"] = Field(..., description="CE (call) or PE (put)")
+
+
+class BulkQuoteRequest(BaseModel):
+    """Request schema for fetching quotes of a whole leg set."""
+    chain_file: str = Field(..., description="CSV or Parquet file name inside OPTION_CHAIN_DIR")
+    contracts: List[ContractQuery] = Field(..., min_length=1, max_length=10000, description="Contracts to quote")
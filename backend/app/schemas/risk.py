@@ -0,0 +1,52 @@
+"""
+Pydantic schemas for risk analytics (scenario grids, historical VaR).
+"""
+from pydantic import BaseModel, Field, model_validator
+from typing import Optional, List
+from .strategy import StrategyDefinition
+
+
+class ScenarioRequest(BaseModel):
+    """Request schema for a spot x volatility x time shock grid."""
+    strategy_ids: List[int] = Field(default=[], description="Saved strategies in the portfolio")
+    strategies: List[StrategyDefinition] = Field(default=[], description="Inline strategies in the portfolio")
+    underlying_price: float = Field(..., gt=0, description="Current underlying price")
+    volatility: Optional[float] = Field(default=None, gt=0, description="Current volatility (0.15 = 15%)")
+    valuation_date: Optional[str] = Field(default=None, description="Valuation date YYYY-MM-DD (default: today)")
+    spot_shocks: Optional[List[float]] = Field(default=None, description="Spot moves in percent, e.g. [-5, 0, 5]")
+    vol_shocks: Optional[List[float]] = Field(default=None, description="Volatility moves in points, e.g. [0, 10]")
+    days_elapsed: Optional[List[float]] = Field(default=None, description="Days passed, e.g. [0, 3]")
+    include_breakdown: bool = Field(default=False, description="Return each strategy's P&L cube")
+    precision: Optional[str] = Field(default=None, description="float64 or float32 (default: NUMERIC_PRECISION)")
+    
+    @model_validator(mode="after")
+    def validate_grid(self):
+        if not self.strategy_ids and not self.strategies:
+            raise ValueError("Provide strategy_ids and/or strategies")
+        for name in ("spot_shocks", "vol_shocks", "days_elapsed"):
+            values = getattr(self, name)
+            if values is not None and not 1 <= len(values) <= 200:
+                raise ValueError(f"{name} must have between 1 and 200 values")
+        if self.spot_shocks and min(self.spot_shocks) <= -100:
+            raise ValueError("spot_shocks must be greater than -100")
+        if self.days_elapsed and min(self.days_elapsed) < 0:
+            raise ValueError("days_elapsed cannot be negative")
+        return self
+
+
+class HistoricalVaRRequest(BaseModel):
+    """Request schema for historical-simulation VaR of the saved book."""
+    history_file: str = Field(..., description="Price history file name inside PRICE_HISTORY_DIR")
+    strategy_ids: List[int] = Field(default=[], description="Restrict the book to these strategies (default: all saved)")
+    strategy_types: List[str] = Field(default=[], description="Restrict the book to these strategy types")
+    strategies: List[StrategyDefinition] = Field(default=[], description="Inline strategies added to the book")
+    underlying_price: Optional[float] = Field(default=None, gt=0, description="Current underlying price (default: last close)")
+    horizon_days: int = Field(default=1, ge=1, le=250, description="Bars per historical return (N-day VaR)")
+    confidence: float = Field(default=0.99, ge=0.5, lt=1, description="VaR confidence level")
+    volatility: Optional[float] = Field(default=None, gt=0, description="Pricing volatility (default: DEFAULT_VOLATILITY)")
+    valuation_date: Optional[str] = Field(default=None, description="Valuation date YYYY-MM-DD (default: today)")
+    start_date: Optional[str] = Field(default=None, description="First bar used for returns (default: start of file)")
+    end_date: Optional[str] = Field(default=None, description="Last bar used for returns (default: end of file)")
+    worst_scenarios: int = Field(default=5, ge=1, le=100, description="Number of worst scenarios to return")
+    include_breakdown: bool = Field(default=False, description="Return per-strategy VaR and VaR-scenario P&L")
+    precision: Optional[str] = Field(default=None, description="float64 or float32 (default: NUMERIC_PRECISION)")
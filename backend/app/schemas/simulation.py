@@ -0,0 +1,71 @@
+"""
+Pydantic schemas for Monte Carlo simulations.
+"""
+from pydantic import BaseModel, Field, model_validator
+from typing import Optional, List
+from .strategy import StrategyDefinition
+
+
+class HestonParameters(BaseModel):
+    """Heston stochastic-volatility parameters (variances are annualized)."""
+    initial_variance: Optional[float] = Field(default=None, gt=0, description="Starting variance (default: volatility^2)")
+    long_run_variance: Optional[float] = Field(default=None, gt=0, description="Mean-reversion level (default: volatility^2)")
+    kappa: Optional[float] = Field(default=None, gt=0, description="Mean-reversion speed (default: 2.0)")
+    vol_of_vol: Optional[float] = Field(default=None, gt=0, description="Volatility of variance (default: 0.5)")
+    rho: Optional[float] = Field(default=None, ge=-1, le=1, description="Spot/variance correlation (default: -0.7)")
+
+
+class MertonParameters(BaseModel):
+    """Merton jump-diffusion parameters."""
+    jump_intensity: Optional[float] = Field(default=None, ge=0, description="Expected jumps per year (default: 1.0)")
+    jump_mean: Optional[float] = Field(default=None, description="Mean log jump size (default: -0.05)")
+    jump_volatility: Optional[float] = Field(default=None, ge=0, description="Std dev of log jump size (default: 0.1)")
+
+
+class SimulationRequest(BaseModel):
+    """Request schema for a Monte Carlo P&L distribution."""
+    strategy_ids: List[int] = Field(default=[], description="Saved strategies in the portfolio")
+    strategies: List[StrategyDefinition] = Field(default=[], description="Inline strategies in the portfolio")
+    underlying_price: float = Field(..., gt=0, description="Current underlying price")
+    model: str = Field(default="gbm", description="Price model: gbm, heston or merton")
+    num_paths: int = Field(default=100_000, ge=100, le=5_000_000, description="Number of simulated paths")
+    volatility: Optional[float] = Field(default=None, gt=0, description="Current volatility (0.15 = 15%)")
+    valuation_date: Optional[str] = Field(default=None, description="Valuation date YYYY-MM-DD (default: today)")
+    horizon_date: Optional[str] = Field(default=None, description="Date P&L is measured at (default: earliest expiry)")
+    heston: Optional[HestonParameters] = Field(default=None, description="Heston parameters (model=heston)")
+    merton: Optional[MertonParameters] = Field(default=None, description="Merton parameters (model=merton)")
+    seed: Optional[int] = Field(default=None, ge=0, description="Random seed for reproducible runs")
+    sampling: str = Field(default="pseudo", description="pseudo or sobol (scrambled quasi-random)")
+    antithetic: bool = Field(default=False, description="Pair every path with its antithetic path")
+    control_variate: bool = Field(default=False, description="Use the terminal price as control variate")
+    include_breakdown: bool = Field(default=False, description="Return per-strategy statistics")
+    precision: Optional[str] = Field(default=None, description="float64 or float32 (default: NUMERIC_PRECISION)")
+
+    @model_validator(mode="after")
+    def validate_strategy_count(self):
+        count = len(self.strategy_ids) + len(self.strategies)
+        if count == 0:
+            raise ValueError("Provide strategy_ids and/or strategies")
+        if count > 500:
+            raise ValueError("At most 500 strategies per simulation")
+        return self
+
+    def model_params(self) -> Optional[dict]:
+        """Parameters of the selected model, if any were given."""
+        params = {"heston": self.heston, "merton": self.merton}.get(self.model)
+        return params.model_dump() if params is not None else None
+
+
+class SimulationExitRequest(SimulationRequest):
+    """Request schema for a daily-path simulation with exit rules."""
+    num_paths: int = Field(default=20_000, ge=100, le=1_000_000, description="Number of simulated paths")
+    stop_loss: Optional[float] = Field(default=None, gt=0, description="Close a strategy once its loss reaches this amount")
+    profit_target: Optional[float] = Field(default=None, gt=0, description="Close a strategy once its profit reaches this amount")
+    max_days_held: Optional[int] = Field(default=None, ge=1, description="Close a strategy after this many days")
+    exit_on_strike_breach: bool = Field(default=False, description="Close once the underlying crosses a short strike")
+
+    @model_validator(mode="after")
+    def validate_exit_options(self):
+        if self.control_variate:
+            raise ValueError("control_variate is not supported with exit rules")
+        return self
@@ -1,9 +1,12 @@
 """
 Pydantic schemas for request/response validation.
 """
-from pydantic import BaseModel, Field, validator
-from typing import Optional, Dict, List, Any
-from datetime import datetime
+from pydantic import BaseModel, Field, model_validator, validator
+from typing import Optional, Dict, List, Any, Literal
+from datetime import date, datetime
+
+# Upper bound on per-ID patches in one batch update
+MAX_BATCH_PATCHES = 10000
 
 
 class PayoffRequest(BaseModel):
@@ -14,7 +17,12 @@ class PayoffRequest(BaseModel):
     parameters: Optional[Dict[str, Any]] = Field(default={}, description="Strategy parameters")
     underlying_price: Optional[float] = Field(default=18000, description="Current underlying price")
     price_range_percent: Optional[float] = Field(default=30, ge=10, le=100, description="Price range percentage (10-100)")
-    custom_legs: Optional[List[Dict[str, Any]]] = Field(default=None, description="Custom strategy legs")
+    num_points: int = Field(default=50, ge=2, le=10000, description="Number of price points on the curve")
+    grid_spacing: str = Field(default="linear", description="Price grid spacing: linear, log or strike-dense")
+    custom_legs: Optional[List[Dict[str, Any]]] = Field(default=None, description="Custom strategy legs (each may set its own expiry)")
+    volatility: Optional[float] = Field(default=None, gt=0, description="Volatility for legs expiring after the nearest expiry (default: DEFAULT_VOLATILITY)")
+    chain_file: Optional[str] = Field(default=None, description="Option-chain file used to price missing premiums")
+    underlying: Optional[str] = Field(default=None, description="Underlying symbol in the option-chain file")
     
     @validator("price_range_percent")
     def validate_price_range(cls, v):
@@ -23,6 +31,13 @@ class PayoffRequest(BaseModel):
         return v
 
 
+class PayoffStreamRequest(PayoffRequest):
+    """Request schema for a streamed (chunked) payoff curve."""
+    num_points: int = Field(default=10000, ge=2, le=10_000_000, description="Number of price points on the curve")
+    format: str = Field(default="ndjson", description="Output format: ndjson or csv")
+    precision: Optional[str] = Field(default=None, description="float64 or float32 (default: NUMERIC_PRECISION)")
+
+
 class PayoffDataPoint(BaseModel):
     """Single data point in payoff diagram."""
     price: float = Field(..., description="Underlying price")
@@ -33,31 +48,46 @@ class StrategyCreate(BaseModel):
     """Schema for creating a new strategy."""
     name: str = Field(..., min_length=1, max_length=255, description="Strategy name")
     strategy_type: str = Field(..., description="Type of strategy")
-    entry_date: str = Field(..., description="Entry date")
-    expiry_date: str = Field(..., description="Expiry date")
+    entry_date: date = Field(..., description="Entry date in YYYY-MM-DD format")
+    expiry_date: date = Field(..., description="Expiry date in YYYY-MM-DD format")
     parameters: Dict[str, Any] = Field(default={}, description="Strategy parameters")
     custom_legs: Optional[List[Dict[str, Any]]] = Field(default=None, description="Custom strategy legs")
     notes: Optional[str] = Field(default=None, description="User notes")
 
 
+class StrategyDefinition(BaseModel):
+    """Strategy defined inline in an analytics request (not saved)."""
+    name: Optional[str] = Field(default=None, description="Label for the results")
+    strategy_type: str = Field(..., description="Type of strategy")
+    entry_date: str = Field(..., description="Entry date in YYYY-MM-DD format")
+    expiry_date: str = Field(..., description="Expiry date in YYYY-MM-DD format")
+    parameters: Dict[str, Any] = Field(default={}, description="Strategy parameters")
+    custom_legs: Optional[List[Dict[str, Any]]] = Field(default=None, description="Custom strategy legs")
+
+
 class StrategyUpdate(BaseModel):
     """Schema for updating an existing strategy."""
     name: Optional[str] = Field(None, min_length=1, max_length=255)
     strategy_type: Optional[str] = None
-    entry_date: Optional[str] = None
-    expiry_date: Optional[str] = None
+    entry_date: Optional[date] = None
+    expiry_date: Optional[date] = None
     parameters: Optional[Dict[str, Any]] = None
     custom_legs: Optional[List[Dict[str, Any]]] = None
     notes: Optional[str] = None
 
 
+class StrategyPatch(StrategyUpdate):
+    """Partial update of one strategy in a batch."""
+    id: int = Field(..., description="Strategy ID")
+
+
 class StrategyResponse(BaseModel):
     """Schema for strategy response."""
     id: int
     name: str
     strategy_type: str
-    entry_date: str
-    expiry_date: str
+    entry_date: date
+    expiry_date: date
     parameters: Dict[str, Any]
     custom_legs: Optional[List[Dict[str, Any]]]
     notes: Optional[str]
@@ -72,4 +102,70 @@ class StandardResponse(BaseModel):
     """Standard API response format."""
     success: bool = Field(..., description="Whether the operation was successful")
     message: str = Field(..., description="Human-readable message")
-    data: Optional[Any] = Field(default=None, description="Response data")
\ No newline at end of file
+    data: Optional[Any] = Field(default=None, description="Response data")
+
+
+class PaginatedResponse(StandardResponse):
+    """Standard response for one page of a listing."""
+    next_cursor: Optional[str] = Field(default=None, description="Token of the next page (null on the last page)")
+
+
+class StrategySelection(BaseModel):
+    """Strategies matched by every given criterion (at least one is required)."""
+    ids: Optional[List[int]] = Field(default=None, min_length=1, description="Strategy IDs")
+    strategy_types: Optional[List[str]] = Field(default=None, min_length=1, description="Strategy types")
+    expiry_before: Optional[date] = Field(default=None, description="Expiry earlier than this date, YYYY-MM-DD (e.g. today for expired strategies)")
+    expiry_from: Optional[date] = Field(default=None, description="Expiry on or after this date, YYYY-MM-DD")
+    expiry_to: Optional[date] = Field(default=None, description="Expiry on or before this date, YYYY-MM-DD")
+    name_prefix: Optional[str] = Field(default=None, min_length=1, max_length=255, description="Name starts with this text (case-sensitive on PostgreSQL)")
+    
+    @model_validator(mode="after")
+    def validate_selection(self):
+        if all(getattr(self, name) is None for name in self.model_fields):
+            raise ValueError(f"Provide at least one of {', '.join(self.model_fields)}")
+        if self.expiry_from and self.expiry_to and self.expiry_from > self.expiry_to:
+            raise ValueError("expiry_from must not be after expiry_to")
+        return self
+
+
+class StrategyLegQuery(BaseModel):
+    """Strategy legs matched by every given criterion."""
+    leg_type: Optional[Literal["CE", "PE", "FUT"]] = Field(default=None, description="Leg type")
+    action: Optional[Literal["BUY", "SELL"]] = Field(default=None, description="BUY (long) or SELL (short)")
+    strike_min: Optional[float] = Field(default=None, description="Strike at or above this value")
+    strike_max: Optional[float] = Field(default=None, description="Strike at or below this value")
+    expiry_from: Optional[date] = Field(default=None, description="Leg expiry on or after this date, YYYY-MM-DD")
+    expiry_to: Optional[date] = Field(default=None, description="Leg expiry on or before this date, YYYY-MM-DD")
+    strategy_types: Optional[List[str]] = Field(default=None, min_length=1, description="Only legs of these strategy types")
+    
+    @model_validator(mode="after")
+    def validate_query(self):
+        if self.strike_min is not None and self.strike_max is not None and self.strike_min > self.strike_max:
+            raise ValueError("strike_min must not be above strike_max")
+        if self.expiry_from and self.expiry_to and self.expiry_from > self.expiry_to:
+            raise ValueError("expiry_from must not be after expiry_to")
+        return self
+
+
+class StrategyBatchUpdate(BaseModel):
+    """Request schema for a batch update: one change for a selection, or per-ID patches."""
+    selection: Optional[StrategySelection] = Field(default=None, description="Strategies to change")
+    changes: Optional[StrategyUpdate] = Field(default=None, description="Fields set on every selected strategy")
+    updates: Optional[List[StrategyPatch]] = Field(default=None, description="Per-strategy partial updates")
+    
+    @model_validator(mode="after")
+    def validate_batch(self):
+        if self.updates is not None:
+            if self.selection is not None or self.changes is not None:
+                raise ValueError("Use either updates or selection with changes, not both")
+            if not 1 <= len(self.updates) <= MAX_BATCH_PATCHES:
+                raise ValueError(f"updates must have between 1 and {MAX_BATCH_PATCHES} items")
+            if any(not patch.model_dump(exclude_unset=True).keys() - {"id"} for patch in self.updates):
+                raise ValueError("Every update must change at least one field")
+            return self
+        if self.selection is None or self.changes is None:
+            raise ValueError("Provide selection and changes, or updates")
+        if not self.changes.model_dump(exclude_unset=True):
+            raise ValueError("changes must set at least one field")
+        return self
+
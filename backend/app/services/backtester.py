@@ -0,0 +1,223 @@
+"""
+Backtest service - Replays strategies over a local price history.
+
+All strategies are stacked into one leg matrix and marked to model on
+every bar with a single broadcast (bars x strategies x legs) pricing call,
+so many variants are simulated together. Exit rules are applied as
+boolean masks over the resulting P&L matrix.
+"""
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from ..config import settings
+from ..kernels import resolve_precision
+from .legs import stack_legs, strategy_to_legs
+from .market_data import load_price_history, to_datetime64
+
+# Upper bound on bars x strategies x legs priced per chunk
+CHUNK_ELEMENTS = 2_000_000
+
+EXIT_REASONS = ("stop_loss", "profit_target", "time_stop", "expiry", "end_of_data")
+
+
+def _max_drawdown(equity: np.ndarray) -> np.ndarray:
+    """Largest peak-to-trough fall along axis 0."""
+    return (np.maximum.accumulate(equity, axis=0) - equity).max(axis=0)
+
+
+class BacktestService:
+    """Service for historical strategy backtests."""
+
+    @staticmethod
+    def run(
+        strategies: List[Dict[str, Any]],
+        history_file: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        volatility: Optional[float] = None,
+        rate: Optional[float] = None,
+        stop_loss: Optional[float] = None,
+        profit_target: Optional[float] = None,
+        max_days_held: Optional[int] = None,
+        include_equity_curves: bool = False,
+        precision: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Backtest strategies over a price-history file.
+
+        Each strategy is entered at the first bar on or after its entry_date
+        and held until an exit rule fires, it expires, or the data ends.
+
+        Args:
+            strategies: Dicts with strategy_type, entry_date, expiry_date,
+                parameters, custom_legs and optionally id/name
+            history_file: Price history file name inside PRICE_HISTORY_DIR
+            start_date: Ignore bars before this date
+            end_date: Ignore bars after this date
+            volatility: Pricing volatility (default: trailing 20-bar realized vol)
+            rate: Risk-free rate (default: settings.risk_free_rate)
+            stop_loss: Exit when P&L falls to -stop_loss
+            profit_target: Exit when P&L reaches profit_target
+            max_days_held: Exit after this many calendar days
+            include_equity_curves: Return each strategy's equity curve
+            precision: float64 or float32 (default: settings.numeric_precision)
+
+        Returns:
+            Dict with per-strategy results, the combined equity curve and a summary
+        """
+        started = time.perf_counter()
+        rate = settings.risk_free_rate if rate is None else rate
+        dtype = resolve_precision(precision)
+
+        history = load_price_history(history_file).window(start_date, end_date)
+        if len(history) < 2:
+            raise ValueError("Not enough price history in the selected window")
+
+        times, close = history.times, history.close
+        num_bars = len(history)
+        if volatility is None:
+            bar_vol = history.realized_volatility()
+            bar_vol = np.where(np.isnan(bar_vol), settings.default_volatility, bar_vol)
+        else:
+            bar_vol = np.full(num_bars, volatility)
+
+        results: List[Dict[str, Any]] = []
+        entered, matrices, entry_index = [], [], []
+
+        for strategy in strategies:
+            label = {"id": strategy.get("id"), "name": strategy.get("name")}
+            entry_time = to_datetime64(strategy["entry_date"])
+            index = int(np.searchsorted(times, entry_time))
+
+            if index >= num_bars:
+                results.append({**label, "status": "skipped", "detail": "Entry date is after the price history"})
+                continue
+
+            matrices.append(strategy_to_legs(
+                strategy["strategy_type"],
+                strategy.get("parameters"),
+                strategy.get("custom_legs"),
+                strategy["expiry_date"],
+                float(close[index]),
+            ))
+            entered.append((len(results), label))
+            entry_index.append(index)
+            results.append(None)
+
+        if not matrices:
+            raise ValueError("No strategy could be entered within the price history")
+
+        legs = stack_legs(matrices)
+        entry_index = np.array(entry_index)
+        expiry = legs.expiry.min(axis=1)
+        num_strategies, num_legs = legs.quantity.shape
+        chunk = max(1, CHUNK_ELEMENTS // (num_bars * num_legs))
+
+        bar = np.arange(num_bars)[:, None]
+        spot = close.astype(dtype)[:, None, None]
+        bar_time = times[:, None, None]
+        vol = bar_vol.astype(dtype)[:, None, None]
+
+        total_equity = np.zeros(num_bars)
+
+        for lo in range(0, num_strategies, chunk):
+            hi = min(lo + chunk, num_strategies)
+            part = legs.select(slice(lo, hi))
+            entry = entry_index[lo:hi]
+
+            pnl = part.pnl(spot, part.time_to_expiry(bar_time, dtype), vol, rate, dtype)   # (bars, strategies)
+
+            active = bar >= entry[None, :]
+            expired = times[:, None] >= expiry[None, lo:hi]
+            stop = pnl <= -stop_loss if stop_loss is not None else np.zeros_like(active)
+            target = pnl >= profit_target if profit_target is not None else np.zeros_like(active)
+            if max_days_held is not None:
+                held = times[:, None] - times[entry][None, :]
+                timed = held >= np.timedelta64(max_days_held, "D")
+            else:
+                timed = np.zeros_like(active)
+
+            triggers = active & (stop | target | timed | expired)
+            exit_index = np.where(triggers.any(axis=0), triggers.argmax(axis=0), num_bars - 1)
+
+            # Freeze P&L after exit, zero before entry
+            held_bar = np.minimum(bar, exit_index[None, :])
+            equity = np.where(active, np.take_along_axis(pnl, held_bar, axis=0), dtype.type(0))
+            total_equity += equity.sum(axis=1, dtype=np.float64)
+
+            columns = np.arange(hi - lo)
+            reason_flags = np.stack([
+                stop[exit_index, columns],
+                target[exit_index, columns],
+                timed[exit_index, columns],
+                expired[exit_index, columns],
+                np.ones(hi - lo, dtype=bool),
+            ])
+            reasons = reason_flags.argmax(axis=0)
+
+            # Per-bar P&L changes while the position is open
+            changes = np.diff(equity, axis=0)
+            open_mask = (bar[1:] > entry[None, :]) & (bar[1:] <= exit_index[None, :])
+            count = np.maximum(open_mask.sum(axis=0), 1)
+            mean = (changes * open_mask).sum(axis=0) / count
+            var = (((changes - mean) * open_mask) ** 2).sum(axis=0) / np.maximum(count - 1, 1)
+            std = np.sqrt(var)
+            sharpe = np.where(std > 0, mean / np.where(std > 0, std, 1) * np.sqrt(history.periods_per_year()), 0.0)
+
+            final = equity[-1]
+            drawdown = _max_drawdown(equity)
+            window_pnl = np.where(active & (bar <= exit_index[None, :]), pnl, np.nan)
+            best = np.nanmax(window_pnl, axis=0)
+            worst = np.nanmin(window_pnl, axis=0)
+
+            for j in range(hi - lo):
+                slot, label = entered[lo + j]
+                result = {
+                    **label,
+                    "status": "completed",
+                    "entry_date": str(times[entry[j]]),
+                    "exit_date": str(times[exit_index[j]]),
+                    "exit_reason": EXIT_REASONS[reasons[j]],
+                    "bars_held": int(exit_index[j] - entry[j]),
+                    "final_pnl": round(float(final[j]), 2),
+                    "max_pnl": round(float(best[j]), 2),
+                    "min_pnl": round(float(worst[j]), 2),
+                    "max_drawdown": round(float(drawdown[j]), 2),
+                    "sharpe": round(float(sharpe[j]), 3),
+                }
+                if include_equity_curves:
+                    result["equity_curve"] = np.round(equity[:, j], 2).tolist()
+                results[slot] = result
+
+        finals = np.array([r["final_pnl"] for r in results if r["status"] == "completed"])
+        completed = [r for r in results if r["status"] == "completed"]
+        best_result = completed[int(finals.argmax())]
+        worst_result = completed[int(finals.argmin())]
+
+        return {
+            "history_file": history_file,
+            "bars": num_bars,
+            "start": str(times[0]),
+            "end": str(times[-1]),
+            "summary": {
+                "strategies": len(results),
+                "completed": len(completed),
+                "winners": int((finals > 0).sum()),
+                "win_rate": round(float((finals > 0).mean()), 4),
+                "mean_pnl": round(float(finals.mean()), 2),
+                "median_pnl": round(float(np.median(finals)), 2),
+                "best": {"id": best_result["id"], "name": best_result["name"], "final_pnl": best_result["final_pnl"]},
+                "worst": {"id": worst_result["id"], "name": worst_result["name"], "final_pnl": worst_result["final_pnl"]},
+                "total_pnl": round(float(total_equity[-1]), 2),
+                "max_drawdown": round(float(_max_drawdown(total_equity)), 2),
+            },
+            "equity_curve": {
+                "times": [str(t) for t in times],
+                "pnl": np.round(total_equity, 2).tolist(),
+            },
+            "results": results,
+            "precision": dtype.name,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
@@ -0,0 +1,229 @@
+"""
+Historical VaR - Portfolio value at risk from past N-day moves.
+
+Every overlapping N-bar return in a price-history file becomes a scenario:
+the current spot is moved by that return and time advances by N bars.
+The whole book is repriced with one broadcast call over a
+(scenarios, strategies, legs) matrix, chunked over strategies, and VaR/ES
+are read from the resulting P&L distribution.
+
+Leg matrices are cached per saved strategy and reused while the strategy
+is unchanged (same updated_at) and priced off the same underlying price,
+so repeated runs over a large book skip the conversion step.
+"""
+import threading
+import time
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..config import settings
+from ..kernels import resolve_precision
+from .legs import LegMatrix, stack_legs, strategy_to_legs
+from .market_data import load_price_history, to_datetime64
+
+# Upper bound on scenarios x strategies x legs priced per chunk
+CHUNK_ELEMENTS = 4_000_000
+
+PNL_PERCENTILES = [1, 5, 25, 50, 75, 95, 99]
+
+# Saved strategies whose leg matrices are kept between runs
+LEG_CACHE_SIZE = 100_000
+
+# Leg matrices of saved strategies: id -> ((updated_at, underlying_price), legs)
+_leg_cache: Dict[int, Tuple[Tuple[Any, float], LegMatrix]] = {}
+# Runs execute in the threadpool; eviction must not race another run's insert
+_leg_cache_lock = threading.Lock()
+
+
+def _strategy_legs(strategy: Dict[str, Any], underlying_price: float) -> LegMatrix:
+    """Leg matrix of a strategy, cached for saved strategies."""
+    strategy_id = strategy.get("id")
+    version = (strategy.get("updated_at"), underlying_price)
+    if strategy_id is not None and version[0] is not None:
+        with _leg_cache_lock:
+            cached = _leg_cache.get(strategy_id)
+        if cached and cached[0] == version:
+            return cached[1]
+
+    legs = strategy_to_legs(
+        strategy["strategy_type"],
+        strategy.get("parameters"),
+        strategy.get("custom_legs"),
+        strategy["expiry_date"],
+        underlying_price,
+    )
+
+    if strategy_id is not None and version[0] is not None:
+        with _leg_cache_lock:
+            if len(_leg_cache) >= LEG_CACHE_SIZE and strategy_id not in _leg_cache:
+                # Evict the oldest entry (dicts keep insertion order)
+                del _leg_cache[next(iter(_leg_cache))]
+            _leg_cache[strategy_id] = (version, legs)
+    return legs
+
+
+class HistoricalVaRService:
+    """Service for historical-simulation VaR of a strategy book."""
+
+    @staticmethod
+    def reprice(
+        legs: LegMatrix,
+        spot: np.ndarray,
+        volatility: float,
+        at: np.datetime64,
+        rate: float = 0.0,
+        dtype=np.float64
+    ) -> np.ndarray:
+        """
+        P&L of stacked strategies at each scenario spot price.
+
+        Args:
+            legs: Stacked LegMatrix of shape (strategies, legs)
+            spot: Scenario spot prices
+            volatility: Pricing volatility
+            at: Time the scenarios are priced at (datetime64)
+            rate: Risk-free rate
+            dtype: Floating-point type of the pricing
+
+        Returns:
+            Array of shape (scenarios, strategies)
+        """
+        num_strategies, num_legs = legs.quantity.shape
+        chunk = max(1, CHUNK_ELEMENTS // (len(spot) * num_legs))
+        out = np.empty((len(spot), num_strategies), dtype=dtype)
+        spot = np.asarray(spot, dtype=dtype)[:, None, None]
+
+        for lo in range(0, num_strategies, chunk):
+            part = legs.select(slice(lo, lo + chunk))
+            out[:, lo:lo + chunk] = part.pnl(spot, part.time_to_expiry(at, dtype), volatility, rate, dtype)
+        return out
+
+    @staticmethod
+    def run(
+        strategies: List[Dict[str, Any]],
+        history_file: str,
+        underlying_price: Optional[float] = None,
+        horizon_days: int = 1,
+        confidence: float = 0.99,
+        volatility: Optional[float] = None,
+        valuation_date: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        rate: Optional[float] = None,
+        worst_scenarios: int = 5,
+        include_breakdown: bool = False,
+        precision: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Historical-simulation VaR and expected shortfall of a book.
+
+        Args:
+            strategies: Dicts with strategy_type, expiry_date, parameters,
+                custom_legs and optionally id/name/updated_at
+            history_file: Price history file name inside PRICE_HISTORY_DIR
+            underlying_price: Current underlying price (default: last close)
+            horizon_days: Bars per scenario return (N-day VaR)
+            confidence: VaR confidence level, e.g. 0.99
+            volatility: Pricing volatility (default: settings.default_volatility)
+            valuation_date: Valuation date (default: today)
+            start_date: First bar used for returns (default: start of file)
+            end_date: Last bar used for returns (default: end of file)
+            rate: Risk-free rate (default: settings.risk_free_rate)
+            worst_scenarios: Number of worst scenarios to return
+            include_breakdown: Also return each strategy's own VaR/ES and its
+                P&L in the scenario at the portfolio VaR
+            precision: float64 or float32 (default: settings.numeric_precision)
+
+        Returns:
+            Dict with VaR, ES, the P&L distribution and the worst scenarios;
+            strategies that cannot be priced are listed under `skipped`
+        """
+        started = time.perf_counter()
+        history = load_price_history(history_file).window(start_date, end_date)
+        if len(history) <= horizon_days:
+            raise ValueError(f"Price history needs more than {horizon_days} bars in the selected window")
+
+        underlying_price = float(history.close[-1]) if underlying_price is None else underlying_price
+        volatility = settings.default_volatility if volatility is None else volatility
+        rate = settings.risk_free_rate if rate is None else rate
+        valuation_time = to_datetime64(valuation_date or date.today().isoformat())
+        dtype = resolve_precision(precision)
+
+        if not strategies:
+            raise ValueError("The book is empty")
+
+        matrices, priced, skipped = [], [], []
+        for s in strategies:
+            try:
+                matrices.append(_strategy_legs(s, underlying_price))
+                priced.append(s)
+            except (ValueError, TypeError, KeyError) as e:
+                skipped.append({"id": s.get("id"), "error": str(e)})
+        if not matrices:
+            raise ValueError("No strategies could be priced")
+        legs = stack_legs(matrices)
+
+        # Overlapping N-bar returns; time moves forward by N bars
+        growth = history.close[horizon_days:] / history.close[:-horizon_days]
+        spot = underlying_price * growth
+        elapsed_days = horizon_days * 365.0 / history.periods_per_year()
+        at = valuation_time + np.timedelta64(int(round(elapsed_days * 86400)), "s")
+
+        base = legs.pnl(underlying_price, legs.time_to_expiry(valuation_time), volatility, rate)
+        change = HistoricalVaRService.reprice(legs, spot, volatility, at, rate, dtype) - base.astype(dtype)
+        total = change.sum(axis=1, dtype=np.float64)
+
+        def tail(values: np.ndarray) -> Tuple[float, float]:
+            cutoff = float(np.percentile(values, 100 * (1 - confidence)))
+            return -cutoff, -float(values[values <= cutoff].mean())
+
+        var, es = tail(total)
+        order = np.argsort(total, kind="stable")
+        var_scenario = int(order[min(int(np.floor(len(total) * (1 - confidence))), len(total) - 1)])
+
+        def scenario(i: int) -> Dict[str, Any]:
+            return {
+                "start": str(history.times[i].astype("datetime64[D]")),
+                "end": str(history.times[i + horizon_days].astype("datetime64[D]")),
+                "return_pct": round(float(growth[i] - 1) * 100, 4),
+                "spot": round(float(spot[i]), 2),
+                "pnl": round(float(total[i]), 2),
+            }
+
+        result = {
+            "history_file": history_file,
+            "scenarios": len(total),
+            "horizon_days": horizon_days,
+            "confidence": confidence,
+            "underlying_price": underlying_price,
+            "volatility": volatility,
+            "priced_strategies": len(priced),
+            "value_at_risk": round(var, 2),
+            "expected_shortfall": round(es, 2),
+            "base_pnl": round(float(base.sum()), 2),
+            "mean_pnl": round(float(total.mean()), 2),
+            "pnl_percentiles": {
+                str(q): round(float(v), 2)
+                for q, v in zip(PNL_PERCENTILES, np.percentile(total, PNL_PERCENTILES))
+            },
+            "worst_scenarios": [scenario(int(i)) for i in order[:worst_scenarios]],
+            "skipped": skipped,
+            "precision": dtype.name,
+        }
+
+        if include_breakdown:
+            result["strategies"] = []
+            for n, s in enumerate(priced):
+                strategy_var, strategy_es = tail(change[:, n].astype(np.float64))
+                result["strategies"].append({
+                    "id": s.get("id"),
+                    "name": s.get("name"),
+                    "value_at_risk": round(strategy_var, 2),
+                    "expected_shortfall": round(strategy_es, 2),
+                    "pnl_in_var_scenario": round(float(change[var_scenario, n]), 2),
+                })
+
+        result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        return result
@@ -0,0 +1,324 @@
+"""
+Leg matrix - Normalized array representation of strategy positions.
+
+Every template and custom strategy is converted to the same set of
+per-leg arrays, so analytics (backtests, scenarios, risk) can price many
+strategies at once with broadcast NumPy operations instead of branching
+on strategy_type for every price point.
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from ..kernels import get_kernels
+from .market_data import to_datetime64
+from .pricing import black_scholes_greeks
+
+# Leg kinds
+FUT = 0
+CE = 1
+PE = 2
+
+_KIND_CODES = {"FUT": FUT, "CE": CE, "PE": PE}
+
+SECONDS_PER_YEAR = 365.0 * 24 * 3600
+
+
+@dataclass
+class LegMatrix:
+    """
+    Position legs as parallel arrays; the last axis is the leg axis.
+
+    P&L of the position = sum(quantity * (value - entry_price)) + cash
+    where value is the futures price for FUT legs and the option value for
+    CE/PE legs. quantity is signed: positive when bought, negative when sold.
+    """
+    kind: np.ndarray          # FUT / CE / PE codes
+    quantity: np.ndarray      # Signed units (lots x lot size)
+    strike: np.ndarray        # Option strike (1.0 for FUT legs)
+    entry_price: np.ndarray   # Premium paid/received, or futures entry price
+    expiry: np.ndarray        # datetime64[s] expiry of each leg
+    cash: np.ndarray          # Net premium not attributed to a single leg
+
+    @property
+    def num_legs(self) -> int:
+        return self.kind.shape[-1]
+
+    def select(self, rows) -> "LegMatrix":
+        """Subset of stacked strategies (index or slice along the first axis)."""
+        return LegMatrix(
+            self.kind[rows], self.quantity[rows], self.strike[rows],
+            self.entry_price[rows], self.expiry[rows], self.cash[rows],
+        )
+
+    def time_to_expiry(self, at, dtype=np.float64) -> np.ndarray:
+        """
+        Years from `at` to each leg's expiry, floored at zero.
+
+        `at` must broadcast against the leg arrays (add a trailing axis
+        for the leg dimension).
+        """
+        seconds = (self.expiry - np.asarray(at, dtype="datetime64[s]")).astype(np.int64)
+        return np.maximum(seconds, 0).astype(dtype) / SECONDS_PER_YEAR
+
+    def pnl(self, spot, time_to_expiry, volatility, rate=0.0, dtype=np.float64) -> np.ndarray:
+        """
+        Mark-to-model P&L, summed over the leg axis.
+
+        Options are priced with Black-Scholes while time remains and at
+        intrinsic value once expired; futures are worth the spot price.
+        All inputs broadcast against the leg arrays. The math runs on the
+        active kernel backend (see app.kernels) in `dtype`.
+        """
+        return get_kernels().leg_pnl(
+            self.kind, self.quantity, self.strike, self.entry_price,
+            spot, time_to_expiry, volatility, rate, dtype,
+        ) + self.cash.astype(dtype)
+
+    def greeks(self, spot, time_to_expiry, volatility, rate=0.0, dtype=np.float64) -> Dict[str, np.ndarray]:
+        """
+        Position delta, gamma and vega, summed over the leg axis.
+
+        Futures carry delta 1; expired options carry their intrinsic delta
+        and no gamma or vega. Inputs broadcast as in pnl().
+        """
+        spot = np.asarray(spot, dtype=dtype)
+        t = np.asarray(time_to_expiry, dtype=dtype)
+        is_call = self.kind == CE
+        option = self.kind != FUT
+        alive = option & (t > 0)
+
+        greeks = black_scholes_greeks(spot, self.strike, t, volatility, rate, is_call, dtype)
+        intrinsic_delta = np.where(is_call, (spot > self.strike) * 1.0, (spot < self.strike) * -1.0)
+        delta = np.where(alive, greeks["delta"], np.where(option, intrinsic_delta, 1.0))
+
+        quantity = self.quantity.astype(dtype)
+        return {
+            "delta": (quantity * delta).sum(axis=-1, dtype=dtype),
+            "gamma": (quantity * np.where(alive, greeks["gamma"], 0.0)).sum(axis=-1, dtype=dtype),
+            "vega": (quantity * np.where(alive, greeks["vega"], 0.0)).sum(axis=-1, dtype=dtype),
+        }
+
+    def expiry_pnl(self, spot, dtype=np.float64) -> np.ndarray:
+        """P&L with every leg settled at intrinsic value."""
+        return self.pnl(spot, 0.0, 1.0, dtype=dtype)
+
+    def nearest_expiry_pnl(self, spot, volatility, rate=0.0, dtype=np.float64) -> np.ndarray:
+        """
+        P&L at each strategy's nearest leg expiry.
+
+        Legs expiring then settle at intrinsic value; longer-dated legs
+        (calendars, diagonals) are priced with their remaining time. With
+        a single expiry this equals expiry_pnl().
+        """
+        nearest = self.expiry.min(axis=-1, keepdims=True)
+        return self.pnl(spot, self.time_to_expiry(nearest, dtype), volatility, rate, dtype)
+
+
+def _leg(kind: int, quantity: float, strike: float, entry_price: float) -> tuple:
+    return (kind, quantity, strike, entry_price)
+
+
+def _template_legs(strategy_type: str, p: Dict[str, Any], underlying_price: float):
+    """
+    Legs and net cash of a template, mirroring PayoffCalculatorService defaults.
+
+    Returns:
+        (list of (kind, quantity, strike, entry_price), cash)
+    """
+    def num(name: str, default: float) -> float:
+        value = p.get(name)
+        return float(default if value in (None, "") else value)
+
+    if strategy_type == "covered-call":
+        return [
+            _leg(FUT, num("futuresLotSize", 50), 1.0, num("futuresPrice", underlying_price)),
+            _leg(CE, -num("callLotSize", 50), num("callStrike", underlying_price + 500), num("premium", 200)),
+        ], 0.0
+
+    if strategy_type == "bull-call-spread":
+        lot = num("lotSize", 50)
+        return [
+            _leg(CE, lot, num("longCallStrike", underlying_price), num("longCallPremium", 300)),
+            _leg(CE, -lot, num("shortCallStrike", underlying_price + 1000), num("shortCallPremium", 150)),
+        ], 0.0
+
+    if strategy_type == "iron-condor":
+        lot = num("lotSize", 50)
+        return [
+            _leg(PE, lot, num("putBuyStrike", underlying_price - 1000), 0.0),
+            _leg(PE, -lot, num("putSellStrike", underlying_price - 500), 0.0),
+            _leg(CE, -lot, num("callSellStrike", underlying_price + 500), 0.0),
+            _leg(CE, lot, num("callBuyStrike", underlying_price + 1000), 0.0),
+        ], num("netPremium", 100) * lot
+
+    if strategy_type == "long-straddle":
+        lot = num("lotSize", 50)
+        strike = num("strike", underlying_price)
+        return [
+            _leg(CE, lot, strike, num("callPremium", 300)),
+            _leg(PE, lot, strike, num("putPremium", 300)),
+        ], 0.0
+
+    if strategy_type == "protective-put":
+        lot = num("lotSize", 50)
+        return [
+            _leg(FUT, lot, 1.0, num("stockPrice", underlying_price)),
+            _leg(PE, lot, num("putStrike", underlying_price - 500), num("putPremium", 200)),
+        ], 0.0
+
+    if strategy_type == "butterfly-spread":
+        lot = num("lotSize", 50)
+        return [
+            _leg(CE, lot, num("lowerStrike", underlying_price - 500), num("lowerPremium", 300)),
+            _leg(CE, -2 * lot, num("middleStrike", underlying_price), num("middlePremium", 200)),
+            _leg(CE, lot, num("upperStrike", underlying_price + 500), num("upperPremium", 100)),
+        ], 0.0
+
+    raise ValueError(f"Unknown strategy type: {strategy_type}")
+
+
+def _strategy_rows(
+    strategy_type: str,
+    parameters: Optional[Dict[str, Any]],
+    custom_legs: Optional[List[Dict[str, Any]]],
+    underlying_price: float
+):
+    """
+    Legs of a template or custom strategy.
+
+    Returns:
+        (list of (kind, quantity, strike, entry_price), cash)
+    """
+    if strategy_type != "custom-strategy":
+        return _template_legs(strategy_type, parameters or {}, underlying_price)
+
+    rows = []
+    for leg in custom_legs or []:
+        kind = _KIND_CODES.get(leg.get("type"))
+        if kind is None:
+            raise ValueError(f"Unknown leg type: {leg.get('type')}")
+        sign = 1.0 if leg.get("action") == "BUY" else -1.0
+        quantity = sign * float(leg.get("lotSize") or 0)
+        if kind == FUT:
+            rows.append(_leg(FUT, quantity, 1.0, float(leg.get("entryPrice") or underlying_price)))
+        else:
+            rows.append(_leg(
+                kind, quantity,
+                float(leg.get("strike") or underlying_price),
+                float(leg.get("premium") or 0),
+            ))
+    return rows, 0.0
+
+
+def _leg_expiries(
+    strategy_type: str,
+    custom_legs: Optional[List[Dict[str, Any]]],
+    expiry: np.datetime64,
+    count: int
+) -> np.ndarray:
+    """Expiry of each leg: a custom leg's own `expiry`, else the strategy expiry."""
+    if strategy_type != "custom-strategy" or not custom_legs:
+        return np.full(count, expiry, dtype="datetime64[s]")
+    return np.array(
+        [to_datetime64(leg["expiry"]) if leg.get("expiry") else expiry for leg in custom_legs],
+        dtype="datetime64[s]",
+    )
+
+
+def strategy_to_legs(
+    strategy_type: str,
+    parameters: Optional[Dict[str, Any]],
+    custom_legs: Optional[List[Dict[str, Any]]],
+    expiry_date,
+    underlying_price: float
+) -> LegMatrix:
+    """
+    Convert a strategy definition to a LegMatrix.
+
+    Args:
+        strategy_type: Template name or custom-strategy
+        parameters: Template parameters (same names as the payoff calculator)
+        custom_legs: Legs of a custom strategy; a leg may set its own
+            `expiry` (calendars, diagonals)
+        expiry_date: Strategy expiry (YYYY-MM-DD string or date)
+        underlying_price: Reference price for parameter defaults
+
+    Returns:
+        LegMatrix with one row per leg
+    """
+    expiry = to_datetime64(expiry_date)
+    rows, cash = _strategy_rows(strategy_type, parameters, custom_legs, underlying_price)
+
+    expiries = _leg_expiries(strategy_type, custom_legs, expiry, len(rows))
+    if not rows:
+        rows = [_leg(FUT, 0.0, 1.0, 0.0)]
+        expiries = np.full(1, expiry, dtype="datetime64[s]")
+
+    kind, quantity, strike, entry_price = (np.array(col, dtype=float) for col in zip(*rows))
+    return LegMatrix(
+        kind=kind.astype(np.int8),
+        quantity=quantity,
+        strike=strike,
+        entry_price=entry_price,
+        expiry=expiries,
+        cash=np.asarray(cash, dtype=float),
+    )
+
+
+def strategy_strikes(
+    strategy_type: str,
+    parameters: Optional[Dict[str, Any]],
+    custom_legs: Optional[List[Dict[str, Any]]],
+    underlying_price: float
+) -> List[float]:
+    """Distinct option strikes of a strategy, i.e. where its expiry payoff bends."""
+    rows, _ = _strategy_rows(strategy_type, parameters, custom_legs, underlying_price)
+    return sorted({strike for kind, quantity, strike, _ in rows if kind != FUT and quantity})
+
+
+def stack_legs(matrices: List[LegMatrix]) -> LegMatrix:
+    """
+    Stack strategies into (num_strategies, max_legs) arrays.
+
+    Shorter strategies are padded with zero-quantity futures legs, which
+    contribute nothing to P&L.
+    """
+    width = max(m.num_legs for m in matrices)
+    count = len(matrices)
+
+    kind = np.full((count, width), FUT, dtype=np.int8)
+    quantity = np.zeros((count, width))
+    strike = np.ones((count, width))
+    entry_price = np.zeros((count, width))
+    expiry = np.empty((count, width), dtype="datetime64[s]")
+    cash = np.zeros(count)
+
+    for i, m in enumerate(matrices):
+        n = m.num_legs
+        kind[i, :n] = m.kind
+        quantity[i, :n] = m.quantity
+        strike[i, :n] = m.strike
+        entry_price[i, :n] = m.entry_price
+        expiry[i, :] = m.expiry.min()
+        expiry[i, :n] = m.expiry
+        cash[i] = m.cash
+
+    return LegMatrix(kind, quantity, strike, entry_price, expiry, cash)
+
+
+def strategy_leg_rows(
+    strategy_type: str,
+    parameters: Optional[Dict[str, Any]],
+    custom_legs: Optional[List[Dict[str, Any]]],
+    expiry_date,
+    underlying_price: float
+) -> List[tuple]:
+    """
+    Legs of a strategy in definition order, as
+    (kind, signed quantity, strike, entry_price, expiry datetime64) tuples.
+    """
+    rows, _ = _strategy_rows(strategy_type, parameters, custom_legs, underlying_price)
+    expiries = _leg_expiries(strategy_type, custom_legs, to_datetime64(expiry_date), len(rows))
+    return [(*row, expiry) for row, expiry in zip(rows, expiries)]
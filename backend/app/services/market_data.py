@@ -0,0 +1,145 @@
+"""
+Market data service - Local data files and date helpers.
+
+Price history CSV columns (header row required, names case-insensitive):
+- date / datetime / timestamp: Bar time (YYYY-MM-DD or ISO 8601)
+- close: Closing price of the bar
+- open, high, low: Optional
+"""
+import csv
+import os
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Dict, Tuple
+
+import numpy as np
+
+from ..config import settings
+
+
+def resolve_data_file(base_dir: str, file_name: str, label: str) -> str:
+    """
+    Resolve a file name inside a configured data directory.
+
+    Raises:
+        ValueError: If the name escapes the directory
+        FileNotFoundError: If the file does not exist
+    """
+    base_dir = os.path.abspath(base_dir)
+    path = os.path.abspath(os.path.join(base_dir, file_name))
+
+    if os.path.commonpath([base_dir, path]) != base_dir:
+        raise ValueError(f"Invalid {label} file: {file_name}")
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"{label.capitalize()} file not found: {file_name}")
+
+    return path
+
+
+def to_datetime64(value) -> np.datetime64:
+    """Convert a YYYY-MM-DD / ISO string, date or datetime to datetime64[s]."""
+    if isinstance(value, np.datetime64):
+        return value.astype("datetime64[s]")
+    if isinstance(value, datetime):
+        return np.datetime64(value.replace(tzinfo=None), "s")
+    if isinstance(value, date):
+        return np.datetime64(value.isoformat(), "s")
+    if not value:
+        raise ValueError("Date is required")
+    try:
+        return np.datetime64(str(value).strip().replace("Z", ""), "s")
+    except ValueError:
+        raise ValueError(f"Invalid date: {value}")
+
+
+@dataclass(frozen=True)
+class PriceHistory:
+    """Bars of an underlying's price history, in time order."""
+    times: np.ndarray   # datetime64[s]
+    close: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    def window(self, start=None, end=None) -> "PriceHistory":
+        """Bars between start and end (inclusive)."""
+        mask = np.ones(len(self), dtype=bool)
+        if start is not None:
+            mask &= self.times >= to_datetime64(start)
+        if end is not None:
+            # A plain date includes every bar of that day
+            end_time = to_datetime64(end)
+            if isinstance(end, str) and len(end.strip()) == 10:
+                end_time = end_time + np.timedelta64(1, "D") - np.timedelta64(1, "s")
+            mask &= self.times <= end_time
+        return PriceHistory(self.times[mask], self.close[mask])
+
+    def periods_per_year(self) -> float:
+        """Bars per trading year (252 sessions times bars per session)."""
+        sessions = len(np.unique(self.times.astype("datetime64[D]")))
+        return 252.0 * len(self) / max(sessions, 1)
+
+    def realized_volatility(self, window: int = 20) -> np.ndarray:
+        """
+        Trailing annualized volatility of log returns at each bar.
+
+        Bars without a full window use the first available estimate.
+        """
+        returns = np.diff(np.log(self.close), prepend=np.nan)
+        vol = np.full(len(self), np.nan)
+        if len(self) > window:
+            windows = np.lib.stride_tricks.sliding_window_view(returns[1:], window)
+            vol[window:] = windows.std(axis=1, ddof=1) * np.sqrt(self.periods_per_year())
+            vol[:window] = vol[window]
+        return vol
+
+
+# Parsed histories keyed by absolute path -> (mtime, history)
+_history_cache: Dict[str, Tuple[float, PriceHistory]] = {}
+
+
+def _read_price_csv(path: str) -> PriceHistory:
+    """Parse a price-history CSV into sorted arrays."""
+    times, closes = [], []
+
+    with open(path, newline="") as f:
+        reader = csv.DictReader(f)
+        fields = {name.strip().lower(): name for name in reader.fieldnames or []}
+        time_field = next((fields[n] for n in ("date", "datetime", "timestamp", "time") if n in fields), None)
+        close_field = fields.get("close")
+        if time_field is None or close_field is None:
+            raise ValueError("Price history file needs a date/timestamp column and a close column")
+
+        for row in reader:
+            close = row[close_field].strip().replace(",", "")
+            if close in ("", "-"):
+                continue
+            times.append(to_datetime64(row[time_field]))
+            closes.append(float(close))
+
+    times = np.array(times, dtype="datetime64[s]")
+    closes = np.array(closes, dtype=float)
+    order = np.argsort(times, kind="stable")
+    return PriceHistory(times[order], closes[order])
+
+
+def load_price_history(history_file: str) -> PriceHistory:
+    """
+    Load a price history, reusing the parsed arrays while the file is unchanged.
+
+    Args:
+        history_file: File name relative to PRICE_HISTORY_DIR
+    """
+    path = resolve_data_file(settings.price_history_dir, history_file, "price history")
+    mtime = os.path.getmtime(path)
+
+    cached = _history_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    history = _read_price_csv(path)
+    if len(history) < 2:
+        raise ValueError("Price history needs at least two bars")
+
+    _history_cache[path] = (mtime, history)
+    return history
@@ -0,0 +1,490 @@
+"""
+Option chain service - Columnar store for option-chain snapshots.
+
+Snapshots are ingested once from local CSV or Parquet files into a folder
+of NumPy column files under OPTION_CHAIN_STORE_DIR. Rows are sorted by a
+packed (underlying, expiry, strike, type) key, so a contract quote is an
+O(log n) binary search and an expiry is a contiguous slice. Column files
+are opened memory-mapped: requests never re-parse the source file and
+only touch the pages they read.
+
+Expected source columns (header row required):
+- underlying: Underlying symbol (e.g. NIFTY)
+- expiry: Expiry date in YYYY-MM-DD format
+- strike: Strike price
+- option_type: CE or PE
+- bid, ask: Best bid/ask (optional, blank allowed)
+- ltp: Last traded price (optional)
+- iv: Implied volatility as a decimal, 0.14 = 14% (optional)
+- underlying_price: Spot/futures price at snapshot time (optional)
+"""
+import csv
+import json
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from ..config import settings
+from .market_data import resolve_data_file
+
+
+# Packed key layout (most to least significant):
+# underlying id (10 bits) | expiry days since epoch (20 bits) | strike in cents (32 bits) | is_call (1 bit)
+_EXPIRY_BITS = 20
+_STRIKE_BITS = 32
+_MAX_UNDERLYINGS = 1 << 10
+_MAX_EXPIRY = np.datetime64((1 << _EXPIRY_BITS) - 1, "D")
+_MAX_STRIKE = ((1 << _STRIKE_BITS) - 1) / 100
+
+_NUMERIC_COLUMNS = ("bid", "ask", "ltp", "iv", "underlying_price")
+_STORE_COLUMNS = ("keys", "underlying_id", "expiry", "strike", "is_call") + _NUMERIC_COLUMNS
+
+
+@dataclass(frozen=True)
+class OptionChain:
+    """Column arrays for the contracts of one underlying (one row per contract)."""
+    underlying: str
+    expiry: np.ndarray          # datetime64[D]
+    strike: np.ndarray
+    is_call: np.ndarray         # bool
+    bid: np.ndarray             # NaN when missing
+    ask: np.ndarray
+    ltp: np.ndarray
+    iv: np.ndarray
+    underlying_price: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.strike)
+
+    def filter(self, mask: np.ndarray) -> "OptionChain":
+        """Return a new chain containing only rows where mask is True."""
+        columns = {
+            name: getattr(self, name)[mask]
+            for name in self.__dataclass_fields__
+            if name != "underlying"
+        }
+        return OptionChain(underlying=self.underlying, **columns)
+
+
+def mid_price(bid: np.ndarray, ask: np.ndarray, ltp: np.ndarray) -> np.ndarray:
+    """Mid of bid/ask where both sides are quoted, else last traded price."""
+    bid = np.where(bid > 0, bid, np.nan)
+    ask = np.where(ask > 0, ask, np.nan)
+    mid = (bid + ask) / 2
+    return np.where(np.isnan(mid), np.where(ltp > 0, ltp, np.nan), mid)
+
+
+def pack_contract_keys(underlying_id, expiry, strike, is_call) -> np.ndarray:
+    """
+    Pack contract identifiers into sortable int64 keys.
+
+    Args:
+        underlying_id: Index of the underlying in the store's symbol list
+        expiry: datetime64[D] expiry dates
+        strike: Strike prices (stored to the cent)
+        is_call: True for CE, False for PE
+
+    Raises:
+        ValueError: If an expiry or strike does not fit its bits of the key
+    """
+    expiry = np.asarray(expiry, dtype="datetime64[D]")
+    expiry_days = expiry.astype(np.int64)
+    bad_expiry = np.isnat(expiry) | (expiry_days < 0) | (expiry_days > _MAX_EXPIRY.astype(np.int64))
+    if bad_expiry.any():
+        raise ValueError(f"Expiry out of range: {expiry[bad_expiry].flat[0]} (must be 1970-01-01 to {_MAX_EXPIRY})")
+
+    strike = np.asarray(strike, dtype=float)
+    bad_strike = ~((strike >= 0) & (strike <= _MAX_STRIKE))
+    if bad_strike.any():
+        raise ValueError(f"Strike out of range: {strike[bad_strike].flat[0]} (must be 0 to {_MAX_STRIKE:.2f})")
+
+    strike_cents = np.rint(strike * 100).astype(np.int64)
+    prefix = (np.asarray(underlying_id, dtype=np.int64) << _EXPIRY_BITS) | expiry_days
+    return (((prefix << _STRIKE_BITS) | strike_cents) << 1) | np.asarray(is_call, dtype=np.int64)
+
+
+def resolve_chain_path(chain_file: str) -> str:
+    """Resolve a chain file name inside the configured chain directory."""
+    return resolve_data_file(settings.option_chain_dir, chain_file, "option chain")
+
+
+def _to_float(value: Optional[str]) -> float:
+    """Parse a CSV cell, treating blanks and dashes as missing."""
+    if value is None:
+        return np.nan
+    value = value.strip().replace(",", "")
+    if value in ("", "-"):
+        return np.nan
+    return float(value)
+
+
+def _read_csv(path: str) -> Dict[str, np.ndarray]:
+    """Read an option-chain CSV file into raw column arrays."""
+    columns: Dict[str, List[Any]] = {
+        name: [] for name in ("underlying", "expiry", "strike", "option_type") + _NUMERIC_COLUMNS
+    }
+
+    with open(path, newline="") as f:
+        reader = csv.DictReader(f)
+        missing = {"underlying", "expiry", "strike", "option_type"} - set(reader.fieldnames or [])
+        if missing:
+            raise ValueError(f"Option chain file is missing columns: {', '.join(sorted(missing))}")
+
+        for row in reader:
+            columns["underlying"].append(row["underlying"].strip().upper())
+            columns["expiry"].append(row["expiry"].strip())
+            columns["strike"].append(_to_float(row["strike"]))
+            columns["option_type"].append(row["option_type"].strip().upper())
+            for name in _NUMERIC_COLUMNS:
+                columns[name].append(_to_float(row.get(name)))
+
+    return {name: np.array(values) for name, values in columns.items()}
+
+
+def _read_parquet(path: str) -> Dict[str, np.ndarray]:
+    """Read an option-chain Parquet file into raw column arrays (requires pyarrow)."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError("Reading Parquet option chains requires the pyarrow package")
+
+    table = pq.read_table(path)
+    missing = {"underlying", "expiry", "strike", "option_type"} - set(table.column_names)
+    if missing:
+        raise ValueError(f"Option chain file is missing columns: {', '.join(sorted(missing))}")
+
+    columns = {
+        "underlying": np.char.upper(np.char.strip(table.column("underlying").to_numpy().astype(str))),
+        "expiry": table.column("expiry").to_numpy().astype("datetime64[D]"),
+        "strike": table.column("strike").to_numpy().astype(float),
+        "option_type": np.char.upper(np.char.strip(table.column("option_type").to_numpy().astype(str))),
+    }
+    for name in _NUMERIC_COLUMNS:
+        if name in table.column_names:
+            columns[name] = table.column(name).to_numpy(zero_copy_only=False).astype(float)
+        else:
+            columns[name] = np.full(table.num_rows, np.nan)
+    return columns
+
+
+class OptionChainStore:
+    """Memory-mapped, key-sorted columns of one option-chain snapshot."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, "meta.json")) as f:
+            self.meta = json.load(f)
+        self.underlyings: List[str] = self.meta["underlyings"]
+        self.columns = {
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r")
+            for name in _STORE_COLUMNS
+        }
+        self.keys = self.columns["keys"]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @staticmethod
+    def store_path(chain_file: str) -> str:
+        """Folder holding the ingested columns of a chain file."""
+        name = chain_file.replace(os.sep, "__").replace("/", "__")
+        return os.path.join(os.path.abspath(settings.option_chain_store_dir), name)
+
+    @staticmethod
+    def ingest(chain_file: str) -> "OptionChainStore":
+        """
+        Parse a CSV/Parquet snapshot and write it as sorted column files.
+
+        Duplicate contracts keep the last row in the file.
+        """
+        source = resolve_chain_path(chain_file)
+        if source.lower().endswith((".parquet", ".pq")):
+            raw = _read_parquet(source)
+        else:
+            raw = _read_csv(source)
+
+        option_type = raw["option_type"]
+        if not np.isin(option_type, ["CE", "PE"]).all():
+            raise ValueError("option_type must be CE or PE")
+
+        underlyings, underlying_id = np.unique(raw["underlying"], return_inverse=True)
+        if len(underlyings) > _MAX_UNDERLYINGS:
+            raise ValueError(f"A chain file may contain at most {_MAX_UNDERLYINGS} underlyings")
+
+        expiry = raw["expiry"].astype("datetime64[D]")
+        is_call = option_type == "CE"
+        keys = pack_contract_keys(underlying_id, expiry, raw["strike"], is_call)
+
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        last_of_key = np.append(sorted_keys[1:] != sorted_keys[:-1], True)
+        order = order[last_of_key]
+
+        columns = {
+            "keys": keys[order],
+            "underlying_id": underlying_id[order].astype(np.uint16),
+            "expiry": expiry[order],
+            "strike": raw["strike"][order].astype(float),
+            "is_call": is_call[order],
+        }
+        for name in _NUMERIC_COLUMNS:
+            columns[name] = raw[name][order].astype(float)
+
+        target = OptionChainStore.store_path(chain_file)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        # Unique per ingest, so concurrent ingests of one file never share it
+        staging = tempfile.mkdtemp(prefix=f"{os.path.basename(target)}.tmp-", dir=os.path.dirname(target))
+        try:
+            for name, values in columns.items():
+                np.save(os.path.join(staging, f"{name}.npy"), values)
+            with open(os.path.join(staging, "meta.json"), "w") as f:
+                json.dump({
+                    "chain_file": chain_file,
+                    "source_mtime": os.path.getmtime(source),
+                    "rows": int(len(order)),
+                    "underlyings": [str(u) for u in underlyings],
+                }, f)
+            # Open before moving: the mappings stay valid whoever replaces the folder next
+            store = OptionChainStore(staging)
+
+            shutil.rmtree(target, ignore_errors=True)
+            try:
+                os.replace(staging, target)
+            except OSError:
+                # A concurrent ingest of the same file replaced it first
+                if not os.path.exists(os.path.join(target, "meta.json")):
+                    raise
+                shutil.rmtree(staging, ignore_errors=True)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        store.path = target
+        return store
+
+    def _underlying_id(self, underlying: Optional[str]) -> int:
+        if underlying is None:
+            if len(self.underlyings) > 1:
+                raise ValueError("Chain contains several underlyings; specify one")
+            return 0
+        try:
+            return self.underlyings.index(underlying.upper())
+        except ValueError:
+            raise ValueError(f"No contracts found for underlying {underlying}")
+
+    def _range(self, prefix: int, shift: int) -> slice:
+        """Row range whose keys start with the given prefix."""
+        lo = np.searchsorted(self.keys, np.int64(prefix) << shift, side="left")
+        hi = np.searchsorted(self.keys, np.int64(prefix + 1) << shift, side="left")
+        return slice(int(lo), int(hi))
+
+    def expiries(self, underlying: Optional[str] = None) -> List[str]:
+        """Distinct expiries listed for an underlying, ascending."""
+        rows = self._range(self._underlying_id(underlying), _EXPIRY_BITS + _STRIKE_BITS + 1)
+        return [str(e) for e in np.unique(self.columns["expiry"][rows])]
+
+    def select(self, underlying: Optional[str] = None, expiry: Optional[str] = None) -> OptionChain:
+        """
+        Contracts of one underlying and expiry as zero-copy column slices.
+
+        Defaults to the only underlying in the store and its nearest expiry.
+        """
+        uid = self._underlying_id(underlying)
+        if expiry is None:
+            rows = self._range(uid, _EXPIRY_BITS + _STRIKE_BITS + 1)
+            if rows.start == rows.stop:
+                raise ValueError(f"No contracts found for underlying {underlying}")
+            expiry_days = int(self.columns["expiry"][rows.start].astype(np.int64))
+        else:
+            expiry_days = int(np.datetime64(expiry, "D").astype(np.int64))
+
+        rows = self._range((uid << _EXPIRY_BITS) | expiry_days, _STRIKE_BITS + 1)
+        if rows.start == rows.stop:
+            raise ValueError(f"No contracts found for expiry {expiry}")
+
+        return OptionChain(
+            underlying=self.underlyings[uid],
+            **{
+                name: self.columns[name][rows]
+                for name in ("expiry", "strike", "is_call") + _NUMERIC_COLUMNS
+            }
+        )
+
+    def locate(self, underlying, expiry, strike, option_type) -> np.ndarray:
+        """
+        Row index of each requested contract (-1 where not listed).
+
+        All arguments broadcast, so a whole leg set is resolved with one
+        vectorized binary search.
+        """
+        symbols = np.atleast_1d(np.asarray(underlying))
+        ids = np.array([
+            self.underlyings.index(s.upper()) if s.upper() in self.underlyings else -1
+            for s in symbols.ravel()
+        ]).reshape(symbols.shape)
+        is_call = np.char.upper(np.asarray(option_type, dtype=str)) == "CE"
+
+        keys = pack_contract_keys(np.maximum(ids, 0), expiry, strike, is_call)
+        index = np.minimum(np.searchsorted(self.keys, keys), len(self.keys) - 1)
+        found = (self.keys[index] == keys) & (ids >= 0)
+        return np.where(found, index, -1)
+
+    def fetch(self, underlying, expiry, strike, option_type) -> Dict[str, np.ndarray]:
+        """
+        Bulk quote fetch for a leg set.
+
+        Returns:
+            Dict of column arrays (NaN for contracts not in the chain),
+            including a `found` mask and a `price` column (mid or last)
+        """
+        index = np.atleast_1d(self.locate(underlying, expiry, strike, option_type))
+        found = index >= 0
+        safe = np.where(found, index, 0)
+
+        quotes = {"found": found}
+        for name in _NUMERIC_COLUMNS:
+            quotes[name] = np.where(found, self.columns[name][safe], np.nan)
+        quotes["price"] = mid_price(quotes["bid"], quotes["ask"], quotes["ltp"])
+        return quotes
+
+    def lookup(self, underlying: str, expiry: str, strike: float, option_type: str) -> Optional[Dict[str, Any]]:
+        """Quote of a single contract, or None if it is not listed."""
+        quotes = self.fetch(underlying, expiry, strike, option_type)
+        if not quotes["found"][0]:
+            return None
+        return {
+            name: (None if np.isnan(values[0]) else float(values[0]))
+            for name, values in quotes.items()
+            if name != "found"
+        }
+
+
+# Open stores keyed by chain file name
+_stores: Dict[str, OptionChainStore] = {}
+
+
+def get_chain_store(chain_file: str) -> OptionChainStore:
+    """
+    Open the store for a chain file, ingesting it on first use.
+
+    The source file is re-ingested when its modification time changes.
+    """
+    source_mtime = os.path.getmtime(resolve_chain_path(chain_file))
+
+    store = _stores.get(chain_file)
+    if store is None:
+        path = OptionChainStore.store_path(chain_file)
+        if os.path.exists(os.path.join(path, "meta.json")):
+            store = OptionChainStore(path)
+
+    if store is None or store.meta["source_mtime"] != source_mtime:
+        store = OptionChainStore.ingest(chain_file)
+
+    _stores[chain_file] = store
+    return store
+
+
+# Premium parameters of each template that can be priced from a chain:
+# (option type, strike parameter, premium parameter)
+TEMPLATE_PREMIUM_FIELDS = {
+    "covered-call": [("CE", "callStrike", "premium")],
+    "bull-call-spread": [
+        ("CE", "longCallStrike", "longCallPremium"),
+        ("CE", "shortCallStrike", "shortCallPremium"),
+    ],
+    "long-straddle": [("CE", "strike", "callPremium"), ("PE", "strike", "putPremium")],
+    "protective-put": [("PE", "putStrike", "putPremium")],
+    "butterfly-spread": [
+        ("CE", "lowerStrike", "lowerPremium"),
+        ("CE", "middleStrike", "middlePremium"),
+        ("CE", "upperStrike", "upperPremium"),
+    ],
+}
+
+# Iron condor legs: (option type, strike parameter, +1 sold / -1 bought)
+IRON_CONDOR_LEGS = [
+    ("PE", "putBuyStrike", -1),
+    ("PE", "putSellStrike", 1),
+    ("CE", "callSellStrike", 1),
+    ("CE", "callBuyStrike", -1),
+]
+
+
+def _is_blank(value: Any) -> bool:
+    return value is None or value == ""
+
+
+def price_from_chain(
+    strategy_type: str,
+    parameters: Dict[str, Any],
+    custom_legs: Optional[List[Dict[str, Any]]],
+    chain_file: str,
+    expiry: str,
+    underlying: Optional[str] = None
+):
+    """
+    Fill missing premiums from an option-chain snapshot.
+
+    Premiums already present in the parameters or legs are kept; the rest
+    are priced at the chain's mid (or last traded) price with a single bulk
+    fetch. Template strikes must be present for their premium to be filled.
+
+    Returns:
+        (parameters, custom_legs) copies with premiums filled in
+    """
+    store = get_chain_store(chain_file)
+    symbol = underlying or store.underlyings[0]
+    parameters = dict(parameters or {})
+
+    if strategy_type == "custom-strategy":
+        legs = [dict(leg) for leg in (custom_legs or [])]
+        targets = [
+            leg for leg in legs
+            if leg.get("type") in ("CE", "PE") and leg.get("strike") is not None
+            and _is_blank(leg.get("premium"))
+        ]
+        if targets:
+            quotes = store.fetch(
+                symbol,
+                [leg.get("expiry") or expiry for leg in targets],
+                [float(leg["strike"]) for leg in targets],
+                [leg["type"] for leg in targets],
+            )
+            for leg, found, price in zip(targets, quotes["found"], quotes["price"]):
+                if found and not np.isnan(price):
+                    leg["premium"] = round(float(price), 2)
+        return parameters, legs
+
+    if strategy_type == "iron-condor":
+        if not _is_blank(parameters.get("netPremium")) or any(
+            _is_blank(parameters.get(k)) for _, k, _ in IRON_CONDOR_LEGS
+        ):
+            return parameters, custom_legs
+        quotes = store.fetch(
+            symbol, expiry,
+            [float(parameters[k]) for _, k, _ in IRON_CONDOR_LEGS],
+            [t for t, _, _ in IRON_CONDOR_LEGS],
+        )
+        if quotes["found"].all():
+            signs = np.array([s for _, _, s in IRON_CONDOR_LEGS])
+            parameters["netPremium"] = round(float((signs * quotes["price"]).sum()), 2)
+        return parameters, custom_legs
+
+    fields = [
+        (t, k, p) for t, k, p in TEMPLATE_PREMIUM_FIELDS.get(strategy_type, [])
+        if _is_blank(parameters.get(p)) and not _is_blank(parameters.get(k))
+    ]
+    if fields:
+        quotes = store.fetch(
+            symbol, expiry,
+            [float(parameters[k]) for _, k, _ in fields],
+            [t for t, _, _ in fields],
+        )
+        for (_, _, p), found, price in zip(fields, quotes["found"], quotes["price"]):
+            if found and not np.isnan(price):
+                parameters[p] = round(float(price), 2)
+
+    return parameters, custom_legs
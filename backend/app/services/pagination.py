@@ -0,0 +1,35 @@
+"""
+Pagination - Opaque continuation tokens for keyset (cursor) pagination.
+
+A cursor records the sort key of the last row of a page; the next page
+is read with a WHERE on that key instead of an OFFSET, so every page costs
+one index seek however deep it is. Tokens are URL-safe base64 JSON and are
+meant to be passed back verbatim, not parsed by clients.
+"""
+import base64
+import binascii
+import json
+from typing import Any, Dict
+
+
+def encode_cursor(position: Dict[str, Any]) -> str:
+    """Opaque token for a page position (a JSON-serializable dict)."""
+    raw = json.dumps(position, separators=(",", ":"), sort_keys=True).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> Dict[str, Any]:
+    """
+    Page position of a token from encode_cursor.
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        position = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(position, dict):
+        raise ValueError("Invalid cursor")
+    return position
@@ -2,8 +2,24 @@
 Payoff calculation service - Business logic layer.
 Separated from controllers for clean architecture.
 """
-from typing import List, Dict, Any
+from datetime import date
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+
+import numpy as np
+
+from ..config import settings
 from ..schemas.strategy import PayoffDataPoint
+from ..kernels import resolve_precision
+from .legs import stack_legs, strategy_strikes, strategy_to_legs
+from .price_grid import get_price_grid, iter_price_grid
+
+# Grid points evaluated per block by iter_payoff_chunks. The NumPy kernel
+# keeps about 15 block x legs temporaries alive, so this bounds the peak
+# (about 4 MB for a four-leg strategy in float64).
+PAYOFF_CHUNK_POINTS = 8192
+
+# Grid points of the per-strategy metrics summary
+METRICS_POINTS = 201
 
 
 class PayoffCalculatorService:
@@ -13,35 +29,38 @@ class PayoffCalculatorService:
     def calculate_price_range(
         underlying_price: float,
         price_range_percent: float,
-        num_points: int = 50
-    ) -> List[float]:
+        num_points: int = 50,
+        spacing: str = "linear",
+        strikes: Optional[List[float]] = None
+    ) -> np.ndarray:
         """
-        Generate evenly-spaced price points within the range.
+        Generate price points within the range.
         
         Formula:
         - minPrice = underlyingPrice × (1 - range/100)
         - maxPrice = underlyingPrice × (1 + range/100)
         
+        Grids are cached and shared (see price_grid.get_price_grid), so the
+        returned array is read-only.
+        
         Args:
             underlying_price: Current price of underlying asset
             price_range_percent: Percentage range (10-100)
             num_points: Number of price points to generate
+            spacing: linear, log or strike-dense
+            strikes: Strikes to densify around (strike-dense only)
             
         Returns:
-            List of price points
+            Read-only array of price points
         """
-        min_price = underlying_price * (1 - price_range_percent / 100)
-        max_price = underlying_price * (1 + price_range_percent / 100)
-        
-        step = (max_price - min_price) / (num_points - 1)
-        
-        return [min_price + (step * i) for i in range(num_points)]
+        return get_price_grid(underlying_price, price_range_percent, num_points, spacing, strikes)
     
     @staticmethod
     def calculate_covered_call(
         parameters: Dict[str, Any],
         underlying_price: float,
-        price_range_percent: float
+        price_range_percent: float,
+        price_points: Optional[np.ndarray] = None
     ) -> List[PayoffDataPoint]:
         """
         Calculate payoff for Covered Call strategy.
@@ -54,6 +73,7 @@ class PayoffCalculatorService:
             parameters: Strategy parameters (futuresPrice, callStrike, premium, lotSize)
             underlying_price: Current underlying price
             price_range_percent: Price range percentage
+            price_points: Precomputed price grid (default: 50 linear points)
             
         Returns:
             List of PayoffDataPoint objects
@@ -66,9 +86,10 @@ class PayoffCalculatorService:
         call_lot_size = float(parameters.get("callLotSize", 50))
         
         # Generate price points
-        price_points = PayoffCalculatorService.calculate_price_range(
-            underlying_price, price_range_percent
-        )
+        if price_points is None:
+            price_points = PayoffCalculatorService.calculate_price_range(
+                underlying_price, price_range_percent
+            )
         
         payoff_data = []
         
@@ -99,7 +120,8 @@ class PayoffCalculatorService:
     def calculate_bull_call_spread(
         parameters: Dict[str, Any],
         underlying_price: float,
-        price_range_percent: float
+        price_range_percent: float,
+        price_points: Optional[np.ndarray] = None
     ) -> List[PayoffDataPoint]:
         """
         Calculate payoff for Bull Call Spread.
@@ -117,9 +139,10 @@ class PayoffCalculatorService:
         # Net debit paid
         net_debit = long_call_premium - short_call_premium
         
-        price_points = PayoffCalculatorService.calculate_price_range(
-            underlying_price, price_range_percent
-        )
+        if price_points is None:
+            price_points = PayoffCalculatorService.calculate_price_range(
+                underlying_price, price_range_percent
+            )
         
         payoff_data = []
         
@@ -151,7 +174,8 @@ class PayoffCalculatorService:
     def calculate_iron_condor(
         parameters: Dict[str, Any],
         underlying_price: float,
-        price_range_percent: float
+        price_range_percent: float,
+        price_points: Optional[np.ndarray] = None
     ) -> List[PayoffDataPoint]:
         """Calculate payoff for Iron Condor."""
         lot_size = float(parameters.get("lotSize", 50))
@@ -161,24 +185,25 @@ class PayoffCalculatorService:
         call_buy_strike = float(parameters.get("callBuyStrike", underlying_price + 1000))
         net_premium = float(parameters.get("netPremium", 100))
         
-        price_points = PayoffCalculatorService.calculate_price_range(
-            underlying_price, price_range_percent
-        )
+        if price_points is None:
+            price_points = PayoffCalculatorService.calculate_price_range(
+                underlying_price, price_range_percent
+            )
         
         payoff_data = []
         
         for price in price_points:
             pnl = net_premium  # Start with premium received
             
-            # Put spread
+            # Put spread (loss capped at the spread width below the long put)
             if price < put_buy_strike:
-                pnl -= (put_buy_strike - price) - (put_sell_strike - price)
+                pnl -= (put_sell_strike - price) - (put_buy_strike - price)
             elif price < put_sell_strike:
                 pnl -= (put_sell_strike - price)
             
-            # Call spread
+            # Call spread (loss capped at the spread width above the long call)
             if price > call_buy_strike:
-                pnl -= (price - call_buy_strike) - (price - call_sell_strike)
+                pnl -= (price - call_sell_strike) - (price - call_buy_strike)
             elif price > call_sell_strike:
                 pnl -= (price - call_sell_strike)
             
@@ -197,7 +222,8 @@ class PayoffCalculatorService:
     def calculate_long_straddle(
         parameters: Dict[str, Any],
         underlying_price: float,
-        price_range_percent: float
+        price_range_percent: float,
+        price_points: Optional[np.ndarray] = None
     ) -> List[PayoffDataPoint]:
         """Calculate payoff for Long Straddle."""
         strike = float(parameters.get("strike", underlying_price))
@@ -207,9 +233,10 @@ class PayoffCalculatorService:
         
         total_premium_paid = call_premium + put_premium
         
-        price_points = PayoffCalculatorService.calculate_price_range(
-            underlying_price, price_range_percent
-        )
+        if price_points is None:
+            price_points = PayoffCalculatorService.calculate_price_range(
+                underlying_price, price_range_percent
+            )
         
         payoff_data = []
         
@@ -235,7 +262,8 @@ class PayoffCalculatorService:
     def calculate_protective_put(
         parameters: Dict[str, Any],
         underlying_price: float,
-        price_range_percent: float
+        price_range_percent: float,
+        price_points: Optional[np.ndarray] = None
     ) -> List[PayoffDataPoint]:
         """Calculate payoff for Protective Put."""
         stock_price = float(parameters.get("stockPrice", underlying_price))
@@ -243,9 +271,10 @@ class PayoffCalculatorService:
         put_premium = float(parameters.get("putPremium", 200))
         lot_size = float(parameters.get("lotSize", 50))
         
-        price_points = PayoffCalculatorService.calculate_price_range(
-            underlying_price, price_range_percent
-        )
+        if price_points is None:
+            price_points = PayoffCalculatorService.calculate_price_range(
+                underlying_price, price_range_percent
+            )
         
         payoff_data = []
         
@@ -271,7 +300,8 @@ class PayoffCalculatorService:
     def calculate_butterfly_spread(
         parameters: Dict[str, Any],
         underlying_price: float,
-        price_range_percent: float
+        price_range_percent: float,
+        price_points: Optional[np.ndarray] = None
     ) -> List[PayoffDataPoint]:
         """Calculate payoff for Butterfly Spread."""
         lower_strike = float(parameters.get("lowerStrike", underlying_price - 500))
@@ -282,9 +312,10 @@ class PayoffCalculatorService:
         upper_premium = float(parameters.get("upperPremium", 100))
         lot_size = float(parameters.get("lotSize", 50))
         
-        price_points = PayoffCalculatorService.calculate_price_range(
-            underlying_price, price_range_percent
-        )
+        if price_points is None:
+            price_points = PayoffCalculatorService.calculate_price_range(
+                underlying_price, price_range_percent
+            )
         
         payoff_data = []
         
@@ -313,53 +344,48 @@ class PayoffCalculatorService:
     def calculate_custom_strategy(
         custom_legs: List[Dict[str, Any]],
         underlying_price: float,
-        price_range_percent: float
+        price_range_percent: float,
+        price_points: Optional[np.ndarray] = None,
+        expiry_date: Optional[str] = None,
+        volatility: Optional[float] = None
     ) -> List[PayoffDataPoint]:
-        """Calculate payoff for custom multi-leg strategy."""
-        price_points = PayoffCalculatorService.calculate_price_range(
-            underlying_price, price_range_percent
-        )
+        """
+        Calculate payoff for custom multi-leg strategy.
         
-        payoff_data = []
+        Legs may carry their own `expiry` (calendar and diagonal spreads).
+        The curve is taken at the nearest expiry: legs expiring then settle
+        at intrinsic value and longer-dated legs are priced with
+        Black-Scholes for their remaining time, all legs in one
+        vectorized call.
         
-        for price in price_points:
-            total_pnl = 0
-            
-            for leg in custom_legs:
-                leg_type = leg.get("type")  # FUT, CE, PE
-                action = leg.get("action")  # BUY, SELL
-                lot_size = float(leg.get("lotSize", 0))
-                
-                if leg_type == "FUT":
-                    entry_price = float(leg.get("entryPrice", underlying_price))
-                    if action == "BUY":
-                        leg_pnl = (price - entry_price) * lot_size
-                    else:  # SELL
-                        leg_pnl = (entry_price - price) * lot_size
-                else:  # Options (CE or PE)
-                    strike = float(leg.get("strike", underlying_price))
-                    premium = float(leg.get("premium", 0))
-                    
-                    if leg_type == "CE":  # Call
-                        intrinsic = max(0, price - strike)
-                    else:  # PE (Put)
-                        intrinsic = max(0, strike - price)
-                    
-                    if action == "BUY":
-                        leg_pnl = (intrinsic - premium) * lot_size
-                    else:  # SELL
-                        leg_pnl = (premium - intrinsic) * lot_size
-                
-                total_pnl += leg_pnl
-            
-            payoff_data.append(
-                PayoffDataPoint(
-                    price=round(price, 2),
-                    pnl=round(total_pnl, 2)
-                )
+        Args:
+            custom_legs: Legs with type, action, lotSize, strike, premium,
+                entryPrice and optional expiry (YYYY-MM-DD)
+            underlying_price: Current underlying price
+            price_range_percent: Price range percentage
+            price_points: Prices to evaluate (default: linear grid)
+            expiry_date: Expiry of legs without their own (default: today)
+            volatility: Volatility of longer-dated legs
+                (default: settings.default_volatility)
+        """
+        if price_points is None:
+            price_points = PayoffCalculatorService.calculate_price_range(
+                underlying_price, price_range_percent
             )
+        volatility = settings.default_volatility if volatility is None else volatility
         
-        return payoff_data
+        legs = strategy_to_legs(
+            "custom-strategy", None, custom_legs,
+            expiry_date or date.today().isoformat(), underlying_price
+        )
+        pnl = legs.nearest_expiry_pnl(
+            np.asarray(price_points, dtype=float)[:, None], volatility, settings.risk_free_rate
+        )
+        
+        return [
+            PayoffDataPoint(price=round(float(price), 2), pnl=round(float(value), 2))
+            for price, value in zip(price_points, pnl)
+        ]
     
     @staticmethod
     def calculate_payoff(
@@ -367,11 +393,18 @@ class PayoffCalculatorService:
         parameters: Dict[str, Any],
         underlying_price: float,
         price_range_percent: float,
-        custom_legs: List[Dict[str, Any]] = None
+        custom_legs: List[Dict[str, Any]] = None,
+        num_points: int = 50,
+        grid_spacing: str = "linear",
+        expiry_date: Optional[str] = None,
+        volatility: Optional[float] = None
     ) -> List[PayoffDataPoint]:
         """
         Main entry point for payoff calculation.
         Routes to specific strategy calculator.
+        
+        expiry_date and volatility are used by custom strategies whose
+        legs expire on different dates.
         """
         # Ensure parameters is a dict (not None)
         if parameters is None:
@@ -386,15 +419,145 @@ class PayoffCalculatorService:
             "butterfly-spread": PayoffCalculatorService.calculate_butterfly_spread,
         }
         
+        if strategy_type == "custom-strategy" and not custom_legs:
+            return []
+        
+        calculator = strategy_calculators.get(strategy_type)
+        if strategy_type != "custom-strategy" and not calculator:
+            raise ValueError(f"Unknown strategy type: {strategy_type}")
+        
+        strikes = None
+        if grid_spacing == "strike-dense":
+            strikes = strategy_strikes(strategy_type, parameters, custom_legs, underlying_price)
+        price_points = PayoffCalculatorService.calculate_price_range(
+            underlying_price, price_range_percent, num_points, grid_spacing, strikes
+        )
+        
         if strategy_type == "custom-strategy":
-            if not custom_legs:
-                return []
             return PayoffCalculatorService.calculate_custom_strategy(
-                custom_legs, underlying_price, price_range_percent
+                custom_legs, underlying_price, price_range_percent, price_points,
+                expiry_date, volatility
             )
         
-        calculator = strategy_calculators.get(strategy_type)
-        if not calculator:
-            raise ValueError(f"Unknown strategy type: {strategy_type}")
+        return calculator(parameters, underlying_price, price_range_percent, price_points)
+    
+    @staticmethod
+    def iter_payoff_chunks(
+        strategy_type: str,
+        parameters: Dict[str, Any],
+        underlying_price: float,
+        price_range_percent: float,
+        expiry_date: str,
+        custom_legs: List[Dict[str, Any]] = None,
+        num_points: int = 50,
+        grid_spacing: str = "linear",
+        chunk_size: int = PAYOFF_CHUNK_POINTS,
+        precision: Optional[str] = None,
+        volatility: Optional[float] = None
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Evaluate the expiry payoff block by block over the price grid.
         
-        return calculator(parameters, underlying_price, price_range_percent)
\ No newline at end of file
+        Custom legs with later expiries are priced at the nearest expiry,
+        as in calculate_custom_strategy.
+        
+        The strategy is converted to a leg matrix once; each block of grid
+        prices is then priced with one vectorized call. Only one block is
+        alive at a time, so memory stays flat for any num_points.
+        
+        Args:
+            strategy_type: Template name or custom-strategy
+            parameters: Template parameters
+            underlying_price: Current underlying price
+            price_range_percent: Price range percentage
+            expiry_date: Strategy expiry (YYYY-MM-DD)
+            custom_legs: Legs of a custom strategy
+            num_points: Points on the curve
+            grid_spacing: linear, log or strike-dense
+            chunk_size: Maximum points per block
+            precision: float64 or float32 (default: settings.numeric_precision)
+            volatility: Volatility of longer-dated legs
+                (default: settings.default_volatility)
+            
+        Yields:
+            (prices, pnl) array blocks in ascending price order
+        """
+        dtype = resolve_precision(precision)
+        volatility = settings.default_volatility if volatility is None else volatility
+        legs = strategy_to_legs(strategy_type, parameters, custom_legs, expiry_date, underlying_price)
+        strikes = None
+        if grid_spacing == "strike-dense":
+            strikes = strategy_strikes(strategy_type, parameters, custom_legs, underlying_price)
+        
+        for prices in iter_price_grid(
+            underlying_price, price_range_percent, num_points, grid_spacing, strikes, chunk_size
+        ):
+            yield prices, legs.nearest_expiry_pnl(prices[:, None], volatility, settings.risk_free_rate, dtype)
+    
+    @staticmethod
+    def summarize_strategies(
+        strategies: List[Dict[str, Any]],
+        underlying_price: float,
+        price_range_percent: float = 30,
+        num_points: int = METRICS_POINTS,
+        volatility: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Payoff metrics of many strategies with one vectorized call.
+        
+        The strategies are stacked into one leg matrix and priced over a
+        shared linear grid at each strategy's nearest expiry. Maximum profit
+        and loss are bounded by the grid, so unlimited payoffs show the
+        value at the range edge.
+        
+        Args:
+            strategies: Dicts with strategy_type, expiry_date, parameters
+                and custom_legs
+            underlying_price: Current underlying price
+            price_range_percent: Price range percentage of the grid
+            num_points: Points on the grid
+            volatility: Volatility of longer-dated legs
+                (default: settings.default_volatility)
+            
+        Returns:
+            One dict per strategy, in input order, with max_profit, max_loss,
+            breakevens and error (None, or why the strategy could not be
+            priced)
+        """
+        volatility = settings.default_volatility if volatility is None else volatility
+        empty = {"max_profit": None, "max_loss": None, "breakevens": None, "error": None}
+        summaries: List[Dict[str, Any]] = [dict(empty) for _ in strategies]
+        
+        matrices, priced = [], []
+        for n, s in enumerate(strategies):
+            try:
+                matrices.append(strategy_to_legs(
+                    s["strategy_type"], s.get("parameters"), s.get("custom_legs"),
+                    s["expiry_date"], underlying_price
+                ))
+                priced.append(n)
+            except (ValueError, TypeError, KeyError) as e:
+                summaries[n]["error"] = str(e)
+        if not matrices:
+            return summaries
+        
+        prices = PayoffCalculatorService.calculate_price_range(underlying_price, price_range_percent, num_points)
+        pnl = stack_legs(matrices).nearest_expiry_pnl(
+            prices[:, None, None], volatility, settings.risk_free_rate
+        )  # (points, strategies)
+        
+        high, low = pnl.max(axis=0), pnl.min(axis=0)
+        # Breakevens: linear interpolation where P&L changes sign between grid points
+        left, right = pnl[:-1], pnl[1:]
+        crossing = np.signbit(left) != np.signbit(right)
+        weight = np.divide(left, left - right, out=np.zeros_like(left), where=left != right)
+        roots = prices[:-1, None] + weight * np.diff(prices)[:, None]
+        
+        for column, n in enumerate(priced):
+            summaries[n] = {
+                "max_profit": round(float(high[column]), 2),
+                "max_loss": round(float(low[column]), 2),
+                "breakevens": [round(float(r), 2) for r in roots[crossing[:, column], column]],
+                "error": None,
+            }
+        return summaries
@@ -0,0 +1,197 @@
+"""
+Price grid service - Shared, read-only price axes for payoff curves.
+
+Grids are cached by their parameters and returned as read-only NumPy
+arrays, so every calculator, batch item and request that asks for the
+same grid shares one array instead of rebuilding a list.
+
+Grids can also be produced block by block (iter_price_grid), so very
+large grids never exist in memory at once.
+
+Spacing:
+- linear: evenly spaced prices (the classic payoff-chart grid)
+- log: evenly spaced log prices, i.e. equal percentage steps
+- strike-dense: half the points spread linearly, the other half packed
+  around the strikes, with every strike on the grid; expiry payoffs are
+  piecewise linear between strikes, so the curve stays exact at low
+  resolution
+"""
+from functools import lru_cache
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..config import settings
+
+GRID_SPACINGS = ("linear", "log", "strike-dense")
+
+# Log grids start at this fraction of the underlying price (log(0) is undefined)
+MIN_LOG_PRICE_FRACTION = 0.01
+
+# Grids larger than this are built on demand and not kept in the cache
+MAX_CACHED_POINTS = 100_000
+
+
+def _price_bounds(underlying_price: float, price_range_percent: float) -> Tuple[float, float]:
+    min_price = underlying_price * (1 - price_range_percent / 100)
+    max_price = underlying_price * (1 + price_range_percent / 100)
+    return min_price, max_price
+
+
+def _linear_grid(min_price: float, max_price: float, num_points: int) -> np.ndarray:
+    step = (max_price - min_price) / (num_points - 1)
+    return min_price + step * np.arange(num_points)
+
+
+def _build_grid(
+    underlying_price: float,
+    price_range_percent: float,
+    num_points: int,
+    spacing: str,
+    strikes: Tuple[float, ...]
+) -> np.ndarray:
+    min_price, max_price = _price_bounds(underlying_price, price_range_percent)
+
+    if spacing == "log":
+        low = max(min_price, underlying_price * MIN_LOG_PRICE_FRACTION)
+        grid = np.geomspace(low, max_price, num_points)
+    elif spacing == "strike-dense" and strikes:
+        base_points = max(2, num_points // 2)
+        base = _linear_grid(min_price, max_price, base_points)
+        step = base[1] - base[0]
+
+        # Remaining points go in a +/- one-step band around each strike
+        per_strike = max(1, (num_points - base_points) // len(strikes))
+        band = np.linspace(-step, step, per_strike) if per_strike > 1 else np.zeros(1)
+        dense = (np.asarray(strikes)[:, None] + band[None, :]).ravel()
+
+        grid = np.concatenate([base, dense, strikes])
+        grid = np.unique(np.clip(grid, min_price, max_price))
+    else:
+        grid = _linear_grid(min_price, max_price, num_points)
+
+    grid.setflags(write=False)
+    return grid
+
+
+@lru_cache(maxsize=settings.price_grid_cache_size)
+def _cached_grid(
+    underlying_price: float,
+    price_range_percent: float,
+    num_points: int,
+    spacing: str,
+    strikes: Tuple[float, ...]
+) -> np.ndarray:
+    return _build_grid(underlying_price, price_range_percent, num_points, spacing, strikes)
+
+
+def _grid_key_strikes(
+    underlying_price: float,
+    price_range_percent: float,
+    spacing: str,
+    strikes: Optional[Sequence[float]]
+) -> Tuple[float, ...]:
+    """Strikes inside the grid range, sorted (empty unless strike-dense)."""
+    if spacing != "strike-dense" or not strikes:
+        return ()
+    min_price, max_price = _price_bounds(underlying_price, price_range_percent)
+    return tuple(sorted({float(k) for k in strikes if min_price <= k <= max_price}))
+
+
+def _validate_grid(spacing: str, num_points: int) -> None:
+    if spacing not in GRID_SPACINGS:
+        raise ValueError(f"Unknown grid spacing: {spacing} (use {', '.join(GRID_SPACINGS)})")
+    if num_points < 2:
+        raise ValueError("num_points must be at least 2")
+
+
+def get_price_grid(
+    underlying_price: float,
+    price_range_percent: float,
+    num_points: int = 50,
+    spacing: str = "linear",
+    strikes: Optional[Sequence[float]] = None
+) -> np.ndarray:
+    """
+    Read-only price grid, shared through a small LRU cache.
+
+    Args:
+        underlying_price: Center of the grid
+        price_range_percent: Grid spans +/- this percentage of the price
+        num_points: Number of points (strike-dense grids may differ slightly)
+        spacing: linear, log or strike-dense
+        strikes: Strikes to densify around (strike-dense only)
+
+    Returns:
+        Sorted, read-only float64 array of prices
+
+    Raises:
+        ValueError: If the spacing is unknown or num_points < 2
+    """
+    _validate_grid(spacing, num_points)
+    underlying_price = float(underlying_price)
+    price_range_percent = float(price_range_percent)
+    num_points = int(num_points)
+    key_strikes = _grid_key_strikes(underlying_price, price_range_percent, spacing, strikes)
+
+    if num_points > MAX_CACHED_POINTS:
+        return _build_grid(underlying_price, price_range_percent, num_points, spacing, key_strikes)
+    return _cached_grid(underlying_price, price_range_percent, num_points, spacing, key_strikes)
+
+
+def iter_price_grid(
+    underlying_price: float,
+    price_range_percent: float,
+    num_points: int,
+    spacing: str = "linear",
+    strikes: Optional[Sequence[float]] = None,
+    chunk_size: int = 65536
+) -> Iterator[np.ndarray]:
+    """
+    Yield a price grid in ascending blocks of at most `chunk_size` points.
+
+    Grids up to MAX_CACHED_POINTS are sliced from the shared cached grid.
+    Larger linear and log grids are computed block by block, so memory
+    does not grow with num_points. A large strike-dense grid is already
+    fine everywhere; it is streamed as a linear grid with the strikes
+    inserted, which keeps every payoff kink exact.
+
+    Raises:
+        ValueError: If the spacing is unknown or num_points < 2
+    """
+    _validate_grid(spacing, num_points)
+
+    if num_points <= MAX_CACHED_POINTS:
+        grid = get_price_grid(underlying_price, price_range_percent, num_points, spacing, strikes)
+        for lo in range(0, len(grid), chunk_size):
+            yield grid[lo:lo + chunk_size]
+        return
+
+    min_price, max_price = _price_bounds(underlying_price, price_range_percent)
+    key_strikes = np.array(_grid_key_strikes(underlying_price, price_range_percent, spacing, strikes))
+
+    if spacing == "log":
+        low = max(min_price, underlying_price * MIN_LOG_PRICE_FRACTION)
+        log_step = np.log(max_price / low) / (num_points - 1)
+    else:
+        step = (max_price - min_price) / (num_points - 1)
+
+    for lo in range(0, num_points, chunk_size):
+        index = np.arange(lo, min(lo + chunk_size, num_points))
+        if spacing == "log":
+            block = low * np.exp(log_step * index)
+        else:
+            block = min_price + step * index
+
+        if len(key_strikes):
+            # Strikes in [block start, next block start) belong to this block
+            upper = min_price + step * (index[-1] + 1) if index[-1] + 1 < num_points else np.inf
+            inside = key_strikes[(key_strikes >= block[0]) & (key_strikes < upper)]
+            if len(inside):
+                block = np.union1d(block, inside)
+        yield block
+
+
+def price_grid_cache_info() -> Dict[str, int]:
+    """Hit/miss statistics of the grid cache."""
+    return _cached_grid.cache_info()._asdict()
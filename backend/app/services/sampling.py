@@ -0,0 +1,219 @@
+"""
+Sampling - Random and quasi-random draws for the simulation engine.
+
+A draw source hands out one dimension at a time: an array holding one
+normal or uniform variate per path. Models request their dimensions in
+a fixed order, so the same model code runs on every source:
+- pseudo: NumPy's default (PCG64) generator
+- sobol: randomly scrambled Sobol points (randomized quasi-Monte Carlo)
+Any source can be wrapped in antithetic pairs.
+
+Sobol direction numbers are Joe and Kuo's (2008) table new-joe-kuo-6.21201,
+chosen so that two-dimensional projections are well distributed. Each
+replicate applies its own random linear matrix scramble and digital
+shift, so replicates are independent and unbiased and their spread gives the standard error.
+"""
+import gzip
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Tuple
+
+import numpy as np
+
+from .pricing import norm_ppf
+
+SAMPLING_METHODS = ("pseudo", "sobol")
+
+# Bits of precision of each Sobol coordinate
+SOBOL_BITS = 32
+
+# Dimensions covered by the direction-number table
+SOBOL_MAX_DIMENSIONS = 21201
+
+# One line per dimension 2..21201: d, degree s, interior polynomial
+# coefficients a and initial direction numbers m_1..m_s
+_JOE_KUO_TABLE = Path(__file__).parent / "data" / "new-joe-kuo-6.21201.gz"
+
+
+@lru_cache(maxsize=1)
+def _joe_kuo() -> List[Tuple[int, int, Tuple[int, ...]]]:
+    """(s, a, initial m) of every dimension after the first."""
+    with gzip.open(_JOE_KUO_TABLE, "rt") as f:
+        next(f)
+        return [
+            (int(s), int(a), tuple(int(x) for x in m))
+            for _, s, a, *m in (line.split() for line in f)
+        ]
+
+
+@lru_cache(maxsize=8)
+def _direction_numbers(dimensions: int) -> np.ndarray:
+    """
+    Direction numbers V[dim, bit] as SOBOL_BITS-bit integers.
+
+    Dimension 0 is the van der Corput sequence; dimension d >= 1 uses
+    row d + 1 of the Joe-Kuo table (which numbers dimensions from 1).
+    """
+    if dimensions > SOBOL_MAX_DIMENSIONS:
+        raise ValueError(
+            f"Sobol sampling covers at most {SOBOL_MAX_DIMENSIONS} dimensions "
+            "(use pseudo sampling for longer simulations)"
+        )
+    table = _joe_kuo()
+    v = np.zeros((dimensions, SOBOL_BITS), dtype=np.uint64)
+
+    for dim in range(dimensions):
+        if dim == 0:
+            m = [1] * SOBOL_BITS
+        else:
+            s, a, initial = table[dim - 1]
+            m = list(initial[:SOBOL_BITS])
+            for i in range(s, SOBOL_BITS):
+                value = m[i - s] ^ (m[i - s] << s)
+                for k in range(1, s):
+                    if a >> (s - 1 - k) & 1:
+                        value ^= m[i - k] << k
+                m.append(value)
+        for bit in range(SOBOL_BITS):
+            v[dim, bit] = m[bit] << (SOBOL_BITS - 1 - bit)
+    v.setflags(write=False)
+    return v
+
+
+_POSITIONS = np.arange(SOBOL_BITS, dtype=np.uint64)
+_DIGITS = np.uint64(1) << _POSITIONS
+_HIGHER_DIGITS = np.array(
+    [((1 << SOBOL_BITS) - 1) & ~((2 << p) - 1) for p in range(SOBOL_BITS)], dtype=np.uint64
+)
+
+
+def _parity(x: np.ndarray) -> np.ndarray:
+    for shift in (32, 16, 8, 4, 2, 1):
+        x = x ^ (x >> np.uint64(shift))
+    return x & np.uint64(1)
+
+
+class SobolScramble:
+    """
+    One randomized Sobol replicate: a linear matrix scramble and a
+    digital shift per dimension, drawn lazily as dimensions are used.
+    """
+
+    def __init__(self, rng: np.random.Generator):
+        self.rng = rng
+        self._directions: List[np.ndarray] = []
+        self._shifts: List[np.uint64] = []
+
+    def _scrambled(self, dim: int):
+        if dim >= len(self._directions):
+            available = 64
+            while available <= dim:
+                available *= 2
+            available = min(available, max(dim + 1, SOBOL_MAX_DIMENSIONS))
+            # Scramble in growing batches; models ask for dimensions in order
+            end = min(max(dim + 1, 2 * len(self._directions), 16), available)
+            v = _direction_numbers(available)[len(self._directions):end]
+
+            # Random lower-triangular matrix with unit diagonal per dimension:
+            # output digit k mixes input digits 1..k (digit 1 = most significant)
+            random_bits = self.rng.integers(0, 1 << SOBOL_BITS, size=(len(v), SOBOL_BITS), dtype=np.uint64)
+            rows = (random_bits & _HIGHER_DIGITS) | _DIGITS
+            digits = _parity(v[:, :, None] & rows[:, None, :])
+            scrambled = np.bitwise_or.reduce(digits << _POSITIONS, axis=2)
+            shifts = self.rng.integers(0, 1 << SOBOL_BITS, size=len(v), dtype=np.uint64)
+
+            self._directions.extend(scrambled)
+            self._shifts.extend(shifts)
+        return self._directions[dim], self._shifts[dim]
+
+    def uniform(self, dim: int, start: int, n: int) -> np.ndarray:
+        """
+        Points start..start+n-1 of dimension `dim`, as floats in (0, 1).
+
+        Built in Gray-code order by doubling: for j < 2^m,
+        x(2^m + j) = x(j) ^ V[m] ^ V[m-1], so a block of n points costs
+        about 2n XORs, and an aligned block only adds x(start).
+        """
+        v, shift = self._scrambled(dim)
+        size = 1
+        while size < n:
+            size *= 2
+        if start % size:
+            raise ValueError("Sobol blocks must start at a multiple of their size")
+
+        table = np.zeros(size, dtype=np.uint64)
+        filled, m = 1, 0
+        while filled < size:
+            step = v[m] ^ (v[m - 1] if m else np.uint64(0))
+            table[filled:2 * filled] = table[:filled] ^ step
+            filled *= 2
+            m += 1
+
+        gray = start ^ (start >> 1)
+        offset = np.uint64(0)
+        for bit in range(SOBOL_BITS):
+            if gray >> bit & 1:
+                offset ^= v[bit]
+
+        x = table[:n] ^ offset ^ shift
+        return (x.astype(np.float64) + 0.5) / float(1 << SOBOL_BITS)
+
+
+class PseudoSource:
+    """Draws from a NumPy random generator."""
+
+    def __init__(self, rng: np.random.Generator, n: int, dtype=np.float64):
+        self.rng = rng
+        self.n = n
+        self.dtype = dtype
+
+    def normal(self) -> np.ndarray:
+        return self.rng.standard_normal(self.n, dtype=self.dtype)
+
+    def uniform(self) -> np.ndarray:
+        return self.rng.random(self.n, dtype=self.dtype)
+
+
+class SobolSource:
+    """Consecutive points of one scrambled Sobol replicate; each call is the next dimension."""
+
+    def __init__(self, scramble: SobolScramble, start: int, n: int, dtype=np.float64):
+        self.scramble = scramble
+        self.start = start
+        self.n = n
+        self.dtype = dtype
+        self._dim = 0
+
+    def uniform(self) -> np.ndarray:
+        u = self.scramble.uniform(self._dim, self.start, self.n)
+        self._dim += 1
+        return u.astype(self.dtype)
+
+    def normal(self) -> np.ndarray:
+        u = self.scramble.uniform(self._dim, self.start, self.n)
+        self._dim += 1
+        return norm_ppf(u, self.dtype)
+
+
+class AntitheticSource:
+    """Pairs every draw with its mirror image: paths 2k and 2k+1 are antithetic."""
+
+    def __init__(self, source):
+        self.source = source
+        self.n = 2 * source.n
+        self.dtype = source.dtype
+
+    @staticmethod
+    def _pair(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+        out = np.empty(2 * len(first), dtype=first.dtype)
+        out[0::2] = first
+        out[1::2] = second
+        return out
+
+    def normal(self) -> np.ndarray:
+        z = self.source.normal()
+        return self._pair(z, -z)
+
+    def uniform(self) -> np.ndarray:
+        u = self.source.uniform()
+        return self._pair(u, 1 - u)
@@ -0,0 +1,248 @@
+"""
+Scenario service - P&L of strategies under price, volatility and time shocks.
+
+The whole shock cube is priced with one broadcast call: spot shocks,
+volatility shocks and elapsed days each occupy their own axis and the
+strategies x legs matrix occupies the trailing axes, so no Python loop
+runs over scenarios.
+"""
+import time
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from ..config import settings
+from ..kernels import resolve_precision
+from .legs import LegMatrix, stack_legs, strategy_to_legs
+from .market_data import to_datetime64
+
+# Upper bound on scenarios x strategies x legs priced per chunk
+CHUNK_ELEMENTS = 4_000_000
+
+# Floor applied to shocked volatility
+MIN_VOLATILITY = 0.01
+
+DEFAULT_SPOT_SHOCKS = [-10.0, -5.0, -2.0, 0.0, 2.0, 5.0, 10.0]
+DEFAULT_VOL_SHOCKS = [-5.0, 0.0, 5.0, 10.0]
+DEFAULT_DAYS_ELAPSED = [0.0, 1.0, 5.0]
+
+# Standard scenario set of the daily book stress test
+STRESS_SPOT_SHOCKS = [-20.0, -15.0, -10.0, -5.0, -3.0, 0.0, 3.0, 5.0, 10.0, 15.0, 20.0]
+STRESS_VOL_SHOCKS = [-5.0, 0.0, 5.0, 10.0, 20.0]
+STRESS_DAYS_ELAPSED = [0.0, 1.0, 5.0]
+
+
+class ScenarioService:
+    """Service for scenario (shock grid) analysis."""
+
+    @staticmethod
+    def shock_grid(
+        legs: LegMatrix,
+        underlying_price: float,
+        volatility: float,
+        valuation_time: np.datetime64,
+        spot_shocks: np.ndarray,
+        vol_shocks: np.ndarray,
+        days_elapsed: np.ndarray,
+        rate: float = 0.0,
+        dtype=np.float64
+    ) -> np.ndarray:
+        """
+        Mark-to-model P&L of stacked strategies across a shock cube.
+
+        Args:
+            legs: Stacked LegMatrix of shape (strategies, legs)
+            underlying_price: Unshocked spot price
+            volatility: Unshocked volatility
+            valuation_time: Current time (datetime64)
+            spot_shocks: Relative spot moves in percent
+            vol_shocks: Absolute volatility moves in percentage points
+            days_elapsed: Calendar days that pass
+            rate: Risk-free rate
+            dtype: Floating-point type of the pricing and of the cube
+
+        Returns:
+            Array of shape (spot, vol, days, strategies)
+        """
+        spot = underlying_price * (1 + np.asarray(spot_shocks, dtype=dtype) / 100)
+        vol = np.maximum(volatility + np.asarray(vol_shocks, dtype=dtype) / 100, MIN_VOLATILITY)
+        elapsed = (np.asarray(days_elapsed, dtype=float) * 86400).astype("timedelta64[s]")
+        at = valuation_time + elapsed
+
+        num_strategies, num_legs = legs.quantity.shape
+        cube = len(spot) * len(vol) * len(at)
+        chunk = max(1, CHUNK_ELEMENTS // (cube * num_legs))
+        out = np.empty((len(spot), len(vol), len(at), num_strategies), dtype=dtype)
+
+        spot = spot[:, None, None, None, None]
+        vol = vol[None, :, None, None, None]
+        at = at[None, None, :, None, None]
+
+        for lo in range(0, num_strategies, chunk):
+            part = legs.select(slice(lo, lo + chunk))
+            out[..., lo:lo + chunk] = part.pnl(spot, part.time_to_expiry(at, dtype), vol, rate, dtype)
+
+        return out
+
+    @staticmethod
+    def stress_strategies(
+        strategies: List[Dict[str, Any]],
+        underlying_price: float,
+        volatility: float,
+        valuation_time: np.datetime64,
+        rate: float = 0.0
+    ) -> List[Dict[str, Any]]:
+        """
+        Worst and best P&L of each strategy over the standard stress scenarios.
+
+        Strategies that cannot be converted to legs get an `error` entry
+        instead of failing the whole batch.
+
+        Returns:
+            One dict per strategy, in input order
+        """
+        results: List[Dict[str, Any]] = [None] * len(strategies)
+        matrices, positions = [], []
+
+        for n, s in enumerate(strategies):
+            try:
+                matrices.append(strategy_to_legs(
+                    s["strategy_type"],
+                    s.get("parameters"),
+                    s.get("custom_legs"),
+                    s["expiry_date"],
+                    underlying_price,
+                ))
+                positions.append(n)
+            except (ValueError, TypeError, KeyError) as e:
+                results[n] = {"strategy_id": s.get("id"), "error": str(e)}
+
+        if matrices:
+            legs = stack_legs(matrices)
+            spot_shocks = np.array(STRESS_SPOT_SHOCKS)
+            vol_shocks = np.array(STRESS_VOL_SHOCKS)
+            days_elapsed = np.array(STRESS_DAYS_ELAPSED)
+
+            cube = ScenarioService.shock_grid(
+                legs, underlying_price, volatility, valuation_time,
+                spot_shocks, vol_shocks, days_elapsed, rate
+            ).reshape(-1, len(matrices))
+            base = legs.pnl(underlying_price, legs.time_to_expiry(valuation_time), volatility, rate)
+
+            worst = cube.argmin(axis=0)
+            i, j, k = np.unravel_index(worst, (len(spot_shocks), len(vol_shocks), len(days_elapsed)))
+
+            for m, n in enumerate(positions):
+                results[n] = {
+                    "strategy_id": strategies[n].get("id"),
+                    "base_pnl": round(float(base[m]), 2),
+                    "worst_pnl": round(float(cube[worst[m], m]), 2),
+                    "worst_spot_shock": float(spot_shocks[i[m]]),
+                    "worst_vol_shock": float(vol_shocks[j[m]]),
+                    "worst_days_elapsed": float(days_elapsed[k[m]]),
+                    "best_pnl": round(float(cube[:, m].max()), 2),
+                    "error": None,
+                }
+
+        return results
+
+    @staticmethod
+    def run(
+        strategies: List[Dict[str, Any]],
+        underlying_price: float,
+        volatility: Optional[float] = None,
+        valuation_date: Optional[str] = None,
+        spot_shocks: Optional[List[float]] = None,
+        vol_shocks: Optional[List[float]] = None,
+        days_elapsed: Optional[List[float]] = None,
+        rate: Optional[float] = None,
+        include_breakdown: bool = False,
+        precision: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Scenario analysis for a strategy or a portfolio of strategies.
+
+        Args:
+            strategies: Dicts with strategy_type, expiry_date, parameters,
+                custom_legs and optionally id/name
+            underlying_price: Current underlying price
+            volatility: Current volatility (default: settings.default_volatility)
+            valuation_date: Valuation date/time (default: today)
+            spot_shocks: Spot moves in percent
+            vol_shocks: Volatility moves in percentage points
+            days_elapsed: Days passed
+            rate: Risk-free rate (default: settings.risk_free_rate)
+            include_breakdown: Also return each strategy's P&L cube
+            precision: float64 or float32 (default: settings.numeric_precision)
+
+        Returns:
+            Dict with the shock axes, the portfolio P&L cube and extremes
+        """
+        started = time.perf_counter()
+        volatility = settings.default_volatility if volatility is None else volatility
+        rate = settings.risk_free_rate if rate is None else rate
+        valuation_time = to_datetime64(valuation_date or date.today().isoformat())
+        dtype = resolve_precision(precision)
+
+        spot_shocks = np.asarray(DEFAULT_SPOT_SHOCKS if spot_shocks is None else spot_shocks, dtype=float)
+        vol_shocks = np.asarray(DEFAULT_VOL_SHOCKS if vol_shocks is None else vol_shocks, dtype=float)
+        days_elapsed = np.asarray(DEFAULT_DAYS_ELAPSED if days_elapsed is None else days_elapsed, dtype=float)
+
+        legs = stack_legs([
+            strategy_to_legs(
+                s["strategy_type"],
+                s.get("parameters"),
+                s.get("custom_legs"),
+                s["expiry_date"],
+                underlying_price,
+            )
+            for s in strategies
+        ])
+
+        per_strategy = ScenarioService.shock_grid(
+            legs, underlying_price, volatility, valuation_time,
+            spot_shocks, vol_shocks, days_elapsed, rate, dtype
+        )
+        total = per_strategy.sum(axis=-1, dtype=np.float64)
+        base = legs.pnl(underlying_price, legs.time_to_expiry(valuation_time), volatility, rate)
+
+        def extreme(cube: np.ndarray, pick) -> Dict[str, float]:
+            i, j, k = np.unravel_index(pick(cube), cube.shape)
+            return {
+                "pnl": round(float(cube[i, j, k]), 2),
+                "spot_shock": float(spot_shocks[i]),
+                "vol_shock": float(vol_shocks[j]),
+                "days_elapsed": float(days_elapsed[k]),
+            }
+
+        result = {
+            "axes": {
+                "spot_shocks": spot_shocks.tolist(),
+                "spot_prices": np.round(underlying_price * (1 + spot_shocks / 100), 2).tolist(),
+                "vol_shocks": vol_shocks.tolist(),
+                "volatilities": np.round(np.maximum(volatility + vol_shocks / 100, MIN_VOLATILITY), 4).tolist(),
+                "days_elapsed": days_elapsed.tolist(),
+            },
+            "base_pnl": round(float(base.sum()), 2),
+            "pnl": np.round(total, 2).tolist(),
+            "worst": extreme(total, np.argmin),
+            "best": extreme(total, np.argmax),
+            "scenarios": int(total.size),
+            "precision": dtype.name,
+        }
+
+        if include_breakdown:
+            result["strategies"] = [
+                {
+                    "id": s.get("id"),
+                    "name": s.get("name"),
+                    "base_pnl": round(float(base[n]), 2),
+                    "worst": extreme(per_strategy[..., n], np.argmin),
+                    "pnl": np.round(per_strategy[..., n], 2).tolist(),
+                }
+                for n, s in enumerate(strategies)
+            ]
+
+        result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        return result
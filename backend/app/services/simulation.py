@@ -0,0 +1,795 @@
+"""
+Simulation service - Monte Carlo distribution of strategy P&L at a horizon.
+
+Terminal underlying prices are drawn from a selectable model:
+- gbm: geometric Brownian motion (lognormal, constant volatility)
+- heston: Heston stochastic volatility, Andersen's quadratic-exponential
+  (QE) discretization on daily steps
+- merton: Merton jump diffusion (lognormal jumps at a Poisson rate)
+
+Paths are generated in chunks, fully vectorized within a chunk, so
+memory stays bounded for any path count. Every model feeds the same
+payoff evaluation: the stacked leg matrix is marked to model at the
+terminal prices in one broadcast call.
+
+In path mode (run_exits) the same models are stepped day by day, every
+path is marked to model on every day in one broadcast call, and exit
+rules are applied as boolean masks over the (days, paths, strategies)
+P&L, as in the backtester.
+
+Models take their random inputs from a draw source (see sampling), so
+each model runs on pseudo-random or scrambled Sobol draws, optionally
+in antithetic pairs. The terminal price, whose mean S*exp(rT) is known,
+serves as control variate. Every run reports the standard error of its
+estimates.
+"""
+import time
+from datetime import date
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from ..config import settings
+from ..kernels import resolve_precision
+from .legs import CE, PE, SECONDS_PER_YEAR, LegMatrix, stack_legs, strategy_to_legs
+from .pricing import norm_ppf
+from .market_data import to_datetime64
+from .sampling import AntitheticSource, PseudoSource, SAMPLING_METHODS, SobolScramble, SobolSource
+
+SIMULATION_MODELS = ("gbm", "heston", "merton")
+
+# Upper bound on paths simulated per chunk
+CHUNK_PATHS = 100_000
+
+# Upper bound on paths x strategies x legs priced per chunk
+CHUNK_ELEMENTS = 4_000_000
+
+# Heston time steps per year of horizon
+HESTON_STEPS_PER_YEAR = 252
+
+# Independently scrambled replicates of a Sobol run (their spread gives the standard error)
+SOBOL_REPLICATES = 16
+
+# Poisson jump counts are inverted up to this tail probability
+MAX_JUMP_TAIL = 1e-12
+
+# QE switching threshold between the quadratic and exponential branches
+QE_PSI_CRITICAL = 1.5
+
+DEFAULT_HESTON = {"kappa": 2.0, "vol_of_vol": 0.5, "rho": -0.7}
+DEFAULT_MERTON = {"jump_intensity": 1.0, "jump_mean": -0.05, "jump_volatility": 0.1}
+
+PNL_PERCENTILES = [1, 5, 25, 50, 75, 95, 99]
+
+EXIT_REASONS = ("stop_loss", "profit_target", "time_stop", "strike_breach", "horizon")
+
+# Longest horizon of a path simulation, in daily steps
+MAX_PATH_STEPS = 750
+
+
+def _gbm_step(source, log_spot, variance, dt, volatility, rate, params, dtype):
+    """One exact GBM step of any length (1 dimension); the variance does not change."""
+    z = source.normal()
+    drift = (rate - 0.5 * volatility ** 2) * dt
+    return log_spot + drift + volatility * np.sqrt(dt) * z, variance
+
+
+def _poisson(u: np.ndarray, mean: float) -> np.ndarray:
+    """Poisson counts by inversion of uniform draws."""
+    if mean <= 0:
+        return np.zeros(len(u))
+    pmf = [np.exp(-mean)]
+    cdf = [pmf[0]]
+    while cdf[-1] < 1 - MAX_JUMP_TAIL and len(cdf) < 10_000:
+        pmf.append(pmf[-1] * mean / len(pmf))
+        cdf.append(cdf[-1] + pmf[-1])
+    return np.searchsorted(np.array(cdf), u, side="right").astype(float)
+
+
+def _merton_step(source, log_spot, variance, dt, volatility, rate, params, dtype):
+    """
+    One exact Merton jump-diffusion step of any length (3 dimensions).
+
+    Given the jump count N, the summed log-jumps are normal with mean
+    N * jump_mean and variance N * jump_volatility^2, so one normal draw
+    covers all jumps in the step. The drift is compensated so the
+    discounted price stays a martingale.
+    """
+    lam = params["jump_intensity"]
+    mu_j = params["jump_mean"]
+    delta = params["jump_volatility"]
+    compensator = np.exp(mu_j + 0.5 * delta ** 2) - 1
+
+    jumps = _poisson(source.uniform(), lam * dt).astype(dtype)
+    z = source.normal()
+    z_jump = source.normal()
+
+    drift = (rate - 0.5 * volatility ** 2 - lam * compensator) * dt
+    log_return = drift + volatility * np.sqrt(dt) * z + jumps * mu_j + np.sqrt(jumps) * delta * z_jump
+    return log_spot + log_return, variance
+
+
+def _heston_step(source, log_spot, variance, dt, volatility, rate, params, dtype):
+    """
+    One Heston QE step (2 dimensions).
+
+    The variance step matches the exact conditional mean and variance
+    with a scaled noncentral chi-square (quadratic branch) or a point
+    mass at zero plus an exponential (exponential branch); both branches
+    invert the same uniform draw. log S uses Andersen's central
+    discretization of the integrated variance.
+    """
+    if dt <= 0:
+        return log_spot, variance
+
+    kappa = params["kappa"]
+    theta = params["long_run_variance"]
+    xi = params["vol_of_vol"]
+    rho = params["rho"]
+
+    decay = np.exp(-kappa * dt)
+    k0 = -rho * kappa * theta * dt / xi
+    k1 = 0.5 * dt * (kappa * rho / xi - 0.5) - rho / xi
+    k2 = 0.5 * dt * (kappa * rho / xi - 0.5) + rho / xi
+    k3 = 0.5 * dt * (1 - rho ** 2)
+
+    mean = theta + (variance - theta) * decay
+    var = (variance * xi ** 2 * decay / kappa * (1 - decay)
+           + theta * xi ** 2 / (2 * kappa) * (1 - decay) ** 2)
+    psi = var / (mean * mean)
+
+    u_variance = source.uniform()
+    z = source.normal()
+    next_variance = np.empty_like(variance)
+
+    quadratic = psi <= QE_PSI_CRITICAL
+    m, p = mean[quadratic], psi[quadratic]
+    b2 = 2 / p - 1 + np.sqrt(2 / p) * np.sqrt(2 / p - 1)
+    a = m / (1 + b2)
+    z_variance = norm_ppf(np.clip(u_variance[quadratic], 1e-12, 1 - 1e-12), dtype)
+    next_variance[quadratic] = a * (np.sqrt(b2) + z_variance) ** 2
+
+    exponential = ~quadratic
+    m, p, u = mean[exponential], psi[exponential], u_variance[exponential]
+    zero_mass = (p - 1) / (p + 1)
+    beta = (1 - zero_mass) / m
+    next_variance[exponential] = np.where(
+        u <= zero_mass, 0.0, np.log((1 - zero_mass) / np.maximum(1 - u, 1e-12)) / beta
+    )
+
+    log_spot = log_spot + (rate * dt + k0 + k1 * variance + k2 * next_variance
+                           + np.sqrt(k3 * (variance + next_variance)) * z)
+    return log_spot, next_variance
+
+
+_STEPPERS = {
+    "gbm": _gbm_step,
+    "heston": _heston_step,
+    "merton": _merton_step,
+}
+
+
+def _initial_state(model: str, n: int, spot: float, volatility: float, params, dtype):
+    """(log spot, variance) at the valuation time; the variance is a scalar unless Heston."""
+    log_spot = np.full(n, np.log(spot), dtype=dtype)
+    if model == "heston":
+        return log_spot, np.full(n, params["initial_variance"], dtype=dtype)
+    return log_spot, volatility ** 2
+
+
+def _advance(model: str, source, log_spot, variance, dt: float, volatility, rate, params, dtype):
+    """
+    Move the state forward by dt years.
+
+    GBM and Merton steps are exact for any length; Heston is stepped at
+    HESTON_STEPS_PER_YEAR (or finer).
+    """
+    step = _STEPPERS[model]
+    substeps = max(1, int(np.ceil(dt * HESTON_STEPS_PER_YEAR))) if model == "heston" else 1
+    for _ in range(substeps):
+        log_spot, variance = step(source, log_spot, variance, dt / substeps, volatility, rate, params, dtype)
+    return log_spot, variance
+
+
+def _model_params(model: str, volatility: float, params: Optional[Dict[str, float]]) -> Dict[str, float]:
+    """Model parameters with defaults filled in."""
+    if model not in SIMULATION_MODELS:
+        raise ValueError(f"Unknown model: {model} (use {', '.join(SIMULATION_MODELS)})")
+    params = {k: v for k, v in (params or {}).items() if v is not None}
+
+    if model == "heston":
+        merged = {
+            **DEFAULT_HESTON,
+            "initial_variance": volatility ** 2,
+            "long_run_variance": volatility ** 2,
+            **params,
+        }
+        if merged["kappa"] <= 0 or merged["vol_of_vol"] <= 0:
+            raise ValueError("Heston kappa and vol_of_vol must be positive")
+        if not -1 <= merged["rho"] <= 1:
+            raise ValueError("Heston rho must be between -1 and 1")
+        return merged
+    if model == "merton":
+        merged = {**DEFAULT_MERTON, **params}
+        if merged["jump_intensity"] < 0 or merged["jump_volatility"] < 0:
+            raise ValueError("Merton jump_intensity and jump_volatility cannot be negative")
+        return merged
+    return {}
+
+
+def _stack_strategies(strategies: List[Dict[str, Any]], underlying_price: float) -> LegMatrix:
+    return stack_legs([
+        strategy_to_legs(
+            s["strategy_type"],
+            s.get("parameters"),
+            s.get("custom_legs"),
+            s["expiry_date"],
+            underlying_price,
+        )
+        for s in strategies
+    ])
+
+
+def _horizon_years(valuation_time: np.datetime64, horizon_time: np.datetime64) -> float:
+    horizon = float((horizon_time - valuation_time) / np.timedelta64(1, "s")) / SECONDS_PER_YEAR
+    if horizon <= 0:
+        raise ValueError("The horizon must be after the valuation date")
+    return horizon
+
+
+def _path_steps(horizon: float) -> int:
+    """Daily steps covering a horizon in years; whole days are not rounded up a step."""
+    return int(np.ceil(round(horizon * 365, 9)))
+
+
+def _pnl_distribution(total: np.ndarray) -> Dict[str, Any]:
+    """Tail risk and percentiles of per-path P&L."""
+    var_95 = float(np.percentile(total, 5))
+    return {
+        "pnl_std": round(float(total.std()), 2),
+        "value_at_risk_95": round(-var_95, 2),
+        "expected_shortfall_95": round(-float(total[total <= var_95].mean()), 2),
+        "min_pnl": round(float(total.min()), 2),
+        "max_pnl": round(float(total.max()), 2),
+        "pnl_percentiles": {
+            str(q): round(float(v), 2)
+            for q, v in zip(PNL_PERCENTILES, np.percentile(total, PNL_PERCENTILES))
+        },
+    }
+
+
+def _path_layout(num_paths: int, sampling: str, antithetic: bool, chunk: int) -> Tuple[int, int, int]:
+    """
+    (replicates, paths per replicate, paths per chunk) of a run.
+
+    Antithetic runs use an even number of paths per replicate and chunk;
+    Sobol chunks are powers of two so that every block is aligned.
+    """
+    if sampling not in SAMPLING_METHODS:
+        raise ValueError(f"Unknown sampling method: {sampling} (use {', '.join(SAMPLING_METHODS)})")
+
+    replicates = SOBOL_REPLICATES if sampling == "sobol" else 1
+    per_replicate = -(-num_paths // replicates)
+    if antithetic:
+        per_replicate += per_replicate % 2
+        chunk = max(2, chunk - chunk % 2)
+    if sampling == "sobol":
+        chunk = 1 << max(1, chunk.bit_length() - 1)
+    return replicates, per_replicate, chunk
+
+
+def _draw_source(rng, scramble, start: int, n: int, antithetic: bool, dtype):
+    """Draw source for paths start..start+n-1 of a replicate."""
+    if antithetic:
+        start, n = start // 2, n // 2
+    if scramble is not None:
+        source = SobolSource(scramble, start, n, dtype)
+    else:
+        source = PseudoSource(rng, n, dtype)
+    return AntitheticSource(source) if antithetic else source
+
+
+def _estimate(
+    values: np.ndarray,
+    control: Optional[np.ndarray],
+    antithetic: bool,
+    replicates: int
+) -> Tuple[float, float]:
+    """
+    Mean of per-path values and its standard error.
+
+    control: deviations of the control variate from its known mean;
+    the values are adjusted by the regression coefficient on it. The
+    standard error comes from replicate means (Sobol), pair means
+    (antithetic) or single paths.
+    """
+    if control is not None:
+        centered = control - control.mean()
+        variance = float(centered @ centered)
+        if variance > 0:
+            values = values - float(values @ centered) / variance * control
+
+    if replicates > 1:
+        means = values.reshape(replicates, -1).mean(axis=1)
+        return float(means.mean()), float(means.std(ddof=1) / np.sqrt(replicates))
+    if antithetic:
+        values = values.reshape(-1, 2).mean(axis=1)
+    return float(values.mean()), float(values.std(ddof=1) / np.sqrt(len(values)))
+
+
+class SimulationService:
+    """Service for Monte Carlo P&L distributions."""
+
+    @staticmethod
+    def iter_pnl_chunks(
+        legs: LegMatrix,
+        model: str,
+        underlying_price: float,
+        volatility: float,
+        valuation_time: np.datetime64,
+        horizon_time: np.datetime64,
+        num_paths: int,
+        rate: float = 0.0,
+        params: Optional[Dict[str, float]] = None,
+        seed: Optional[int] = None,
+        sampling: str = "pseudo",
+        antithetic: bool = False,
+        dtype=np.float64
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Simulated P&L of stacked strategies at a horizon, chunk by chunk.
+
+        Legs expiring by the horizon settle at intrinsic value; longer-dated
+        legs are priced with Black-Scholes at the simulated price (and, under
+        Heston, the simulated volatility).
+
+        Args:
+            legs: Stacked LegMatrix of shape (strategies, legs)
+            model: gbm, heston or merton
+            underlying_price: Current underlying price
+            volatility: Current volatility
+            valuation_time: Current time (datetime64)
+            horizon_time: Time the P&L is measured at (datetime64)
+            num_paths: Number of simulated paths
+            rate: Risk-free rate
+            params: Model parameters (defaults per model)
+            seed: Random seed for reproducible runs
+            sampling: pseudo or sobol
+            antithetic: Pair every path with its antithetic path
+            dtype: Floating-point type of the simulation and pricing
+
+        Yields:
+            (terminal prices (paths,), P&L (paths, strategies)) per chunk.
+            Sobol runs yield SOBOL_REPLICATES equal replicates in turn, and
+            path counts are rounded up to fill replicates and pairs.
+        """
+        params = _model_params(model, volatility, params)
+        horizon = _horizon_years(valuation_time, horizon_time)
+
+        rng = np.random.default_rng(seed)
+        num_strategies, num_legs = legs.quantity.shape
+        chunk = max(1, min(CHUNK_PATHS, CHUNK_ELEMENTS // (num_strategies * num_legs)))
+        replicates, per_replicate, chunk = _path_layout(num_paths, sampling, antithetic, chunk)
+        time_to_expiry = legs.time_to_expiry(horizon_time, dtype)
+
+        for _ in range(replicates):
+            scramble = SobolScramble(rng) if sampling == "sobol" else None
+            for lo in range(0, per_replicate, chunk):
+                n = min(chunk, per_replicate - lo)
+                source = _draw_source(rng, scramble, lo, n, antithetic, dtype)
+                log_spot, variance = _initial_state(model, n, underlying_price, volatility, params, dtype)
+                log_spot, variance = _advance(
+                    model, source, log_spot, variance, horizon, volatility, rate, params, dtype
+                )
+                prices = np.exp(log_spot)
+                vols = np.sqrt(np.asarray(variance, dtype=dtype))
+                yield prices, legs.pnl(prices[:, None, None], time_to_expiry, vols[..., None, None], rate, dtype)
+
+    @staticmethod
+    def run(
+        strategies: List[Dict[str, Any]],
+        underlying_price: float,
+        model: str = "gbm",
+        num_paths: int = 100_000,
+        volatility: Optional[float] = None,
+        valuation_date: Optional[str] = None,
+        horizon_date: Optional[str] = None,
+        rate: Optional[float] = None,
+        params: Optional[Dict[str, float]] = None,
+        seed: Optional[int] = None,
+        sampling: str = "pseudo",
+        antithetic: bool = False,
+        control_variate: bool = False,
+        include_breakdown: bool = False,
+        precision: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Monte Carlo P&L distribution of a strategy or portfolio.
+
+        Args:
+            strategies: Dicts with strategy_type, expiry_date, parameters,
+                custom_legs and optionally id/name
+            underlying_price: Current underlying price
+            model: gbm, heston or merton
+            num_paths: Number of simulated paths
+            volatility: Current volatility (default: settings.default_volatility)
+            valuation_date: Valuation date (default: today)
+            horizon_date: Date the P&L is measured at (default: earliest expiry)
+            rate: Risk-free rate (default: settings.risk_free_rate)
+            params: Model parameters (defaults per model)
+            seed: Random seed for reproducible runs
+            sampling: pseudo or sobol (scrambled, randomized QMC)
+            antithetic: Pair every path with its antithetic path
+            control_variate: Adjust the expected P&L and POP with the
+                terminal price, whose mean is known
+            include_breakdown: Also return per-strategy statistics
+            precision: float64 or float32 (default: settings.numeric_precision)
+
+        Returns:
+            Dict with P&L statistics, their standard errors, percentiles
+            and a terminal-price summary
+        """
+        started = time.perf_counter()
+        volatility = settings.default_volatility if volatility is None else volatility
+        rate = settings.risk_free_rate if rate is None else rate
+        valuation_time = to_datetime64(valuation_date or date.today().isoformat())
+        dtype = resolve_precision(precision)
+
+        legs = _stack_strategies(strategies, underlying_price)
+        horizon_time = to_datetime64(horizon_date) if horizon_date else legs.expiry.min()
+
+        replicates, per_replicate, _ = _path_layout(num_paths, sampling, antithetic, CHUNK_PATHS)
+        num_paths = replicates * per_replicate
+        horizon = _horizon_years(valuation_time, horizon_time)
+        forward = underlying_price * np.exp(rate * horizon)
+
+        # Only the portfolio P&L and terminal price of each path are kept;
+        # per-strategy results are reduced chunk by chunk (with the sums
+        # the control-variate adjustment needs)
+        terminal = np.empty(num_paths)
+        total = np.empty(num_paths)
+        strategy_sums = np.zeros((4, len(strategies)))   # pnl, pnl*dx, wins, wins*dx
+
+        lo = 0
+        for prices, pnl in SimulationService.iter_pnl_chunks(
+            legs, model, underlying_price, volatility, valuation_time, horizon_time,
+            num_paths, rate, params, seed, sampling, antithetic, dtype
+        ):
+            hi = lo + len(prices)
+            terminal[lo:hi] = prices
+            total[lo:hi] = pnl.sum(axis=1, dtype=np.float64)
+            dx = prices.astype(np.float64) - forward
+            wins = pnl > 0
+            strategy_sums += [
+                pnl.sum(axis=0, dtype=np.float64), dx @ pnl.astype(np.float64),
+                wins.sum(axis=0), dx @ wins,
+            ]
+            lo = hi
+
+        control = terminal - forward if control_variate else None
+        expected_pnl, pnl_error = _estimate(total, control, antithetic, replicates)
+        pop, pop_error = _estimate((total > 0).astype(float), control, antithetic, replicates)
+
+        strategy_means = strategy_sums / num_paths
+        if control_variate:
+            dx_mean = control.mean()
+            dx_var = control.var()
+            for value, cross in ((0, 1), (2, 3)):
+                beta = (strategy_means[cross] - strategy_means[value] * dx_mean) / dx_var if dx_var > 0 else 0.0
+                strategy_means[value] -= beta * dx_mean
+
+        result = {
+            "model": model,
+            "parameters": _model_params(model, volatility, params),
+            "paths": num_paths,
+            "sampling": {
+                "method": sampling,
+                "antithetic": antithetic,
+                "control_variate": control_variate,
+                "replicates": replicates,
+            },
+            "horizon": str(horizon_time),
+            "expected_pnl": round(expected_pnl, 2),
+            "probability_of_profit": round(pop, 4),
+            "standard_error": {
+                "expected_pnl": round(pnl_error, 4),
+                "probability_of_profit": round(pop_error, 6),
+            },
+            **_pnl_distribution(total),
+            "terminal_price": {
+                "mean": round(float(terminal.mean()), 2),
+                "std": round(float(terminal.std()), 2),
+                "percentiles": {
+                    str(q): round(float(v), 2)
+                    for q, v in zip(PNL_PERCENTILES, np.percentile(terminal, PNL_PERCENTILES))
+                },
+            },
+            "precision": dtype.name,
+        }
+
+        if include_breakdown:
+            result["strategies"] = [
+                {
+                    "id": s.get("id"),
+                    "name": s.get("name"),
+                    "expected_pnl": round(float(strategy_means[0, n]), 2),
+                    "probability_of_profit": round(float(strategy_means[2, n]), 4),
+                }
+                for n, s in enumerate(strategies)
+            ]
+
+        result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        return result
+
+    @staticmethod
+    def iter_exit_chunks(
+        legs: LegMatrix,
+        model: str,
+        underlying_price: float,
+        volatility: float,
+        valuation_time: np.datetime64,
+        horizon_time: np.datetime64,
+        num_paths: int,
+        rate: float = 0.0,
+        params: Optional[Dict[str, float]] = None,
+        seed: Optional[int] = None,
+        sampling: str = "pseudo",
+        antithetic: bool = False,
+        stop_loss: Optional[float] = None,
+        profit_target: Optional[float] = None,
+        max_days_held: Optional[int] = None,
+        exit_on_strike_breach: bool = False,
+        dtype=np.float64
+    ) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        Daily paths with exit rules applied per strategy, chunk by chunk.
+
+        Every path is marked to model at the end of each day. Each rule is
+        a (days, paths, strategies) mask; a strategy exits on the first day
+        any rule fires, and at the horizon otherwise.
+
+        Args:
+            legs: Stacked LegMatrix of shape (strategies, legs)
+            model, underlying_price, volatility, valuation_time, horizon_time,
+            num_paths, rate, params, seed, sampling, antithetic, dtype:
+                As in iter_pnl_chunks
+            stop_loss: Exit once the P&L falls to -stop_loss
+            profit_target: Exit once the P&L reaches profit_target
+            max_days_held: Exit after this many days
+            exit_on_strike_breach: Exit once the underlying crosses the
+                strike of a live short option
+
+        Yields:
+            Dict per chunk with exit_step (index into the daily steps),
+            exit_pnl, reason (index into EXIT_REASONS) and hold_pnl (P&L
+            at the horizon), each of shape (paths, strategies)
+        """
+        params = _model_params(model, volatility, params)
+        horizon = _horizon_years(valuation_time, horizon_time)
+        num_steps = _path_steps(horizon)
+        if num_steps > MAX_PATH_STEPS:
+            raise ValueError(f"Path simulations cover at most {MAX_PATH_STEPS} days")
+
+        # End of each day, the last one cut at the horizon
+        step_years = np.minimum(np.arange(1, num_steps + 1) / 365, horizon)
+        step_times = valuation_time + (step_years * SECONDS_PER_YEAR).astype("timedelta64[s]")
+        step_times[-1] = horizon_time
+        step_dt = np.diff(step_years, prepend=0.0)
+        time_to_expiry = legs.time_to_expiry(step_times[:, None, None], dtype)   # (days, strategies, legs)
+        days_held = np.arange(1, num_steps + 1)
+
+        short_call = (legs.kind == CE) & (legs.quantity < 0)
+        short_put = (legs.kind == PE) & (legs.quantity < 0)
+        live = time_to_expiry[:, None] > 0
+
+        rng = np.random.default_rng(seed)
+        num_strategies, num_legs = legs.quantity.shape
+        chunk = max(1, min(CHUNK_PATHS, CHUNK_ELEMENTS // (num_steps * num_strategies * num_legs)))
+        replicates, per_replicate, chunk = _path_layout(num_paths, sampling, antithetic, chunk)
+
+        for _ in range(replicates):
+            scramble = SobolScramble(rng) if sampling == "sobol" else None
+            for lo in range(0, per_replicate, chunk):
+                n = min(chunk, per_replicate - lo)
+                source = _draw_source(rng, scramble, lo, n, antithetic, dtype)
+                log_spot, variance = _initial_state(model, n, underlying_price, volatility, params, dtype)
+
+                spot = np.empty((num_steps, n), dtype=dtype)
+                vols = np.empty((num_steps, n), dtype=dtype) if model == "heston" else np.asarray(volatility, dtype)
+                for day in range(num_steps):
+                    log_spot, variance = _advance(
+                        model, source, log_spot, variance, step_dt[day], volatility, rate, params, dtype
+                    )
+                    spot[day] = np.exp(log_spot)
+                    if model == "heston":
+                        vols[day] = np.sqrt(variance)
+
+                spot_legs = spot[:, :, None, None]
+                pnl = legs.pnl(spot_legs, time_to_expiry[:, None], vols[..., None, None], rate, dtype)
+
+                # Rule masks in priority order; the last day always exits
+                shape = pnl.shape
+                no_exit = np.zeros(shape, dtype=bool)
+                flags = [
+                    pnl <= -stop_loss if stop_loss is not None else no_exit,
+                    pnl >= profit_target if profit_target is not None else no_exit,
+                    np.broadcast_to((days_held >= max_days_held)[:, None, None], shape)
+                    if max_days_held is not None else no_exit,
+                    (live & ((short_call & (spot_legs > legs.strike)) | (short_put & (spot_legs < legs.strike)))).any(axis=-1)
+                    if exit_on_strike_breach else no_exit,
+                    np.broadcast_to((days_held == num_steps)[:, None, None], shape),
+                ]
+                triggered = np.logical_or.reduce(flags)
+                exit_step = triggered.argmax(axis=0)
+                fired = np.stack([
+                    np.take_along_axis(flag, exit_step[None], axis=0)[0] for flag in flags
+                ])
+
+                yield {
+                    "exit_step": exit_step,
+                    "exit_pnl": np.take_along_axis(pnl, exit_step[None], axis=0)[0],
+                    "reason": fired.argmax(axis=0),
+                    "hold_pnl": pnl[-1],
+                }
+
+    @staticmethod
+    def run_exits(
+        strategies: List[Dict[str, Any]],
+        underlying_price: float,
+        model: str = "gbm",
+        num_paths: int = 20_000,
+        volatility: Optional[float] = None,
+        valuation_date: Optional[str] = None,
+        horizon_date: Optional[str] = None,
+        rate: Optional[float] = None,
+        params: Optional[Dict[str, float]] = None,
+        seed: Optional[int] = None,
+        sampling: str = "pseudo",
+        antithetic: bool = False,
+        stop_loss: Optional[float] = None,
+        profit_target: Optional[float] = None,
+        max_days_held: Optional[int] = None,
+        exit_on_strike_breach: bool = False,
+        include_breakdown: bool = False,
+        precision: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Monte Carlo P&L of a strategy or portfolio managed with exit rules.
+
+        Each strategy is closed on its own when a rule fires; the realized
+        P&L is compared with holding to the horizon.
+
+        Args:
+            strategies, underlying_price, model, num_paths, volatility,
+            valuation_date, horizon_date, rate, params, seed, sampling,
+            antithetic, include_breakdown, precision: As in run()
+            stop_loss: Per-strategy loss that closes the position
+            profit_target: Per-strategy profit that closes the position
+            max_days_held: Days after which a position is closed
+            exit_on_strike_breach: Close when a short strike is breached
+
+        Returns:
+            Dict with realized P&L statistics, the hold-to-horizon
+            comparison, exit reasons and the exit-day distribution
+        """
+        started = time.perf_counter()
+        volatility = settings.default_volatility if volatility is None else volatility
+        rate = settings.risk_free_rate if rate is None else rate
+        valuation_time = to_datetime64(valuation_date or date.today().isoformat())
+        dtype = resolve_precision(precision)
+
+        legs = _stack_strategies(strategies, underlying_price)
+        horizon_time = to_datetime64(horizon_date) if horizon_date else legs.expiry.min()
+
+        replicates, per_replicate, _ = _path_layout(num_paths, sampling, antithetic, CHUNK_PATHS)
+        num_paths = replicates * per_replicate
+        num_steps = _path_steps(_horizon_years(valuation_time, horizon_time))
+        num_strategies = len(strategies)
+
+        # Per-path portfolio totals; per-strategy results reduce to sums
+        # and exit counts by reason and by day
+        total = np.empty(num_paths)
+        hold_total = np.empty(num_paths)
+        strategy_sums = np.zeros((3, num_strategies))   # realized, hold, wins
+        reason_counts = np.zeros((num_strategies, len(EXIT_REASONS)), dtype=np.int64)
+        day_counts = np.zeros((num_strategies, num_steps), dtype=np.int64)
+        offsets = np.arange(num_strategies)
+
+        lo = 0
+        for chunk in SimulationService.iter_exit_chunks(
+            legs, model, underlying_price, volatility, valuation_time, horizon_time,
+            num_paths, rate, params, seed, sampling, antithetic,
+            stop_loss, profit_target, max_days_held, exit_on_strike_breach, dtype
+        ):
+            exit_pnl = chunk["exit_pnl"]
+            hi = lo + len(exit_pnl)
+            total[lo:hi] = exit_pnl.sum(axis=1, dtype=np.float64)
+            hold_total[lo:hi] = chunk["hold_pnl"].sum(axis=1, dtype=np.float64)
+            strategy_sums += [
+                exit_pnl.sum(axis=0, dtype=np.float64),
+                chunk["hold_pnl"].sum(axis=0, dtype=np.float64),
+                (exit_pnl > 0).sum(axis=0),
+            ]
+            reason_counts += np.bincount(
+                (offsets * len(EXIT_REASONS) + chunk["reason"]).ravel(),
+                minlength=reason_counts.size,
+            ).reshape(reason_counts.shape)
+            day_counts += np.bincount(
+                (offsets * num_steps + chunk["exit_step"]).ravel(), minlength=day_counts.size
+            ).reshape(day_counts.shape)
+            lo = hi
+
+        expected_pnl, pnl_error = _estimate(total, None, antithetic, replicates)
+        pop, pop_error = _estimate((total > 0).astype(float), None, antithetic, replicates)
+        hold_pnl, hold_error = _estimate(hold_total, None, antithetic, replicates)
+
+        days = np.arange(1, num_steps + 1)
+
+        def exit_days(counts: np.ndarray) -> Dict[str, Any]:
+            cumulative = np.cumsum(counts) / counts.sum()
+            return {
+                "mean": round(float(counts @ days / counts.sum()), 2),
+                "percentiles": {
+                    str(q): int(days[np.searchsorted(cumulative, q / 100 - 1e-12)])
+                    for q in PNL_PERCENTILES
+                },
+            }
+
+        def reasons(counts: np.ndarray) -> Dict[str, float]:
+            return {name: round(float(c / counts.sum()), 4) for name, c in zip(EXIT_REASONS, counts)}
+
+        all_days = day_counts.sum(axis=0)
+        result = {
+            "model": model,
+            "parameters": _model_params(model, volatility, params),
+            "paths": num_paths,
+            "steps": num_steps,
+            "sampling": {
+                "method": sampling,
+                "antithetic": antithetic,
+                "replicates": replicates,
+            },
+            "horizon": str(horizon_time),
+            "rules": {
+                "stop_loss": stop_loss,
+                "profit_target": profit_target,
+                "max_days_held": max_days_held,
+                "exit_on_strike_breach": exit_on_strike_breach,
+            },
+            "expected_pnl": round(expected_pnl, 2),
+            "probability_of_profit": round(pop, 4),
+            "standard_error": {
+                "expected_pnl": round(pnl_error, 4),
+                "probability_of_profit": round(pop_error, 6),
+            },
+            **_pnl_distribution(total),
+            "hold_to_horizon": {
+                "expected_pnl": round(hold_pnl, 2),
+                "standard_error": round(hold_error, 4),
+                "probability_of_profit": round(float((hold_total > 0).mean()), 4),
+            },
+            "exit_reasons": reasons(reason_counts.sum(axis=0)),
+            "exit_days": {
+                **exit_days(all_days),
+                "histogram": [round(float(c), 6) for c in all_days / all_days.sum()],
+            },
+            "precision": dtype.name,
+        }
+
+        if include_breakdown:
+            strategy_means = strategy_sums / num_paths
+            result["strategies"] = [
+                {
+                    "id": s.get("id"),
+                    "name": s.get("name"),
+                    "expected_pnl": round(float(strategy_means[0, n]), 2),
+                    "hold_to_horizon_pnl": round(float(strategy_means[1, n]), 2),
+                    "probability_of_profit": round(float(strategy_means[2, n]), 4),
+                    "exit_reasons": reasons(reason_counts[n]),
+                    "exit_days": exit_days(day_counts[n]),
+                }
+                for n, s in enumerate(strategies)
+            ]
+
+        result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        return result
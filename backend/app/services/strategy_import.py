@@ -0,0 +1,259 @@
+"""
+Strategy import - Bulk load strategies from NDJSON or CSV.
+
+The request body is parsed line by line as it arrives, every row is
+validated with the StrategyCreate schema, and valid rows are written in
+large batches, each batch one statement and one commit:
+- PostgreSQL (asyncpg): COPY ... FROM STDIN through copy_records_to_table,
+  with IDs reserved from the sequence first
+- other backends (SQLite): one executemany INSERT ... RETURNING the
+  columns the legs are derived from
+
+The strategy_legs rows of each batch are written with it (COPY or one
+executemany INSERT), in the same transaction.
+
+Invalid rows are skipped and reported with their line number, so one bad
+spreadsheet row does not reject the whole file. Batches already written
+stay committed if a later batch fails.
+
+CSV files need a header row with the StrategyCreate field names (other
+columns, e.g. id or created_at from an export, are ignored). parameters
+and custom_legs cells hold JSON text, and blank cells count as missing.
+"""
+import csv
+import json
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.strategy import Strategy
+from ..models.strategy_leg import StrategyLeg
+from ..schemas.strategy import StrategyCreate
+from .strategy_legs import LEG_COLUMNS, LEG_SOURCE_COLUMNS, LEG_SOURCE_FIELDS, leg_records, leg_writes
+from .streaming import STREAM_FORMATS
+
+# Valid rows written per statement/commit
+IMPORT_BATCH_SIZE = 1000
+
+# Row errors listed in the report (all of them are counted)
+MAX_REPORTED_ERRORS = 1000
+
+# Columns written by an import, in COPY order
+IMPORT_COLUMNS = ("name", "strategy_type", "entry_date", "expiry_date", "parameters", "custom_legs", "notes")
+
+# CSV cells that hold JSON text
+_JSON_COLUMNS = ("parameters", "custom_legs")
+
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Decoded lines of a byte stream (without line endings or a UTF-8 BOM)."""
+    pending = b""
+    first = True
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            text = line.decode("utf-8").rstrip("\r")
+            if first:
+                text, first = text.lstrip("\ufeff"), False
+            yield text
+    if pending:
+        text = pending.decode("utf-8").rstrip("\r")
+        yield text.lstrip("\ufeff") if first else text
+
+
+async def _iter_records(lines: AsyncIterator[str], fmt: str) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    (line number, raw record) pairs; a record is a dict, or the exception
+    raised while parsing its line.
+    """
+    number = 0
+    if fmt == "ndjson":
+        async for line in lines:
+            number += 1
+            if not line.strip():
+                continue
+            try:
+                yield number, json.loads(line)
+            except json.JSONDecodeError as e:
+                yield number, ValueError(f"Invalid JSON: {e.msg}")
+        return
+
+    header: Optional[List[str]] = None
+    pending: List[str] = []
+    start = 0
+    async for line in lines:
+        number += 1
+        if not pending:
+            start = number
+            if not line.strip():
+                continue
+        pending.append(line)
+        # A quoted cell may span lines: the record ends once its quotes balance
+        text = "\n".join(pending)
+        if text.count('"') % 2:
+            continue
+        pending = []
+
+        cells = next(csv.reader([text]))
+        if header is None:
+            header = [cell.strip() for cell in cells]
+            continue
+        if len(cells) != len(header):
+            yield start, ValueError(f"Expected {len(header)} cells, found {len(cells)}")
+            continue
+        yield start, _csv_record(dict(zip(header, cells)))
+
+    if pending:
+        yield start, ValueError("Unterminated quoted cell")
+
+
+def _csv_record(cells: Dict[str, str]) -> Any:
+    """Record of a CSV row: blank cells dropped, JSON cells decoded."""
+    record: Dict[str, Any] = {}
+    for key, value in cells.items():
+        if value == "":
+            continue
+        if key in _JSON_COLUMNS:
+            try:
+                value = json.loads(value)
+            except json.JSONDecodeError as e:
+                return ValueError(f"Invalid JSON in {key}: {e.msg}")
+        record[key] = value
+    return record
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in e['loc']) or 'row'}: {e['msg']}" for e in error.errors()
+    )
+
+
+def _validate(record: Any) -> Dict[str, Any]:
+    """
+    Insert values of one record.
+
+    Raises:
+        ValueError: If the record cannot be parsed or fails validation
+    """
+    if isinstance(record, Exception):
+        raise record
+    if not isinstance(record, dict):
+        raise ValueError("Each row must be a JSON object")
+    try:
+        strategy = StrategyCreate.model_validate(record)
+    except ValidationError as e:
+        raise ValueError(_validation_message(e))
+    values = strategy.model_dump(include=set(IMPORT_COLUMNS))
+    values["custom_legs"] = values["custom_legs"] or []
+    return values
+
+
+def _leg_sources(ids: List[int], rows: List[Dict[str, Any]]) -> List[tuple]:
+    return [(i, *(row[name] for name in LEG_SOURCE_FIELDS)) for i, row in zip(ids, rows)]
+
+
+async def _write_batch(db: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+    """Insert validated rows and their legs with COPY (asyncpg) or executemany INSERTs, then commit."""
+    connection = await db.connection()
+    if connection.dialect.driver == "asyncpg":
+        # COPY returns nothing: take the IDs from the sequence up front
+        ids = (await db.scalars(
+            text("SELECT nextval(pg_get_serial_sequence('strategies', 'id')) FROM generate_series(1, :n)"),
+            {"n": len(rows)},
+        )).all()
+        raw = (await connection.get_raw_connection()).driver_connection
+        await raw.copy_records_to_table(
+            Strategy.__tablename__,
+            records=[
+                (i, *(
+                    json.dumps(row[c]) if c in _JSON_COLUMNS else row[c]
+                    for c in IMPORT_COLUMNS
+                ))
+                for i, row in zip(ids, rows)
+            ],
+            columns=["id", *IMPORT_COLUMNS],
+        )
+        legs = [leg for source in _leg_sources(ids, rows) for leg in leg_records(source)]
+        if legs:
+            await raw.copy_records_to_table(
+                StrategyLeg.__tablename__,
+                records=[tuple(leg[c] for c in LEG_COLUMNS) for leg in legs],
+                columns=list(LEG_COLUMNS),
+            )
+    else:
+        # Each returned row carries its own leg sources, so the RETURNING order
+        # does not matter (sort_by_parameter_order makes SQLite insert row by row)
+        sources = (await db.execute(insert(Strategy).returning(*LEG_SOURCE_COLUMNS), rows)).all()
+        for statement, legs in leg_writes(sources, replace=False):
+            await db.execute(statement, legs)
+    await db.commit()
+
+
+class StrategyImportService:
+    """Service for bulk strategy imports."""
+
+    @staticmethod
+    async def import_stream(
+        db: AsyncSession,
+        chunks: AsyncIterator[bytes],
+        fmt: str = "ndjson",
+        batch_size: int = IMPORT_BATCH_SIZE
+    ) -> Dict[str, Any]:
+        """
+        Validate and insert strategies from an NDJSON or CSV byte stream.
+
+        Args:
+            db: Async database session
+            chunks: Body bytes, in any chunking
+            fmt: ndjson (one StrategyCreate object per line) or csv
+            batch_size: Valid rows written per statement/commit
+
+        Returns:
+            Dict with row counts, per-row errors ({line, error}, up to
+            MAX_REPORTED_ERRORS) and the elapsed time
+
+        Raises:
+            ValueError: If the format is unknown or the body is not UTF-8
+        """
+        if fmt not in STREAM_FORMATS:
+            raise ValueError(f"Unknown format: {fmt} (use {', '.join(STREAM_FORMATS)})")
+
+        started = time.perf_counter()
+        rows: List[Dict[str, Any]] = []
+        errors: List[Dict[str, Any]] = []
+        received = inserted = failed = 0
+
+        try:
+            async for line, record in _iter_records(_iter_lines(chunks), fmt):
+                received += 1
+                try:
+                    rows.append(_validate(record))
+                except ValueError as e:
+                    failed += 1
+                    if len(errors) < MAX_REPORTED_ERRORS:
+                        errors.append({"line": line, "error": str(e)})
+                    continue
+
+                if len(rows) >= batch_size:
+                    await _write_batch(db, rows)
+                    inserted += len(rows)
+                    rows = []
+        except UnicodeDecodeError:
+            raise ValueError(f"Body is not UTF-8 text (inserted {inserted} rows before the error)")
+
+        if rows:
+            await _write_batch(db, rows)
+            inserted += len(rows)
+
+        return {
+            "format": fmt,
+            "received": received,
+            "inserted": inserted,
+            "failed": failed,
+            "errors": errors,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
@@ -0,0 +1,241 @@
+"""
+Strategy legs - Indexed leg rows derived from saved strategies.
+
+Template parameters and custom legs live in JSON columns, which cannot
+answer "which strategies are short the 18500 CE?" without reading every
+row. Each leg is therefore also stored as a strategy_legs row (type,
+action, strike, quantity, entry price, expiry) with indexes for leg
+queries.
+
+Rows are derived with the mapping the payoff analytics use (services.legs)
+and rewritten in the same transaction as every strategy write that can
+change them: creates, updates that touch LEG_SOURCE_FIELDS, bulk imports
+and batch writes. Deleting a strategy removes its legs through the
+ON DELETE CASCADE foreign key. A template strike left to default to the
+spot price is stored as null, and strategies whose legs cannot be read
+(unknown leg type, invalid leg expiry) have no rows.
+
+On PostgreSQL a single strategy write can carry its legs in the same
+statement, as data-modifying CTEs (leg_write_ctes).
+"""
+import math
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import cast, column, delete, exists, insert, select, true, tuple_, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from ..models.strategy import Strategy
+from ..models.strategy_leg import StrategyLeg
+from ..schemas.strategy import StrategyLegQuery
+from .legs import CE, FUT, PE, strategy_leg_rows
+from .pagination import decode_cursor, encode_cursor
+
+# Strategy columns legs are derived from (an update of any of them rewrites the legs)
+LEG_SOURCE_FIELDS = ("strategy_type", "parameters", "custom_legs", "expiry_date")
+
+# Columns of a leg source row: the strategy id, then LEG_SOURCE_FIELDS
+LEG_SOURCE_COLUMNS = (Strategy.id, *(Strategy.__table__.columns[name] for name in LEG_SOURCE_FIELDS))
+
+# Strategies whose legs are rewritten per statement
+LEG_SYNC_BATCH = 1000
+
+# Columns written for each leg, in COPY order
+LEG_COLUMNS = tuple(StrategyLeg.__table__.columns.keys())
+
+_KIND_NAMES = {FUT: "FUT", CE: "CE", PE: "PE"}
+
+
+def _number(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
+def leg_source(strategy: Strategy) -> tuple:
+    """Leg source row of a Strategy instance."""
+    return (strategy.id, *(getattr(strategy, name) for name in LEG_SOURCE_FIELDS))
+
+
+def leg_records(source: Sequence[Any]) -> List[Dict[str, Any]]:
+    """
+    strategy_legs rows of one strategy.
+
+    Args:
+        source: (id, strategy_type, parameters, custom_legs, expiry_date)
+
+    Returns:
+        Leg row dicts (empty when the legs cannot be read); legs with no
+        quantity are skipped
+    """
+    strategy_id, strategy_type, parameters, custom_legs, expiry_date = source
+    try:
+        # A NaN spot leaves strikes that default to the spot price unset
+        rows = strategy_leg_rows(strategy_type, parameters, custom_legs, expiry_date, math.nan)
+    except (ValueError, TypeError, AttributeError):
+        return []
+
+    return [
+        {
+            "strategy_id": strategy_id,
+            "leg_index": index,
+            "leg_type": _KIND_NAMES[int(kind)],
+            "action": "BUY" if quantity > 0 else "SELL",
+            "quantity": abs(quantity),
+            "strike": None if kind == FUT else _number(strike),
+            "entry_price": _number(entry_price),
+            "expiry": expiry.astype("datetime64[D]").item(),
+        }
+        for index, (kind, quantity, strike, entry_price, expiry) in enumerate(rows)
+        if quantity
+    ]
+
+
+def leg_writes(
+    sources: Sequence[Sequence[Any]],
+    replace: bool = True
+) -> Iterator[Tuple[Any, Optional[List[Dict[str, Any]]]]]:
+    """
+    (statement, parameter rows) pairs that write the legs of strategies,
+    LEG_SYNC_BATCH strategies at a time.
+
+    Args:
+        sources: Leg source rows (see LEG_SOURCE_COLUMNS)
+        replace: Delete existing legs first (False for new strategies)
+    """
+    for lo in range(0, len(sources), LEG_SYNC_BATCH):
+        batch = sources[lo:lo + LEG_SYNC_BATCH]
+        if replace:
+            yield (
+                delete(StrategyLeg)
+                .where(StrategyLeg.strategy_id.in_([s[0] for s in batch]))
+                .execution_options(synchronize_session=False)
+            ), None
+        records = [record for source in batch for record in leg_records(source)]
+        if records:
+            yield insert(StrategyLeg.__table__), records
+
+
+def leg_write_ctes(strategies, records: List[Dict[str, Any]], replace: bool = True) -> List[Any]:
+    """
+    Data-modifying CTEs that write the legs of a strategy in the same
+    statement as the strategy itself (PostgreSQL).
+
+    Args:
+        strategies: CTE with an id column holding the strategy (an INSERT
+            or UPDATE ... RETURNING); no row writes no legs
+        records: Leg rows (see leg_records); their strategy_id is taken
+            from `strategies`
+        replace: Delete legs missing from records and overwrite the others
+            (False for new strategies)
+
+    Returns:
+        CTEs to attach to the statement that selects from `strategies`
+    """
+    legs = StrategyLeg.__table__
+    ctes = []
+    if replace:
+        # Old legs not in records; the upsert below touches the others, so
+        # the two sub-statements never write the same row
+        ctes.append(
+            delete(legs)
+            .where(
+                legs.c.strategy_id.in_(select(strategies.c.id)),
+                legs.c.leg_index.not_in([record["leg_index"] for record in records]),
+            )
+            .cte("stale_legs")
+        )
+    if records:
+        names = LEG_COLUMNS[1:]
+        rows = values(*(column(name, legs.c[name].type) for name in names), name="leg").data(
+            [tuple(record[name] for name in names) for record in records]
+        )
+        # VALUES columns holding only nulls have no type of their own: cast each to its column's
+        source = select(strategies.c.id, *(cast(rows.c[name], legs.c[name].type) for name in names))
+        statement = pg_insert(legs).from_select(LEG_COLUMNS, source.select_from(strategies.join(rows, true())))
+        if replace:
+            statement = statement.on_conflict_do_update(
+                index_elements=[legs.c.strategy_id, legs.c.leg_index],
+                set_={name: statement.excluded[name] for name in names[1:]},
+            )
+        ctes.append(statement.cte("written_legs"))
+    return ctes
+
+
+def leg_source_statements(ids: Sequence[int]) -> Iterator[Any]:
+    """SELECTs of the leg source rows of strategies, LEG_SYNC_BATCH IDs each."""
+    for lo in range(0, len(ids), LEG_SYNC_BATCH):
+        yield select(*LEG_SOURCE_COLUMNS).where(Strategy.id.in_(ids[lo:lo + LEG_SYNC_BATCH]))
+
+
+def backfill_legs(connection, batch_size: int = LEG_SYNC_BATCH) -> int:
+    """
+    Write the legs of strategies that have none (rows saved before the
+    strategy_legs table existed).
+
+    Args:
+        connection: Synchronous Connection or Session (the caller commits)
+        batch_size: Strategies read per query
+
+    Returns:
+        Number of leg rows written
+    """
+    missing = (
+        select(*LEG_SOURCE_COLUMNS)
+        .where(~exists().where(StrategyLeg.strategy_id == Strategy.id))
+        .order_by(Strategy.id)
+        .limit(batch_size)
+    )
+    written = 0
+    last_id = None
+    while True:
+        query = missing if last_id is None else missing.where(Strategy.id > last_id)
+        sources = connection.execute(query).all()
+        if not sources:
+            return written
+        for statement, rows in leg_writes(sources, replace=False):
+            connection.execute(statement, rows)
+            written += len(rows)
+        last_id = sources[-1][0]
+
+
+def leg_page_statement(query: StrategyLegQuery, limit: int, cursor: Optional[str] = None):
+    """
+    SELECT of one page of matching legs with their strategy's name and
+    type, in (strategy_id, leg_index) order, with one extra row to tell
+    whether more follow.
+    """
+    legs = StrategyLeg.__table__.c
+    statement = (
+        select(
+            legs.strategy_id, Strategy.name, Strategy.strategy_type, legs.leg_index,
+            legs.leg_type, legs.action, legs.quantity, legs.strike, legs.entry_price, legs.expiry,
+        )
+        .join(Strategy, Strategy.id == legs.strategy_id)
+    )
+    if query.leg_type is not None:
+        statement = statement.where(legs.leg_type == query.leg_type)
+    if query.action is not None:
+        statement = statement.where(legs.action == query.action)
+    if query.strike_min is not None:
+        statement = statement.where(legs.strike >= query.strike_min)
+    if query.strike_max is not None:
+        statement = statement.where(legs.strike <= query.strike_max)
+    if query.expiry_from is not None:
+        statement = statement.where(legs.expiry >= query.expiry_from)
+    if query.expiry_to is not None:
+        statement = statement.where(legs.expiry <= query.expiry_to)
+    if query.strategy_types is not None:
+        statement = statement.where(Strategy.strategy_type.in_(query.strategy_types))
+    if cursor:
+        position = decode_cursor(cursor)
+        last = (position.get("strategy_id"), position.get("leg_index"))
+        if not all(isinstance(value, int) for value in last):
+            raise ValueError("Invalid cursor")
+        statement = statement.where(tuple_(legs.strategy_id, legs.leg_index) > tuple_(*last))
+    return statement.order_by(legs.strategy_id, legs.leg_index).limit(limit + 1)
+
+
+def leg_page(items: List[Dict[str, Any]], limit: int) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Legs of a page (look-ahead row trimmed) and the cursor of the next page."""
+    if len(items) <= limit:
+        return items, None
+    items = items[:limit]
+    return items, encode_cursor({"strategy_id": items[-1]["strategy_id"], "leg_index": items[-1]["leg_index"]})
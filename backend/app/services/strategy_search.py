@@ -0,0 +1,134 @@
+"""
+Strategy search - Ranked full-text search over strategy names and notes.
+
+Each backend searches its own full-text index:
+- PostgreSQL: the GIN expression index ix_strategies_search over
+  SEARCH_DOCUMENT (english tsvector, name weighted above notes), matched
+  with to_tsquery and ranked by ts_rank_cd
+- SQLite: the FTS5 table strategies_fts (kept in step by triggers),
+  matched with MATCH and ranked by bm25 with the name weighted above notes
+- other backends: a LIKE scan of name and notes, unranked
+
+A query is split into words; every word must match and the last one also
+matches as a prefix, so results follow the user while they type.
+
+Results are ordered by relevance, so pages cannot be keyed on the
+primary key: a search cursor holds the query and the offset of the next
+page in the ranked matches.
+"""
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, column, func, literal, literal_column, or_, select, table
+
+from ..models.strategy import SEARCH_DOCUMENT, SEARCH_TABLE, Strategy
+from .pagination import decode_cursor, encode_cursor
+
+# Words of a query used for matching (the rest are ignored)
+MAX_SEARCH_TERMS = 16
+
+# bm25 weights of the name and notes columns on SQLite
+_SQLITE_WEIGHTS = (10.0, 1.0)
+
+
+def search_terms(q: str) -> List[str]:
+    """
+    Lowercase words of a search query.
+
+    Raises:
+        ValueError: If the query has no words to search for
+    """
+    terms = re.findall(r"\w+", q.lower())[:MAX_SEARCH_TERMS]
+    if not terms:
+        raise ValueError("Search query has no words to search for")
+    return terms
+
+
+def _search_offset(cursor: Optional[str], terms: List[str]) -> int:
+    """Offset of the page a search cursor points to (0 without a cursor)."""
+    if not cursor:
+        return 0
+    position = decode_cursor(cursor)
+    offset = position.get("offset")
+    if position.get("q") != " ".join(terms) or not isinstance(offset, int) or offset < 0:
+        raise ValueError("Invalid cursor")
+    return offset
+
+
+def _postgresql_match(terms: List[str]):
+    document = literal_column(f"({SEARCH_DOCUMENT})")
+    query = func.to_tsquery(
+        literal_column("'english'::regconfig"),
+        " & ".join(terms[:-1] + [f"{terms[-1]}:*"])
+    )
+    return Strategy.__table__, document.op("@@")(query), func.ts_rank_cd(document, query)
+
+
+def _sqlite_match(terms: List[str]):
+    fts = table(SEARCH_TABLE, column("rowid"))
+    rank = func.bm25(literal_column(SEARCH_TABLE), *(literal(w) for w in _SQLITE_WEIGHTS))
+    match = " ".join(f'"{term}"' for term in terms) + "*"
+    source = Strategy.__table__.join(fts, fts.c.rowid == Strategy.id)
+    # bm25 is lower for better matches; the score is negated so higher is better
+    return source, literal_column(SEARCH_TABLE).op("MATCH")(match), -rank
+
+
+def _fallback_match(terms: List[str]):
+    clause = and_(*(
+        or_(func.lower(Strategy.name).contains(term), func.lower(Strategy.notes).contains(term))
+        for term in terms
+    ))
+    return Strategy.__table__, clause, literal(0.0)
+
+
+def search_statement(
+    dialect: str,
+    q: str,
+    fields: List[str],
+    limit: int,
+    cursor: Optional[str] = None
+) -> Tuple[Any, List[str], int]:
+    """
+    SELECT of one page of ranked matches, with one extra row to tell
+    whether more follow.
+
+    Args:
+        dialect: Database dialect name (postgresql, sqlite, ...)
+        q: Search query
+        fields: Columns to return
+        limit: Maximum number of matches in the page
+        cursor: Continuation token of the previous page (None: first page)
+
+    Returns:
+        (statement, search terms, offset of the page)
+    """
+    terms = search_terms(q)
+    offset = _search_offset(cursor, terms)
+    build = {"postgresql": _postgresql_match, "sqlite": _sqlite_match}.get(dialect, _fallback_match)
+    source, match, score = build(terms)
+
+    columns = Strategy.__table__.columns
+    score = score.label("score")
+    statement = (
+        select(*(columns[name] for name in fields), score)
+        .select_from(source)
+        .where(match)
+        .order_by(score.desc(), Strategy.id.asc())
+        .offset(offset)
+        .limit(limit + 1)
+    )
+    return statement, terms, offset
+
+
+def search_page(
+    items: List[Dict[str, Any]],
+    limit: int,
+    terms: List[str],
+    offset: int
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Matches of a page (look-ahead row trimmed) and the cursor of the next page."""
+    for item in items:
+        item["score"] = float(item["score"])
+    if len(items) <= limit:
+        return items, None
+    return items[:limit], encode_cursor({"q": " ".join(terms), "offset": offset + limit})
@@ -1,10 +1,336 @@
 """
 Strategy service - Business logic for strategy CRUD operations.
+
+StrategyService works on synchronous sessions (analytics routers, which
+run in the threadpool, and scripts). AsyncStrategyService runs the same
+methods on an AsyncSession for the strategy endpoints, so database round
+trips never block the event loop.
+
+Writes are single INSERT/UPDATE/DELETE statements with RETURNING, so each
+create, update or delete costs one round trip (plus the commit) instead
+of a select/refresh around it. Legs go with them:
+- PostgreSQL: a create, and an update that sets every leg source field,
+  write the strategy and its legs in one statement (data-modifying CTEs).
+  An update that changes only some leg source fields needs the updated
+  row to derive the legs, so it takes two: the UPDATE, then one statement
+  replacing the legs.
+- SQLite (no DML in CTEs): the leg INSERT, and for updates the leg
+  DELETE before it, follow the strategy statement in the same transaction.
+- Deletes are one statement everywhere: legs go by ON DELETE CASCADE.
+- Batch writes and imports write legs in extra statements of
+  LEG_SYNC_BATCH strategies each (see strategy_legs).
+
+Listing pages by keyset on the primary key: ids are assigned in insertion
+order, so pages follow creation order, and a continuation cursor (the last
+id of a page) turns every page into one index range scan whatever its
+depth. Pages select only the requested columns with a Core select and
+build plain dicts from the rows (no ORM objects, no identity map).
+
+Batch updates and deletes are set-based: a selection becomes one
+UPDATE/DELETE ... WHERE ... RETURNING id, and per-ID patches become one
+executemany UPDATE per set of changed fields, all in one transaction.
+
+Searches are ranked full-text matches over name and notes, read from
+the backend's full-text index (see strategy_search).
+
+Every write also keeps the strategy_legs rows of the strategies it
+touches in step (see strategy_legs), in the same transaction.
+
+Exports read the whole table through a server-side cursor (yield_per), one
+batch of rows at a time, so memory stays flat however large the book is.
 """
-from sqlalchemy.orm import Session
-from typing import List, Optional
+import re
+from datetime import date
+from sqlalchemy import String, bindparam, delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.sql.expression import ColumnElement
+from sqlalchemy.sql.sqltypes import NullType
+from sqlalchemy.sql.visitors import InternalTraversal
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 from ..models.strategy import Strategy
-from ..schemas.strategy import StrategyCreate, StrategyUpdate
+from ..schemas.strategy import StrategyCreate, StrategyLegQuery, StrategyPatch, StrategySelection, StrategyUpdate
+from .pagination import decode_cursor, encode_cursor
+from .strategy_legs import (
+    LEG_SOURCE_COLUMNS,
+    LEG_SOURCE_FIELDS,
+    leg_page,
+    leg_page_statement,
+    leg_records,
+    leg_source,
+    leg_source_statements,
+    leg_write_ctes,
+    leg_writes,
+)
+from .strategy_search import search_page, search_statement
+
+STRATEGY_ORDERS = ("asc", "desc")
+
+# Columns a listing can return (same keys as Strategy.to_dict)
+STRATEGY_FIELDS = tuple(Strategy.__table__.columns.keys())
+
+# Default listing projection: what a strategy list/sidebar shows
+SUMMARY_FIELDS = ("id", "name", "strategy_type", "expiry_date")
+
+# Rows fetched from the server-side cursor per export batch
+EXPORT_BATCH_SIZE = 1000
+
+
+def resolve_fields(fields: Optional[str]) -> List[str]:
+    """
+    Columns of a `fields=` parameter.
+
+    Args:
+        fields: Comma-separated column names, "all", or None for SUMMARY_FIELDS
+
+    Returns:
+        Column names, always starting with id (pages are keyed on it)
+    """
+    if fields is None or not fields.strip():
+        return list(SUMMARY_FIELDS)
+    if fields.strip() == "all":
+        return list(STRATEGY_FIELDS)
+
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in names if name not in STRATEGY_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {unknown} (choose from {', '.join(STRATEGY_FIELDS)})")
+    return ["id"] + [name for name in dict.fromkeys(names) if name != "id"]
+
+
+def _row_dict(row) -> Dict[str, Any]:
+    """Response dict of a projected row, serialized like Strategy.to_dict."""
+    return {
+        key: value.isoformat() if isinstance(value, date) else value
+        for key, value in row._mapping.items()
+    }
+
+
+def _page_statement(
+    fields: List[str],
+    limit: int,
+    cursor: Optional[str],
+    order: str,
+    skip: Optional[int] = None,
+    selection: Optional[StrategySelection] = None
+):
+    """SELECT of one page of the given columns, with one extra row to tell whether more follow."""
+    if order not in STRATEGY_ORDERS:
+        raise ValueError(f"Unknown order: {order} (use {', '.join(STRATEGY_ORDERS)})")
+
+    columns = Strategy.__table__.columns
+    query = select(*(columns[name] for name in fields))
+    if selection is not None:
+        query = query.where(*_selection_clauses(selection))
+    if skip is not None:
+        if cursor:
+            raise ValueError("Use either cursor or skip, not both")
+        query = query.offset(skip)
+    elif cursor:
+        position = decode_cursor(cursor)
+        last_id = position.get("id")
+        if position.get("order") != order or not isinstance(last_id, int):
+            raise ValueError("Invalid cursor")
+        query = query.where(Strategy.id > last_id if order == "asc" else Strategy.id < last_id)
+
+    key = Strategy.id.asc() if order == "asc" else Strategy.id.desc()
+    return query.order_by(key).limit(limit + 1)
+
+
+def _page(rows, limit: int, order: str, skip: Optional[int]) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Row dicts of a page (look-ahead row trimmed) and the cursor of the next page."""
+    items = [_row_dict(row) for row in rows[:limit]]
+    if len(rows) <= limit or skip is not None:
+        return items, None
+    return items, encode_cursor({"id": items[-1]["id"], "order": order})
+
+
+def _export_statement(fields: List[str], order: str, batch_size: int):
+    """SELECT of every strategy, fetched `batch_size` rows at a time from a server-side cursor."""
+    if order not in STRATEGY_ORDERS:
+        raise ValueError(f"Unknown order: {order} (use {', '.join(STRATEGY_ORDERS)})")
+
+    columns = Strategy.__table__.columns
+    key = Strategy.id.asc() if order == "asc" else Strategy.id.desc()
+    return select(*(columns[name] for name in fields)).order_by(key).execution_options(yield_per=batch_size)
+
+
+def _insert_statement(strategy_data: StrategyCreate):
+    """INSERT returning the new row as a Strategy (server defaults included)."""
+    return insert(Strategy).values(
+        name=strategy_data.name,
+        strategy_type=strategy_data.strategy_type,
+        entry_date=strategy_data.entry_date,
+        expiry_date=strategy_data.expiry_date,
+        parameters=strategy_data.parameters,
+        custom_legs=strategy_data.custom_legs or [],
+        notes=strategy_data.notes
+    ).returning(Strategy)
+
+
+def _update_statement(strategy_id: int, update_data: Dict[str, Any]):
+    """UPDATE of the given fields returning the updated row (no row if not found)."""
+    return (
+        update(Strategy)
+        .where(Strategy.id == strategy_id)
+        .values(**update_data)
+        .returning(Strategy)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+
+
+def _delete_statement(strategy_id: int):
+    return delete(Strategy).where(Strategy.id == strategy_id).execution_options(synchronize_session=False)
+
+
+def _writes_legs_inline(db: Session) -> bool:
+    """Whether strategy writes can carry their legs in the same statement (PostgreSQL)."""
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def _with_legs(write, source: tuple, replace: bool = True):
+    """
+    One statement running `write` (INSERT/UPDATE ... RETURNING the strategy)
+    and the writes of its legs, selecting the written row as a Strategy.
+
+    Args:
+        write: Strategy INSERT or UPDATE returning the row
+        source: Leg source row of the written strategy (see LEG_SOURCE_COLUMNS)
+        replace: Replace existing legs (False for new strategies)
+    """
+    written = write.cte("written")
+    return (
+        select(aliased(Strategy, written))
+        .add_cte(*leg_write_ctes(written, leg_records(source), replace))
+        .execution_options(populate_existing=True)
+    )
+
+
+def _replace_legs_statement(source: tuple):
+    """One statement replacing the legs of a saved strategy (source: its leg source row)."""
+    kept = select(Strategy.id).where(Strategy.id == source[0]).cte("kept")
+    return select(kept.c.id).add_cte(*leg_write_ctes(kept, leg_records(source)))
+
+
+def _changes_legs(values: Dict[str, Any]) -> bool:
+    """Whether an update of these fields can change a strategy's legs."""
+    return not values.keys().isdisjoint(LEG_SOURCE_FIELDS)
+
+
+def _write_legs(db: Session, sources, replace: bool = True) -> None:
+    """Rewrite the strategy_legs rows of strategies (leg source rows) in the current transaction."""
+    for statement, rows in leg_writes(sources, replace):
+        db.execute(statement, rows)
+
+
+class _StartsWith(ColumnElement):
+    """
+    Case-sensitive prefix match that can use an index on every backend:
+    LIKE 'abc%' (PostgreSQL, with a varchar_pattern_ops index) or GLOB 'abc*'
+    (SQLite, whose LIKE is case-insensitive and skips BINARY indexes).
+    """
+    inherit_cache = True
+    type = NullType()
+    _traverse_internals = [
+        ("column", InternalTraversal.dp_clauseelement),
+        ("like", InternalTraversal.dp_clauseelement),
+        ("glob", InternalTraversal.dp_clauseelement),
+    ]
+
+    def __init__(self, column, prefix: str):
+        self.column = column
+        self.like = bindparam(None, re.sub(r"([/%_])", r"/\1", prefix) + "%", type_=String)
+        self.glob = bindparam(None, re.sub(r"([*?\[])", r"[\1]", prefix) + "*", type_=String)
+
+
+@compiles(_StartsWith)
+def _compile_starts_with(element, compiler, **kw):
+    return f"{compiler.process(element.column, **kw)} LIKE {compiler.process(element.like, **kw)} ESCAPE '/'"
+
+
+@compiles(_StartsWith, "sqlite")
+def _compile_starts_with_sqlite(element, compiler, **kw):
+    return f"{compiler.process(element.column, **kw)} GLOB {compiler.process(element.glob, **kw)}"
+
+
+def _selection_clauses(selection: StrategySelection) -> list:
+    """WHERE clauses of a selection (criteria are ANDed)."""
+    clauses = []
+    if selection.ids is not None:
+        clauses.append(Strategy.id.in_(selection.ids))
+    if selection.strategy_types is not None:
+        clauses.append(Strategy.strategy_type.in_(selection.strategy_types))
+    if selection.expiry_before is not None:
+        clauses.append(Strategy.expiry_date < selection.expiry_before)
+    if selection.expiry_from is not None:
+        clauses.append(Strategy.expiry_date >= selection.expiry_from)
+    if selection.expiry_to is not None:
+        clauses.append(Strategy.expiry_date <= selection.expiry_to)
+    if selection.name_prefix is not None:
+        clauses.append(_StartsWith(Strategy.name, selection.name_prefix))
+    return clauses
+
+
+def _batch_update_statement(selection: StrategySelection, changes: StrategyUpdate):
+    """
+    One UPDATE of every selected strategy, returning the updated IDs (with
+    the leg source columns when the change can alter legs).
+    """
+    values = changes.model_dump(exclude_unset=True)
+    returned = LEG_SOURCE_COLUMNS if _changes_legs(values) else (Strategy.id,)
+    return (
+        update(Strategy)
+        .where(*_selection_clauses(selection))
+        .values(**values)
+        .returning(*returned)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _batch_delete_statement(selection: StrategySelection):
+    """One DELETE of every selected strategy, returning the deleted IDs."""
+    return (
+        delete(Strategy)
+        .where(*_selection_clauses(selection))
+        .returning(Strategy.id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _patch_groups(patches: List[StrategyPatch]) -> List[Tuple[Any, List[Dict[str, Any]]]]:
+    """
+    Per-ID patches grouped by the fields they change, as (UPDATE statement,
+    parameter rows) pairs; each pair runs as one executemany.
+    """
+    groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+    for patch in patches:
+        values = patch.model_dump(exclude_unset=True, exclude={"id"})
+        groups.setdefault(tuple(sorted(values)), []).append({"_id": patch.id, **values})
+
+    table = Strategy.__table__
+    return [
+        (
+            update(table).where(table.c.id == bindparam("_id")).values({name: bindparam(name) for name in names}),
+            rows,
+        )
+        for names, rows in groups.items()
+    ]
+
+
+def _leg_patch_ids(patches: List[StrategyPatch]) -> List[int]:
+    """IDs of patched strategies whose legs may have changed."""
+    return [p.id for p in patches if _changes_legs(p.model_dump(exclude_unset=True, exclude={"id"}))]
+
+
+def _batch_result(ids: List[int], requested: Optional[List[int]] = None) -> Dict[str, Any]:
+    """Affected IDs of a batch write, plus requested IDs that were not matched."""
+    ids = sorted(ids)
+    result: Dict[str, Any] = {"count": len(ids), "ids": ids}
+    if requested is not None:
+        found = set(ids)
+        result["unmatched_ids"] = sorted({i for i in requested if i not in found})
+    return result
 
 
 class StrategyService:
@@ -22,19 +348,15 @@ class StrategyService:
         Returns:
             Created Strategy model instance
         """
-        db_strategy = Strategy(
-            name=strategy_data.name,
-            strategy_type=strategy_data.strategy_type,
-            entry_date=strategy_data.entry_date,
-            expiry_date=strategy_data.expiry_date,
-            parameters=strategy_data.parameters,
-            custom_legs=strategy_data.custom_legs or [],
-            notes=strategy_data.notes
-        )
-        
-        db.add(db_strategy)
+        if _writes_legs_inline(db):
+            source = (None, *(getattr(strategy_data, name) for name in LEG_SOURCE_FIELDS))
+            db_strategy = db.scalars(_with_legs(_insert_statement(strategy_data), source, replace=False)).one()
+        else:
+            db_strategy = db.scalars(_insert_statement(strategy_data)).one()
+            _write_legs(db, [leg_source(db_strategy)], replace=False)
+        # Detach so the commit does not expire the returned values
+        db.expunge(db_strategy)
         db.commit()
-        db.refresh(db_strategy)
         
         return db_strategy
     
@@ -51,7 +373,111 @@ class StrategyService:
         Returns:
             List of Strategy instances
         """
-        return db.query(Strategy).offset(skip).limit(limit).all()
+        return db.query(Strategy).order_by(Strategy.id).offset(skip).limit(limit).all()
+    
+    @staticmethod
+    def get_strategies_page(
+        db: Session,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        order: str = "asc",
+        fields: Optional[List[str]] = None,
+        skip: Optional[int] = None,
+        selection: Optional[StrategySelection] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Retrieve one page of strategies by keyset pagination.
+        
+        Args:
+            db: Database session
+            limit: Maximum number of records to return
+            cursor: Continuation token of the previous page (None: first page)
+            order: asc (oldest first) or desc (newest first)
+            fields: Columns to return, starting with id (default: SUMMARY_FIELDS)
+            skip: Deprecated offset paging instead of a cursor (no next cursor)
+            selection: Only strategies matching these filters (pass the
+                same filters with every cursor)
+            
+        Returns:
+            (strategy dicts, cursor of the next page or None on the last page)
+        """
+        fields = fields or list(SUMMARY_FIELDS)
+        rows = db.execute(_page_statement(fields, limit, cursor, order, skip, selection)).all()
+        return _page(rows, limit, order, skip)
+    
+    @staticmethod
+    def search_strategies(
+        db: Session,
+        q: str,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Search strategy names and notes, best matches first.
+        
+        Args:
+            db: Database session
+            q: Search words (all must match; the last one also as a prefix)
+            limit: Maximum number of matches to return
+            cursor: Continuation token of the previous page (None: first page)
+            fields: Columns to return (default: SUMMARY_FIELDS)
+            
+        Returns:
+            (strategy dicts with a relevance score, cursor of the next page
+            or None on the last page)
+        """
+        fields = fields or list(SUMMARY_FIELDS)
+        statement, terms, offset = search_statement(db.get_bind().dialect.name, q, fields, limit, cursor)
+        items = [_row_dict(row) for row in db.execute(statement).all()]
+        return search_page(items, limit, terms, offset)
+    
+    @staticmethod
+    def get_legs_page(
+        db: Session,
+        query: StrategyLegQuery,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Retrieve one page of strategy legs matching a leg query.
+        
+        Args:
+            db: Database session
+            query: Leg criteria (all must match)
+            limit: Maximum number of legs to return
+            cursor: Continuation token of the previous page (None: first page)
+            
+        Returns:
+            (leg dicts with their strategy's name and type, cursor of the
+            next page or None on the last page)
+        """
+        rows = db.execute(leg_page_statement(query, limit, cursor)).all()
+        return leg_page([_row_dict(row) for row in rows], limit)
+    
+    @staticmethod
+    def iter_strategy_batches(
+        db: Session,
+        fields: Optional[List[str]] = None,
+        order: str = "asc",
+        batch_size: int = EXPORT_BATCH_SIZE
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream every strategy in batches from a server-side cursor.
+        
+        Args:
+            db: Database session
+            fields: Columns to return (default: all)
+            order: asc (oldest first) or desc (newest first)
+            batch_size: Rows per batch
+            
+        Yields:
+            Lists of strategy dicts
+        """
+        fields = fields or list(STRATEGY_FIELDS)
+        result = db.execute(_export_statement(fields, order, batch_size))
+        for rows in result.partitions():
+            yield [_row_dict(row) for row in rows]
     
     @staticmethod
     def get_strategy_by_id(db: Session, strategy_id: int) -> Optional[Strategy]:
@@ -84,18 +510,28 @@ class StrategyService:
         Returns:
             Updated Strategy instance or None if not found
         """
-        db_strategy = StrategyService.get_strategy_by_id(db, strategy_id)
-        
-        if not db_strategy:
-            return None
-        
         # Update fields if provided
         update_data = strategy_data.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_strategy, field, value)
+        if not update_data:
+            return StrategyService.get_strategy_by_id(db, strategy_id)
+        
+        inline = _writes_legs_inline(db)
+        changes_legs = _changes_legs(update_data)
+        statement = _update_statement(strategy_id, update_data)
+        if changes_legs and inline and update_data.keys() >= set(LEG_SOURCE_FIELDS):
+            # Every leg source field is given: the legs go in the same statement
+            source = (strategy_id, *(update_data[name] for name in LEG_SOURCE_FIELDS))
+            statement = _with_legs(statement, source)
+            changes_legs = False
         
+        db_strategy = db.scalars(statement).one_or_none()
+        if db_strategy is not None:
+            if changes_legs and inline:
+                db.execute(_replace_legs_statement(leg_source(db_strategy)))
+            elif changes_legs:
+                _write_legs(db, [leg_source(db_strategy)])
+            db.expunge(db_strategy)
         db.commit()
-        db.refresh(db_strategy)
         
         return db_strategy
     
@@ -111,12 +547,248 @@ class StrategyService:
         Returns:
             True if deleted, False if not found
         """
-        db_strategy = StrategyService.get_strategy_by_id(db, strategy_id)
+        deleted = db.execute(_delete_statement(strategy_id)).rowcount
+        db.commit()
         
-        if not db_strategy:
-            return False
+        return deleted > 0
+    
+    @staticmethod
+    def update_strategies(
+        db: Session,
+        selection: Optional[StrategySelection] = None,
+        changes: Optional[StrategyUpdate] = None,
+        patches: Optional[List[StrategyPatch]] = None
+    ) -> Dict[str, Any]:
+        """
+        Update many strategies in one transaction.
+        
+        Args:
+            db: Database session
+            selection: Strategies to change (with changes)
+            changes: Fields set on every selected strategy
+            patches: Per-ID partial updates (instead of selection/changes)
+            
+        Returns:
+            Dict with count, the updated IDs and unmatched_ids (requested
+            IDs that were not updated)
+        """
+        if patches is None:
+            rows = db.execute(_batch_update_statement(selection, changes)).all()
+            if _changes_legs(changes.model_dump(exclude_unset=True)):
+                _write_legs(db, rows)
+            db.commit()
+            return _batch_result([row[0] for row in rows], selection.ids)
         
-        db.delete(db_strategy)
+        requested = [patch.id for patch in patches]
+        ids = db.scalars(select(Strategy.id).where(Strategy.id.in_(requested))).all()
+        found = set(ids)
+        patches = [p for p in patches if p.id in found]
+        for statement, rows in _patch_groups(patches):
+            db.execute(statement, rows)
+        for statement in leg_source_statements(_leg_patch_ids(patches)):
+            _write_legs(db, db.execute(statement).all())
         db.commit()
+        return _batch_result(ids, requested)
+    
+    @staticmethod
+    def delete_strategies(db: Session, selection: StrategySelection) -> Dict[str, Any]:
+        """
+        Delete every selected strategy in one statement.
+        
+        Args:
+            db: Database session
+            selection: Strategies to delete
+            
+        Returns:
+            Dict with count, the deleted IDs and unmatched_ids (requested
+            IDs that were not deleted)
+        """
+        ids = db.scalars(_batch_delete_statement(selection)).all()
+        db.commit()
+        return _batch_result(ids, selection.ids)
+    
+    @staticmethod
+    def get_strategies_by_ids(db: Session, strategy_ids: List[int]) -> List[Strategy]:
+        """
+        Retrieve several strategies by ID in one query.
+        
+        Args:
+            db: Database session
+            strategy_ids: Strategy IDs
+            
+        Returns:
+            List of Strategy instances (IDs that do not exist are omitted)
+        """
+        if not strategy_ids:
+            return []
+        return db.query(Strategy).filter(Strategy.id.in_(strategy_ids)).all()
+    
+    @staticmethod
+    def get_strategy_definitions(
+        db: Session,
+        strategy_ids: List[int]
+    ) -> Tuple[List[Dict[str, Any]], List[int]]:
+        """
+        Load saved strategies as plain dicts for the analytics services.
         
-        return True
+        Args:
+            db: Database session
+            strategy_ids: Strategy IDs
+            
+        Returns:
+            (strategy dicts in request order, IDs that were not found)
+        """
+        saved = {s.id: s for s in StrategyService.get_strategies_by_ids(db, strategy_ids)}
+        missing = [i for i in strategy_ids if i not in saved]
+        return [saved[i].to_dict() for i in strategy_ids if i in saved], missing
+    
+    @staticmethod
+    def get_book_definitions(
+        db: Session,
+        strategy_ids: Optional[List[int]] = None,
+        strategy_types: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Load the saved book (or a filtered part of it) for portfolio analytics.
+        
+        Only the columns needed to build legs are read; updated_at is
+        included so callers can cache per-strategy results.
+        
+        Args:
+            db: Database session
+            strategy_ids: Restrict to these IDs (default: all)
+            strategy_types: Restrict to these strategy types (default: all)
+            
+        Returns:
+            Strategy dicts ordered by ID
+        """
+        query = db.query(
+            Strategy.id,
+            Strategy.name,
+            Strategy.strategy_type,
+            Strategy.expiry_date,
+            Strategy.parameters,
+            Strategy.custom_legs,
+            Strategy.updated_at,
+        )
+        if strategy_ids:
+            query = query.filter(Strategy.id.in_(strategy_ids))
+        if strategy_types:
+            query = query.filter(Strategy.strategy_type.in_(strategy_types))
+        return [row._asdict() for row in query.order_by(Strategy.id)]
+
+
+class AsyncStrategyService:
+    """
+    StrategyService on an AsyncSession, for request handlers.
+    
+    Each method runs the StrategyService method through
+    AsyncSession.run_sync: the same statements, issued through the async
+    driver, so there is one implementation of every query and none of
+    them blocks the event loop. Only the export stream, which yields
+    between batches, is written against the async API.
+    """
+    
+    @staticmethod
+    async def create_strategy(db: AsyncSession, strategy_data: StrategyCreate) -> Strategy:
+        """See StrategyService.create_strategy."""
+        return await db.run_sync(StrategyService.create_strategy, strategy_data)
+    
+    @staticmethod
+    async def get_strategies(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[Strategy]:
+        """See StrategyService.get_strategies."""
+        return await db.run_sync(StrategyService.get_strategies, skip, limit)
+    
+    @staticmethod
+    async def get_strategies_page(
+        db: AsyncSession,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        order: str = "asc",
+        fields: Optional[List[str]] = None,
+        skip: Optional[int] = None,
+        selection: Optional[StrategySelection] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """See StrategyService.get_strategies_page."""
+        return await db.run_sync(
+            StrategyService.get_strategies_page, limit, cursor, order, fields, skip, selection
+        )
+    
+    @staticmethod
+    async def search_strategies(
+        db: AsyncSession,
+        q: str,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """See StrategyService.search_strategies."""
+        return await db.run_sync(StrategyService.search_strategies, q, limit, cursor, fields)
+    
+    @staticmethod
+    async def get_legs_page(
+        db: AsyncSession,
+        query: StrategyLegQuery,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """See StrategyService.get_legs_page."""
+        return await db.run_sync(StrategyService.get_legs_page, query, limit, cursor)
+    
+    @staticmethod
+    async def iter_strategy_batches(
+        db: AsyncSession,
+        fields: Optional[List[str]] = None,
+        order: str = "asc",
+        batch_size: int = EXPORT_BATCH_SIZE
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Stream every strategy in batches from a server-side cursor.
+        
+        Args:
+            db: Async database session
+            fields: Columns to return (default: all)
+            order: asc (oldest first) or desc (newest first)
+            batch_size: Rows per batch
+            
+        Yields:
+            Lists of strategy dicts
+        """
+        fields = fields or list(STRATEGY_FIELDS)
+        result = await db.stream(_export_statement(fields, order, batch_size))
+        async for rows in result.partitions():
+            yield [_row_dict(row) for row in rows]
+    
+    @staticmethod
+    async def get_strategy_by_id(db: AsyncSession, strategy_id: int) -> Optional[Strategy]:
+        """See StrategyService.get_strategy_by_id."""
+        return await db.run_sync(StrategyService.get_strategy_by_id, strategy_id)
+    
+    @staticmethod
+    async def update_strategy(
+        db: AsyncSession,
+        strategy_id: int,
+        strategy_data: StrategyUpdate
+    ) -> Optional[Strategy]:
+        """See StrategyService.update_strategy."""
+        return await db.run_sync(StrategyService.update_strategy, strategy_id, strategy_data)
+    
+    @staticmethod
+    async def delete_strategy(db: AsyncSession, strategy_id: int) -> bool:
+        """See StrategyService.delete_strategy."""
+        return await db.run_sync(StrategyService.delete_strategy, strategy_id)
+    
+    @staticmethod
+    async def update_strategies(
+        db: AsyncSession,
+        selection: Optional[StrategySelection] = None,
+        changes: Optional[StrategyUpdate] = None,
+        patches: Optional[List[StrategyPatch]] = None
+    ) -> Dict[str, Any]:
+        """See StrategyService.update_strategies."""
+        return await db.run_sync(StrategyService.update_strategies, selection, changes, patches)
+    
+    @staticmethod
+    async def delete_strategies(db: AsyncSession, selection: StrategySelection) -> Dict[str, Any]:
+        """See StrategyService.delete_strategies."""
+        return await db.run_sync(StrategyService.delete_strategies, selection)
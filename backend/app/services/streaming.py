@@ -0,0 +1,90 @@
+"""
+Streaming serializers - Encode blocks of array columns or records as
+NDJSON or CSV.
+
+Each block is formatted into one string, so a response is produced
+incrementally and only one block is held in memory at a time.
+"""
+import csv
+import io
+import json
+from typing import Any, Dict, Iterable, Iterator, List
+
+import numpy as np
+
+# Format -> media type
+STREAM_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def encode_blocks(
+    blocks: Iterable[Dict[str, np.ndarray]],
+    fmt: str = "ndjson",
+    decimals: int = 2
+) -> Iterator[str]:
+    """
+    Serialize column blocks row by row.
+
+    Args:
+        blocks: Dicts of equally long column arrays, same columns in every block
+        fmt: ndjson (one JSON object per line) or csv (with a header row)
+        decimals: Decimal places of every value
+
+    Yields:
+        Text chunks, one per block (plus the CSV header)
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if fmt not in STREAM_FORMATS:
+        raise ValueError(f"Unknown format: {fmt} (use {', '.join(STREAM_FORMATS)})")
+
+    template = None
+    for block in blocks:
+        if template is None:
+            columns = list(block)
+            if fmt == "ndjson":
+                template = "{" + ",".join(f'"{c}":%.{decimals}f' for c in columns) + "}"
+            else:
+                template = ",".join(f"%.{decimals}f" for _ in columns)
+                yield ",".join(columns) + "\n"
+
+        rows = zip(*(np.asarray(block[c]).tolist() for c in columns))
+        yield "\n".join(template % row for row in rows) + "\n"
+
+
+def encode_records(block: List[Dict[str, Any]], fmt: str = "ndjson", header: bool = False) -> str:
+    """
+    Serialize one block of records (dicts with the same keys).
+
+    Args:
+        block: Records, e.g. database rows
+        fmt: ndjson (one JSON object per line) or csv; in CSV, list and
+            dict values are written as JSON text
+        header: Start with the CSV header row (first block of a stream)
+
+    Returns:
+        Text of the block ("" for an empty block)
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if fmt not in STREAM_FORMATS:
+        raise ValueError(f"Unknown format: {fmt} (use {', '.join(STREAM_FORMATS)})")
+    if not block:
+        return ""
+
+    if fmt == "ndjson":
+        return "".join(json.dumps(record, default=str) + "\n" for record in block)
+
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    if header:
+        writer.writerow(block[0])
+    writer.writerows(
+        [json.dumps(value) if isinstance(value, (list, dict)) else value for value in record.values()]
+        for record in block
+    )
+    return out.getvalue()
@@ -0,0 +1,513 @@
+"""
+Strike optimizer service - Searches option-chain strike combinations
+for a strategy template and returns the best-scoring candidates.
+
+Candidates are enumerated as NumPy index arrays, dominated combinations
+are pruned before the expensive cross products are formed, and the
+overall top-k is kept in a bounded heap while blocks are scored.
+"""
+import heapq
+import itertools
+import time
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from ..config import settings
+from .option_chain import OptionChain, get_chain_store, mid_price
+from .pricing import expected_payoff, probability_above
+
+
+# Maximum number of candidates scored per vectorized block
+BLOCK_SIZE = 65536
+
+
+@dataclass
+class StrikeBook:
+    """Per-strike quotes and model expectations for one expiry."""
+    strikes: np.ndarray
+    call_buy: np.ndarray    # Price paid to buy a call at each strike (NaN if absent)
+    call_sell: np.ndarray   # Price received to sell a call
+    put_buy: np.ndarray
+    put_sell: np.ndarray
+    call_exp: np.ndarray    # Expected call payoff at expiry
+    put_exp: np.ndarray     # Expected put payoff at expiry
+    spot: float
+    time_to_expiry: float
+    volatility: float
+    rate: float
+
+    def prob_above(self, level: np.ndarray) -> np.ndarray:
+        return probability_above(self.spot, level, self.time_to_expiry, self.volatility, self.rate)
+
+    def probability_of_profit(self, block: Dict[str, Any], rows: np.ndarray) -> np.ndarray:
+        """
+        POP of the given block rows: the chance of finishing above the lower
+        breakeven, and below the upper one when the payoff has two.
+
+        Evaluated lazily because the normal CDF dominates the cost of a block
+        and most objectives only need it for the final top-k.
+        """
+        pop = self.prob_above(block["lower_be"][rows])
+        if block["upper_be"] is not None:
+            pop = pop - self.prob_above(block["upper_be"][rows])
+        return pop
+
+
+def _quote_prices(chain: OptionChain, price_basis: str):
+    """Return (buy, sell) price per contract for the chosen pricing basis."""
+    if price_basis != "bid_ask":
+        mid = mid_price(chain.bid, chain.ask, chain.ltp)
+        return mid, mid
+
+    bid = np.where(chain.bid > 0, chain.bid, np.nan)
+    ask = np.where(chain.ask > 0, chain.ask, np.nan)
+    ltp = np.where(chain.ltp > 0, chain.ltp, np.nan)
+    buy = np.where(np.isnan(ask), ltp, ask)
+    sell = np.where(np.isnan(bid), ltp, bid)
+    return buy, sell
+
+
+def _prune_dominated(group: np.ndarray, order_key: np.ndarray, value: np.ndarray) -> np.ndarray:
+    """
+    Keep rows whose value beats every earlier row of the same group.
+
+    Rows are visited in ascending (group, order_key) order; a row survives only
+    if its value is strictly greater than the running maximum of its group.
+    The running maximum is computed for all groups at once by offsetting each
+    group's values above the previous group's range.
+    """
+    keep = np.zeros(len(value), dtype=bool)
+    if len(value) == 0:
+        return keep
+
+    order = np.lexsort((order_key, group))
+    g = group[order]
+    v = value[order]
+    span = v.max() - v.min() + 1.0
+    shifted = v + g * span
+
+    running = np.maximum.accumulate(shifted)
+    previous = np.concatenate(([-np.inf], running[:-1]))
+    keep[order] = shifted > previous
+    return keep
+
+
+class StrikeOptimizerService:
+    """Service for searching strike combinations of strategy templates."""
+
+    TEMPLATES = ("iron-condor", "bull-call-spread", "butterfly-spread", "covered-call")
+    OBJECTIVES = ("reward_risk", "pop", "expected_value")
+
+    @staticmethod
+    def build_strike_book(
+        chain: OptionChain,
+        underlying_price: Optional[float],
+        volatility: Optional[float],
+        valuation_date: Optional[str],
+        rate: float,
+        price_basis: str
+    ) -> StrikeBook:
+        """
+        Pivot a single-expiry chain into per-strike call/put arrays.
+
+        Spot defaults to the chain's underlying_price column and volatility
+        to the at-the-money implied volatility.
+        """
+        strikes = np.unique(chain.strike)
+        position = np.searchsorted(strikes, chain.strike)
+        buy, sell = _quote_prices(chain, price_basis)
+
+        def pivot(values: np.ndarray, is_call: bool) -> np.ndarray:
+            out = np.full(len(strikes), np.nan)
+            mask = chain.is_call == is_call
+            out[position[mask]] = values[mask]
+            return out
+
+        if underlying_price is None:
+            if np.isnan(chain.underlying_price).all():
+                raise ValueError("underlying_price is required when the chain has no underlying_price column")
+            underlying_price = float(np.nanmedian(chain.underlying_price))
+
+        if volatility is None:
+            atm = np.abs(chain.strike - underlying_price)
+            atm_iv = chain.iv[(atm == atm.min()) & ~np.isnan(chain.iv)]
+            volatility = float(atm_iv.mean()) if len(atm_iv) else settings.default_volatility
+
+        as_of = np.datetime64(valuation_date or date.today().isoformat(), "D")
+        days = (chain.expiry[0] - as_of).astype(int)
+        time_to_expiry = max(days, 0) / 365.0
+
+        return StrikeBook(
+            strikes=strikes,
+            call_buy=pivot(buy, True),
+            call_sell=pivot(sell, True),
+            put_buy=pivot(buy, False),
+            put_sell=pivot(sell, False),
+            call_exp=expected_payoff(underlying_price, strikes, time_to_expiry, volatility, rate, True),
+            put_exp=expected_payoff(underlying_price, strikes, time_to_expiry, volatility, rate, False),
+            spot=underlying_price,
+            time_to_expiry=time_to_expiry,
+            volatility=volatility,
+            rate=rate,
+        )
+
+    @staticmethod
+    def _vertical_spreads(book: StrikeBook, is_call: bool, max_width: Optional[float]) -> Dict[str, np.ndarray]:
+        """
+        Enumerate out-of-the-money credit verticals (short the inner strike,
+        buy the wing).
+
+        A spread is dominated when a narrower spread on the same short strike
+        collects at least as much credit: its payoff is then higher at every
+        terminal price, so the wider one can never rank above it.
+        """
+        lower, upper = np.triu_indices(len(book.strikes), 1)
+        if is_call:
+            short, long = lower, upper
+            credit = book.call_sell[short] - book.call_buy[long]
+            expected = credit - book.call_exp[short] + book.call_exp[long]
+        else:
+            short, long = upper, lower
+            credit = book.put_sell[short] - book.put_buy[long]
+            expected = credit - book.put_exp[short] + book.put_exp[long]
+
+        # Condor shorts are out of the money: puts below spot, calls above
+        otm = book.strikes[short] >= book.spot if is_call else book.strikes[short] <= book.spot
+        width = book.strikes[upper] - book.strikes[lower]
+        valid = otm & np.isfinite(credit) & (credit > 0) & (credit < width)
+        if max_width is not None:
+            valid &= width <= max_width
+
+        short, long, credit, width, expected = (
+            a[valid] for a in (short, long, credit, width, expected)
+        )
+        keep = _prune_dominated(short, width, credit)
+
+        return {
+            "short": short[keep],
+            "long": long[keep],
+            "credit": credit[keep],
+            "width": width[keep],
+            "expected": expected[keep],
+            "raw": len(lower),
+        }
+
+    @staticmethod
+    def _iron_condor_blocks(book: StrikeBook, max_width: Optional[float]) -> Iterator[Dict[str, Any]]:
+        """Cross pruned put-credit and call-credit spreads block by block."""
+        puts = StrikeOptimizerService._vertical_spreads(book, False, max_width)
+        calls = StrikeOptimizerService._vertical_spreads(book, True, max_width)
+        yield {"combinations": puts["raw"] * calls["raw"]}
+
+        n_calls = len(calls["short"])
+        if n_calls == 0 or len(puts["short"]) == 0:
+            return
+
+        rows = max(1, BLOCK_SIZE // n_calls)
+        call_short_strike = book.strikes[calls["short"]][None, :]
+
+        for start in range(0, len(puts["short"]), rows):
+            block = slice(start, start + rows)
+            put_short_strike = book.strikes[puts["short"][block]][:, None]
+
+            credit = puts["credit"][block][:, None] + calls["credit"][None, :]
+            max_loss = np.maximum(puts["width"][block][:, None], calls["width"][None, :]) - credit
+            valid = (put_short_strike < call_short_strike) & (max_loss > 0)
+
+            p_idx, c_idx = np.nonzero(valid)
+            credit = credit[valid]
+            lower_be = put_short_strike[:, 0][p_idx] - credit
+            upper_be = call_short_strike[0][c_idx] + credit
+            p_idx = p_idx + start
+
+            yield {
+                "legs": np.stack([
+                    puts["long"][p_idx], puts["short"][p_idx],
+                    calls["short"][c_idx], calls["long"][c_idx],
+                ], axis=1),
+                "net_premium": credit,
+                "max_profit": credit,
+                "max_loss": max_loss[valid],
+                "lower_be": lower_be,
+                "upper_be": upper_be,
+                "expected": puts["expected"][p_idx] + calls["expected"][c_idx],
+            }
+
+    @staticmethod
+    def _bull_call_spread_blocks(book: StrikeBook, max_width: Optional[float]) -> Iterator[Dict[str, Any]]:
+        """
+        Long call at the lower strike, short call at the higher strike.
+
+        A wider spread on the same long strike that costs no more dominates
+        the narrower one, so only spreads whose debit rises with width survive.
+        """
+        long, short = np.triu_indices(len(book.strikes), 1)
+        yield {"combinations": len(long)}
+
+        debit = book.call_buy[long] - book.call_sell[short]
+        width = book.strikes[short] - book.strikes[long]
+        valid = np.isfinite(debit) & (debit > 0) & (debit < width)
+        if max_width is not None:
+            valid &= width <= max_width
+
+        long, short, debit, width = (a[valid] for a in (long, short, debit, width))
+        keep = _prune_dominated(long, -width, -debit)
+        long, short, debit, width = (a[keep] for a in (long, short, debit, width))
+
+        lower_be = book.strikes[long] + debit
+        yield {
+            "legs": np.stack([long, short], axis=1),
+            "net_premium": -debit,
+            "max_profit": width - debit,
+            "max_loss": debit,
+            "lower_be": lower_be,
+            "upper_be": None,
+            "expected": -debit + book.call_exp[long] - book.call_exp[short],
+        }
+
+    @staticmethod
+    def _butterfly_spread_blocks(book: StrikeBook, max_width: Optional[float]) -> Iterator[Dict[str, Any]]:
+        """Symmetric long call butterflies: buy lower/upper, sell 2x middle."""
+        strikes = book.strikes
+        lower, middle = np.triu_indices(len(strikes), 1)
+        yield {"combinations": len(lower)}
+
+        target = 2 * strikes[middle] - strikes[lower]
+        upper = np.minimum(np.searchsorted(strikes, target), len(strikes) - 1)
+        valid = np.isclose(strikes[upper], target)
+        if max_width is not None:
+            valid &= (target - strikes[lower]) <= max_width
+
+        lower, middle, upper = lower[valid], middle[valid], upper[valid]
+        debit = book.call_buy[lower] + book.call_buy[upper] - 2 * book.call_sell[middle]
+        wing = strikes[middle] - strikes[lower]
+
+        valid = np.isfinite(debit) & (debit > 0) & (debit < wing)
+        lower, middle, upper, debit, wing = (a[valid] for a in (lower, middle, upper, debit, wing))
+
+        lower_be = strikes[lower] + debit
+        upper_be = strikes[upper] - debit
+        yield {
+            "legs": np.stack([lower, middle, upper], axis=1),
+            "net_premium": -debit,
+            "max_profit": wing - debit,
+            "max_loss": debit,
+            "lower_be": lower_be,
+            "upper_be": upper_be,
+            "expected": -debit + book.call_exp[lower] - 2 * book.call_exp[middle] + book.call_exp[upper],
+        }
+
+    @staticmethod
+    def _covered_call_blocks(book: StrikeBook, max_width: Optional[float]) -> Iterator[Dict[str, Any]]:
+        """Long futures at spot plus one short call per candidate strike."""
+        strike_idx = np.arange(len(book.strikes))
+        yield {"combinations": len(strike_idx)}
+
+        credit = book.call_sell
+        max_profit = book.strikes - book.spot + credit
+        valid = np.isfinite(credit) & (max_profit > 0)
+        if max_width is not None:
+            valid &= (book.strikes - book.spot) <= max_width
+
+        strike_idx, credit, max_profit = strike_idx[valid], credit[valid], max_profit[valid]
+        lower_be = book.spot - credit
+        futures_drift = book.spot * (np.exp(book.rate * book.time_to_expiry) - 1)
+
+        yield {
+            "legs": strike_idx[:, None],
+            "net_premium": credit,
+            "max_profit": max_profit,
+            "max_loss": book.spot - credit,
+            "lower_be": lower_be,
+            "upper_be": None,
+            "expected": credit - book.call_exp[strike_idx] + futures_drift,
+        }
+
+    @staticmethod
+    def _template_parameters(
+        strategy_type: str,
+        book: StrikeBook,
+        legs: np.ndarray,
+        net_premium: float,
+        lot_size: float
+    ) -> Dict[str, Any]:
+        """Express a candidate in the parameter names used by the payoff calculator."""
+        k = [float(book.strikes[i]) for i in legs]
+
+        if strategy_type == "iron-condor":
+            return {
+                "putBuyStrike": k[0],
+                "putSellStrike": k[1],
+                "callSellStrike": k[2],
+                "callBuyStrike": k[3],
+                "netPremium": round(net_premium, 2),
+                "lotSize": lot_size,
+            }
+        if strategy_type == "bull-call-spread":
+            return {
+                "longCallStrike": k[0],
+                "shortCallStrike": k[1],
+                "longCallPremium": round(float(book.call_buy[legs[0]]), 2),
+                "shortCallPremium": round(float(book.call_sell[legs[1]]), 2),
+                "lotSize": lot_size,
+            }
+        if strategy_type == "butterfly-spread":
+            return {
+                "lowerStrike": k[0],
+                "middleStrike": k[1],
+                "upperStrike": k[2],
+                "lowerPremium": round(float(book.call_buy[legs[0]]), 2),
+                "middlePremium": round(float(book.call_sell[legs[1]]), 2),
+                "upperPremium": round(float(book.call_buy[legs[2]]), 2),
+                "lotSize": lot_size,
+            }
+        # covered-call
+        return {
+            "futuresPrice": round(book.spot, 2),
+            "callStrike": k[0],
+            "premium": round(net_premium, 2),
+            "futuresLotSize": lot_size,
+            "callLotSize": lot_size,
+        }
+
+    @staticmethod
+    def optimize(
+        strategy_type: str,
+        chain_file: str,
+        objective: str = "reward_risk",
+        top_k: int = 10,
+        underlying: Optional[str] = None,
+        expiry: Optional[str] = None,
+        underlying_price: Optional[float] = None,
+        lot_size: float = 50,
+        price_basis: str = "mid",
+        max_width: Optional[float] = None,
+        min_pop: Optional[float] = None,
+        volatility: Optional[float] = None,
+        valuation_date: Optional[str] = None,
+        rate: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Search strike combinations for a strategy template.
+
+        Args:
+            strategy_type: Template to fill (iron-condor, bull-call-spread, ...)
+            chain_file: Option-chain file name inside OPTION_CHAIN_DIR
+            objective: reward_risk (max profit / max loss), pop or expected_value
+            top_k: Number of candidates to return
+            underlying: Underlying symbol (optional if the file has only one)
+            expiry: Expiry date YYYY-MM-DD (default: nearest)
+            underlying_price: Spot price (default: from chain)
+            lot_size: Lot size applied to every leg
+            price_basis: "mid" or "bid_ask" (buy at ask, sell at bid)
+            max_width: Maximum distance between the outer strikes of a spread
+            min_pop: Discard candidates below this probability of profit
+            volatility: Volatility for POP/EV (default: ATM implied vol)
+            valuation_date: Date the probabilities are computed from (default: today)
+            rate: Risk-free rate (default: settings.risk_free_rate)
+
+        Returns:
+            Dict with ranked candidates and search statistics
+        """
+        enumerators = {
+            "iron-condor": StrikeOptimizerService._iron_condor_blocks,
+            "bull-call-spread": StrikeOptimizerService._bull_call_spread_blocks,
+            "butterfly-spread": StrikeOptimizerService._butterfly_spread_blocks,
+            "covered-call": StrikeOptimizerService._covered_call_blocks,
+        }
+        enumerate_blocks = enumerators.get(strategy_type)
+        if not enumerate_blocks:
+            raise ValueError(
+                f"Unsupported template: {strategy_type}. "
+                f"Supported: {', '.join(StrikeOptimizerService.TEMPLATES)}"
+            )
+        if objective not in StrikeOptimizerService.OBJECTIVES:
+            raise ValueError(f"Unknown objective: {objective}")
+
+        started = time.perf_counter()
+        chain = get_chain_store(chain_file).select(underlying, expiry)
+        book = StrikeOptimizerService.build_strike_book(
+            chain,
+            underlying_price,
+            volatility,
+            valuation_date,
+            settings.risk_free_rate if rate is None else rate,
+            price_basis,
+        )
+
+        heap: List[tuple] = []
+        tie_breaker = itertools.count()
+        combinations = 0
+        scored = 0
+
+        for block in enumerate_blocks(book, max_width):
+            if "combinations" in block:
+                combinations = block["combinations"]
+                continue
+
+            all_rows = np.arange(len(block["net_premium"]))
+            if objective == "pop" or min_pop is not None:
+                block["pop"] = book.probability_of_profit(block, all_rows)
+
+            if objective == "reward_risk":
+                score = block["max_profit"] / block["max_loss"]
+            elif objective == "pop":
+                score = block["pop"]
+            else:
+                score = block["expected"]
+
+            candidates = np.isfinite(score)
+            if min_pop is not None:
+                candidates &= block["pop"] >= min_pop
+            rows = np.flatnonzero(candidates)
+            scored += len(all_rows)
+
+            # Only the block's own top-k can enter the global heap
+            if len(rows) > top_k:
+                best = np.argpartition(-score[rows], top_k - 1)[:top_k]
+                rows = rows[best]
+
+            for row in rows:
+                entry = (float(score[row]), next(tie_breaker), block, int(row))
+                if len(heap) < top_k:
+                    heapq.heappush(heap, entry)
+                elif entry[0] > heap[0][0]:
+                    heapq.heapreplace(heap, entry)
+
+        results = []
+        for rank, (score, _, block, row) in enumerate(sorted(heap, key=lambda e: (-e[0], e[1])), start=1):
+            net_premium = float(block["net_premium"][row])
+            pop = block["pop"][row] if "pop" in block else book.probability_of_profit(block, np.array([row]))[0]
+            breakevens = [
+                round(float(block[key][row]), 2)
+                for key in ("lower_be", "upper_be")
+                if block[key] is not None
+            ]
+            results.append({
+                "rank": rank,
+                "score": round(score, 6),
+                "parameters": StrikeOptimizerService._template_parameters(
+                    strategy_type, book, block["legs"][row], net_premium, lot_size
+                ),
+                "net_premium": round(net_premium * lot_size, 2),
+                "max_profit": round(float(block["max_profit"][row]) * lot_size, 2),
+                "max_loss": round(float(block["max_loss"][row]) * lot_size, 2),
+                "pop": round(float(pop), 4),
+                "expected_value": round(float(block["expected"][row]) * lot_size, 2),
+                "breakevens": breakevens,
+            })
+
+        return {
+            "strategy_type": strategy_type,
+            "objective": objective,
+            "expiry": str(chain.expiry[0]),
+            "underlying_price": round(book.spot, 2),
+            "volatility": round(book.volatility, 4),
+            "combinations": int(combinations),
+            "scored": int(scored),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+            "candidates": results,
+        }
@@ -0,0 +1 @@
+# Benchmark Scripts Package
@@ -0,0 +1,99 @@
+"""
+Kernel Backend Benchmark
+Compares the NumPy and Numba kernel backends on speed and agreement.
+
+Usage (from the backend directory):
+    python -m benchmarks.kernel_backends
+    python -m benchmarks.kernel_backends --strategies 2000 --bars 1000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from app.kernels import load_backend
+
+
+def best_of(func, repeat: int) -> float:
+    """Fastest of `repeat` runs, in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def make_inputs(strategies: int, bars: int, legs: int, seed: int = 7):
+    """Random option positions marked on every bar (backtest-shaped inputs)."""
+    rng = np.random.default_rng(seed)
+    return {
+        "kind": rng.integers(0, 3, size=(strategies, legs)).astype(np.int8),
+        "quantity": rng.choice([-100.0, -50.0, 50.0, 100.0], size=(strategies, legs)),
+        "strike": rng.uniform(16000, 20000, size=(strategies, legs)),
+        "entry_price": rng.uniform(0, 400, size=(strategies, legs)),
+        "spot": rng.uniform(16000, 20000, size=(bars, 1, 1)),
+        "time_to_expiry": rng.uniform(-0.01, 0.2, size=(bars, strategies, legs)),
+        "volatility": rng.uniform(0.08, 0.4, size=(bars, 1, 1)),
+        "rate": 0.05,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the kernel backends")
+    parser.add_argument("--strategies", type=int, default=500)
+    parser.add_argument("--bars", type=int, default=500)
+    parser.add_argument("--legs", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    data = make_inputs(args.strategies, args.bars, args.legs)
+    flat = {
+        "spot": np.broadcast_to(data["spot"], data["time_to_expiry"].shape).ravel(),
+        "strike": np.broadcast_to(data["strike"], data["time_to_expiry"].shape).ravel(),
+        "t": np.maximum(data["time_to_expiry"].ravel(), 0.001),
+        "vol": np.broadcast_to(data["volatility"], data["time_to_expiry"].shape).ravel(),
+        "is_call": np.broadcast_to(data["kind"] == 1, data["time_to_expiry"].shape).ravel(),
+    }
+    print(f"leg_pnl: {args.bars} bars x {args.strategies} strategies x {args.legs} legs")
+    print(f"black_scholes_price: {flat['t'].size:,} options\n")
+
+    results = {}
+    for name in ("numpy", "numba"):
+        try:
+            kernels = load_backend(name)
+        except ValueError as e:
+            print(f"{name:>6}: skipped ({e})")
+            continue
+
+        def price():
+            return kernels.black_scholes_price(
+                flat["spot"], flat["strike"], flat["t"], flat["vol"], data["rate"], flat["is_call"]
+            )
+
+        def pnl():
+            return kernels.leg_pnl(**data)
+
+        started = time.perf_counter()
+        price()
+        pnl()
+        first_call = (time.perf_counter() - started) * 1000
+
+        results[name] = (price(), pnl())
+        print(
+            f"{name:>6}: first call {first_call:8.1f} ms | "
+            f"black_scholes_price {best_of(price, args.repeat):8.1f} ms | "
+            f"leg_pnl {best_of(pnl, args.repeat):8.1f} ms"
+        )
+
+    if len(results) == 2:
+        (ref_price, ref_pnl), (jit_price, jit_pnl) = results["numpy"], results["numba"]
+        print("\nAgreement with the NumPy reference:")
+        print(f"  black_scholes_price max abs diff: {np.abs(ref_price - jit_price).max():.3e}")
+        print(f"  leg_pnl max abs diff:             {np.abs(ref_pnl - jit_pnl).max():.3e}")
+        print(f"  leg_pnl max relative diff:        "
+              f"{(np.abs(ref_pnl - jit_pnl) / np.maximum(np.abs(ref_pnl), 1.0)).max():.3e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Payoff Stream Memory Check
+Streams payoff curves of increasing size through the chunked evaluator and
+the NDJSON serializer, each in a fresh process, and checks that peak RSS
+does not grow with the number of points.
+
+Exits with status 1 when the growth exceeds the ceiling.
+
+Usage (from the backend directory):
+    python -m benchmarks.payoff_stream_memory
+    python -m benchmarks.payoff_stream_memory --sizes 100000 1000000 10000000
+"""
+import argparse
+import resource
+import subprocess
+import sys
+import time
+
+# Allowed peak-RSS growth between the smallest and the largest curve
+MEMORY_CEILING_MIB = 32
+
+
+def stream_curve(num_points: int) -> None:
+    """Child process: stream one curve and print bytes, seconds and peak RSS (KiB)."""
+    from app.services.payoff_calculator import PayoffCalculatorService
+    from app.services.streaming import encode_blocks
+
+    started = time.perf_counter()
+    chunks = PayoffCalculatorService.iter_payoff_chunks(
+        strategy_type="iron-condor",
+        parameters={},
+        underlying_price=18000,
+        price_range_percent=30,
+        expiry_date="2026-12-31",
+        num_points=num_points,
+        grid_spacing="strike-dense",
+    )
+    blocks = ({"price": prices, "pnl": pnl} for prices, pnl in chunks)
+    size = sum(len(text) for text in encode_blocks(blocks, "ndjson"))
+    elapsed = time.perf_counter() - started
+    print(size, elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check payoff streaming memory")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000, 5_000_000])
+    parser.add_argument("--child", type=int, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        stream_curve(args.child)
+        return
+
+    peaks = []
+    for num_points in sorted(args.sizes):
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.payoff_stream_memory", "--child", str(num_points)],
+            check=True, capture_output=True, text=True
+        ).stdout.split()
+        size, elapsed, peak_kib = int(output[0]), float(output[1]), int(output[2])
+        peaks.append(peak_kib / 1024)
+        print(
+            f"{num_points:>12,} points: {size / 2**20:8.1f} MiB streamed in {elapsed:6.2f}s, "
+            f"peak RSS {peaks[-1]:7.1f} MiB"
+        )
+
+    growth = peaks[-1] - peaks[0]
+    ok = growth <= MEMORY_CEILING_MIB
+    print(f"{'✅' if ok else '❌'} Peak RSS growth {growth:.1f} MiB (ceiling {MEMORY_CEILING_MIB} MiB)")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Precision Check
+Verifies the documented float32 error bounds against the float64 reference
+and reports the memory saved.
+
+Exits with status 1 when a bound is exceeded.
+
+Usage (from the backend directory):
+    python -m benchmarks.precision_check
+    python -m benchmarks.precision_check --samples 2000000
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from app.kernels import FLOAT32_PRICE_TOLERANCE, load_backend
+
+
+def make_inputs(samples: int, legs: int, seed: int = 11):
+    """Random positions over a wide range of moneyness, vol and expiry."""
+    rng = np.random.default_rng(seed)
+    rows = samples // legs
+    spot = rng.uniform(1000, 60000, size=(rows, 1))
+    return {
+        "kind": rng.integers(0, 3, size=(rows, legs)).astype(np.int8),
+        "quantity": rng.choice([-100.0, -50.0, -25.0, 25.0, 50.0, 100.0], size=(rows, legs)),
+        "strike": spot * rng.uniform(0.6, 1.4, size=(rows, legs)),
+        "entry_price": spot * rng.uniform(0, 0.1, size=(rows, legs)),
+        "spot": spot,
+        "time_to_expiry": rng.uniform(-0.01, 2.0, size=(rows, legs)),
+        "volatility": rng.uniform(0.03, 1.5, size=(rows, 1)),
+        "rate": 0.06,
+    }
+
+
+def check(name: str, worst: float) -> bool:
+    ok = worst <= FLOAT32_PRICE_TOLERANCE
+    print(f"  {'✅' if ok else '❌'} {name}: worst error {worst:.2e} of notional (bound {FLOAT32_PRICE_TOLERANCE:.0e})")
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check float32 error bounds")
+    parser.add_argument("--samples", type=int, default=1_000_000)
+    parser.add_argument("--legs", type=int, default=4)
+    args = parser.parse_args()
+
+    data = make_inputs(args.samples, args.legs)
+    is_call = data["kind"] == 1
+    notional = data["spot"] + data["strike"]
+    position_notional = (np.abs(data["quantity"]) * notional).sum(axis=-1)
+    passed = True
+
+    for name in ("numpy", "numba"):
+        try:
+            kernels = load_backend(name)
+        except ValueError as e:
+            print(f"{name}: skipped ({e})")
+            continue
+        print(f"{name} kernels:")
+
+        prices, pnls, timings = {}, {}, {}
+        for dtype in (np.float64, np.float32):
+            started = time.perf_counter()
+            prices[dtype] = kernels.black_scholes_price(
+                data["spot"], data["strike"], np.maximum(data["time_to_expiry"], 0),
+                data["volatility"], data["rate"], is_call, dtype
+            )
+            pnls[dtype] = kernels.leg_pnl(**data, dtype=dtype)
+            timings[dtype] = (time.perf_counter() - started) * 1000
+
+        price_error = np.abs(prices[np.float32] - prices[np.float64]) / notional
+        pnl_error = np.abs(pnls[np.float32] - pnls[np.float64]) / position_notional
+        passed &= check("black_scholes_price", float(price_error.max()))
+        passed &= check("leg_pnl", float(pnl_error.max()))
+        print(
+            f"     buffers {prices[np.float64].nbytes / 2**20:.1f} MiB -> "
+            f"{prices[np.float32].nbytes / 2**20:.1f} MiB, "
+            f"time {timings[np.float64]:.0f} ms -> {timings[np.float32]:.0f} ms"
+        )
+
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Pricing Kernel Benchmark
+Times the exact Black-Scholes kernel, the shared-d1/d2 Greeks and the
+lookup-table mode, and checks the table against its error bound.
+
+Exits with status 1 if the table error exceeds its documented bound.
+
+Usage (from the backend directory):
+    python -m benchmarks.pricing_kernels
+    python -m benchmarks.pricing_kernels --options 4000000 --num-z 2401 --num-s 384
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from app.services.pricing import (
+    MIN_TIME_TO_EXPIRY,
+    BlackScholesTable,
+    black_scholes_greeks,
+    black_scholes_price,
+)
+
+
+def best_of(func, repeat: int) -> float:
+    """Fastest of `repeat` runs, in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the pricing kernels")
+    parser.add_argument("--options", type=int, default=1_000_000)
+    parser.add_argument("--num-z", type=int, default=1601)
+    parser.add_argument("--num-s", type=int, default=256)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(7)
+    n = args.options
+    spot = rng.uniform(15000, 21000, n)
+    strike = rng.uniform(15000, 21000, n)
+    t = rng.uniform(0.0, 0.5, n)
+    vol = rng.uniform(0.08, 0.6, n)
+    is_call = rng.random(n) < 0.5
+    rate = 0.06
+
+    started = time.perf_counter()
+    table = BlackScholesTable(num_z=args.num_z, num_s=args.num_s)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    print(f"{n:,} options")
+    print(f"table: {args.num_z} x {args.num_s} ({table.values.nbytes / 2**20:.1f} MiB), "
+          f"built in {build_ms:.0f} ms\n")
+
+    modes = {
+        "exact price": lambda: black_scholes_price(spot, strike, t, vol, rate, is_call),
+        "price + greeks": lambda: black_scholes_greeks(spot, strike, t, vol, rate, is_call),
+        "table price": lambda: table.price(spot, strike, t, vol, rate, is_call),
+    }
+    for name, func in modes.items():
+        ms = best_of(func, args.repeat)
+        print(f"{name:>15}: {ms:8.1f} ms ({ms * 1e6 / n:6.1f} ns/option)")
+
+    exact = black_scholes_price(spot, strike, t, vol, rate, is_call)
+    approx = table.price(spot, strike, t, vol, rate, is_call)
+    discounted_strike = strike * np.exp(-rate * np.maximum(t, MIN_TIME_TO_EXPIRY))
+    error = float((np.abs(approx - exact) / discounted_strike).max())
+
+    print(f"\ntable error (fraction of discounted strike): {error:.2e} "
+          f"(bound {table.max_error:.2e})")
+    print(f"largest absolute error: {np.abs(approx - exact).max():.4f}")
+
+    if error > table.max_error:
+        print("FAIL: table error exceeds its bound")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
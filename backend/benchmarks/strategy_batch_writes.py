@@ -0,0 +1,80 @@
+"""
+Strategy Batch Write Benchmark
+Times changing and deleting many strategies one request at a time
+(update_strategy/delete_strategy per ID, one commit each) against the
+set-based batch methods (one transaction):
+- per-ID patches: one executemany UPDATE
+- a selection: one UPDATE/DELETE ... WHERE ... RETURNING id
+
+The scratch database defaults to a temporary SQLite file, so the
+configured DATABASE_URL is never written to.
+
+Usage (from the backend directory):
+    python -m benchmarks.strategy_batch_writes
+    python -m benchmarks.strategy_batch_writes --rows 100000 --batch 5000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.schemas.strategy import StrategyPatch, StrategySelection, StrategyUpdate
+from app.services.strategy_service import StrategyService
+from benchmarks.strategy_pagination import seed
+
+
+def timed(fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare per-ID and batch strategy writes")
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--batch", type=int, default=1_000, help="Strategies per per-ID comparison")
+    parser.add_argument("--database-url", default=None, help="Scratch database (default: temporary SQLite file)")
+    args = parser.parse_args()
+
+    scratch = None
+    if args.database_url is None:
+        scratch = tempfile.NamedTemporaryFile(suffix=".db", delete=False).name
+        args.database_url = f"sqlite:///{scratch}"
+
+    engine = create_engine(args.database_url)
+    try:
+        seed(engine, args.rows)
+        with Session(engine) as db:
+            first_id = min(s.id for s in StrategyService.get_strategies(db, limit=1))
+            ids = list(range(first_id, first_id + args.batch))
+            more = list(range(first_id + args.batch, first_id + 2 * args.batch))
+            print(f"{args.rows:,} strategies, {args.batch:,} per batch")
+
+            single = timed(lambda: [
+                StrategyService.update_strategy(db, i, StrategyUpdate(notes=f"note {i}")) for i in ids
+            ])
+            patches = [StrategyPatch(id=i, notes=f"note {i}") for i in more]
+            batch = timed(lambda: StrategyService.update_strategies(db, patches=patches))
+            print(f"  update by ID: one by one {single:9.1f} ms   batch {batch:7.1f} ms   x{single / batch:.0f}")
+
+            everything = StrategySelection(strategy_types=["iron-condor"])
+            batch = timed(lambda: StrategyService.update_strategies(db, everything, StrategyUpdate(notes="repriced")))
+            print(f"  update all {args.rows:,} by selection: {batch:7.1f} ms")
+
+            single = timed(lambda: [StrategyService.delete_strategy(db, i) for i in ids])
+            batch = timed(lambda: StrategyService.delete_strategies(db, StrategySelection(ids=more)))
+            print(f"  delete by ID: one by one {single:9.1f} ms   batch {batch:7.1f} ms   x{single / batch:.0f}")
+
+            batch = timed(lambda: StrategyService.delete_strategies(db, StrategySelection(expiry_before="2026-02-01")))
+            print(f"  delete expired ({args.rows - 2 * args.batch:,}) by selection: {batch:7.1f} ms")
+    finally:
+        engine.dispose()
+        if scratch:
+            os.unlink(scratch)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Strategy Bulk Import Benchmark
+Times loading a book into a scratch database two ways:
+- per row: one create (INSERT + commit) per strategy, like repeated
+  POST /api/strategies calls
+- bulk: StrategyImportService on an NDJSON and a CSV body, batched
+  (executemany INSERT, or COPY on PostgreSQL)
+
+The scratch database defaults to a temporary SQLite file, so the
+configured DATABASE_URL is never written to.
+
+Usage (from the backend directory):
+    python -m benchmarks.strategy_bulk_import
+    python -m benchmarks.strategy_bulk_import --rows 100000 --database-url postgresql://...
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.database import Base, async_database_url
+from app.schemas.strategy import StrategyCreate
+from app.services.strategy_import import StrategyImportService
+from app.services.strategy_service import AsyncStrategyService
+from app.services.streaming import encode_records
+
+# Body bytes handed to the importer per chunk, like a request stream
+CHUNK_BYTES = 65536
+
+
+def _strategy(n: int) -> dict:
+    return {
+        "name": f"import-{n}",
+        "strategy_type": "iron-condor",
+        "entry_date": "2026-01-01",
+        "expiry_date": "2026-01-29",
+        "parameters": {"lotSize": 50, "netPremium": 100},
+        "custom_legs": [],
+        "notes": None,
+    }
+
+
+async def _chunks(body: bytes):
+    for lo in range(0, len(body), CHUNK_BYTES):
+        yield body[lo:lo + CHUNK_BYTES]
+
+
+async def run(database_url: str, rows: int, single_rows: int, batch_size: int) -> None:
+    engine = create_async_engine(async_database_url(database_url))
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    strategies = [_strategy(n) for n in range(rows)]
+
+    started = time.perf_counter()
+    async with sessions() as db:
+        for s in strategies[:single_rows]:
+            await AsyncStrategyService.create_strategy(db, StrategyCreate(**s))
+    per_row = single_rows / (time.perf_counter() - started)
+    print(f"  {'per row':>12}: {per_row:10,.0f} rows/s ({single_rows:,} rows)")
+
+    for fmt in ("ndjson", "csv"):
+        body = encode_records(strategies, fmt, header=True).encode()
+        async with sessions() as db:
+            report = await StrategyImportService.import_stream(db, _chunks(body), fmt, batch_size)
+        seconds = report["elapsed_ms"] / 1000
+        print(
+            f"  {'bulk ' + fmt:>12}: {report['inserted'] / seconds:10,.0f} rows/s "
+            f"({report['inserted']:,} rows in {seconds:.2f}s, x{report['inserted'] / seconds / per_row:.0f})"
+        )
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare per-row and bulk strategy imports")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--single-rows", type=int, default=2_000, help="Rows created one by one")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--database-url", default=None, help="Scratch database (default: temporary SQLite file)")
+    args = parser.parse_args()
+
+    scratch = None
+    if args.database_url is None:
+        scratch = tempfile.NamedTemporaryFile(suffix=".db", delete=False).name
+        args.database_url = f"sqlite:///{scratch}"
+
+    engine = create_engine(args.database_url)
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+    try:
+        print(f"{args.rows:,} strategies, batches of {args.batch_size:,}")
+        asyncio.run(run(args.database_url, args.rows, args.single_rows, args.batch_size))
+    finally:
+        if scratch:
+            os.unlink(scratch)
+
+
+if __name__ == "__main__":
+    main()
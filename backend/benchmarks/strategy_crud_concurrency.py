@@ -0,0 +1,118 @@
+"""
+Strategy CRUD Concurrency Benchmark
+Runs the same concurrent create/read/update/delete workload through both
+ways a request handler can reach the database, on one event loop:
+- blocking: StrategyService on a sync Session inside a coroutine (what
+  the strategy endpoints did before the async layer)
+- async: AsyncStrategyService on an AsyncSession
+
+Reports operations per second and the worst event-loop stall seen by a
+heartbeat task; a blocking handler stalls every other request on the
+worker for each database round trip. Differences grow with network
+latency, so run it against the real Postgres database for meaningful
+numbers (SQLite round trips are nearly free).
+
+Usage (from the backend directory):
+    python -m benchmarks.strategy_crud_concurrency
+    python -m benchmarks.strategy_crud_concurrency --concurrency 50 --requests 2000
+"""
+import argparse
+import asyncio
+import time
+
+from app.database import AsyncSessionLocal, SessionLocal, async_engine, init_db
+from app.schemas.strategy import StrategyCreate, StrategyUpdate
+from app.services.strategy_service import AsyncStrategyService, StrategyService
+
+# Operations per workload cycle: create, get, list, update, delete
+OPS_PER_CYCLE = 5
+
+HEARTBEAT_SECONDS = 0.001
+
+
+def _payload(n: int) -> StrategyCreate:
+    return StrategyCreate(
+        name=f"benchmark-{n}",
+        strategy_type="iron-condor",
+        entry_date="2026-01-01",
+        expiry_date="2026-01-29",
+        parameters={"lotSize": 50},
+    )
+
+
+async def blocking_cycle(n: int) -> None:
+    db = SessionLocal()
+    try:
+        created = StrategyService.create_strategy(db, _payload(n))
+        StrategyService.get_strategy_by_id(db, created.id)
+        StrategyService.get_strategies(db, limit=20)
+        StrategyService.update_strategy(db, created.id, StrategyUpdate(notes="updated"))
+        StrategyService.delete_strategy(db, created.id)
+    finally:
+        db.close()
+
+
+async def async_cycle(n: int) -> None:
+    async with AsyncSessionLocal() as db:
+        created = await AsyncStrategyService.create_strategy(db, _payload(n))
+        await AsyncStrategyService.get_strategy_by_id(db, created.id)
+        await AsyncStrategyService.get_strategies(db, limit=20)
+        await AsyncStrategyService.update_strategy(db, created.id, StrategyUpdate(notes="updated"))
+        await AsyncStrategyService.delete_strategy(db, created.id)
+
+
+async def run(cycle, cycles: int, concurrency: int) -> dict:
+    """Run `cycles` workload cycles, `concurrency` at a time, with a heartbeat."""
+    stalls = []
+    done = asyncio.Event()
+
+    async def heartbeat() -> None:
+        while not done.is_set():
+            before = time.perf_counter()
+            await asyncio.sleep(HEARTBEAT_SECONDS)
+            stalls.append(time.perf_counter() - before - HEARTBEAT_SECONDS)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited(n: int) -> None:
+        async with semaphore:
+            await cycle(n)
+
+    beat = asyncio.create_task(heartbeat())
+    started = time.perf_counter()
+    await asyncio.gather(*(limited(n) for n in range(cycles)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await beat
+
+    return {
+        "ops_per_second": cycles * OPS_PER_CYCLE / elapsed,
+        "max_stall_ms": max(stalls, default=0.0) * 1000,
+    }
+
+
+async def main_async(args) -> None:
+    modes = [("blocking", blocking_cycle), ("async", async_cycle)]
+    print(f"{args.requests:,} operations, concurrency {args.concurrency}")
+    for label, cycle in modes:
+        await run(cycle, min(10, args.requests), args.concurrency)   # warm the pools
+        result = await run(cycle, args.requests // OPS_PER_CYCLE, args.concurrency)
+        print(
+            f"  {label:>8}: {result['ops_per_second']:8.0f} ops/s   "
+            f"worst event-loop stall {result['max_stall_ms']:7.1f} ms"
+        )
+    await async_engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare blocking and async strategy CRUD")
+    parser.add_argument("--requests", type=int, default=1000, help="Total operations per mode")
+    parser.add_argument("--concurrency", type=int, default=20, help="Workload cycles in flight")
+    args = parser.parse_args()
+
+    init_db()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
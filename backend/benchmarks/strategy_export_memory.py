@@ -0,0 +1,90 @@
+"""
+Strategy Export Memory Check
+Seeds scratch databases with books of increasing size, then streams each
+one through the server-side-cursor export (with the per-row metrics
+summary) and the NDJSON serializer in a fresh process, and checks that
+peak RSS does not grow with the number of strategies.
+
+The scratch databases default to temporary SQLite files, so the
+configured DATABASE_URL is never written to.
+
+Exits with status 1 when the growth exceeds the ceiling.
+
+Usage (from the backend directory):
+    python -m benchmarks.strategy_export_memory
+    python -m benchmarks.strategy_export_memory --sizes 10000 100000 1000000
+"""
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from sqlalchemy import create_engine
+
+from benchmarks.strategy_pagination import seed
+
+# Allowed peak-RSS growth between the smallest and the largest book
+MEMORY_CEILING_MIB = 32
+
+
+def export_book(database_url: str) -> None:
+    """Child process: export one book and print bytes, seconds and peak RSS (KiB)."""
+    from sqlalchemy.orm import Session
+
+    from app.services.payoff_calculator import PayoffCalculatorService
+    from app.services.strategy_service import StrategyService
+    from app.services.streaming import encode_records
+
+    engine = create_engine(database_url)
+    started = time.perf_counter()
+    size = 0
+    with Session(engine) as db:
+        for batch in StrategyService.iter_strategy_batches(db):
+            summaries = PayoffCalculatorService.summarize_strategies(batch, underlying_price=18000)
+            size += len(encode_records([{**row, **s} for row, s in zip(batch, summaries)], "ndjson"))
+    elapsed = time.perf_counter() - started
+    engine.dispose()
+    print(size, elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check strategy export memory")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 300_000])
+    parser.add_argument("--child", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        export_book(args.child)
+        return
+
+    peaks = []
+    for rows in sorted(args.sizes):
+        scratch = tempfile.NamedTemporaryFile(suffix=".db", delete=False).name
+        try:
+            engine = create_engine(f"sqlite:///{scratch}")
+            seed(engine, rows)
+            engine.dispose()
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.strategy_export_memory", "--child", f"sqlite:///{scratch}"],
+                check=True, capture_output=True, text=True
+            ).stdout.split()
+        finally:
+            os.unlink(scratch)
+        size, elapsed, peak_kib = int(output[0]), float(output[1]), int(output[2])
+        peaks.append(peak_kib / 1024)
+        print(
+            f"{rows:>12,} strategies: {size / 2**20:8.1f} MiB streamed in {elapsed:6.2f}s, "
+            f"peak RSS {peaks[-1]:7.1f} MiB"
+        )
+
+    growth = peaks[-1] - peaks[0]
+    ok = growth <= MEMORY_CEILING_MIB
+    print(f"{'✅' if ok else '❌'} Peak RSS growth {growth:.1f} MiB (ceiling {MEMORY_CEILING_MIB} MiB)")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Strategy Filter Plan Check
+Seeds a scratch database with a varied book (several strategy types,
+weekly expiries over two years, prefixed names), then prints the query
+plan and page time of each listing filter and checks that every filtered
+query reads an index instead of scanning the table.
+
+Plans are read with EXPLAIN QUERY PLAN on SQLite and EXPLAIN on
+PostgreSQL. The scratch database defaults to a temporary SQLite file, so
+the configured DATABASE_URL is never written to; pass a scratch
+PostgreSQL database to check the production plans.
+
+Exits with status 1 when a filter falls back to a table scan.
+
+Usage (from the backend directory):
+    python -m benchmarks.strategy_filter_plans
+    python -m benchmarks.strategy_filter_plans --rows 1000000 --database-url postgresql://...
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import Session
+
+from app.database import Base
+from app.models.strategy import Strategy
+from app.schemas.strategy import StrategySelection
+from app.services.strategy_service import SUMMARY_FIELDS, StrategyService, _page_statement
+
+TYPES = [
+    "covered-call", "bull-call-spread", "iron-condor", "long-straddle",
+    "protective-put", "butterfly-spread", "custom-strategy",
+]
+
+FIRST_EXPIRY = date(2026, 1, 1)
+WEEKS = 104
+
+FILTERS = [
+    ("type + expiry range", StrategySelection(
+        strategy_types=["iron-condor"], expiry_from=date(2026, 6, 1), expiry_to=date(2026, 6, 30))),
+    ("expiring this week", StrategySelection(
+        expiry_from=date(2026, 3, 2), expiry_to=date(2026, 3, 8))),
+    ("name prefix", StrategySelection(name_prefix="iron-condor-12")),
+]
+
+
+def seed(engine, rows: int) -> None:
+    Base.metadata.create_all(bind=engine)
+    batch_size = 10_000
+    with engine.begin() as conn:
+        for lo in range(0, rows, batch_size):
+            conn.execute(insert(Strategy), [
+                {
+                    "name": f"{TYPES[n % len(TYPES)]}-{n}",
+                    "strategy_type": TYPES[n % len(TYPES)],
+                    "entry_date": FIRST_EXPIRY,
+                    "expiry_date": FIRST_EXPIRY + timedelta(weeks=(n // len(TYPES)) % WEEKS),
+                    "parameters": {"lotSize": 50},
+                    "custom_legs": [],
+                }
+                for n in range(lo, min(rows, lo + batch_size))
+            ])
+        conn.execute(text("ANALYZE"))
+
+
+def query_plan(db: Session, statement) -> list:
+    compiled = statement.compile(dialect=db.bind.dialect, compile_kwargs={"literal_binds": True})
+    if db.bind.dialect.name == "sqlite":
+        return [row[-1] for row in db.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))]
+    return [row[0] for row in db.execute(text(f"EXPLAIN {compiled}"))]
+
+
+def uses_index(plan: list) -> bool:
+    lines = " ".join(plan)
+    return "USING INDEX" in lines or "USING COVERING INDEX" in lines or "Index" in lines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check that listing filters use indexes")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--database-url", default=None, help="Scratch database (default: temporary SQLite file)")
+    args = parser.parse_args()
+
+    scratch = None
+    if args.database_url is None:
+        scratch = tempfile.NamedTemporaryFile(suffix=".db", delete=False).name
+        args.database_url = f"sqlite:///{scratch}"
+
+    engine = create_engine(args.database_url)
+    failures = []
+    try:
+        seed(engine, args.rows)
+        print(f"{args.rows:,} strategies")
+        with Session(engine) as db:
+            for label, selection in FILTERS:
+                statement = _page_statement(list(SUMMARY_FIELDS), 100, None, "asc", selection=selection)
+                plan = query_plan(db, statement)
+                started = time.perf_counter()
+                page, _ = StrategyService.get_strategies_page(db, 100, selection=selection)
+                elapsed = (time.perf_counter() - started) * 1000
+                ok = uses_index(plan)
+                if not ok:
+                    failures.append(label)
+                print(f"{'✅' if ok else '❌'} {label}: {len(page)} rows in {elapsed:.2f} ms")
+                for line in plan:
+                    print(f"     {line}")
+    finally:
+        engine.dispose()
+        if scratch:
+            os.unlink(scratch)
+
+    if failures:
+        print(f"Table scans: {', '.join(failures)}")
+    raise SystemExit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
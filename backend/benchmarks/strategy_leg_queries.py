@@ -0,0 +1,150 @@
+"""
+Strategy Leg Query Check
+Seeds a scratch database with a mixed book (spreads and condors with set
+strikes, custom strategies with their own leg expiries), fills
+strategy_legs with backfill_legs (as the legs migration does), then for each leg
+query prints its plan and page time and checks that it reads an index.
+
+For comparison, the first question ("who is short the 18500 CE?") is
+also answered the way the JSON columns allow: read every strategy and
+derive its legs in Python.
+
+Plans are read with EXPLAIN QUERY PLAN on SQLite and EXPLAIN on
+PostgreSQL. The scratch database defaults to a temporary SQLite file, so
+the configured DATABASE_URL is never written to.
+
+Exits with status 1 when a leg query falls back to a table scan.
+
+Usage (from the backend directory):
+    python -m benchmarks.strategy_leg_queries
+    python -m benchmarks.strategy_leg_queries --rows 1000000 --database-url postgresql://...
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine, insert, select, text
+from sqlalchemy.orm import Session
+
+from app.database import Base
+from app.models.strategy import Strategy
+from app.schemas.strategy import StrategyLegQuery
+from app.services.strategy_legs import LEG_SOURCE_COLUMNS, backfill_legs, leg_page_statement, leg_records
+from app.services.strategy_service import StrategyService
+from benchmarks.strategy_filter_plans import query_plan, uses_index
+
+FIRST_EXPIRY = date(2026, 1, 1)
+WEEKS = 52
+STRIKES = [17000 + 100 * i for i in range(31)]
+
+QUERIES = [
+    ("short 18500 CE", StrategyLegQuery(leg_type="CE", action="SELL", strike_min=18500, strike_max=18500)),
+    ("long puts 17000-17500", StrategyLegQuery(leg_type="PE", action="BUY", strike_min=17000, strike_max=17500)),
+    ("legs expiring this week", StrategyLegQuery(expiry_from=date(2026, 3, 2), expiry_to=date(2026, 3, 8))),
+    ("short CE 18500+ this month", StrategyLegQuery(
+        leg_type="CE", action="SELL", strike_min=18500,
+        expiry_from=date(2026, 3, 1), expiry_to=date(2026, 3, 31))),
+]
+
+
+def _strategy(n: int) -> dict:
+    strike = STRIKES[n % len(STRIKES)]
+    expiry = FIRST_EXPIRY + timedelta(weeks=n % WEEKS)
+    kind = n % 3
+    if kind == 0:
+        strategy_type, parameters, custom_legs = "bull-call-spread", {
+            "lotSize": 50, "longCallStrike": strike, "shortCallStrike": strike + 500,
+        }, []
+    elif kind == 1:
+        strategy_type, parameters, custom_legs = "iron-condor", {
+            "lotSize": 50, "putBuyStrike": strike - 1000, "putSellStrike": strike - 500,
+            "callSellStrike": strike + 500, "callBuyStrike": strike + 1000,
+        }, []
+    else:
+        strategy_type, parameters, custom_legs = "custom-strategy", {}, [
+            {"type": "CE", "action": "SELL", "strike": strike, "lotSize": 50, "premium": 120},
+            {"type": "CE", "action": "BUY", "strike": strike, "lotSize": 50, "premium": 180,
+             "expiry": (expiry + timedelta(weeks=4)).isoformat()},
+        ]
+    return {
+        "name": f"{strategy_type}-{n}",
+        "strategy_type": strategy_type,
+        "entry_date": FIRST_EXPIRY,
+        "expiry_date": expiry,
+        "parameters": parameters,
+        "custom_legs": custom_legs,
+    }
+
+
+def seed(engine, rows: int) -> int:
+    """Insert a book and derive its legs; returns the number of leg rows."""
+    Base.metadata.create_all(bind=engine)
+    batch_size = 10_000
+    with engine.begin() as conn:
+        for lo in range(0, rows, batch_size):
+            conn.execute(insert(Strategy), [_strategy(n) for n in range(lo, min(rows, lo + batch_size))])
+        legs = backfill_legs(conn)
+        conn.execute(text("ANALYZE"))
+    return legs
+
+
+def json_scan(db: Session, query: StrategyLegQuery) -> int:
+    """Matching legs found by reading every strategy's JSON and deriving its legs."""
+    found = 0
+    for source in db.execute(select(*LEG_SOURCE_COLUMNS).execution_options(yield_per=10_000)):
+        for leg in leg_records(source):
+            found += (
+                leg["leg_type"] == query.leg_type and leg["action"] == query.action
+                and leg["strike"] is not None and query.strike_min <= leg["strike"] <= query.strike_max
+            )
+    return found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check that leg queries use indexes")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--database-url", default=None, help="Scratch database (default: temporary SQLite file)")
+    args = parser.parse_args()
+
+    scratch = None
+    if args.database_url is None:
+        scratch = tempfile.NamedTemporaryFile(suffix=".db", delete=False).name
+        args.database_url = f"sqlite:///{scratch}"
+
+    engine = create_engine(args.database_url)
+    failures = []
+    try:
+        started = time.perf_counter()
+        legs = seed(engine, args.rows)
+        print(f"{args.rows:,} strategies, {legs:,} legs (seeded and backfilled in {time.perf_counter() - started:.1f}s)")
+        with Session(engine) as db:
+            for label, query in QUERIES:
+                plan = query_plan(db, leg_page_statement(query, 100))
+                started = time.perf_counter()
+                page, _ = StrategyService.get_legs_page(db, query, 100)
+                elapsed = (time.perf_counter() - started) * 1000
+                ok = uses_index(plan)
+                if not ok:
+                    failures.append(label)
+                print(f"{'✅' if ok else '❌'} {label}: {len(page)} legs in {elapsed:.2f} ms")
+                for line in plan:
+                    print(f"     {line}")
+
+            label, query = QUERIES[0]
+            started = time.perf_counter()
+            found = json_scan(db, query)
+            print(f"   {label} from the JSON columns: {found:,} legs in {(time.perf_counter() - started) * 1000:.0f} ms")
+    finally:
+        engine.dispose()
+        if scratch:
+            os.unlink(scratch)
+
+    if failures:
+        print(f"Table scans: {', '.join(failures)}")
+    raise SystemExit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
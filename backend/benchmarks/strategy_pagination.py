@@ -0,0 +1,97 @@
+"""
+Strategy Pagination Benchmark
+Seeds a scratch database with strategies and times fetching one page at
+increasing depths, with OFFSET paging and with keyset (cursor) paging.
+OFFSET time grows with the depth; keyset time should stay flat. It then
+compares a page of full ORM objects serialized with to_dict() against the
+summary projection the listing endpoint returns by default.
+
+The scratch database defaults to a temporary SQLite file, so the
+configured DATABASE_URL is never written to.
+
+Usage (from the backend directory):
+    python -m benchmarks.strategy_pagination
+    python -m benchmarks.strategy_pagination --rows 1000000 --database-url postgresql://...
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import date
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from app.database import Base
+from app.models.strategy import Strategy
+from app.services.pagination import encode_cursor
+from app.services.strategy_service import STRATEGY_FIELDS, StrategyService
+
+
+def seed(engine, rows: int) -> None:
+    Base.metadata.create_all(bind=engine)
+    batch = [
+        {
+            "name": f"strategy-{n}",
+            "strategy_type": "iron-condor",
+            "entry_date": date(2026, 1, 1),
+            "expiry_date": date(2026, 1, 29),
+            "parameters": {"lotSize": 50},
+            "custom_legs": [],
+        }
+        for n in range(10_000)
+    ]
+    with engine.begin() as conn:
+        for lo in range(0, rows, len(batch)):
+            conn.execute(insert(Strategy), batch[:min(len(batch), rows - lo)])
+
+
+def best_of(fn, repeats: int = 5) -> float:
+    times = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    return min(times) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare OFFSET and keyset paging")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--database-url", default=None, help="Scratch database (default: temporary SQLite file)")
+    args = parser.parse_args()
+
+    scratch = None
+    if args.database_url is None:
+        scratch = tempfile.NamedTemporaryFile(suffix=".db", delete=False).name
+        args.database_url = f"sqlite:///{scratch}"
+
+    engine = create_engine(args.database_url)
+    try:
+        seed(engine, args.rows)
+        with Session(engine) as db:
+            first_id = min(s.id for s in StrategyService.get_strategies(db, limit=1))
+            print(f"{args.rows:,} strategies, pages of {args.limit}")
+            for depth in (0, args.rows // 100, args.rows // 10, args.rows // 2, args.rows - args.limit):
+                # Cursor of the page that ends just before `depth`
+                cursor = encode_cursor({"id": first_id + depth - 1, "order": "asc"}) if depth else None
+                offset_ms = best_of(lambda: StrategyService.get_strategies(db, skip=depth, limit=args.limit))
+                keyset_ms = best_of(lambda: StrategyService.get_strategies_page(db, args.limit, cursor))
+                print(f"  depth {depth:>9,}: offset {offset_ms:8.2f} ms   keyset {keyset_ms:6.2f} ms")
+
+            size = 1000
+            print(f"Page of {size:,}")
+            orm_ms = best_of(lambda: [s.to_dict() for s in StrategyService.get_strategies(db, limit=size)])
+            db.expunge_all()
+            full_ms = best_of(lambda: StrategyService.get_strategies_page(db, size, fields=list(STRATEGY_FIELDS)))
+            summary_ms = best_of(lambda: StrategyService.get_strategies_page(db, size))
+            print(f"  ORM + to_dict {orm_ms:6.2f} ms   all columns {full_ms:6.2f} ms   summary {summary_ms:6.2f} ms")
+    finally:
+        engine.dispose()
+        if scratch:
+            os.unlink(scratch)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Strategy Search Benchmark
+Seeds a scratch database with a book of strategies whose names and notes
+are drawn from a trading vocabulary, then times the first page and a
+deep page of several searches:
+- index: StrategyService.search_strategies (FTS5 on SQLite, the GIN
+  tsvector index on PostgreSQL), ranked
+- scan: the same words matched with LIKE over name and notes, the
+  fallback used on backends without a full-text index
+
+Latencies are medians over --repeat runs. The scratch database defaults
+to a temporary SQLite file, so the configured DATABASE_URL is never
+written to.
+
+Usage (from the backend directory):
+    python -m benchmarks.strategy_search
+    python -m benchmarks.strategy_search --rows 100000 --database-url postgresql://...
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import Session
+
+from app.database import Base
+from app.models.strategy import Strategy
+from app.services.strategy_search import search_statement
+from app.services.strategy_service import SUMMARY_FIELDS, StrategyService
+
+UNDERLYINGS = ["nifty", "banknifty", "finnifty", "reliance", "infosys", "hdfcbank", "tcs", "sbin"]
+TYPES = {
+    "iron-condor": "iron condor",
+    "bull-call-spread": "bull call spread",
+    "long-straddle": "long straddle",
+    "covered-call": "covered call",
+    "butterfly-spread": "butterfly",
+}
+NOTE_WORDS = [
+    "weekly", "monthly", "hedge", "earnings", "adjustment", "rollover", "gamma", "theta",
+    "scalp", "wings", "skew", "expiry", "event", "budget", "policy", "breakout", "range",
+    "premium", "decay", "volatility", "crush", "defensive", "income", "trend", "reversal",
+]
+
+# One strategy in this many mentions it in its notes
+RARE_WORD, RARE_EVERY = "blackswan", 10_000
+
+SEARCHES = [
+    ("common word", "nifty"),
+    ("two words", "banknifty condor"),
+    ("notes words", "budget hedge"),
+    ("prefix", "theta scal"),
+    ("rare word", RARE_WORD),
+]
+
+
+def seed(engine, rows: int, random_seed: int = 7) -> None:
+    Base.metadata.create_all(bind=engine)
+    rng = random.Random(random_seed)
+    types = list(TYPES)
+    batch_size = 10_000
+    with engine.begin() as conn:
+        for lo in range(0, rows, batch_size):
+            batch = []
+            for n in range(lo, min(rows, lo + batch_size)):
+                strategy_type = types[n % len(types)]
+                notes = None
+                if n % 5:
+                    words = rng.sample(NOTE_WORDS, rng.randint(4, 10))
+                    if n % RARE_EVERY == 1:
+                        words.append(RARE_WORD)
+                    notes = " ".join(words)
+                batch.append({
+                    "name": f"{rng.choice(UNDERLYINGS)} {TYPES[strategy_type]} {n}",
+                    "strategy_type": strategy_type,
+                    "entry_date": date(2026, 1, 1),
+                    "expiry_date": date(2026, 1, 1) + timedelta(weeks=n % 52),
+                    "parameters": {"lotSize": 50},
+                    "custom_legs": [],
+                    "notes": notes,
+                })
+            conn.execute(insert(Strategy), batch)
+        conn.execute(text("ANALYZE"))
+
+
+def median_ms(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - started) * 1000)
+    return statistics.median(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time full-text strategy search against a LIKE scan")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=20, help="Matches per page")
+    parser.add_argument("--deep-page", type=int, default=50, help="Page number of the deep-page timing")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--database-url", default=None, help="Scratch database (default: temporary SQLite file)")
+    args = parser.parse_args()
+
+    scratch = None
+    if args.database_url is None:
+        scratch = tempfile.NamedTemporaryFile(suffix=".db", delete=False).name
+        args.database_url = f"sqlite:///{scratch}"
+
+    engine = create_engine(args.database_url)
+    try:
+        started = time.perf_counter()
+        seed(engine, args.rows)
+        print(f"{args.rows:,} strategies seeded and indexed in {time.perf_counter() - started:.1f}s")
+        fields = list(SUMMARY_FIELDS)
+        with Session(engine) as db:
+            for label, q in SEARCHES:
+                page, cursor = StrategyService.search_strategies(db, q, limit=args.limit)
+                first = median_ms(lambda: StrategyService.search_strategies(db, q, limit=args.limit), args.repeat)
+
+                deep_offset = (args.deep_page - 1) * args.limit
+                deep, _, _ = search_statement(db.get_bind().dialect.name, q, fields, args.limit)
+                deep = deep.offset(deep_offset)
+                deep_ms = median_ms(lambda: db.execute(deep).all(), args.repeat)
+
+                scan, _, _ = search_statement("default", q, fields, args.limit)
+                scan_ms = median_ms(lambda: db.execute(scan).all(), args.repeat)
+
+                print(
+                    f"  {label:>12} {q!r:>20}: index {first:8.2f} ms   page {args.deep_page} {deep_ms:8.2f} ms"
+                    f"   scan {scan_ms:8.2f} ms   ({len(page)} shown"
+                    f"{', more' if cursor else ''}; top: {page[0]['name'] if page else '-'})"
+                )
+    finally:
+        engine.dispose()
+        if scratch:
+            os.unlink(scratch)
+
+
+if __name__ == "__main__":
+    main()
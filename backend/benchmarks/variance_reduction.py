@@ -0,0 +1,61 @@
+"""
+Variance Reduction Benchmark
+Runs the same simulation with each sampling configuration and reports the
+standard error, the variance reduction against plain Monte Carlo (how many
+times fewer paths reach the same precision) and the run time.
+
+Usage (from the backend directory):
+    python -m benchmarks.variance_reduction
+    python -m benchmarks.variance_reduction --model heston --paths 65536
+"""
+import argparse
+import time
+
+from app.services.simulation import SIMULATION_MODELS, SimulationService
+
+CONFIGS = [
+    ("plain", {}),
+    ("antithetic", {"antithetic": True}),
+    ("control variate", {"control_variate": True}),
+    ("antithetic + cv", {"antithetic": True, "control_variate": True}),
+    ("sobol", {"sampling": "sobol"}),
+    ("sobol + cv", {"sampling": "sobol", "control_variate": True}),
+]
+
+STRATEGIES = [
+    {"strategy_type": "iron-condor", "expiry_date": "2026-03-26", "parameters": {}},
+    {"strategy_type": "covered-call", "expiry_date": "2026-03-26", "parameters": {}},
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare variance reduction settings")
+    parser.add_argument("--model", choices=SIMULATION_MODELS, default=None, help="Model (default: all)")
+    parser.add_argument("--paths", type=int, default=131072)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    for model in [args.model] if args.model else SIMULATION_MODELS:
+        print(f"\n{model}: {args.paths:,} paths, iron condor + covered call")
+        baseline = None
+        for label, options in CONFIGS:
+            started = time.perf_counter()
+            result = SimulationService.run(
+                STRATEGIES, underlying_price=18000, model=model, num_paths=args.paths,
+                volatility=0.15, valuation_date="2026-02-19", rate=0.06, seed=args.seed, **options
+            )
+            elapsed = time.perf_counter() - started
+            errors = result["standard_error"]
+            if baseline is None:
+                baseline = errors
+            pnl_gain = (baseline["expected_pnl"] / errors["expected_pnl"]) ** 2
+            pop_gain = (baseline["probability_of_profit"] / errors["probability_of_profit"]) ** 2
+            print(
+                f"  {label:>16}: E[P&L] {result['expected_pnl']:>10.2f} ± {errors['expected_pnl']:<8.2f} "
+                f"(x{pnl_gain:7.1f})  POP {result['probability_of_profit']:.4f} "
+                f"± {errors['probability_of_profit']:.5f} (x{pop_gain:7.1f})  {elapsed * 1000:7.0f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
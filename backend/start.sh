@@ -1,8 +1,13 @@
 #!/bin/bash
-# Startup script for Railway deployment
+# Startup script for Railway / Docker deployment
+set -e
 
 echo "🚀 Starting Options Strategy Builder API..."
 
+# Bring existing tables up to the current schema before serving.
+# Missing tables are created afterwards by init_db() in main.py.
+echo "🗄️  Applying database migrations..."
+alembic upgrade head
+
 # Start the FastAPI application
-# Database tables will be created automatically via init_db() in main.py
 exec uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-8000}
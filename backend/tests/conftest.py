@@ -0,0 +1,155 @@
+"""
+Shared test fixtures.
+
+Each test run gets its own scratch directory holding a SQLite database and
+empty option-chain, chain-store and price-history folders. The environment
+is set here, before the app is imported, so the DATABASE_URL in .env is
+never connected to.
+"""
+import csv
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pytest
+
+_SCRATCH = tempfile.mkdtemp(prefix="options-strategy-tests-")
+_FOLDERS = {
+    "OPTION_CHAIN_DIR": "option_chains",
+    "OPTION_CHAIN_STORE_DIR": "option_chain_store",
+    "PRICE_HISTORY_DIR": "price_history",
+}
+os.environ.update({
+    "DATABASE_URL": f"sqlite:///{os.path.join(_SCRATCH, 'test.db')}",
+    "FRONTEND_URL": "http://localhost:5173",
+    "SECRET_KEY": "test",
+    "ENVIRONMENT": "test",
+    "DEBUG": "False",
+    **{name: os.path.join(_SCRATCH, folder) for name, folder in _FOLDERS.items()},
+})
+for folder in _FOLDERS.values():
+    os.makedirs(os.path.join(_SCRATCH, folder))
+
+# Synthetic NIFTY snapshot: 100-point strikes around an 18000 spot
+CHAIN_EXPIRY = "2026-11-26"
+CHAIN_SPOT = 18000.0
+CHAIN_STRIKES = np.arange(16000, 20001, 100, dtype=float)
+VALUATION_DATE = "2026-10-18"
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(_SCRATCH, ignore_errors=True)
+
+
+def write_chain(
+    file_name: str,
+    strikes=CHAIN_STRIKES,
+    expiries=(CHAIN_EXPIRY,),
+    spot: float = CHAIN_SPOT,
+    volatility: float = 0.15,
+    underlying: str = "NIFTY"
+) -> str:
+    """
+    Write an option-chain CSV into OPTION_CHAIN_DIR, quoted 2% either side
+    of the Black-Scholes price, and return its file name.
+    """
+    from app.services.pricing import black_scholes_price
+
+    path = os.path.join(os.environ["OPTION_CHAIN_DIR"], file_name)
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["underlying", "expiry", "strike", "option_type", "bid", "ask", "ltp", "iv", "underlying_price"])
+        for expiry in expiries:
+            years = (np.datetime64(expiry) - np.datetime64(VALUATION_DATE)).astype(int) / 365.0
+            for option_type in ("CE", "PE"):
+                prices = black_scholes_price(spot, strikes, years, volatility, 0.0, option_type == "CE")
+                for strike, price in zip(strikes, prices):
+                    writer.writerow([
+                        underlying, expiry, f"{strike:g}", option_type,
+                        f"{price * 0.98:.2f}", f"{price * 1.02:.2f}", f"{price:.2f}", volatility, spot,
+                    ])
+    return file_name
+
+
+@pytest.fixture
+def chain_file(request) -> str:
+    """A synthetic single-expiry chain named after the test."""
+    return write_chain(f"{request.node.name}.csv")
+
+
+@pytest.fixture
+def db_engine():
+    """The app's engine over freshly created tables."""
+    from app.database import Base, engine, init_db
+
+    init_db()
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(db_engine):
+    """A synchronous session over freshly created tables."""
+    from app.database import SessionLocal
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client(db_engine):
+    """API client over freshly created tables."""
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def statements(db_engine):
+    """
+    SQL statements sent on the app's engine while the test runs, as
+    (first keyword, executemany) pairs. Commits are not recorded.
+    """
+    from sqlalchemy import event
+
+    sent = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        sent.append((statement.split()[0].upper(), executemany))
+
+    event.listen(db_engine, "before_cursor_execute", record)
+    yield sent
+    event.remove(db_engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def save_book(db):
+    """
+    Save strategies through StrategyService and return {name: id} in order.
+
+    Each strategy is a dict of StrategyCreate fields over the keyword
+    defaults; the type defaults to iron-condor and the dates to
+    VALUATION_DATE and CHAIN_EXPIRY.
+    """
+    from app.schemas.strategy import StrategyCreate
+    from app.services.strategy_service import StrategyService
+
+    def save(strategies, **defaults):
+        defaults = {
+            "strategy_type": "iron-condor", "entry_date": VALUATION_DATE, "expiry_date": CHAIN_EXPIRY,
+            **defaults,
+        }
+        return {
+            strategy["name"]: StrategyService.create_strategy(db, StrategyCreate(**{**defaults, **strategy})).id
+            for strategy in strategies
+        }
+
+    return save
@@ -0,0 +1,111 @@
+"""Vectorized backtester: P&L, exit rules and batching."""
+import os
+
+import numpy as np
+import pytest
+
+from app.services.backtester import BacktestService
+
+# 30 daily bars: up 10 a day for 10 days, then down 20 a day
+CLOSES = [18000 + 10 * i for i in range(10)] + [18090 - 20 * i for i in range(1, 21)]
+DATES = [str(np.datetime64("2026-01-01") + i) for i in range(len(CLOSES))]
+
+
+@pytest.fixture
+def history_file(request):
+    name = f"{request.node.name}.csv"
+    with open(os.path.join(os.environ["PRICE_HISTORY_DIR"], name), "w") as f:
+        f.write("date,close\n")
+        for day, close in zip(DATES, CLOSES):
+            f.write(f"{day},{close}\n")
+    return name
+
+
+def _long_futures(name="long", entry_date="2026-01-01", expiry_date="2026-12-31", lots=50):
+    return {
+        "name": name,
+        "strategy_type": "custom-strategy",
+        "entry_date": entry_date,
+        "expiry_date": expiry_date,
+        "parameters": {},
+        "custom_legs": [{"type": "FUT", "action": "BUY", "lotSize": lots}],
+    }
+
+
+def test_futures_pnl_follows_the_close(history_file):
+    result = BacktestService.run([_long_futures()], history_file, include_equity_curves=True)
+
+    strategy = result["results"][0]
+    assert strategy["exit_reason"] == "end_of_data"
+    assert strategy["final_pnl"] == pytest.approx((CLOSES[-1] - CLOSES[0]) * 50)
+    assert strategy["max_pnl"] == pytest.approx((max(CLOSES) - CLOSES[0]) * 50)
+    assert strategy["equity_curve"] == pytest.approx([(c - CLOSES[0]) * 50 for c in CLOSES])
+    assert strategy["max_drawdown"] == pytest.approx((max(CLOSES) - CLOSES[-1]) * 50)
+
+
+def test_exit_rules_fire_on_the_first_triggering_bar(history_file):
+    result = BacktestService.run(
+        [_long_futures("stopped"), _long_futures("expired", expiry_date=DATES[5])],
+        history_file, stop_loss=2000,
+    )
+
+    stopped, expired = result["results"]
+    # P&L first falls to -2000 or below at the 17950 close (-2500)
+    assert stopped["exit_reason"] == "stop_loss"
+    assert stopped["exit_date"].startswith(DATES[CLOSES.index(17950)])
+    assert stopped["final_pnl"] == pytest.approx(-2500)
+    assert expired["exit_reason"] == "expiry"
+    assert expired["exit_date"].startswith(DATES[5])
+
+
+def test_profit_target_and_time_stop(history_file):
+    result = BacktestService.run(
+        [_long_futures()], history_file, profit_target=2500,
+    )
+    assert result["results"][0]["exit_reason"] == "profit_target"
+    assert result["results"][0]["final_pnl"] == pytest.approx(2500)
+
+    result = BacktestService.run([_long_futures()], history_file, max_days_held=3)
+    assert result["results"][0]["exit_reason"] == "time_stop"
+    assert result["results"][0]["bars_held"] == 3
+
+
+def test_batched_variants_match_individual_runs(history_file):
+    variants = [
+        {
+            "name": f"condor {width}",
+            "strategy_type": "iron-condor",
+            "entry_date": DATES[2],
+            "expiry_date": "2026-02-26",
+            "parameters": {
+                "lotSize": 50, "netPremium": 80,
+                "putBuyStrike": 18000 - width, "putSellStrike": 17900,
+                "callSellStrike": 18100, "callBuyStrike": 18000 + width,
+            },
+            "custom_legs": [],
+        }
+        for width in (300, 400, 500)
+    ] + [_long_futures(entry_date=DATES[4])]
+
+    together = BacktestService.run(variants, history_file, volatility=0.15)
+    alone = [BacktestService.run([v], history_file, volatility=0.15)["results"][0] for v in variants]
+
+    for batched, single in zip(together["results"], alone):
+        assert batched["final_pnl"] == pytest.approx(single["final_pnl"])
+        assert batched["max_drawdown"] == pytest.approx(single["max_drawdown"])
+    assert together["summary"]["total_pnl"] == pytest.approx(sum(r["final_pnl"] for r in alone), abs=0.05)
+
+
+def test_entry_after_history_is_skipped(history_file):
+    result = BacktestService.run(
+        [_long_futures(), _long_futures("late", entry_date="2027-01-01")], history_file
+    )
+
+    assert result["results"][1]["status"] == "skipped"
+    assert result["summary"]["completed"] == 1
+
+
+def test_unknown_saved_strategy_is_not_found(client, history_file):
+    response = client.post("/api/backtest/run", json={"history_file": history_file, "strategy_ids": [999]})
+
+    assert response.status_code == 404
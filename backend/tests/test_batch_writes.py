@@ -0,0 +1,112 @@
+"""Set-based batch updates and deletes."""
+import pytest
+from sqlalchemy import select
+
+from app.models.strategy_leg import StrategyLeg
+from app.schemas.strategy import StrategyPatch, StrategySelection, StrategyUpdate
+from app.services.strategy_service import StrategyService
+
+from .conftest import VALUATION_DATE
+
+BOOK = [
+    ("Condor Nov", "iron-condor", "2026-11-26"),
+    ("Condor Dec", "iron-condor", "2026-12-31"),
+    ("Spread Nov", "bull-call-spread", "2026-11-26"),
+    ("Expired", "bull-call-spread", "2026-09-24"),
+]
+
+
+@pytest.fixture
+def ids(save_book):
+    book = save_book(
+        [{"name": name, "strategy_type": strategy_type, "expiry_date": expiry} for name, strategy_type, expiry in BOOK],
+        entry_date="2026-09-01",
+    )
+    return list(book.values())
+
+
+def _notes(db):
+    return {s.name: s.notes for s in StrategyService.get_strategies(db)}
+
+
+def test_selection_update_is_one_statement(db, ids, statements):
+    result = StrategyService.update_strategies(
+        db, StrategySelection(strategy_types=["iron-condor"], expiry_to="2026-12-01"), StrategyUpdate(notes="rolled")
+    )
+
+    assert result == {"count": 1, "ids": [ids[0]]}
+    assert statements == [("UPDATE", False)]
+    assert _notes(db) == {"Condor Nov": "rolled", "Condor Dec": None, "Spread Nov": None, "Expired": None}
+
+
+def test_requested_ids_that_do_not_match_are_reported(db, ids):
+    result = StrategyService.update_strategies(
+        db, StrategySelection(ids=[ids[0], ids[2], 999], strategy_types=["iron-condor"]), StrategyUpdate(notes="x")
+    )
+
+    assert result == {"count": 1, "ids": [ids[0]], "unmatched_ids": [ids[2], 999]}
+
+
+def test_patches_group_into_one_executemany_per_field_set(db, ids, statements):
+    patches = [
+        StrategyPatch(id=ids[0], notes="a"),
+        StrategyPatch(id=ids[1], notes="b"),
+        StrategyPatch(id=ids[2], name="Spread", notes="c"),
+        StrategyPatch(id=999, notes="missing"),
+    ]
+
+    result = StrategyService.update_strategies(db, patches=patches)
+
+    assert result == {"count": 3, "ids": ids[:3], "unmatched_ids": [999]}
+    assert statements == [("SELECT", False), ("UPDATE", True), ("UPDATE", False)]
+    assert _notes(db) == {"Condor Nov": "a", "Condor Dec": "b", "Spread": "c", "Expired": None}
+
+
+def test_leg_changes_rewrite_the_legs_of_updated_strategies(db, ids):
+    StrategyService.update_strategies(
+        db, StrategySelection(strategy_types=["iron-condor"]), StrategyUpdate(expiry_date="2027-01-28")
+    )
+    StrategyService.update_strategies(db, patches=[StrategyPatch(id=ids[2], parameters={"longCallStrike": 17900})])
+
+    legs = db.execute(select(StrategyLeg.strategy_id, StrategyLeg.expiry, StrategyLeg.strike)).all()
+    assert {str(expiry) for strategy_id, expiry, _ in legs if strategy_id in ids[:2]} == {"2027-01-28"}
+    assert 17900 in {strike for strategy_id, _, strike in legs if strategy_id == ids[2]}
+
+
+def test_delete_selection_returns_the_deleted_ids(db, ids):
+    result = StrategyService.delete_strategies(db, StrategySelection(expiry_before=VALUATION_DATE))
+
+    assert result == {"count": 1, "ids": [ids[3]]}
+    assert [s.id for s in StrategyService.get_strategies(db)] == ids[:3]
+    assert db.scalars(select(StrategyLeg.strategy_id).where(StrategyLeg.strategy_id == ids[3])).all() == []
+
+
+def test_name_prefix_is_a_literal_match(db, ids, save_book):
+    save_book([{"name": "Cond%r"}])
+
+    result = StrategyService.delete_strategies(db, StrategySelection(name_prefix="Cond%"))
+
+    assert result["count"] == 1
+    assert len(StrategyService.get_strategies(db)) == 4
+
+
+def test_batch_endpoints(client, ids):
+    updated = client.post("/api/strategies/batch-update", json={
+        "updates": [{"id": ids[0], "notes": "x"}, {"id": 999, "notes": "y"}],
+    })
+    deleted = client.post("/api/strategies/batch-delete", json={"ids": [ids[1], 999]})
+
+    assert updated.json()["data"] == {"count": 1, "ids": [ids[0]], "unmatched_ids": [999]}
+    assert deleted.json()["data"] == {"count": 1, "ids": [ids[1]], "unmatched_ids": [999]}
+
+
+@pytest.mark.parametrize("path, body", [
+    ("/api/strategies/batch-delete", {}),
+    ("/api/strategies/batch-delete", {"expiry_from": "2026-12-01", "expiry_to": "2026-11-01"}),
+    ("/api/strategies/batch-update", {"selection": {"ids": [1]}}),
+    ("/api/strategies/batch-update", {"selection": {"ids": [1]}, "changes": {}}),
+    ("/api/strategies/batch-update", {"updates": [{"id": 1}]}),
+    ("/api/strategies/batch-update", {"updates": [{"id": 1, "notes": "x"}], "selection": {"ids": [1]}}),
+])
+def test_invalid_batches_are_rejected(client, path, body):
+    assert client.post(path, json=body).status_code == 422
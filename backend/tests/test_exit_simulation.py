@@ -0,0 +1,99 @@
+"""Path simulations with exit rules: day counting, rule priority and the endpoint."""
+import numpy as np
+import pytest
+
+from app.services.sampling import PseudoSource
+from app.services.simulation import DEFAULT_HESTON, EXIT_REASONS, SimulationService, _heston_step
+
+from .conftest import CHAIN_EXPIRY, VALUATION_DATE
+
+CONDOR = {
+    "strategy_type": "iron-condor",
+    "expiry_date": "2027-06-18",
+    "parameters": {"putBuyStrike": 17000, "putSellStrike": 17500, "callSellStrike": 18500, "callBuyStrike": 19000},
+}
+
+
+def _run_exits(strategies=(CONDOR,), **kwargs):
+    options = dict(
+        underlying_price=18000.0, volatility=0.15, valuation_date=VALUATION_DATE,
+        rate=0.0, num_paths=2000, seed=11,
+    )
+    return SimulationService.run_exits(list(strategies), **{**options, **kwargs})
+
+
+@pytest.mark.parametrize("model", ["gbm", "heston", "merton"])
+def test_whole_day_horizons_do_not_gain_a_step(model):
+    # 2026-10-18 to 2027-06-18 is 243 days; 243 / 365 * 365 rounds up past 243
+    result = _run_exits(model=model)
+
+    assert result["steps"] == 243
+    assert len(result["exit_days"]["histogram"]) == 243
+    assert np.isfinite(result["expected_pnl"])
+    assert np.isfinite(result["hold_to_horizon"]["expected_pnl"])
+
+
+def test_zero_length_heston_step_keeps_the_state():
+    params = {**DEFAULT_HESTON, "long_run_variance": 0.04}
+    log_spot, variance = np.full(4, np.log(18000.0)), np.full(4, 0.04)
+
+    after = _heston_step(PseudoSource(np.random.default_rng(0), 4), log_spot, variance, 0.0, 0.2, 0.0, params, np.float64)
+
+    assert np.array_equal(after[0], log_spot) and np.array_equal(after[1], variance)
+
+
+def test_without_rules_every_strategy_is_held_to_the_horizon():
+    result = _run_exits(horizon_date="2026-11-17")
+
+    assert result["steps"] == 30
+    assert result["exit_reasons"]["horizon"] == 1.0
+    assert result["exit_days"]["mean"] == 30
+    assert result["expected_pnl"] == result["hold_to_horizon"]["expected_pnl"]
+
+
+def test_time_stop_closes_on_the_given_day():
+    result = _run_exits(max_days_held=5, horizon_date="2026-11-17")
+
+    assert result["exit_reasons"]["time_stop"] == 1.0
+    assert result["exit_days"]["percentiles"] == {str(q): 5 for q in (1, 5, 25, 50, 75, 95, 99)}
+
+
+def test_stop_loss_takes_priority_and_caps_losses_early():
+    result = _run_exits(stop_loss=1000, profit_target=50_000, include_breakdown=True, horizon_date="2026-11-17")
+
+    reasons = result["exit_reasons"]
+    assert set(reasons) == set(EXIT_REASONS)
+    assert sum(reasons.values()) == pytest.approx(1.0, abs=1e-3)
+    assert reasons["stop_loss"] > 0.5
+    assert reasons["profit_target"] == 0
+    assert result["strategies"][0]["exit_reasons"] == reasons
+
+
+def test_strike_breach_exits_before_the_horizon():
+    result = _run_exits(exit_on_strike_breach=True, horizon_date="2026-11-17", volatility=0.4)
+
+    assert result["exit_reasons"]["strike_breach"] > 0
+    assert result["exit_days"]["mean"] < 30
+
+
+def test_path_length_is_capped():
+    with pytest.raises(ValueError, match="at most"):
+        _run_exits([{**CONDOR, "expiry_date": "2029-06-18"}])
+
+
+def test_exit_endpoint(client):
+    body = {
+        "strategies": [{**CONDOR, "expiry_date": CHAIN_EXPIRY, "name": "Condor", "entry_date": VALUATION_DATE}],
+        "underlying_price": 18000,
+        "valuation_date": VALUATION_DATE,
+        "num_paths": 500,
+        "seed": 3,
+        "stop_loss": 5000,
+    }
+
+    response = client.post("/api/simulation/exits", json=body)
+    rejected = client.post("/api/simulation/exits", json={**body, "control_variate": True})
+
+    assert response.status_code == 200
+    assert response.json()["data"]["steps"] == 39
+    assert rejected.status_code == 422
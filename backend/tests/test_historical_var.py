@@ -0,0 +1,177 @@
+"""Historical VaR: scenario P&L, tail statistics, the leg cache and the endpoint."""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from app.services import historical_var
+from app.services.historical_var import HistoricalVaRService
+
+from .conftest import VALUATION_DATE
+
+RETURNS = np.random.default_rng(21).normal(0, 0.01, 120)
+CLOSES = np.round(18000 * np.cumprod(np.concatenate([[1.0], 1 + RETURNS])), 2)
+DATES = [str(np.datetime64("2026-01-01") + i) for i in range(len(CLOSES))]
+
+
+@pytest.fixture
+def history_file(request):
+    name = f"{request.node.name}.csv"
+    with open(os.path.join(os.environ["PRICE_HISTORY_DIR"], name), "w") as f:
+        f.write("date,close\n")
+        for day, close in zip(DATES, CLOSES):
+            f.write(f"{day},{close}\n")
+    return name
+
+
+def _futures(action="BUY", lots=50, **extra):
+    return {
+        "name": f"{action.lower()} futures",
+        "strategy_type": "custom-strategy",
+        "expiry_date": "2027-03-25",
+        "parameters": {},
+        "custom_legs": [{"type": "FUT", "action": action, "lotSize": lots}],
+        **extra,
+    }
+
+
+def _run(strategies, history_file, **kwargs):
+    return HistoricalVaRService.run(
+        strategies, history_file, underlying_price=18000.0, valuation_date=VALUATION_DATE, **kwargs
+    )
+
+
+def test_futures_var_is_the_return_percentile(history_file):
+    result = _run([_futures()], history_file, confidence=0.95)
+
+    pnl = 50 * 18000 * (CLOSES[1:] / CLOSES[:-1] - 1)
+    cutoff = np.percentile(pnl, 5)
+    assert result["scenarios"] == len(CLOSES) - 1
+    assert result["value_at_risk"] == pytest.approx(-cutoff, abs=0.01)
+    assert result["expected_shortfall"] == pytest.approx(-pnl[pnl <= cutoff].mean(), abs=0.01)
+    assert result["expected_shortfall"] >= result["value_at_risk"]
+
+
+def test_worst_scenarios_are_the_largest_n_day_drops(history_file):
+    result = _run([_futures()], history_file, horizon_days=5, worst_scenarios=3)
+
+    growth = CLOSES[5:] / CLOSES[:-5]
+    worst = int(np.argmin(growth))
+    assert result["scenarios"] == len(CLOSES) - 5
+    assert len(result["worst_scenarios"]) == 3
+    first = result["worst_scenarios"][0]
+    assert first["start"] == DATES[worst] and first["end"] == DATES[worst + 5]
+    assert first["return_pct"] == pytest.approx((growth[worst] - 1) * 100, abs=1e-4)
+    assert [s["pnl"] for s in result["worst_scenarios"]] == sorted(s["pnl"] for s in result["worst_scenarios"])
+
+
+def test_hedged_book_has_no_risk_and_breakdown_per_strategy(history_file):
+    result = _run([_futures(id=1), _futures("SELL", id=2)], history_file, include_breakdown=True)
+
+    assert result["value_at_risk"] == pytest.approx(0, abs=0.01)
+    long, short = result["strategies"]
+    assert [long["id"], short["id"]] == [1, 2]
+    assert long["pnl_in_var_scenario"] == pytest.approx(-short["pnl_in_var_scenario"])
+    assert long["value_at_risk"] > 0
+
+
+def test_chunking_does_not_change_the_result(history_file, monkeypatch):
+    book = [_futures(lots=lots) for lots in (25, 50, 75)] + [{
+        "strategy_type": "iron-condor", "expiry_date": "2026-11-26",
+        "parameters": {"putBuyStrike": 17000, "putSellStrike": 17500, "callSellStrike": 18500, "callBuyStrike": 19000},
+    }]
+    whole = _run(book, history_file, include_breakdown=True)
+    monkeypatch.setattr(historical_var, "CHUNK_ELEMENTS", 1)
+    chunked = _run(book, history_file, include_breakdown=True)
+
+    for key in ("value_at_risk", "expected_shortfall", "pnl_percentiles", "strategies"):
+        assert chunked[key] == whole[key]
+
+
+def test_strategies_that_cannot_be_priced_are_skipped(history_file):
+    result = _run([_futures(id=1), {**_futures(id=2), "strategy_type": "unknown"}], history_file)
+
+    assert result["priced_strategies"] == 1
+    assert result["skipped"] == [{"id": 2, "error": "Unknown strategy type: unknown"}]
+    with pytest.raises(ValueError, match="No strategies could be priced"):
+        _run([{**_futures(id=3), "strategy_type": "unknown"}], history_file)
+
+
+def test_leg_matrices_are_cached_per_version(history_file, monkeypatch):
+    monkeypatch.setattr(historical_var, "_leg_cache", {})
+    saved = _futures(id=7, updated_at="2026-10-01T00:00:00")
+
+    first = historical_var._strategy_legs(saved, 18000.0)
+    assert historical_var._strategy_legs(dict(saved), 18000.0) is first
+    assert historical_var._strategy_legs({**saved, "updated_at": "2026-10-02T00:00:00"}, 18000.0) is not first
+    assert historical_var._strategy_legs(saved, 18100.0) is not first
+    # Unsaved strategies are never cached
+    historical_var._strategy_legs(_futures(), 18000.0)
+    assert list(historical_var._leg_cache) == [7]
+
+
+def test_leg_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(historical_var, "_leg_cache", {})
+    monkeypatch.setattr(historical_var, "LEG_CACHE_SIZE", 2)
+
+    for strategy_id in (1, 2, 3):
+        historical_var._strategy_legs(_futures(id=strategy_id, updated_at="2026-10-01"), 18000.0)
+
+    assert list(historical_var._leg_cache) == [2, 3]
+
+
+class _InterleavedCache(dict):
+    """Lets two evictions read the same oldest key before either deletes it."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.barrier = threading.Barrier(2, timeout=0.5)
+
+    def __iter__(self):
+        keys = list(super().__iter__())
+        try:
+            self.barrier.wait()
+        except threading.BrokenBarrierError:
+            pass
+        return iter(keys)
+
+
+def test_concurrent_evictions_do_not_collide(monkeypatch):
+    monkeypatch.setattr(historical_var, "_leg_cache", _InterleavedCache())
+    monkeypatch.setattr(historical_var, "LEG_CACHE_SIZE", 1)
+    historical_var._strategy_legs(_futures(id=0, updated_at="2026-10-01"), 18000.0)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        list(pool.map(
+            lambda strategy_id: historical_var._strategy_legs(_futures(id=strategy_id, updated_at="2026-10-01"), 18000.0),
+            [1, 2],
+        ))
+
+    assert len(historical_var._leg_cache) == 1
+
+
+def test_historical_var_endpoint_filters_the_saved_book(client, history_file):
+    for strategy in (_futures(), _futures("SELL")):
+        client.post("/api/strategies", json={**strategy, "entry_date": VALUATION_DATE})
+    client.post("/api/strategies", json={
+        "name": "condor", "strategy_type": "iron-condor", "entry_date": VALUATION_DATE,
+        "expiry_date": "2026-11-26", "parameters": {},
+    })
+    body = {"history_file": history_file, "underlying_price": 18000, "valuation_date": VALUATION_DATE}
+
+    book = client.post("/api/risk/historical-var", json=body).json()["data"]
+    futures = client.post("/api/risk/historical-var", json={**body, "strategy_types": ["custom-strategy"]}).json()["data"]
+
+    assert book["priced_strategies"] == 3
+    assert futures["priced_strategies"] == 2
+    assert futures["value_at_risk"] == pytest.approx(0, abs=0.01)
+
+
+def test_historical_var_endpoint_errors(client, history_file):
+    body = {"history_file": history_file, "underlying_price": 18000, "valuation_date": VALUATION_DATE}
+
+    assert client.post("/api/risk/historical-var", json={**body, "strategy_ids": [999]}).status_code == 404
+    assert client.post("/api/risk/historical-var", json={**body, "history_file": "missing.csv"}).status_code == 404
+    assert client.post("/api/risk/historical-var", json=body).status_code == 400   # empty book
@@ -0,0 +1,81 @@
+"""Kernel backends: selection and agreement with the NumPy reference."""
+import numpy as np
+import pytest
+
+import app.kernels as kernels_module
+from app.kernels import get_kernels, load_backend, warm_up
+from benchmarks.kernel_backends import make_inputs
+
+
+@pytest.fixture(params=["numpy", "numba"])
+def backend(request):
+    if request.param == "numba":
+        pytest.importorskip("numba")
+    return load_backend(request.param)
+
+
+@pytest.fixture
+def reset_backend(monkeypatch):
+    monkeypatch.setattr(kernels_module, "_backend", None)
+
+
+def test_backend_matches_the_numpy_reference(backend):
+    data = make_inputs(strategies=40, bars=30, legs=4)
+    reference = load_backend("numpy")
+
+    pnl = backend.leg_pnl(**data)
+    expected = reference.leg_pnl(**data)
+
+    assert pnl.shape == (30, 40)
+    assert pnl == pytest.approx(expected, rel=1e-9, abs=1e-6)
+
+
+def test_black_scholes_broadcasts_like_numpy(backend):
+    spot = np.linspace(16000, 20000, 5)[:, None]
+    strike = np.linspace(17000, 19000, 3)[None, :]
+
+    calls = backend.black_scholes_price(spot, strike, 0.1, 0.2, 0.05, True)
+    puts = backend.black_scholes_price(spot, strike, 0.1, 0.2, 0.05, False)
+
+    assert calls.shape == (5, 3)
+    # Put-call parity
+    assert calls - puts == pytest.approx(spot - strike * np.exp(-0.05 * 0.1), abs=1e-6)
+
+
+def test_expired_options_settle_at_intrinsic(backend):
+    kind = np.array([1, 2, 0], dtype=np.int8)
+    quantity = np.array([50.0, -50.0, 25.0])
+    strike = np.array([18000.0, 18000.0, 1.0])
+    entry = np.array([100.0, 80.0, 17900.0])
+
+    pnl = backend.leg_pnl(kind, quantity, strike, entry, np.array([[18300.0], [17700.0]]), 0.0, 0.2)
+
+    assert pnl == pytest.approx([
+        50 * (300 - 100) - 50 * (0 - 80) + 25 * 400,
+        50 * (0 - 100) - 50 * (300 - 80) + 25 * -200,
+    ])
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError, match="Unknown kernel backend"):
+        load_backend("auto")
+    with pytest.raises(ValueError, match="Unknown kernel backend"):
+        load_backend("fortran")
+
+
+def test_kernel_backend_setting_selects_the_backend(monkeypatch, reset_backend):
+    monkeypatch.setattr(kernels_module.settings, "kernel_backend", "numpy")
+
+    assert get_kernels().NAME == "numpy"
+    assert warm_up()["backend"] == "numpy"
+
+
+def test_auto_prefers_numba_when_installed(monkeypatch, reset_backend):
+    monkeypatch.setattr(kernels_module.settings, "kernel_backend", "auto")
+    try:
+        import numba  # noqa: F401
+        expected = "numba"
+    except ImportError:
+        expected = "numpy"
+
+    assert get_kernels().NAME == expected
@@ -0,0 +1,89 @@
+"""Per-leg expiries: calendar and diagonal spreads."""
+import numpy as np
+import pytest
+
+from app.services.legs import strategy_to_legs, to_datetime64
+from app.services.payoff_calculator import PayoffCalculatorService
+from app.services.pricing import black_scholes_price
+
+from .conftest import CHAIN_EXPIRY, VALUATION_DATE
+
+FAR_EXPIRY = "2026-12-31"
+GAP_YEARS = 35 / 365   # CHAIN_EXPIRY to FAR_EXPIRY
+
+CALENDAR = [
+    {"type": "CE", "action": "SELL", "strike": 18000, "premium": 250, "lotSize": 50},
+    {"type": "CE", "action": "BUY", "strike": 18000, "premium": 420, "lotSize": 50, "expiry": FAR_EXPIRY},
+]
+
+
+def _calendar_curve(prices, volatility):
+    """Short call at intrinsic value, long call with GAP_YEARS left, at the near expiry."""
+    short = -50 * (np.maximum(prices - 18000, 0) - 250)
+    long = 50 * (black_scholes_price(prices, 18000.0, GAP_YEARS, volatility) - 420)
+    return short + long
+
+
+def test_legs_keep_their_own_expiry():
+    legs = strategy_to_legs("custom-strategy", None, CALENDAR, CHAIN_EXPIRY, 18000)
+
+    assert legs.expiry.tolist() == [to_datetime64(CHAIN_EXPIRY), to_datetime64(FAR_EXPIRY)]
+    assert legs.time_to_expiry(to_datetime64(CHAIN_EXPIRY)) == pytest.approx([0.0, GAP_YEARS])
+
+
+def test_templates_share_the_strategy_expiry():
+    legs = strategy_to_legs("iron-condor", {}, [{"expiry": FAR_EXPIRY}], CHAIN_EXPIRY, 18000)
+
+    assert np.all(legs.expiry == to_datetime64(CHAIN_EXPIRY))
+
+
+def test_calendar_is_valued_at_the_nearest_expiry():
+    prices = np.array([16000.0, 17500.0, 18000.0, 18500.0, 20000.0])
+    legs = strategy_to_legs("custom-strategy", None, CALENDAR, CHAIN_EXPIRY, 18000)
+
+    pnl = legs.nearest_expiry_pnl(prices[:, None], 0.2)
+
+    assert pnl == pytest.approx(_calendar_curve(prices, 0.2))
+    # Long calendars peak at the strike
+    assert pnl.argmax() == 2
+
+
+def test_single_expiry_matches_settlement_at_intrinsic_value():
+    legs = strategy_to_legs("custom-strategy", None, [{**leg, "expiry": None} for leg in CALENDAR], CHAIN_EXPIRY, 18000)
+    prices = np.linspace(16000, 20000, 41)[:, None]
+
+    assert legs.nearest_expiry_pnl(prices, 0.2) == pytest.approx(legs.expiry_pnl(prices))
+
+
+def test_diagonal_curve_through_the_calculator():
+    diagonal = [CALENDAR[0], {**CALENDAR[1], "strike": 18500}]
+    prices = np.array([17000.0, 18000.0, 19000.0])
+
+    curve = PayoffCalculatorService.calculate_custom_strategy(
+        diagonal, 18000, 30, prices, expiry_date=CHAIN_EXPIRY, volatility=0.25
+    )
+
+    short = -50 * (np.maximum(prices - 18000, 0) - 250)
+    long = 50 * (black_scholes_price(prices, 18500.0, GAP_YEARS, 0.25) - 420)
+    assert [point.pnl for point in curve] == pytest.approx(np.round(short + long, 2), abs=0.01)
+
+
+def test_payoff_endpoint_prices_longer_legs_with_the_requested_volatility(client):
+    body = {
+        "strategy_type": "custom-strategy",
+        "entry_date": VALUATION_DATE,
+        "expiry_date": CHAIN_EXPIRY,
+        "underlying_price": 18000,
+        "price_range_percent": 10,
+        "num_points": 3,
+        "custom_legs": CALENDAR,
+    }
+
+    calm = client.post("/api/payoff/calculate", json={**body, "volatility": 0.1}).json()
+    wild = client.post("/api/payoff/calculate", json={**body, "volatility": 0.4}).json()
+
+    assert [p["pnl"] for p in calm] == pytest.approx(
+        np.round(_calendar_curve(np.array([16200.0, 18000.0, 19800.0]), 0.1), 2), abs=0.01
+    )
+    # A long calendar gains from volatility after the near expiry
+    assert wild[1]["pnl"] > calm[1]["pnl"]
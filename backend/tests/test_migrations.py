@@ -0,0 +1,61 @@
+"""Alembic revisions on empty and pre-migration SQLite databases."""
+import os
+
+import pytest
+import sqlalchemy as sa
+from alembic import command
+from alembic.config import Config
+
+from app.config import settings
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    """Scratch database that alembic/env.py migrates instead of DATABASE_URL."""
+    url = f"sqlite:///{tmp_path / 'migrate.db'}"
+    monkeypatch.setattr(settings, "database_url", url)
+    engine = sa.create_engine(url)
+    yield engine
+    engine.dispose()
+
+
+def _upgrade():
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "alembic"))
+    command.upgrade(config, "head")
+
+
+def test_empty_database_is_left_to_init_db(engine):
+    _upgrade()
+
+    with engine.connect() as conn:
+        assert sa.inspect(conn).get_table_names() == ["alembic_version"]
+        assert conn.scalar(sa.text("SELECT version_num FROM alembic_version")) == "d93e5b7f2c14"
+
+
+def test_legacy_table_is_brought_up_to_date(engine):
+    with engine.begin() as conn:
+        conn.execute(sa.text(
+            "CREATE TABLE strategies (id INTEGER PRIMARY KEY, name VARCHAR(255) NOT NULL, "
+            "strategy_type VARCHAR(100) NOT NULL, entry_date VARCHAR(50) NOT NULL, "
+            "expiry_date VARCHAR(50) NOT NULL, parameters JSON, custom_legs JSON, notes TEXT, "
+            "created_at DATETIME, updated_at DATETIME)"
+        ))
+        conn.execute(sa.text(
+            "INSERT INTO strategies (name, strategy_type, entry_date, expiry_date, parameters) "
+            "VALUES ('Spread', 'bull-call-spread', '2026-09-01', '2026-11-26', "
+            "'{\"longCallStrike\": 18000, \"shortCallStrike\": 18500}')"
+        ))
+
+    _upgrade()
+
+    with engine.connect() as conn:
+        inspector = sa.inspect(conn)
+        types = {c["name"]: c["type"] for c in inspector.get_columns("strategies")}
+        assert isinstance(types["expiry_date"], sa.Date)
+        assert "ix_strategies_type_expiry" in {i["name"] for i in inspector.get_indexes("strategies")}
+        assert conn.scalar(sa.text("SELECT count(*) FROM strategies_fts WHERE strategies_fts MATCH 'spread'")) == 1
+        strikes = conn.execute(sa.text("SELECT strike FROM strategy_legs ORDER BY leg_index")).scalars().all()
+        assert strikes == [18000, 18500]
@@ -0,0 +1,145 @@
+"""Option-chain store: key packing, lookups and re-ingestion."""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from app.services.option_chain import OptionChainStore, get_chain_store, pack_contract_keys
+
+from .conftest import CHAIN_EXPIRY, write_chain
+
+
+def _write_rows(file_name, rows):
+    path = os.path.join(os.environ["OPTION_CHAIN_DIR"], file_name)
+    with open(path, "w") as f:
+        f.write("underlying,expiry,strike,option_type,bid,ask,ltp,iv,underlying_price\n")
+        for row in rows:
+            f.write(",".join(str(v) for v in row) + "\n")
+    return file_name
+
+
+def test_packed_keys_sort_like_contract_tuples():
+    rng = np.random.default_rng(3)
+    n = 2000
+    underlying_id = rng.integers(0, 1024, n)
+    expiry = np.datetime64("2024-01-01") + rng.integers(0, 3650, n)
+    strike = rng.integers(1, 10_000_000, n) / 100.0
+    is_call = rng.integers(0, 2, n).astype(bool)
+
+    keys = pack_contract_keys(underlying_id, expiry, strike, is_call)
+
+    by_key = np.argsort(keys, kind="stable")
+    by_tuple = np.lexsort((is_call, np.rint(strike * 100), expiry, underlying_id))
+    assert np.array_equal(keys[by_key], keys[by_tuple])
+    assert len(np.unique(keys)) == len(
+        set(zip(underlying_id.tolist(), expiry.tolist(), np.rint(strike * 100).tolist(), is_call.tolist()))
+    )
+
+
+def test_packed_keys_keep_strikes_to_the_cent():
+    keys = pack_contract_keys(0, "2026-11-26", [18000.0, 18000.01, 18000.004], True)
+
+    assert keys[0] < keys[1]
+    assert keys[0] == keys[2]
+
+
+@pytest.mark.parametrize("expiry, strike, message", [
+    ("2026-11-26", -100, "Strike out of range"),
+    ("2026-11-26", "", "Strike out of range: nan"),
+    ("2026-11-26", 5e7, "Strike out of range"),
+    ("", 18000, "Expiry out of range: NaT"),
+    ("5000-01-01", 18000, "Expiry out of range"),
+])
+def test_contracts_that_do_not_fit_the_key_are_rejected(client, expiry, strike, message):
+    file_name = _write_rows("unpackable.csv", [
+        ("NIFTY", "2026-11-26", 18000, "CE", 10, 12, 11, 0.15, 18000),
+        ("NIFTY", expiry, strike, "PE", 10, 12, 11, 0.15, 18000),
+    ])
+
+    with pytest.raises(ValueError, match=message):
+        OptionChainStore.ingest(file_name)
+    response = client.post("/api/option-chain/ingest", json={"chain_file": file_name})
+    assert response.status_code == 400
+    assert not os.path.exists(OptionChainStore.store_path(file_name))
+
+
+def test_lookup_and_bulk_fetch(chain_file):
+    store = get_chain_store(chain_file)
+
+    quote = store.lookup("NIFTY", CHAIN_EXPIRY, 18000, "CE")
+    assert quote is not None
+    assert quote["bid"] < quote["price"] < quote["ask"]
+    assert store.lookup("NIFTY", CHAIN_EXPIRY, 18050, "CE") is None
+    assert store.lookup("BANKNIFTY", CHAIN_EXPIRY, 18000, "CE") is None
+
+    quotes = store.fetch("NIFTY", CHAIN_EXPIRY, [17500, 18050, 18500], ["PE", "CE", "CE"])
+    assert quotes["found"].tolist() == [True, False, True]
+    assert np.isnan(quotes["price"][1])
+
+
+def test_select_defaults_to_nearest_expiry():
+    write_chain("two_expiries.csv", expiries=("2026-12-31", "2026-11-26"))
+    store = OptionChainStore.ingest("two_expiries.csv")
+
+    assert store.expiries() == ["2026-11-26", "2026-12-31"]
+    assert str(store.select().expiry[0]) == "2026-11-26"
+    chain = store.select(expiry="2026-12-31")
+    assert (chain.expiry == np.datetime64("2026-12-31")).all()
+    assert np.all(np.diff(chain.strike[chain.is_call]) > 0)
+
+
+def test_duplicate_contracts_keep_the_last_row():
+    _write_rows("duplicates.csv", [
+        ("NIFTY", "2026-11-26", 18000, "CE", 10, 12, 11, 0.15, 18000),
+        ("NIFTY", "2026-11-26", 18000, "CE", 20, 22, 21, 0.15, 18000),
+    ])
+    store = OptionChainStore.ingest("duplicates.csv")
+
+    assert len(store) == 1
+    assert store.lookup("NIFTY", "2026-11-26", 18000, "CE")["ltp"] == 21
+
+
+def test_changed_source_is_reingested():
+    _write_rows("changing.csv", [("NIFTY", "2026-11-26", 18000, "CE", 10, 12, 11, 0.15, 18000)])
+    assert get_chain_store("changing.csv").lookup("NIFTY", "2026-11-26", 18000, "CE")["ltp"] == 11
+
+    path = _write_rows("changing.csv", [("NIFTY", "2026-11-26", 18000, "CE", 30, 32, 31, 0.15, 18000)])
+    stat = os.stat(os.path.join(os.environ["OPTION_CHAIN_DIR"], path))
+    os.utime(os.path.join(os.environ["OPTION_CHAIN_DIR"], path), (stat.st_atime, stat.st_mtime + 10))
+
+    assert get_chain_store("changing.csv").lookup("NIFTY", "2026-11-26", 18000, "CE")["ltp"] == 31
+
+
+def test_concurrent_ingests_do_not_collide(chain_file):
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        stores = list(pool.map(OptionChainStore.ingest, [chain_file] * 16))
+
+    store_dir = os.path.dirname(OptionChainStore.store_path(chain_file))
+    assert all(len(store) == len(stores[0]) for store in stores)
+    assert not [name for name in os.listdir(store_dir) if ".tmp-" in name]
+    assert get_chain_store(chain_file).lookup("NIFTY", CHAIN_EXPIRY, 18000, "CE") is not None
+
+
+def test_quote_endpoints(client, chain_file):
+    found = client.get("/api/option-chain/quote", params={
+        "chain_file": chain_file, "expiry": CHAIN_EXPIRY, "strike": 18000, "option_type": "PE",
+    })
+    missing = client.get("/api/option-chain/quote", params={
+        "chain_file": chain_file, "expiry": CHAIN_EXPIRY, "strike": 18050, "option_type": "PE",
+    })
+    bulk = client.post("/api/option-chain/quotes", json={
+        "chain_file": chain_file,
+        "contracts": [
+            {"expiry": CHAIN_EXPIRY, "strike": 18000, "option_type": "CE"},
+            {"expiry": "2027-01-28", "strike": 18000, "option_type": "CE"},
+        ],
+    })
+
+    assert found.status_code == 200
+    assert missing.status_code == 404
+    assert [entry["found"] for entry in bulk.json()["data"]] == [True, False]
+    out_of_range = client.post("/api/option-chain/quotes", json={
+        "chain_file": chain_file, "contracts": [{"expiry": "5000-01-01", "strike": 18000, "option_type": "CE"}],
+    })
+    assert out_of_range.status_code == 400
@@ -0,0 +1,88 @@
+"""Keyset pagination: cursor tokens and walking the strategy list."""
+import pytest
+
+from app.services.pagination import decode_cursor, encode_cursor
+from app.services.strategy_service import StrategyService
+
+
+def _save(save_book, count, prefix="s"):
+    return list(save_book([{"name": f"{prefix}{i}"} for i in range(count)]).values())
+
+
+def _walk(client, **params):
+    """IDs of every page of GET /api/strategies, and the number of pages."""
+    ids, pages, cursor = [], 0, None
+    while True:
+        query = {**params, **({"cursor": cursor} if cursor else {})}
+        body = client.get("/api/strategies", params=query).json()
+        ids += [s["id"] for s in body["data"]]
+        pages += 1
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return ids, pages
+
+
+def test_cursor_tokens_round_trip():
+    position = {"id": 12345, "order": "desc"}
+
+    token = encode_cursor(position)
+
+    assert decode_cursor(token) == position
+    assert "=" not in token and "+" not in token and "/" not in token
+
+
+@pytest.mark.parametrize("token", ["not base64!", "bnVsbA", "WzEsMl0"])   # garbage, null, [1,2]
+def test_malformed_tokens_are_rejected(token):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(token)
+
+
+@pytest.mark.parametrize("order", ["asc", "desc"])
+def test_pages_cover_every_strategy_once(client, save_book, order):
+    saved = _save(save_book, 25)
+
+    ids, pages = _walk(client, limit=10, order=order)
+
+    assert ids == sorted(saved, reverse=order == "desc")
+    assert pages == 3
+
+
+def test_exact_multiple_ends_without_an_empty_page(client, save_book):
+    _save(save_book, 20)
+
+    ids, pages = _walk(client, limit=10)
+
+    assert len(ids) == 20 and pages == 2
+
+
+def test_rows_added_between_pages_are_not_repeated(db, save_book):
+    first_ids = _save(save_book, 10)
+    page, cursor = StrategyService.get_strategies_page(db, 5)
+    later_ids = _save(save_book, 3, prefix="late")
+
+    rest, end = StrategyService.get_strategies_page(db, 100, cursor)
+
+    assert [s["id"] for s in page + rest] == first_ids + later_ids
+    assert end is None
+
+
+def test_cursor_from_another_order_is_rejected(client, save_book):
+    _save(save_book, 5)
+    cursor = client.get("/api/strategies", params={"limit": 2}).json()["next_cursor"]
+
+    wrong_order = client.get("/api/strategies", params={"limit": 2, "order": "desc", "cursor": cursor})
+    with_skip = client.get("/api/strategies", params={"limit": 2, "cursor": cursor, "skip": 2})
+    garbage = client.get("/api/strategies", params={"cursor": "garbage"})
+    bad_order = client.get("/api/strategies", params={"order": "sideways"})
+
+    assert [r.status_code for r in (wrong_order, with_skip, garbage, bad_order)] == [400] * 4
+    assert wrong_order.json()["detail"] == "Invalid cursor"
+
+
+def test_deprecated_skip_still_pages_without_a_cursor(client, save_book):
+    saved = _save(save_book, 5)
+
+    body = client.get("/api/strategies", params={"limit": 2, "skip": 2}).json()
+
+    assert [s["id"] for s in body["data"]] == saved[2:4]
+    assert body["next_cursor"] is None
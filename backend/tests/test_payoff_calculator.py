@@ -0,0 +1,38 @@
+"""Payoff calculator: template curves against hand-computed values."""
+import numpy as np
+import pytest
+
+from app.services.payoff_calculator import PayoffCalculatorService
+
+IRON_CONDOR = {
+    "putBuyStrike": 17000, "putSellStrike": 17500,
+    "callSellStrike": 18500, "callBuyStrike": 19000,
+    "netPremium": 100, "lotSize": 50,
+}
+
+
+def test_iron_condor_loss_is_capped_beyond_the_wings():
+    prices = np.array([15000, 16999, 17000, 17250, 17500, 18000, 18500, 18750, 19000, 19001, 21000], dtype=float)
+
+    curve = PayoffCalculatorService.calculate_iron_condor(IRON_CONDOR, 18000, 30, prices)
+
+    # Credit 100 per unit; max loss = spread width 500 - credit = 400 per unit
+    assert [point.pnl for point in curve] == [
+        -20000, -20000, -20000, -7500, 5000, 5000, 5000, -7500, -20000, -20000, -20000,
+    ]
+
+
+@pytest.mark.parametrize("strategy_type, parameters", [
+    ("iron-condor", IRON_CONDOR),
+    ("bull-call-spread", {"longCallStrike": 17800, "shortCallStrike": 18400, "longCallPremium": 250, "shortCallPremium": 90}),
+    ("butterfly-spread", {"lowerStrike": 17500, "middleStrike": 18000, "upperStrike": 18500}),
+    ("covered-call", {"futuresPrice": 18000, "callStrike": 18500, "premium": 150}),
+])
+def test_template_curves_match_the_leg_matrix(strategy_type, parameters):
+    curve = PayoffCalculatorService.calculate_payoff(strategy_type, parameters, 18000, 30, num_points=301)
+    prices, pnl = next(PayoffCalculatorService.iter_payoff_chunks(
+        strategy_type, parameters, 18000, 30, "2026-11-26", num_points=301
+    ))
+
+    assert [point.price for point in curve] == pytest.approx(np.round(prices, 2))
+    assert [point.pnl for point in curve] == pytest.approx(pnl, abs=0.01)
@@ -0,0 +1,99 @@
+"""Chunked payoff evaluation: flat memory and the streaming endpoint."""
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from app import kernels
+from app.kernels import load_backend
+from app.services.payoff_calculator import PAYOFF_CHUNK_POINTS, PayoffCalculatorService
+from app.services.price_grid import MAX_CACHED_POINTS
+from app.services.streaming import encode_blocks
+
+CONDOR = {
+    "strategy_type": "iron-condor",
+    "parameters": {"putBuyStrike": 17000, "putSellStrike": 17500, "callSellStrike": 18500, "callBuyStrike": 19000},
+    "underlying_price": 18000,
+    "price_range_percent": 30,
+    "expiry_date": "2026-11-26",
+}
+
+
+@pytest.fixture
+def numpy_kernels(monkeypatch):
+    """Pin the NumPy kernels: tracemalloc does not see Numba's allocations."""
+    monkeypatch.setattr(kernels, "_backend", load_backend("numpy"))
+
+
+def _evaluation_peak(num_points: int, grid_spacing: str) -> int:
+    """Peak traced allocation while evaluating a whole curve block by block."""
+    # Warm up first, so kernel compilation and grid caching are not traced
+    next(PayoffCalculatorService.iter_payoff_chunks(num_points=2, grid_spacing=grid_spacing, **CONDOR))
+    tracemalloc.start()
+    try:
+        points = 0
+        for prices, pnl in PayoffCalculatorService.iter_payoff_chunks(
+            num_points=num_points, grid_spacing=grid_spacing, **CONDOR
+        ):
+            points += len(pnl)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert points >= num_points
+    return peak
+
+
+@pytest.mark.parametrize("grid_spacing", ["linear", "log", "strike-dense"])
+def test_peak_memory_does_not_grow_with_the_grid(numpy_kernels, grid_spacing):
+    small = _evaluation_peak(2 * MAX_CACHED_POINTS, grid_spacing)
+    large = _evaluation_peak(1_000_000, grid_spacing)
+
+    assert large < small * 1.25 + 256 * 1024
+    # At most 16 temporaries of one block x the condor's 4 legs, whatever the grid size
+    assert large < 16 * PAYOFF_CHUNK_POINTS * 4 * np.dtype(np.float64).itemsize
+    # Less than one float64 column of the whole 1M-point curve
+    assert large < 8_000_000
+
+
+def test_encoded_blocks_match_the_curve():
+    chunks = PayoffCalculatorService.iter_payoff_chunks(num_points=5, chunk_size=2, **CONDOR)
+    text = "".join(encode_blocks(({"price": p, "pnl": v} for p, v in chunks), "ndjson"))
+
+    assert text.splitlines() == [
+        '{"price":12600.00,"pnl":-20000.00}',
+        '{"price":15300.00,"pnl":-20000.00}',
+        '{"price":18000.00,"pnl":5000.00}',
+        '{"price":20700.00,"pnl":-20000.00}',
+        '{"price":23400.00,"pnl":-20000.00}',
+    ]
+
+
+def test_blocks_cover_the_grid_in_order():
+    blocks = list(PayoffCalculatorService.iter_payoff_chunks(num_points=300_000, **CONDOR))
+
+    prices = np.concatenate([p for p, _ in blocks])
+    assert max(len(p) for p, _ in blocks) == PAYOFF_CHUNK_POINTS
+    assert len(prices) == 300_000
+    assert np.all(np.diff(prices) > 0)
+    assert prices[0] == pytest.approx(12600) and prices[-1] == pytest.approx(23400)
+
+
+def test_stream_endpoint(client):
+    response = client.post("/api/payoff/stream", json={
+        **CONDOR, "entry_date": "2026-10-18", "num_points": 1001, "format": "csv",
+    })
+
+    lines = response.text.splitlines()
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert lines[0] == "price,pnl"
+    assert len(lines) == 1002
+    assert lines[1] == "12600.00,-20000.00"
+
+
+def test_stream_rejects_bad_input_before_streaming(client):
+    response = client.post("/api/payoff/stream", json={
+        **CONDOR, "entry_date": "2026-10-18", "strategy_type": "unknown", "num_points": 1001,
+    })
+
+    assert response.status_code == 400
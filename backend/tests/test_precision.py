@@ -0,0 +1,72 @@
+"""float32 precision mode: documented error bound and dtype plumbing."""
+import numpy as np
+import pytest
+
+from app.kernels import FLOAT32_PRICE_TOLERANCE, load_backend, resolve_precision
+from app.services.scenarios import ScenarioService
+from benchmarks.precision_check import make_inputs
+
+
+@pytest.fixture(params=["numpy", "numba"])
+def backend(request):
+    if request.param == "numba":
+        pytest.importorskip("numba")
+    return load_backend(request.param)
+
+
+@pytest.fixture(scope="module")
+def grid():
+    return make_inputs(samples=200_000, legs=4)
+
+
+def test_float32_prices_stay_within_the_documented_bound(backend, grid):
+    is_call = grid["kind"] == 1
+    args = (grid["spot"], grid["strike"], np.maximum(grid["time_to_expiry"], 0), grid["volatility"], grid["rate"], is_call)
+
+    single = backend.black_scholes_price(*args, np.float32)
+    double = backend.black_scholes_price(*args, np.float64)
+
+    assert single.dtype == np.float32 and double.dtype == np.float64
+    error = np.abs(single.astype(np.float64) - double) / (grid["spot"] + grid["strike"])
+    assert error.max() <= FLOAT32_PRICE_TOLERANCE
+
+
+def test_float32_pnl_stays_within_the_documented_bound(backend, grid):
+    single = backend.leg_pnl(**grid, dtype=np.float32)
+    double = backend.leg_pnl(**grid, dtype=np.float64)
+
+    assert single.dtype == np.float32
+    notional = (np.abs(grid["quantity"]) * (grid["spot"] + grid["strike"])).sum(axis=-1)
+    error = np.abs(single.astype(np.float64) - double) / notional
+    assert error.max() <= FLOAT32_PRICE_TOLERANCE
+
+
+def test_backends_agree_in_float32(grid):
+    pytest.importorskip("numba")
+    numpy_pnl = load_backend("numpy").leg_pnl(**grid, dtype=np.float32)
+    numba_pnl = load_backend("numba").leg_pnl(**grid, dtype=np.float32)
+
+    notional = (np.abs(grid["quantity"]) * (grid["spot"] + grid["strike"])).sum(axis=-1)
+    assert (np.abs(numba_pnl.astype(np.float64) - numpy_pnl) / notional).max() <= 2 * FLOAT32_PRICE_TOLERANCE
+
+
+def test_precision_names():
+    assert resolve_precision("float32") == np.float32
+    assert resolve_precision("FLOAT64") == np.float64
+    with pytest.raises(ValueError, match="Unknown precision"):
+        resolve_precision("float16")
+
+
+def test_scenario_cube_honours_the_requested_precision():
+    strategy = {
+        "strategy_type": "iron-condor", "expiry_date": "2026-11-26",
+        "parameters": {"putBuyStrike": 17000, "putSellStrike": 17500, "callSellStrike": 18500, "callBuyStrike": 19000},
+    }
+    kwargs = dict(underlying_price=18000.0, volatility=0.15, valuation_date="2026-10-18")
+
+    single = ScenarioService.run([strategy], precision="float32", **kwargs)
+    double = ScenarioService.run([strategy], precision="float64", **kwargs)
+
+    assert single["precision"] == "float32"
+    notional = 4 * 50 * (18000 + 19000)
+    assert np.abs(np.array(single["pnl"]) - np.array(double["pnl"])).max() <= FLOAT32_PRICE_TOLERANCE * notional + 0.01
@@ -0,0 +1,64 @@
+"""Price grids: shared read-only cache and spacings."""
+import numpy as np
+import pytest
+
+from app.services import price_grid
+from app.services.price_grid import get_price_grid, iter_price_grid, price_grid_cache_info
+
+
+def test_equal_requests_share_one_read_only_array():
+    hits = price_grid_cache_info()["hits"]
+
+    first = get_price_grid(18000, 30, 200)
+    second = get_price_grid(18000.0, 30.0, 200)
+
+    assert second is first
+    assert price_grid_cache_info()["hits"] == hits + 1
+    with pytest.raises(ValueError):
+        first[0] = 0.0
+
+
+def test_linear_and_log_spacing():
+    linear = get_price_grid(18000, 20, 41)
+    log = get_price_grid(18000, 20, 41, "log")
+
+    assert linear[0] == pytest.approx(14400) and linear[-1] == pytest.approx(21600)
+    assert np.diff(linear) == pytest.approx(np.full(40, 180.0))
+    assert log[0] == pytest.approx(14400) and log[-1] == pytest.approx(21600)
+    ratios = log[1:] / log[:-1]
+    assert ratios == pytest.approx(np.full(40, ratios[0]))
+
+
+def test_strike_dense_grid_contains_every_strike_in_range():
+    grid = get_price_grid(18000, 10, 40, "strike-dense", [17550, 18000, 18333.5, 25000])
+
+    assert {17550.0, 18000.0, 18333.5} <= set(grid.tolist())
+    assert 25000 not in grid
+    assert np.all(np.diff(grid) > 0)
+
+
+def test_strike_order_does_not_split_the_cache():
+    first = get_price_grid(18000, 10, 40, "strike-dense", [18500, 17500])
+    second = get_price_grid(18000, 10, 40, "strike-dense", [17500, 18500, 17500])
+
+    assert second is first
+
+
+def test_large_grids_bypass_the_cache(monkeypatch):
+    monkeypatch.setattr(price_grid, "MAX_CACHED_POINTS", 100)
+
+    assert get_price_grid(18000, 30, 101) is not get_price_grid(18000, 30, 101)
+
+
+def test_blocks_concatenate_to_the_whole_grid():
+    whole = get_price_grid(18000, 30, 1000, "log")
+    blocks = list(iter_price_grid(18000, 30, 1000, "log", chunk_size=128))
+
+    assert max(len(b) for b in blocks) == 128
+    assert np.concatenate(blocks) == pytest.approx(whole)
+
+
+@pytest.mark.parametrize("spacing, num_points", [("cubic", 50), ("linear", 1)])
+def test_invalid_grids_are_rejected(spacing, num_points):
+    with pytest.raises(ValueError):
+        get_price_grid(18000, 30, num_points, spacing)
@@ -0,0 +1,102 @@
+"""Pricing kernels: prices, Greeks, the lookup table and the normal helpers."""
+import math
+
+import numpy as np
+import pytest
+
+from app.services.legs import strategy_to_legs
+from app.services.pricing import (
+    black_scholes_greeks,
+    black_scholes_price,
+    get_pricing_table,
+    norm_cdf,
+    norm_ppf,
+)
+
+
+def _exact_price(spot, strike, t, vol, rate, is_call):
+    """Black-Scholes with math.erf as the normal CDF."""
+    cdf = lambda x: 0.5 * (1 + math.erf(x / math.sqrt(2)))  # noqa: E731
+    d1 = (math.log(spot / strike) + (rate + vol * vol / 2) * t) / (vol * math.sqrt(t))
+    d2 = d1 - vol * math.sqrt(t)
+    if is_call:
+        return spot * cdf(d1) - strike * math.exp(-rate * t) * cdf(d2)
+    return strike * math.exp(-rate * t) * cdf(-d2) - spot * cdf(-d1)
+
+
+@pytest.mark.parametrize("spot, strike, t, vol, rate", [
+    (18000, 18000, 0.1, 0.15, 0.0),
+    (18000, 16000, 0.5, 0.30, 0.06),
+    (18000, 21000, 1.5, 0.60, 0.03),
+    (100, 40, 2.0, 0.05, 0.10),
+])
+@pytest.mark.parametrize("is_call", [True, False])
+def test_prices_match_the_erf_reference(spot, strike, t, vol, rate, is_call):
+    price = black_scholes_price(spot, strike, t, vol, rate, is_call)
+
+    assert price == pytest.approx(_exact_price(spot, strike, t, vol, rate, is_call), abs=1e-6 * (spot + strike))
+
+
+def test_greeks_share_the_price_and_match_finite_differences():
+    spot, strike, t, vol, rate = 18000.0, np.array([17000.0, 18000.0, 19500.0]), 0.2, 0.18, 0.05
+    greeks = black_scholes_greeks(spot, strike, t, vol, rate, np.array([True, False, True]))
+    price = lambda s=spot, v=vol: black_scholes_price(s, strike, t, v, rate, np.array([True, False, True]))  # noqa: E731
+
+    h = 1.0
+    assert greeks["price"] == pytest.approx(price())
+    assert greeks["delta"] == pytest.approx((price(spot + h) - price(spot - h)) / (2 * h), abs=1e-5)
+    assert greeks["gamma"] == pytest.approx((price(spot + h) - 2 * price() + price(spot - h)) / h**2, rel=1e-3)
+    assert greeks["vega"] == pytest.approx((price(v=vol + 1e-4) - price(v=vol - 1e-4)) / 2e-4 / 100, rel=1e-4)
+
+
+def test_position_greeks_sum_the_legs():
+    legs = strategy_to_legs(
+        "long-straddle", {"strike": 18000, "lotSize": 50}, None, "2026-11-26", 18000
+    )
+    position = legs.greeks(18000.0, 0.1, 0.15)
+    call = black_scholes_greeks(18000.0, 18000.0, 0.1, 0.15, 0.0, True)
+    put = black_scholes_greeks(18000.0, 18000.0, 0.1, 0.15, 0.0, False)
+
+    assert position["delta"] == pytest.approx(50 * (call["delta"] + put["delta"]))
+    assert position["gamma"] == pytest.approx(100 * call["gamma"])
+    assert position["vega"] == pytest.approx(100 * call["vega"])
+
+
+def test_table_prices_stay_within_the_measured_bound():
+    table = get_pricing_table()
+    rng = np.random.default_rng(5)
+    n = 200_000
+    spot = rng.uniform(5000, 40000, n)
+    strike = spot * rng.uniform(0.5, 1.5, n)
+    t = rng.uniform(1 / 365, 2.0, n)
+    vol = rng.uniform(0.05, 0.8, n)
+    is_call = rng.integers(0, 2, n).astype(bool)
+
+    approx = table.price(spot, strike, t, vol, 0.05, is_call)
+    exact = black_scholes_price(spot, strike, t, vol, 0.05, is_call)
+
+    assert 0 < table.max_error < 1e-4
+    assert np.abs(approx - exact).max() <= table.max_error * (strike * np.exp(-0.05 * t)).max()
+    assert (np.abs(approx - exact) / (strike * np.exp(-0.05 * t))).max() <= table.max_error * (1 + 1e-9)
+
+
+def test_table_prices_outside_its_domain_exactly():
+    table = get_pricing_table()
+
+    # sigma * sqrt(t) = 2.0 is above s_max
+    assert table.price(18000, 18000, 4.0, 1.0) == pytest.approx(black_scholes_price(18000, 18000, 4.0, 1.0), rel=1e-12)
+
+
+def test_norm_cdf_matches_erf():
+    x = np.linspace(-8, 8, 1601)
+
+    exact = [0.5 * (1 + math.erf(v / math.sqrt(2))) for v in x]
+    assert norm_cdf(x) == pytest.approx(exact, abs=7.5e-8)
+
+
+def test_norm_ppf_inverts_the_normal_cdf():
+    p = np.concatenate([np.logspace(-12, -1, 50), np.linspace(0.01, 0.99, 99), 1 - np.logspace(-1, -12, 50)])
+
+    x = norm_ppf(p)
+    assert [0.5 * math.erfc(-v / math.sqrt(2)) for v in x] == pytest.approx(p, rel=1e-6)
+    assert norm_ppf(np.array([0.5, 0.975])) == pytest.approx([0.0, 1.959964], abs=1e-6)
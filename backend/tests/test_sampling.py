@@ -0,0 +1,143 @@
+"""Draw sources: Sobol direction numbers, scrambled nets and variance reduction."""
+import numpy as np
+import pytest
+
+from app.services.sampling import (
+    SOBOL_BITS,
+    SOBOL_MAX_DIMENSIONS,
+    AntitheticSource,
+    PseudoSource,
+    SobolScramble,
+    SobolSource,
+    _direction_numbers,
+)
+from app.services.simulation import SimulationService
+
+from .conftest import CHAIN_EXPIRY, VALUATION_DATE
+
+
+def _unscrambled(dimensions: int, n: int) -> np.ndarray:
+    """First n raw Sobol points in Gray-code order, shape (n, dimensions)."""
+    v = _direction_numbers(dimensions)
+    index = np.arange(n)
+    gray = index ^ (index >> 1)
+    x = np.zeros((n, dimensions), dtype=np.uint64)
+    for bit in range(SOBOL_BITS):
+        x[(gray >> bit & 1).astype(bool)] ^= v[:, bit]
+    return x / float(1 << SOBOL_BITS)
+
+
+def test_direction_numbers_follow_the_joe_kuo_table():
+    v = _direction_numbers(6)
+    m = v >> (SOBOL_BITS - 1 - np.arange(SOBOL_BITS, dtype=np.uint64))
+
+    # Van der Corput, then the initial numbers of rows d = 2..6 of new-joe-kuo-6.21201
+    assert m[0, :4].tolist() == [1, 1, 1, 1]
+    assert m[1, :1].tolist() == [1]
+    assert m[2, :2].tolist() == [1, 3]
+    assert m[3, :3].tolist() == [1, 3, 1]
+    assert m[4, :3].tolist() == [1, 1, 1]
+    assert m[5, :4].tolist() == [1, 1, 3, 3]
+    # x^2 + x + 1: m_3 = 2 m_2 ^ 4 m_1 ^ m_1
+    assert m[2, 2] == 2 * 3 ^ 4 * 1 ^ 1
+
+
+def test_raw_points_match_scipy():
+    qmc = pytest.importorskip("scipy.stats.qmc")
+
+    expected = qmc.Sobol(40, scramble=False, bits=SOBOL_BITS).random(512)
+    assert np.array_equal(_unscrambled(40, 512), expected)
+
+
+@pytest.mark.parametrize("start", [0, 4096])
+def test_scrambled_blocks_are_stratified_in_every_dimension(start):
+    scramble = SobolScramble(np.random.default_rng(1))
+    n = 1024
+
+    for dim in range(64):
+        u = scramble.uniform(dim, start, n)
+        assert np.all((u > 0) & (u < 1))
+        assert np.array_equal(np.sort(np.floor(u * n)), np.arange(n))
+
+
+def test_first_two_dimensions_form_a_two_dimensional_net():
+    scramble = SobolScramble(np.random.default_rng(2))
+    n = 1024
+    x, y = scramble.uniform(0, 0, n), scramble.uniform(1, 0, n)
+
+    # Every elementary box of volume 1/n holds exactly one point
+    for rows in range(11):
+        cells = np.floor(x * 2 ** rows) * 2 ** (10 - rows) + np.floor(y * 2 ** (10 - rows))
+        assert len(np.unique(cells)) == n
+
+
+def test_blocks_concatenate_and_must_be_aligned():
+    scramble = SobolScramble(np.random.default_rng(3))
+
+    whole = scramble.uniform(5, 0, 2048)
+    halves = np.concatenate([scramble.uniform(5, 0, 1024), scramble.uniform(5, 1024, 1024)])
+    assert np.array_equal(whole, halves)
+    assert np.array_equal(scramble.uniform(5, 1536, 300), whole[1536:1836])
+    with pytest.raises(ValueError, match="multiple of their size"):
+        scramble.uniform(5, 100, 256)
+
+
+def test_dimensions_beyond_the_table_are_rejected():
+    scramble = SobolScramble(np.random.default_rng(4))
+
+    with pytest.raises(ValueError, match=str(SOBOL_MAX_DIMENSIONS)):
+        scramble.uniform(SOBOL_MAX_DIMENSIONS, 0, 16)
+
+
+def test_sources_hand_out_consecutive_dimensions():
+    scramble = SobolScramble(np.random.default_rng(5))
+    source = SobolSource(scramble, 0, 256, np.float32)
+
+    first, second = source.uniform(), source.normal()
+    assert first.dtype == np.float32 and second.dtype == np.float32
+    assert np.array_equal(first, scramble.uniform(0, 0, 256).astype(np.float32))
+    assert not np.array_equal(first, source.uniform())
+
+
+def test_antithetic_pairs_mirror_each_other():
+    source = AntitheticSource(PseudoSource(np.random.default_rng(6), 500))
+
+    z, u = source.normal(), source.uniform()
+    assert len(z) == 1000
+    assert np.array_equal(z[0::2], -z[1::2])
+    assert np.allclose(u[0::2] + u[1::2], 1)
+
+
+def _replicate_error(estimates: np.ndarray) -> float:
+    return float(estimates.std(ddof=1) / np.sqrt(len(estimates)))
+
+
+def test_sobol_beats_pseudo_random_on_a_smooth_integrand():
+    # E[prod(1 + (u - 0.5) / 2)] = 1 over eight dimensions
+    rng = np.random.default_rng(7)
+    n, replicates, dims = 4096, 16, 8
+
+    sobol, pseudo = [], []
+    for _ in range(replicates):
+        source = SobolSource(SobolScramble(rng), 0, n)
+        sobol.append(np.prod([1 + (source.uniform() - 0.5) / 2 for _ in range(dims)], axis=0).mean())
+        source = PseudoSource(rng, n)
+        pseudo.append(np.prod([1 + (source.uniform() - 0.5) / 2 for _ in range(dims)], axis=0).mean())
+
+    assert np.mean(sobol) == pytest.approx(1.0, abs=1e-3)
+    assert _replicate_error(np.array(sobol)) < _replicate_error(np.array(pseudo)) / 10
+
+
+def test_sobol_simulation_reports_a_smaller_standard_error():
+    strategy = {
+        "strategy_type": "bull-call-spread", "expiry_date": CHAIN_EXPIRY,
+        "parameters": {"longCallStrike": 18000, "shortCallStrike": 18600},
+    }
+    kwargs = dict(underlying_price=18000.0, volatility=0.2, valuation_date=VALUATION_DATE, num_paths=65_536, seed=8)
+
+    pseudo = SimulationService.run([strategy], **kwargs)
+    sobol = SimulationService.run([strategy], sampling="sobol", **kwargs)
+
+    assert sobol["sampling"]["replicates"] == 16
+    assert sobol["standard_error"]["expected_pnl"] < pseudo["standard_error"]["expected_pnl"] / 5
+    assert abs(sobol["expected_pnl"] - pseudo["expected_pnl"]) < 4 * pseudo["standard_error"]["expected_pnl"]
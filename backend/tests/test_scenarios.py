@@ -0,0 +1,93 @@
+"""Scenario shock grid: cube values, chunking and the endpoint."""
+import numpy as np
+import pytest
+
+from app.services import scenarios
+from app.services.pricing import black_scholes_price
+from app.services.scenarios import ScenarioService
+
+LONG_CALL = {
+    "name": "long call",
+    "strategy_type": "custom-strategy",
+    "entry_date": "2026-10-18",
+    "expiry_date": "2026-11-27",
+    "parameters": {},
+    "custom_legs": [{"type": "CE", "action": "BUY", "strike": 18000, "lotSize": 50, "premium": 250}],
+}
+SHORT_FUTURES = {
+    "name": "short futures",
+    "strategy_type": "custom-strategy",
+    "entry_date": "2026-10-18",
+    "expiry_date": "2026-11-27",
+    "parameters": {},
+    "custom_legs": [{"type": "FUT", "action": "SELL", "lotSize": 25, "entryPrice": 18000}],
+}
+GRID = dict(
+    underlying_price=18000.0, volatility=0.15, valuation_date="2026-10-18",
+    spot_shocks=[-5, 0, 5], vol_shocks=[-5, 0, 10], days_elapsed=[0, 10, 40], rate=0.0,
+)
+
+
+def test_cube_matches_pointwise_black_scholes():
+    result = ScenarioService.run([LONG_CALL], **GRID)
+
+    cube = np.array(result["pnl"])
+    assert cube.shape == (3, 3, 3)
+    for i, s in enumerate(GRID["spot_shocks"]):
+        for j, v in enumerate(GRID["vol_shocks"]):
+            for k, d in enumerate(GRID["days_elapsed"]):
+                years = (40 - d) / 365
+                if years > 0:
+                    value = black_scholes_price(18000 * (1 + s / 100), 18000, years, 0.15 + v / 100)
+                else:
+                    value = max(18000 * (1 + s / 100) - 18000, 0)
+                assert cube[i, j, k] == pytest.approx(50 * (value - 250), abs=0.01)
+
+
+def test_portfolio_cube_is_the_sum_of_strategies():
+    result = ScenarioService.run([LONG_CALL, SHORT_FUTURES], include_breakdown=True, **GRID)
+
+    total = np.array(result["pnl"])
+    parts = [np.array(s["pnl"]) for s in result["strategies"]]
+    assert total == pytest.approx(parts[0] + parts[1], abs=0.02)
+    # Futures P&L depends on spot only
+    futures = parts[1]
+    assert futures[:, 0, 0] == pytest.approx([-25 * 18000 * s / 100 for s in GRID["spot_shocks"]])
+    assert np.ptp(futures, axis=(1, 2)) == pytest.approx(0)
+    assert result["worst"]["pnl"] == pytest.approx(total.min(), abs=0.01)
+
+
+def test_chunking_does_not_change_the_cube(monkeypatch):
+    book = [dict(LONG_CALL, custom_legs=[dict(LONG_CALL["custom_legs"][0], strike=k)]) for k in range(17000, 19001, 250)]
+    whole = ScenarioService.run(book, include_breakdown=True, **GRID)
+
+    monkeypatch.setattr(scenarios, "CHUNK_ELEMENTS", 1)
+    chunked = ScenarioService.run(book, include_breakdown=True, **GRID)
+
+    assert chunked["pnl"] == whole["pnl"]
+    assert [s["pnl"] for s in chunked["strategies"]] == [s["pnl"] for s in whole["strategies"]]
+
+
+def test_stress_strategies_reports_bad_strategies_per_row():
+    bad = dict(LONG_CALL, id=2, custom_legs=[{"type": "XX", "action": "BUY"}])
+    results = ScenarioService.stress_strategies(
+        [dict(LONG_CALL, id=1), bad], 18000.0, 0.15, np.datetime64("2026-10-18")
+    )
+
+    assert results[0]["error"] is None
+    assert results[0]["worst_pnl"] <= results[0]["base_pnl"] <= results[0]["best_pnl"]
+    assert results[1]["strategy_id"] == 2 and "Unknown leg type" in results[1]["error"]
+
+
+def test_scenario_endpoint_validates_the_grid(client):
+    ok = client.post("/api/risk/scenarios", json={
+        "strategies": [LONG_CALL], "underlying_price": 18000, "valuation_date": "2026-10-18",
+        "spot_shocks": [-5, 5],
+    })
+    bad = client.post("/api/risk/scenarios", json={
+        "strategies": [LONG_CALL], "underlying_price": 18000, "spot_shocks": [-100],
+    })
+
+    assert ok.status_code == 200
+    assert len(ok.json()["data"]["pnl"]) == 2
+    assert bad.status_code == 422
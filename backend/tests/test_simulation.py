@@ -0,0 +1,130 @@
+"""Monte Carlo simulation: model distributions, estimates and the endpoint."""
+import numpy as np
+import pytest
+
+from app.services import simulation
+from app.services.pricing import black_scholes_price
+from app.services.simulation import SimulationService
+
+from .conftest import CHAIN_EXPIRY, VALUATION_DATE
+
+SPOT = 18000.0
+VOLATILITY = 0.2
+YEARS = 39 / 365   # valuation date to CHAIN_EXPIRY
+
+BULL_CALL = {
+    "strategy_type": "bull-call-spread",
+    "expiry_date": CHAIN_EXPIRY,
+    "parameters": {
+        "longCallStrike": 18000, "shortCallStrike": 18600,
+        "longCallPremium": 300, "shortCallPremium": 120, "lotSize": 50,
+    },
+}
+
+
+def _run(strategies=(BULL_CALL,), **kwargs):
+    options = dict(
+        underlying_price=SPOT, volatility=VOLATILITY, valuation_date=VALUATION_DATE,
+        rate=0.0, num_paths=200_000, seed=7,
+    )
+    return SimulationService.run(list(strategies), **{**options, **kwargs})
+
+
+def test_gbm_terminal_prices_are_lognormal():
+    result = _run()
+
+    terminal = result["terminal_price"]
+    assert terminal["mean"] == pytest.approx(SPOT, rel=3e-3)
+    assert terminal["std"] == pytest.approx(SPOT * np.sqrt(np.exp(VOLATILITY ** 2 * YEARS) - 1), rel=1e-2)
+    median = SPOT * np.exp(-0.5 * VOLATILITY ** 2 * YEARS)
+    assert terminal["percentiles"]["50"] == pytest.approx(median, rel=2e-3)
+
+
+def test_expected_pnl_matches_black_scholes_within_the_standard_error():
+    result = _run()
+
+    spread = black_scholes_price(SPOT, 18000, YEARS, VOLATILITY) - black_scholes_price(SPOT, 18600, YEARS, VOLATILITY)
+    exact = 50 * (spread - (300 - 120))
+    error = result["standard_error"]["expected_pnl"]
+    assert error == pytest.approx(result["pnl_std"] / np.sqrt(result["paths"]), rel=1e-3)
+    assert abs(result["expected_pnl"] - exact) < 4 * error
+
+
+@pytest.mark.parametrize("model", ["heston", "merton"])
+def test_other_models_keep_the_price_a_martingale(model):
+    result = _run(model=model)
+
+    terminal = result["terminal_price"]
+    assert result["model"] == model
+    assert abs(terminal["mean"] - SPOT) < 4 * terminal["std"] / np.sqrt(result["paths"])
+
+
+def test_heston_variance_is_stochastic():
+    flat = _run(model="heston", params={"vol_of_vol": 1e-6})
+    stochastic = _run(model="heston", params={"vol_of_vol": 1.0, "rho": -0.9})
+
+    gbm = _run()["terminal_price"]["percentiles"]
+    # Negative correlation fattens the left tail relative to the right
+    assert flat["terminal_price"]["percentiles"]["1"] == pytest.approx(gbm["1"], rel=5e-3)
+    assert stochastic["terminal_price"]["percentiles"]["1"] < gbm["1"]
+    assert stochastic["terminal_price"]["percentiles"]["99"] < gbm["99"]
+
+
+def test_chunking_does_not_change_a_seeded_run(monkeypatch):
+    whole = _run(num_paths=20_000)
+    monkeypatch.setattr(simulation, "CHUNK_PATHS", 1024)
+    chunked = _run(num_paths=20_000)
+
+    for key in ("expected_pnl", "probability_of_profit", "value_at_risk_95", "terminal_price"):
+        assert chunked[key] == whole[key]
+
+
+def test_portfolio_breakdown_sums_to_the_total():
+    condor = {
+        "strategy_type": "iron-condor", "expiry_date": CHAIN_EXPIRY, "id": 2,
+        "parameters": {"putBuyStrike": 17000, "putSellStrike": 17500, "callSellStrike": 18500, "callBuyStrike": 19000},
+    }
+    result = _run([BULL_CALL, condor], num_paths=50_000, include_breakdown=True)
+
+    assert [s["id"] for s in result["strategies"]] == [None, 2]
+    assert sum(s["expected_pnl"] for s in result["strategies"]) == pytest.approx(result["expected_pnl"], abs=0.02)
+
+
+@pytest.mark.parametrize("kwargs, message", [
+    ({"model": "sabr"}, "Unknown model"),
+    ({"horizon_date": "2026-10-01"}, "after the valuation date"),
+    ({"model": "heston", "params": {"rho": -1.5}}, "rho"),
+    ({"sampling": "halton"}, "Unknown sampling"),
+])
+def test_invalid_runs_are_rejected(kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        _run(**kwargs)
+
+
+def test_simulation_endpoint(client):
+    response = client.post("/api/simulation/run", json={
+        "strategies": [{**BULL_CALL, "name": "Bull call", "entry_date": VALUATION_DATE}],
+        "underlying_price": SPOT,
+        "volatility": VOLATILITY,
+        "valuation_date": VALUATION_DATE,
+        "num_paths": 1000,
+        "seed": 1,
+    })
+
+    data = response.json()["data"]
+    assert response.status_code == 200
+    assert data["paths"] == 1000
+    assert data["horizon"].startswith(CHAIN_EXPIRY)
+    assert set(data["pnl_percentiles"]) == {"1", "5", "25", "50", "75", "95", "99"}
+
+
+def test_simulation_endpoint_errors(client):
+    body = {"underlying_price": SPOT, "valuation_date": VALUATION_DATE, "num_paths": 1000}
+
+    missing = client.post("/api/simulation/run", json={**body, "strategy_ids": [999]})
+    bad_model = client.post("/api/simulation/run", json={
+        **body, "model": "sabr", "strategies": [{**BULL_CALL, "name": "x", "entry_date": VALUATION_DATE}],
+    })
+
+    assert missing.status_code == 404
+    assert bad_model.status_code == 400
@@ -0,0 +1,59 @@
+"""Sparse fieldsets: the summary projection and fields= selection."""
+import pytest
+
+from app.schemas.strategy import StrategyCreate
+from app.services.strategy_service import STRATEGY_FIELDS, SUMMARY_FIELDS, StrategyService, resolve_fields
+
+from .conftest import CHAIN_EXPIRY, VALUATION_DATE
+
+
+@pytest.fixture
+def saved(db):
+    strategy = StrategyService.create_strategy(db, StrategyCreate(
+        name="Condor", strategy_type="iron-condor", entry_date=VALUATION_DATE, expiry_date=CHAIN_EXPIRY,
+        parameters={"lotSize": 25}, notes="weekly",
+    ))
+    return strategy.to_dict()
+
+
+@pytest.mark.parametrize("fields, expected", [
+    (None, list(SUMMARY_FIELDS)),
+    ("  ", list(SUMMARY_FIELDS)),
+    ("all", list(STRATEGY_FIELDS)),
+    ("notes,name", ["id", "notes", "name"]),
+    ("name, id ,name", ["id", "name"]),
+])
+def test_resolve_fields(fields, expected):
+    assert resolve_fields(fields) == expected
+
+
+def test_unknown_fields_are_rejected():
+    with pytest.raises(ValueError, match=r"Unknown fields: \['price'\]"):
+        resolve_fields("name,price")
+
+
+def test_listing_defaults_to_the_summary(client, saved):
+    row = client.get("/api/strategies").json()["data"][0]
+
+    assert list(row) == list(SUMMARY_FIELDS)
+    assert row == {key: saved[key] for key in SUMMARY_FIELDS}
+
+
+def test_all_fields_match_the_full_row(client, saved):
+    row = client.get("/api/strategies", params={"fields": "all"}).json()["data"][0]
+
+    assert row == saved
+
+
+def test_selected_fields_are_serialized_like_full_rows(client, saved):
+    row = client.get("/api/strategies", params={"fields": "expiry_date,parameters,created_at"}).json()["data"][0]
+
+    assert row == {key: saved[key] for key in ("id", "expiry_date", "parameters", "created_at")}
+    assert row["expiry_date"] == CHAIN_EXPIRY
+
+
+def test_unknown_field_returns_400(client, saved):
+    response = client.get("/api/strategies", params={"fields": "name,secret"})
+
+    assert response.status_code == 400
+    assert "secret" in response.json()["detail"]
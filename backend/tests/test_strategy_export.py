@@ -0,0 +1,82 @@
+"""Streamed export: batches, formats and payoff metrics."""
+import asyncio
+import csv
+import io
+import json
+
+import pytest
+
+from app.services.payoff_calculator import PayoffCalculatorService
+from app.services.strategy_service import STRATEGY_FIELDS, StrategyService
+
+from .conftest import CHAIN_EXPIRY
+
+CONDOR = {"putBuyStrike": 17000, "putSellStrike": 17500, "callSellStrike": 18500, "callBuyStrike": 19000}
+
+
+@pytest.fixture
+def book(save_book):
+    return save_book([
+        {"name": "Condor", "strategy_type": "iron-condor", "parameters": CONDOR},
+        {"name": "Spread", "strategy_type": "bull-call-spread", "parameters": {"longCallStrike": 18000, "shortCallStrike": 18500}},
+        {"name": "Broken", "strategy_type": "no-such-type", "parameters": {}},
+    ])
+
+
+def test_batches_come_from_one_cursor(db, book):
+    batches = list(StrategyService.iter_strategy_batches(db, ["id", "name"], "desc", batch_size=2))
+
+    assert [len(b) for b in batches] == [2, 1]
+    assert [row["name"] for batch in batches for row in batch] == ["Broken", "Spread", "Condor"]
+
+
+def test_ndjson_export_has_every_column(client, book):
+    response = client.get("/api/strategies/export")
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert [list(row) for row in rows] == [list(STRATEGY_FIELDS)] * 3
+    assert rows[0]["parameters"] == CONDOR
+    assert rows[0]["expiry_date"] == CHAIN_EXPIRY
+
+
+def test_csv_export_with_selected_fields(client, book):
+    response = client.get("/api/strategies/export", params={"format": "csv", "fields": "name", "order": "desc"})
+
+    assert list(csv.reader(io.StringIO(response.text))) == [["id", "name"], ["3", "Broken"], ["2", "Spread"], ["1", "Condor"]]
+
+
+def test_metrics_are_added_per_strategy(client, book):
+    response = client.get("/api/strategies/export", params={"fields": "name", "metrics": "true"})
+
+    condor, spread, broken = [json.loads(line) for line in response.text.splitlines()]
+    assert set(condor) == {"id", "name", "max_profit", "max_loss", "breakevens", "error"}
+    assert condor["max_profit"] == pytest.approx(5000) and condor["max_loss"] == pytest.approx(-20000)
+    assert condor["error"] is None
+    assert len(spread["breakevens"]) == 1
+    assert broken["max_profit"] is None and "no-such-type" in broken["error"]
+
+
+def test_metrics_are_computed_off_the_event_loop(client, book, monkeypatch):
+    summarize = PayoffCalculatorService.summarize_strategies
+    loops = []
+
+    def recording(*args, **kwargs):
+        try:
+            loops.append(asyncio.get_running_loop())
+        except RuntimeError:
+            loops.append(None)
+        return summarize(*args, **kwargs)
+
+    monkeypatch.setattr(PayoffCalculatorService, "summarize_strategies", staticmethod(recording))
+
+    assert client.get("/api/strategies/export", params={"metrics": "true"}).status_code == 200
+    assert loops == [None]
+
+
+@pytest.mark.parametrize("params", [{"format": "xml"}, {"order": "random"}, {"fields": "name,nope"}])
+def test_invalid_exports_fail_before_streaming(client, params):
+    response = client.get("/api/strategies/export", params=params)
+
+    assert response.status_code == 400
@@ -0,0 +1,101 @@
+"""Listing filters: strategy type, expiry range and name prefix."""
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+
+from app.models.strategy import Strategy
+from app.schemas.strategy import StrategySelection
+from app.services.strategy_service import _selection_clauses
+
+BOOK = [
+    ("Condor Nov", "iron-condor", "2026-11-26"),
+    ("condor lower", "iron-condor", "2026-11-30"),
+    ("Condor Dec", "iron-condor", "2026-12-31"),
+    ("Spread Nov", "bull-call-spread", "2026-11-26"),
+    ("Straddle", "long-straddle", "2026-10-29"),
+    ("50% [*?]_x", "custom-strategy", "2026-11-26"),
+]
+
+
+@pytest.fixture
+def book(save_book):
+    return save_book(
+        [{"name": name, "strategy_type": strategy_type, "expiry_date": expiry} for name, strategy_type, expiry in BOOK],
+        entry_date="2026-09-01",
+    )
+
+
+def _names(client, **params):
+    body = client.get("/api/strategies", params=params).json()
+    return [s["name"] for s in body["data"]]
+
+
+def test_strategy_type_can_be_repeated(client, book):
+    assert _names(client, strategy_type=["long-straddle", "bull-call-spread"]) == ["Spread Nov", "Straddle"]
+
+
+def test_expiry_range_is_inclusive(client, book):
+    names = _names(client, expiry_from="2026-11-26", expiry_to="2026-11-30")
+
+    assert names == ["Condor Nov", "condor lower", "Spread Nov", "50% [*?]_x"]
+
+
+def test_filters_combine(client, book):
+    assert _names(client, strategy_type="iron-condor", expiry_to="2026-11-30", name_prefix="Condor") == ["Condor Nov"]
+
+
+def test_name_prefix_is_case_sensitive(client, book):
+    assert _names(client, name_prefix="Condor") == ["Condor Nov", "Condor Dec"]
+    assert _names(client, name_prefix="condor") == ["condor lower"]
+
+
+@pytest.mark.parametrize("prefix, expected", [
+    ("50% [*?]_", ["50% [*?]_x"]),
+    ("50%", ["50% [*?]_x"]),
+    ("5_%", []),
+    ("C*", []),
+    ("[CS]", []),
+    ("Condor ?ov", []),
+])
+def test_name_prefix_wildcards_are_literal(client, book, prefix, expected):
+    assert _names(client, name_prefix=prefix) == expected
+
+
+def test_filters_apply_to_every_page(client, book):
+    first = client.get("/api/strategies", params={"strategy_type": "iron-condor", "limit": 2}).json()
+    rest = client.get("/api/strategies", params={
+        "strategy_type": "iron-condor", "limit": 2, "cursor": first["next_cursor"],
+    }).json()
+
+    assert [s["name"] for s in first["data"] + rest["data"]] == ["Condor Nov", "condor lower", "Condor Dec"]
+    assert rest["next_cursor"] is None
+
+
+def test_postgresql_prefix_is_an_escaped_like():
+    statement = select(Strategy.id).where(*_selection_clauses(StrategySelection(name_prefix="50%_/x")))
+
+    compiled = statement.compile(dialect=postgresql.dialect())
+
+    assert "strategies.name LIKE %(param_1)s ESCAPE '/'" in str(compiled)
+    assert compiled.params["param_1"] == "50/%/_//x%"
+
+
+@pytest.mark.parametrize("selection, index", [
+    (StrategySelection(strategy_types=["iron-condor"], expiry_from="2026-11-01"), "ix_strategies_type_expiry"),
+    (StrategySelection(expiry_from="2026-11-01", expiry_to="2026-11-30"), "ix_strategies_expiry_date"),
+    (StrategySelection(name_prefix="Condor"), "ix_strategies_name"),
+])
+def test_sqlite_filters_read_an_index(db, selection, index):
+    statement = select(Strategy.id).where(*_selection_clauses(selection))
+    compiled = statement.compile(dialect=db.get_bind().dialect, compile_kwargs={"literal_binds": True})
+
+    plan = " ".join(row[-1] for row in db.execute(text(f"EXPLAIN QUERY PLAN {compiled}")))
+
+    assert "USING" in plan and index in plan
+    assert not plan.startswith("SCAN strategies")
+
+
+def test_empty_expiry_range_is_rejected(client):
+    response = client.get("/api/strategies", params={"expiry_from": "2026-12-01", "expiry_to": "2026-11-01"})
+
+    assert response.status_code == 422
@@ -0,0 +1,121 @@
+"""Bulk import: parsing, per-row error reporting and batched writes."""
+import asyncio
+import json
+
+import pytest
+from sqlalchemy import func, select
+
+from app.database import AsyncSessionLocal, async_engine
+from app.models.strategy_leg import StrategyLeg
+from app.services import strategy_import
+from app.services.strategy_import import StrategyImportService
+
+from .conftest import CHAIN_EXPIRY, VALUATION_DATE
+
+
+def _row(name, **extra):
+    return {
+        "name": name, "strategy_type": "iron-condor", "entry_date": VALUATION_DATE,
+        "expiry_date": CHAIN_EXPIRY, "parameters": {"lotSize": 25}, **extra,
+    }
+
+
+NDJSON = "\n".join([
+    json.dumps(_row("one")),
+    '{"name": "broken",',
+    json.dumps(_row("two")),
+    json.dumps({k: v for k, v in _row("x").items() if k != "name"}),
+    "",
+    json.dumps(_row("three", custom_legs=None)),
+    "[1, 2]",
+]) + "\n"
+
+
+def _import(body: bytes, fmt: str, chunk: int = 1 << 20, batch_size: int = 1000):
+    async def chunks():
+        for lo in range(0, len(body), chunk):
+            yield body[lo:lo + chunk]
+
+    async def main():
+        try:
+            async with AsyncSessionLocal() as db:
+                return await StrategyImportService.import_stream(db, chunks(), fmt, batch_size)
+        finally:
+            await async_engine.dispose()
+    return asyncio.run(main())
+
+
+def test_ndjson_rows_are_validated_one_by_one(client):
+    response = client.post("/api/strategies/bulk", content=NDJSON)
+
+    report = response.json()["data"]
+    assert response.status_code == 200
+    assert (report["received"], report["inserted"], report["failed"]) == (6, 3, 3)
+    assert [e["line"] for e in report["errors"]] == [2, 4, 7]
+    assert report["errors"][0]["error"].startswith("Invalid JSON")
+    assert report["errors"][1]["error"] == "name: Field required"
+    assert report["errors"][2]["error"] == "Each row must be a JSON object"
+    names = [s["name"] for s in client.get("/api/strategies").json()["data"]]
+    assert names == ["one", "two", "three"]
+
+
+def test_csv_import_with_quoted_json_and_extra_columns(client):
+    body = (
+        "id,name,strategy_type,entry_date,expiry_date,parameters,custom_legs,notes\r\n"
+        f'99,Calendar,custom-strategy,{VALUATION_DATE},{CHAIN_EXPIRY},,'
+        '"[{""type"": ""CE"", ""action"": ""SELL"", ""strike"": 18000, ""lotSize"": 50}]","two\nlines"\r\n'
+        f"100,Short,iron-condor,{VALUATION_DATE},{CHAIN_EXPIRY}\r\n"
+        f'101,Bad JSON,iron-condor,{VALUATION_DATE},{CHAIN_EXPIRY},{{nope,,\r\n'
+        f"102,Bad date,iron-condor,someday,{CHAIN_EXPIRY},,,\r\n"
+    )
+
+    response = client.post("/api/strategies/bulk", content=body, headers={"content-type": "text/csv"})
+
+    report = response.json()["data"]
+    assert report["format"] == "csv"
+    assert (report["inserted"], report["failed"]) == (1, 3)
+    assert [e["line"] for e in report["errors"]] == [4, 5, 6]
+    assert report["errors"][0]["error"] == "Expected 8 cells, found 5"
+    assert report["errors"][1]["error"].startswith("Invalid JSON in parameters")
+    assert report["errors"][2]["error"].startswith("entry_date:")
+    saved = client.get("/api/strategies", params={"fields": "all"}).json()["data"]
+    assert [(s["id"], s["notes"]) for s in saved] == [(1, "two\nlines")]
+    legs = client.get("/api/strategies/legs").json()["data"]
+    assert [(leg["leg_type"], leg["action"], leg["strike"]) for leg in legs] == [("CE", "SELL", 18000)]
+
+
+@pytest.mark.parametrize("chunk", [1, 7, 4096])
+def test_chunk_boundaries_bom_and_crlf_do_not_matter(db_engine, chunk):
+    body = ("\ufeff" + NDJSON.replace("\n", "\r\n")).encode()
+
+    report = _import(body, "ndjson", chunk=chunk)
+
+    assert (report["received"], report["inserted"], report["failed"]) == (6, 3, 3)
+    assert [e["line"] for e in report["errors"]] == [2, 4, 7]
+
+
+def test_small_batches_write_every_row_and_its_legs(db_engine, db):
+    body = "".join(json.dumps(_row(f"s{i}")) + "\n" for i in range(7)).encode()
+
+    report = _import(body, "ndjson", batch_size=2)
+
+    assert report["inserted"] == 7
+    assert db.scalar(select(func.count()).select_from(StrategyLeg)) == 7 * 4
+
+
+def test_reported_errors_are_capped_but_counted(db_engine, monkeypatch):
+    monkeypatch.setattr(strategy_import, "MAX_REPORTED_ERRORS", 2)
+
+    report = _import(b"{}\n" * 5, "ndjson")
+
+    assert report["failed"] == 5
+    assert len(report["errors"]) == 2
+
+
+def test_unusable_bodies_are_rejected(client):
+    not_utf8 = client.post("/api/strategies/bulk", content=b"\xff\xfe\x00")
+    unknown = client.post("/api/strategies/bulk", params={"format": "xlsx"}, content=b"")
+
+    assert not_utf8.status_code == 400
+    assert "UTF-8" in not_utf8.json()["detail"]
+    assert unknown.status_code == 400
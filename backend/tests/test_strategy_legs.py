@@ -0,0 +1,214 @@
+"""Strategy legs: derived rows, leg queries, cascades and single-statement writes."""
+import asyncio
+import importlib.util
+import os
+from datetime import date
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects import postgresql
+
+from app.database import AsyncSessionLocal, async_engine
+from app.models.strategy_leg import StrategyLeg
+from app.models.stress_result import StrategyStressResult
+from app.schemas.strategy import StrategyCreate, StrategySelection, StrategyUpdate
+from app.services import strategy_service
+from app.services.strategy_legs import LEG_SOURCE_FIELDS, leg_records
+from app.services.strategy_service import StrategyService
+
+from .conftest import CHAIN_EXPIRY, VALUATION_DATE
+
+CONDOR = {"putBuyStrike": 17000, "putSellStrike": 17500, "callSellStrike": 18500, "callBuyStrike": 19000, "lotSize": 25}
+CALENDAR = [
+    {"type": "CE", "action": "SELL", "strike": 18500, "lotSize": 50, "premium": 120},
+    {"type": "CE", "action": "BUY", "strike": 18500, "lotSize": 50, "premium": 210, "expiry": "2026-12-31"},
+    {"type": "FUT", "action": "BUY", "lotSize": 0, "entryPrice": 18000},
+]
+
+
+@pytest.fixture
+def book(save_book):
+    return save_book([
+        {"name": "Condor", "parameters": CONDOR},
+        {"name": "Calendar", "strategy_type": "custom-strategy", "parameters": {}, "custom_legs": CALENDAR},
+        {"name": "Spread", "strategy_type": "bull-call-spread", "parameters": {"longCallStrike": 18000}},
+    ])
+
+
+def _legs(client, **params):
+    response = client.get("/api/strategies/legs", params=params)
+    assert response.status_code == 200
+    return response.json()
+
+
+def _positions(client, **params):
+    return [(leg["name"], leg["leg_index"]) for leg in _legs(client, **params)["data"]]
+
+
+def test_legs_are_derived_in_definition_order(client, book):
+    legs = _legs(client)["data"]
+
+    condor = [(leg["leg_type"], leg["action"], leg["quantity"], leg["strike"]) for leg in legs if leg["name"] == "Condor"]
+    assert condor == [("PE", "BUY", 25, 17000), ("PE", "SELL", 25, 17500), ("CE", "SELL", 25, 18500), ("CE", "BUY", 25, 19000)]
+    calendar = [(leg["leg_index"], leg["expiry"]) for leg in legs if leg["name"] == "Calendar"]
+    assert calendar == [(0, CHAIN_EXPIRY), (1, "2026-12-31")]   # the zero-lot future is skipped
+    spread = [leg["strike"] for leg in legs if leg["name"] == "Spread"]
+    assert spread == [18000, None]   # short strike left to the spot price
+
+
+def test_short_calls_at_a_strike(client, book):
+    positions = _positions(client, leg_type="CE", action="SELL", strike_min=18500, strike_max=18500)
+
+    assert positions == [("Condor", 2), ("Calendar", 0)]
+
+
+@pytest.mark.parametrize("params, expected", [
+    ({"strike_min": 18600}, [("Condor", 3)]),
+    ({"leg_type": "PE", "strike_max": 17200}, [("Condor", 0)]),
+    ({"expiry_from": "2026-12-01"}, [("Calendar", 1)]),
+    ({"expiry_to": CHAIN_EXPIRY, "action": "BUY", "leg_type": "CE"}, [("Condor", 3), ("Spread", 0)]),
+    ({"strategy_type": ["custom-strategy", "bull-call-spread"], "action": "SELL"}, [("Calendar", 0), ("Spread", 1)]),
+])
+def test_leg_filters(client, book, params, expected):
+    assert _positions(client, **params) == expected
+
+
+def test_leg_pages_follow_the_cursor(client, book):
+    first = _legs(client, limit=3)
+    second = _legs(client, limit=3, cursor=first["next_cursor"])
+    last = _legs(client, limit=3, cursor=second["next_cursor"])
+
+    positions = [(leg["strategy_id"], leg["leg_index"]) for page in (first, second, last) for leg in page["data"]]
+    assert positions == sorted(positions) and len(positions) == 8
+    assert last["next_cursor"] is None
+
+
+@pytest.mark.parametrize("params, code", [
+    ({"strike_min": 19000, "strike_max": 18000}, 422),
+    ({"leg_type": "XX"}, 422),
+    ({"cursor": "garbage"}, 400),
+])
+def test_invalid_leg_queries(client, params, code):
+    assert client.get("/api/strategies/legs", params=params).status_code == code
+
+
+def test_updates_rewrite_legs(client, db, book):
+    StrategyService.update_strategy(db, book["Condor"], StrategyUpdate(
+        strategy_type="long-straddle", parameters={"strike": 18000}, custom_legs=None, expiry_date="2026-12-31",
+    ))
+    StrategyService.update_strategy(db, book["Spread"], StrategyUpdate(parameters={"shortCallStrike": 18800}))
+
+    assert _positions(client, strategy_type="long-straddle", expiry_from="2026-12-31") == [("Condor", 0), ("Condor", 1)]
+    assert _positions(client, leg_type="PE", action="SELL") == []
+    assert _positions(client, strike_min=18800, strike_max=18800) == [("Spread", 1)]
+
+
+def test_deletes_cascade_to_legs_and_stress_results(db, book):
+    db.add(StrategyStressResult(run_id=VALUATION_DATE, strategy_id=book["Spread"]))
+    db.commit()
+
+    assert StrategyService.delete_strategy(db, book["Condor"])
+    StrategyService.delete_strategies(db, StrategySelection(ids=[book["Spread"]]))
+
+    assert db.scalars(select(StrategyLeg.strategy_id).distinct()).all() == [book["Calendar"]]
+    assert db.scalar(select(func.count()).select_from(StrategyStressResult)) == 0
+
+
+def test_deletes_are_one_statement(db, book, statements):
+    statements.clear()
+
+    StrategyService.delete_strategy(db, book["Condor"])
+    StrategyService.delete_strategies(db, StrategySelection(ids=[book["Spread"]]))
+
+    assert statements == [("DELETE", False), ("DELETE", False)]
+
+
+def test_foreign_keys_are_enforced_on_both_engines(db_engine, db):
+    async def async_pragma():
+        try:
+            async with AsyncSessionLocal() as session:
+                return await session.scalar(text("PRAGMA foreign_keys"))
+        finally:
+            await async_engine.dispose()
+
+    assert db.scalar(text("PRAGMA foreign_keys")) == 1
+    assert asyncio.run(async_pragma()) == 1
+
+
+def _postgresql_sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def test_postgresql_create_is_one_statement():
+    data = StrategyCreate(
+        name="Condor", strategy_type="iron-condor", entry_date=VALUATION_DATE, expiry_date=CHAIN_EXPIRY,
+        parameters=CONDOR,
+    )
+    source = (None, *(getattr(data, name) for name in LEG_SOURCE_FIELDS))
+
+    sql = _postgresql_sql(strategy_service._with_legs(strategy_service._insert_statement(data), source, replace=False))
+
+    assert sql.startswith("WITH written AS \n(INSERT INTO strategies")
+    assert "written_legs AS \n(INSERT INTO strategy_legs" in sql and "stale_legs" not in sql
+    assert sql.count("), (") == 3   # four condor legs in one VALUES list
+
+
+class _Saved:
+    """Result of a captured statement: the strategy as already saved."""
+    def __init__(self, strategy):
+        self.strategy = strategy
+
+    def one_or_none(self):
+        return self.strategy
+
+
+@pytest.mark.parametrize("changes, expected", [
+    ({"strategy_type": "iron-condor", "parameters": CONDOR, "custom_legs": None, "expiry_date": CHAIN_EXPIRY},
+     ["WITH written AS \n(UPDATE strategies"]),
+    ({"parameters": CONDOR}, ["UPDATE strategies", "WITH kept AS"]),
+    ({"notes": "rolled"}, ["UPDATE strategies"]),
+])
+def test_postgresql_update_statements(db, book, monkeypatch, changes, expected):
+    saved = StrategyService.get_strategy_by_id(db, book["Spread"])
+    statements = []
+    monkeypatch.setattr(strategy_service, "_writes_legs_inline", lambda db: True)
+    monkeypatch.setattr(db, "scalars", lambda statement: statements.append(statement) or _Saved(saved))
+    monkeypatch.setattr(db, "execute", lambda statement, *args: statements.append(statement))
+
+    StrategyService.update_strategy(db, book["Spread"], StrategyUpdate(**changes))
+
+    sql = [_postgresql_sql(statement) for statement in statements]
+    assert [text[:len(prefix)] for text, prefix in zip(sql, expected)] == expected and len(sql) == len(expected)
+    if len(sql) == 2:
+        assert "ON CONFLICT (strategy_id, leg_index) DO UPDATE" in sql[1] and "stale_legs" in sql[1]
+
+
+def _frozen_migration():
+    path = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        "alembic", "versions", "2026_10_18_1100-d93e5b7f2c14_strategy_legs_table.py",
+    )
+    spec = importlib.util.spec_from_file_location("strategy_legs_revision", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize("strategy_type, parameters, custom_legs", [
+    ("covered-call", {"callStrike": 18500, "futuresLotSize": ""}, None),
+    ("bull-call-spread", {"longCallStrike": "18000", "lotSize": 75}, None),
+    ("iron-condor", CONDOR, None),
+    ("long-straddle", {}, None),
+    ("protective-put", {"stockPrice": 18000, "putStrike": 17500}, None),
+    ("butterfly-spread", {"middleStrike": 18000, "lotSize": 0}, None),
+    ("custom-strategy", None, CALENDAR),
+    ("custom-strategy", None, [{"type": "PE", "action": "SELL", "lotSize": 50, "expiry": "2027-01-28T15:30:00Z"}]),
+    ("custom-strategy", None, [{"type": "XX", "lotSize": 50}]),
+    ("custom-strategy", None, [{"type": "CE", "lotSize": 50, "expiry": "someday"}]),
+    ("iron-condor", {"lotSize": "many"}, None),
+    ("no-such-type", {}, None),
+])
+def test_frozen_migration_mapping_matches_the_app(strategy_type, parameters, custom_legs):
+    source = (1, strategy_type, parameters, custom_legs, date(2026, 11, 26))
+
+    assert _frozen_migration()._leg_records(source) == leg_records(source)
@@ -0,0 +1,112 @@
+"""Full-text search: matching, ranking, paging and index upkeep."""
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.schemas.strategy import StrategySelection, StrategyUpdate
+from app.services.pagination import encode_cursor
+from app.services.strategy_search import search_statement, search_terms
+from app.services.strategy_service import SUMMARY_FIELDS, StrategyService
+
+BOOK = [
+    ("Weekly hedge", "Sold one condor against the budget"),
+    ("BankNifty condor", "Weekly theta"),
+    ("Nifty straddle", "Scalping gamma around the budget"),
+    ("Calendar", None),
+]
+
+
+@pytest.fixture
+def book(save_book):
+    return save_book([{"name": name, "notes": notes} for name, notes in BOOK])
+
+
+def _search(client, q, **params):
+    response = client.get("/api/strategies/search", params={"q": q, **params})
+    assert response.status_code == 200
+    return response.json()
+
+
+def _names(client, q):
+    return [s["name"] for s in _search(client, q)["data"]]
+
+
+def test_search_terms():
+    assert search_terms("  BankNifty, condor-42!") == ["banknifty", "condor", "42"]
+    with pytest.raises(ValueError, match="no words"):
+        search_terms("?! ...")
+
+
+def test_name_matches_rank_above_notes_matches(client, book):
+    results = _search(client, "condor")["data"]
+
+    assert [s["name"] for s in results] == ["BankNifty condor", "Weekly hedge"]
+    assert results[0]["score"] > results[1]["score"]
+    assert list(results[0]) == [*SUMMARY_FIELDS, "score"]
+
+
+def test_every_word_must_match(client, book):
+    assert _names(client, "budget straddle") == ["Nifty straddle"]
+    assert _names(client, "budget calendar") == []
+
+
+def test_last_word_matches_as_a_prefix(client, book):
+    assert _names(client, "gamma scal") == ["Nifty straddle"]
+    assert _names(client, "scal gamma") == []
+
+
+def test_words_are_stemmed(client, book):
+    assert _names(client, "condors") == ["BankNifty condor", "Weekly hedge"]
+    assert _names(client, "scalp") == ["Nifty straddle"]
+
+
+def test_writes_keep_the_index_in_step(client, db, book):
+    StrategyService.update_strategy(db, book["Calendar"], StrategyUpdate(notes="Rolled the condor"))
+    StrategyService.delete_strategies(db, StrategySelection(ids=[book["Weekly hedge"]]))
+
+    assert _names(client, "condor") == ["BankNifty condor", "Calendar"]
+    assert _names(client, "budget") == ["Nifty straddle"]
+
+
+def test_pages_walk_the_ranked_matches(client, save_book):
+    save_book([{"name": f"Condor {i}"} for i in range(5)])
+
+    first = _search(client, "condor", limit=2)
+    second = _search(client, "condor", limit=2, cursor=first["next_cursor"])
+    last = _search(client, "condor", limit=2, cursor=second["next_cursor"])
+
+    names = [s["name"] for page in (first, second, last) for s in page["data"]]
+    assert names == [f"Condor {i}" for i in range(5)]
+    assert last["next_cursor"] is None
+
+
+@pytest.mark.parametrize("params", [
+    {"q": "?!"},
+    {"q": "budget", "cursor": encode_cursor({"q": "condor", "offset": 20})},
+    {"q": "condor", "cursor": encode_cursor({"q": "condor", "offset": -1})},
+    {"q": "condor", "cursor": "garbage"},
+    {"q": "condor", "fields": "secret"},
+])
+def test_invalid_searches_return_400(client, params):
+    response = client.get("/api/strategies/search", params=params)
+
+    assert response.status_code == 400
+
+
+def test_postgresql_query_uses_the_indexed_document():
+    statement, terms, offset = search_statement("postgresql", "Budget scal", ["id"], 20)
+
+    sql = str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+    assert (terms, offset) == (["budget", "scal"], 0)
+    assert "to_tsquery('english'::regconfig, 'budget & scal:*')" in sql
+    assert "ts_rank_cd(" in sql and "ORDER BY score DESC, strategies.id ASC" in sql
+    assert "LIMIT 21" in sql
+
+
+def test_other_backends_fall_back_to_like(db, book):
+    statement, _, _ = search_statement("mysql", "condor", ["id", "name"], 20)
+
+    rows = db.execute(statement).mappings().all()
+
+    assert sorted(row["name"] for row in rows) == ["BankNifty condor", "Weekly hedge"]
+    assert {row["score"] for row in rows} == {0.0}
@@ -0,0 +1,95 @@
+"""Single-statement strategy writes: RETURNING results and not-found paths."""
+import pytest
+from sqlalchemy import select
+
+from app.models.strategy_leg import StrategyLeg
+from app.schemas.strategy import StrategyCreate, StrategyUpdate
+from app.services.strategy_service import StrategyService
+
+from .conftest import CHAIN_EXPIRY, VALUATION_DATE
+
+CONDOR = {
+    "name": "Condor",
+    "strategy_type": "iron-condor",
+    "entry_date": VALUATION_DATE,
+    "expiry_date": CHAIN_EXPIRY,
+    "parameters": {"putBuyStrike": 17000, "putSellStrike": 17500, "callSellStrike": 18500, "callBuyStrike": 19000},
+}
+
+
+def _leg_strikes(db, strategy_id):
+    return db.scalars(
+        select(StrategyLeg.strike).where(StrategyLeg.strategy_id == strategy_id).order_by(StrategyLeg.leg_index)
+    ).all()
+
+
+def test_create_returns_the_stored_row(db):
+    strategy = StrategyService.create_strategy(db, StrategyCreate(**CONDOR, notes="first"))
+
+    assert strategy.id is not None
+    assert strategy.created_at is not None and strategy.custom_legs == []
+    assert strategy.to_dict()["notes"] == "first"
+    assert _leg_strikes(db, strategy.id) == [17000, 17500, 18500, 19000]
+
+
+def test_update_returns_the_new_row_in_one_statement(db, statements):
+    strategy = StrategyService.create_strategy(db, StrategyCreate(**CONDOR))
+    statements.clear()
+
+    updated = StrategyService.update_strategy(db, strategy.id, StrategyUpdate(name="Renamed", notes="n"))
+
+    assert statements == [("UPDATE", False)]
+    assert (updated.id, updated.name, updated.notes) == (strategy.id, "Renamed", "n")
+    assert updated.strategy_type == "iron-condor"
+
+
+def test_parameter_updates_rewrite_the_legs(db):
+    strategy = StrategyService.create_strategy(db, StrategyCreate(**CONDOR))
+
+    StrategyService.update_strategy(db, strategy.id, StrategyUpdate(parameters={**CONDOR["parameters"], "callBuyStrike": 19500}))
+
+    assert _leg_strikes(db, strategy.id) == [17000, 17500, 18500, 19500]
+
+
+def test_empty_update_returns_the_current_row(db):
+    strategy = StrategyService.create_strategy(db, StrategyCreate(**CONDOR))
+
+    assert StrategyService.update_strategy(db, strategy.id, StrategyUpdate()).name == "Condor"
+
+
+def test_unknown_ids_are_detected_from_the_write_itself(db, statements):
+    assert StrategyService.update_strategy(db, 999, StrategyUpdate(name="x")) is None
+    assert statements == [("UPDATE", False)]
+    assert StrategyService.delete_strategy(db, 999) is False
+
+
+def test_delete_removes_the_strategy_and_its_legs(db):
+    strategy = StrategyService.create_strategy(db, StrategyCreate(**CONDOR))
+
+    assert StrategyService.delete_strategy(db, strategy.id) is True
+    assert StrategyService.get_strategy_by_id(db, strategy.id) is None
+    assert _leg_strikes(db, strategy.id) == []
+
+
+def test_write_endpoints(client):
+    created = client.post("/api/strategies", json=CONDOR)
+    strategy_id = created.json()["data"]["id"]
+
+    updated = client.put(f"/api/strategies/{strategy_id}", json={"notes": "hedged"})
+    deleted = client.delete(f"/api/strategies/{strategy_id}")
+
+    assert created.status_code == 201
+    assert updated.json()["data"]["notes"] == "hedged"
+    assert updated.json()["data"]["name"] == "Condor"
+    assert deleted.status_code == 200
+    assert client.get(f"/api/strategies/{strategy_id}").status_code == 404
+
+
+@pytest.mark.parametrize("method, body", [("put", {"name": "x"}), ("delete", None), ("get", None)])
+def test_unknown_ids_return_404(client, method, body):
+    kwargs = {"json": body} if body is not None else {}
+
+    response = getattr(client, method)("/api/strategies/999", **kwargs)
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Strategy with ID 999 not found"
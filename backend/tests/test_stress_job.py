@@ -0,0 +1,78 @@
+"""Daily stress test job: coverage, error rows and resumption."""
+from datetime import date
+
+import pytest
+from sqlalchemy import func, insert, select
+
+from app.jobs.stress_test import run_stress_test
+from app.models.strategy import Strategy
+from app.models.stress_result import StrategyStressResult
+
+
+def _seed(db, count, bad=()):
+    rows = []
+    for n in range(count):
+        legs = [{"type": "XX" if n in bad else "CE", "action": "SELL", "strike": 18000 + 100 * n, "lotSize": 50, "premium": 100}]
+        rows.append({
+            "name": f"short call {n}",
+            "strategy_type": "custom-strategy",
+            "entry_date": date(2026, 10, 1),
+            "expiry_date": date(2026, 11, 26),
+            "parameters": {},
+            "custom_legs": legs,
+        })
+    db.execute(insert(Strategy), rows)
+    db.commit()
+
+
+def _results(db, run_id):
+    return db.execute(
+        select(StrategyStressResult).where(StrategyStressResult.run_id == run_id)
+        .order_by(StrategyStressResult.strategy_id)
+    ).scalars().all()
+
+
+def test_every_strategy_gets_one_result(db):
+    _seed(db, 25, bad={3})
+
+    metrics = run_stress_test(18000, 0.15, run_id="r1", valuation_date="2026-10-18", chunk_size=4, workers=2)
+
+    results = _results(db, "r1")
+    assert metrics["processed"] == 25 and metrics["failed"] == 1
+    assert [r.strategy_id for r in results] == list(range(1, 26))
+    assert "Unknown leg type" in results[3].error
+    priced = [r for r in results if r.error is None]
+    assert all(r.worst_pnl <= r.base_pnl <= r.best_pnl for r in priced)
+    # A short call loses most when spot and volatility both rise
+    assert all(r.worst_spot_shock > 0 and r.worst_vol_shock > 0 for r in priced)
+
+
+def test_rerun_resumes_the_same_run(db):
+    _seed(db, 10)
+    done = db.execute(select(Strategy.id).order_by(Strategy.id).limit(6)).scalars().all()
+    db.execute(insert(StrategyStressResult), [{"run_id": "r2", "strategy_id": i, "worst_pnl": 0.0} for i in done])
+    db.commit()
+
+    resumed = run_stress_test(18000, 0.15, run_id="r2", valuation_date="2026-10-18", chunk_size=3, workers=1)
+    again = run_stress_test(18000, 0.15, run_id="r2", valuation_date="2026-10-18", chunk_size=3, workers=1)
+    other = run_stress_test(18000, 0.15, run_id="r3", valuation_date="2026-10-18", chunk_size=3, workers=1)
+
+    assert resumed["processed"] == 4
+    assert again["processed"] == 0
+    assert other["processed"] == 10
+    count = db.execute(
+        select(func.count()).select_from(StrategyStressResult).where(StrategyStressResult.run_id == "r2")
+    ).scalar_one()
+    assert count == 10
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+def test_results_do_not_depend_on_chunking(db, chunk_size):
+    _seed(db, 12)
+
+    run_stress_test(18000, 0.15, run_id=f"c{chunk_size}", valuation_date="2026-10-18", chunk_size=chunk_size, workers=2)
+
+    worst = [r.worst_pnl for r in _results(db, f"c{chunk_size}")]
+    assert len(worst) == 12
+    # Farther out-of-the-money calls lose less in the worst scenario
+    assert worst == sorted(worst)
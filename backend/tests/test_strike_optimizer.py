@@ -0,0 +1,130 @@
+"""Strike optimizer: dominance pruning and top-k selection."""
+import itertools
+
+import numpy as np
+import pytest
+
+from app.services import strike_optimizer
+from app.services.option_chain import get_chain_store
+from app.services.strike_optimizer import StrikeOptimizerService, _prune_dominated
+
+from .conftest import VALUATION_DATE
+
+
+def _book(chain_file):
+    chain = get_chain_store(chain_file).select()
+    return StrikeOptimizerService.build_strike_book(chain, None, None, VALUATION_DATE, 0.0, "mid")
+
+
+def _brute_force_iron_condors(book):
+    """Reward/risk of every valid OTM iron condor, without pruning."""
+    k = book.strikes
+    scores = []
+    for pl, ps, cs, cl in itertools.combinations(range(len(k)), 4):
+        if not (k[ps] <= book.spot <= k[cs]):
+            continue
+        put_credit = book.put_sell[ps] - book.put_buy[pl]
+        call_credit = book.call_sell[cs] - book.call_buy[cl]
+        put_width, call_width = k[ps] - k[pl], k[cl] - k[cs]
+        if not (0 < put_credit < put_width and 0 < call_credit < call_width):
+            continue
+        credit = put_credit + call_credit
+        max_loss = max(put_width, call_width) - credit
+        if max_loss > 0:
+            scores.append(credit / max_loss)
+    return sorted(scores, reverse=True)
+
+
+def _brute_force_bull_call_spreads(book):
+    k = book.strikes
+    scores = []
+    for long, short in itertools.combinations(range(len(k)), 2):
+        debit = book.call_buy[long] - book.call_sell[short]
+        width = k[short] - k[long]
+        if 0 < debit < width:
+            scores.append((width - debit) / debit)
+    return sorted(scores, reverse=True)
+
+
+def test_prune_dominated_keeps_running_maxima_per_group():
+    group = np.array([0, 0, 0, 1, 1, 1])
+    order_key = np.array([1, 2, 3, 1, 2, 3])
+    value = np.array([5.0, 4.0, 6.0, 1.0, 2.0, 2.0])
+
+    keep = _prune_dominated(group, order_key, value)
+
+    # Group 0: 4 < 5 is dominated; group 1: the tie at 2 is dominated
+    assert keep.tolist() == [True, False, True, True, True, False]
+
+
+def test_prune_dominated_ignores_input_order():
+    group = np.array([1, 0, 1, 0])
+    order_key = np.array([2, 2, 1, 1])
+    value = np.array([3.0, 1.0, 4.0, 2.0])
+
+    keep = _prune_dominated(group, order_key, value)
+
+    assert keep.tolist() == [False, False, True, True]
+
+
+@pytest.mark.parametrize("strategy_type, brute_force", [
+    ("iron-condor", _brute_force_iron_condors),
+    ("bull-call-spread", _brute_force_bull_call_spreads),
+])
+def test_pruned_search_matches_brute_force_top_k(chain_file, strategy_type, brute_force):
+    top_k = 10
+    result = StrikeOptimizerService.optimize(
+        strategy_type, chain_file, objective="reward_risk", top_k=top_k, valuation_date=VALUATION_DATE
+    )
+
+    expected = brute_force(_book(chain_file))[:top_k]
+    assert [c["score"] for c in result["candidates"]] == pytest.approx(expected, rel=1e-6)
+
+
+def test_iron_condor_search_prunes_dominated_spreads(chain_file):
+    result = StrikeOptimizerService.optimize("iron-condor", chain_file, valuation_date=VALUATION_DATE)
+
+    assert 0 < result["scored"] < result["combinations"]
+
+
+def test_top_k_is_ranked_and_independent_of_block_size(chain_file, monkeypatch):
+    kwargs = dict(objective="expected_value", top_k=7, valuation_date=VALUATION_DATE)
+    whole = StrikeOptimizerService.optimize("iron-condor", chain_file, **kwargs)
+
+    monkeypatch.setattr(strike_optimizer, "BLOCK_SIZE", 50)
+    blocked = StrikeOptimizerService.optimize("iron-condor", chain_file, **kwargs)
+
+    scores = [c["score"] for c in whole["candidates"]]
+    assert len(scores) == 7
+    assert [c["rank"] for c in whole["candidates"]] == list(range(1, 8))
+    assert scores == sorted(scores, reverse=True)
+    assert [c["score"] for c in blocked["candidates"]] == scores
+    assert [c["parameters"] for c in blocked["candidates"]] == [c["parameters"] for c in whole["candidates"]]
+
+
+def test_min_pop_filters_candidates(chain_file):
+    result = StrikeOptimizerService.optimize(
+        "iron-condor", chain_file, objective="reward_risk", top_k=20,
+        min_pop=0.8, valuation_date=VALUATION_DATE
+    )
+
+    assert result["candidates"]
+    assert all(c["pop"] >= 0.8 for c in result["candidates"])
+
+
+def test_candidate_parameters_are_chain_strikes(chain_file):
+    result = StrikeOptimizerService.optimize(
+        "iron-condor", chain_file, top_k=3, valuation_date=VALUATION_DATE
+    )
+
+    for candidate in result["candidates"]:
+        p = candidate["parameters"]
+        assert p["putBuyStrike"] < p["putSellStrike"] <= result["underlying_price"] <= p["callSellStrike"] < p["callBuyStrike"]
+
+
+def test_unknown_chain_file_is_not_found(client):
+    response = client.post("/api/optimizer/strikes", json={
+        "strategy_type": "iron-condor", "chain_file": "missing.csv",
+    })
+
+    assert response.status_code == 404